@@ -0,0 +1,348 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+"""
+Generators of synthetic Altium SchLib/PcbLib libraries for the benchmarks.
+
+olefile is read only, so this module includes a minimal Compound File (OLE2,
+version 3) writer. It supports storages, streams of any size (mini stream
+included) and the DIFAT chain needed by files larger than ~7 MB.
+"""
+
+import functools
+import pathlib
+import struct
+import typing
+
+_SECTOR_SIZE = 512
+_MINI_SECTOR_SIZE = 64
+_MINI_STREAM_CUTOFF = 4096
+_IDS_PER_SECTOR = _SECTOR_SIZE // 4
+_HEADER_DIFAT_ENTRIES = 109
+
+_FREESECT = 0xFFFFFFFF
+_ENDOFCHAIN = 0xFFFFFFFE
+_FATSECT = 0xFFFFFFFD
+_DIFSECT = 0xFFFFFFFC
+_NOSTREAM = 0xFFFFFFFF
+
+_STGTY_STORAGE = 1
+_STGTY_STREAM = 2
+_STGTY_ROOT = 5
+
+
+class _Entry:
+    def __init__(self, name: str, entry_type: int, data: bytes = b""):
+        self.name = name
+        self.entry_type = entry_type
+        self.data = data
+        self.children: dict[str, "_Entry"] = {}
+        self.sid = 0
+        self.left = _NOSTREAM
+        self.right = _NOSTREAM
+        self.child = _NOSTREAM
+        self.start = _ENDOFCHAIN
+        self.size = 0
+
+
+def _compare_names(a: _Entry, b: _Entry) -> int:
+    # Directory siblings are sorted by name length first, then by uppercase name
+    key_a = (len(a.name), a.name.upper())
+    key_b = (len(b.name), b.name.upper())
+    return (key_a > key_b) - (key_a < key_b)
+
+
+def _build_tree(entries: list[_Entry]) -> int:
+    # A balanced binary tree (all black) keeps the sibling lookups shallow
+    if not entries:
+        return _NOSTREAM
+    middle = len(entries) // 2
+    root = entries[middle]
+    root.left = _build_tree(entries[:middle])
+    root.right = _build_tree(entries[middle + 1 :])
+    return root.sid
+
+
+def _chain(fat: list[int], start: int, count: int):
+    for index in range(start, start + count - 1):
+        fat[index] = index + 1
+    fat[start + count - 1] = _ENDOFCHAIN
+
+
+def _sectors(size: int, sector_size: int) -> int:
+    return (size + sector_size - 1) // sector_size
+
+
+def write_compound_file(path: pathlib.Path, streams: dict[str, bytes]):
+    """
+    Writes a compound file with the given streams. Keys are the stream
+    paths, using '/' to separate the storages (e.g. "Library/Data").
+    """
+    root = _Entry("Root Entry", _STGTY_ROOT)
+    for stream_path, data in streams.items():
+        parent = root
+        *storages, stream_name = stream_path.split("/")
+        for storage in storages:
+            parent = parent.children.setdefault(
+                storage, _Entry(storage, _STGTY_STORAGE)
+            )
+        parent.children[stream_name] = _Entry(stream_name, _STGTY_STREAM, data)
+
+    # Assign the directory ids breadth first
+    entries = [root]
+    index = 0
+    while index < len(entries):
+        entries.extend(entries[index].children.values())
+        index += 1
+    for sid, entry in enumerate(entries):
+        entry.sid = sid
+    for entry in entries:
+        children = sorted(
+            entry.children.values(), key=functools.cmp_to_key(_compare_names)
+        )
+        entry.child = _build_tree(children)
+
+    # Small streams go to the mini stream
+    mini_stream = bytearray()
+    mini_fat: list[int] = []
+    big_streams: list[_Entry] = []
+    for entry in entries:
+        if entry.entry_type != _STGTY_STREAM:
+            continue
+        entry.size = len(entry.data)
+        if entry.size >= _MINI_STREAM_CUTOFF:
+            big_streams.append(entry)
+        elif entry.size:
+            count = _sectors(entry.size, _MINI_SECTOR_SIZE)
+            entry.start = len(mini_fat)
+            mini_fat.extend([0] * count)
+            _chain(mini_fat, entry.start, count)
+            mini_stream += entry.data.ljust(count * _MINI_SECTOR_SIZE, b"\x00")
+
+    # Regular sector layout: big streams, mini stream, mini FAT, directory
+    next_sector = 0
+    for entry in big_streams:
+        entry.start = next_sector
+        next_sector += _sectors(entry.size, _SECTOR_SIZE)
+    root.size = len(mini_stream)
+    root.start = next_sector if mini_stream else _ENDOFCHAIN
+    mini_stream_sectors = _sectors(len(mini_stream), _SECTOR_SIZE)
+    next_sector += mini_stream_sectors
+    mini_fat_start = next_sector if mini_fat else _ENDOFCHAIN
+    mini_fat_sectors = _sectors(len(mini_fat) * 4, _SECTOR_SIZE)
+    next_sector += mini_fat_sectors
+    directory_start = next_sector
+    directory_sectors = _sectors(len(entries) * 128, _SECTOR_SIZE)
+    next_sector += directory_sectors
+
+    # The FAT has to describe itself and the DIFAT sectors too
+    fat_sectors, difat_sectors = 1, 0
+    while True:
+        total = next_sector + fat_sectors + difat_sectors
+        needed_fat = _sectors(total, _IDS_PER_SECTOR)
+        needed_difat = _sectors(
+            max(0, needed_fat - _HEADER_DIFAT_ENTRIES), _IDS_PER_SECTOR - 1
+        )
+        if needed_fat == fat_sectors and needed_difat == difat_sectors:
+            break
+        fat_sectors, difat_sectors = needed_fat, needed_difat
+    fat_start = next_sector
+    difat_start = fat_start + fat_sectors
+    total_sectors = difat_start + difat_sectors
+
+    fat = [_FREESECT] * (fat_sectors * _IDS_PER_SECTOR)
+    for entry in big_streams:
+        _chain(fat, entry.start, _sectors(entry.size, _SECTOR_SIZE))
+    if mini_stream_sectors:
+        _chain(fat, root.start, mini_stream_sectors)
+    if mini_fat_sectors:
+        _chain(fat, mini_fat_start, mini_fat_sectors)
+    _chain(fat, directory_start, directory_sectors)
+    for sector in range(fat_start, difat_start):
+        fat[sector] = _FATSECT
+    for sector in range(difat_start, total_sectors):
+        fat[sector] = _DIFSECT
+
+    fat_ids = list(range(fat_start, difat_start))
+    header_difat = fat_ids[:_HEADER_DIFAT_ENTRIES]
+    header_difat += [_FREESECT] * (_HEADER_DIFAT_ENTRIES - len(header_difat))
+    header = struct.pack(
+        "<8s16sHHHHH6sIIIIIIIII",
+        b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",
+        b"\x00" * 16,
+        0x003E,
+        0x0003,
+        0xFFFE,
+        9,
+        6,
+        b"\x00" * 6,
+        0,
+        fat_sectors,
+        directory_start,
+        0,
+        _MINI_STREAM_CUTOFF,
+        mini_fat_start,
+        mini_fat_sectors,
+        difat_start if difat_sectors else _ENDOFCHAIN,
+        difat_sectors,
+    ) + struct.pack(f"<{_HEADER_DIFAT_ENTRIES}I", *header_difat)
+
+    directory = bytearray()
+    for entry in entries:
+        name = entry.name.encode("utf-16-le")
+        directory += struct.pack(
+            "<64sHBBIII16sIQQIQ",
+            name,
+            len(name) + 2,
+            entry.entry_type,
+            1,
+            entry.left,
+            entry.right,
+            entry.child,
+            b"\x00" * 16,
+            0,
+            0,
+            0,
+            entry.start if entry.size else _ENDOFCHAIN,
+            entry.size,
+        )
+    # Unused directory slots
+    while len(directory) % _SECTOR_SIZE:
+        directory += b"\x00" * 64 + struct.pack(
+            "<HBBIII", 0, 0, 0, _NOSTREAM, _NOSTREAM, _NOSTREAM
+        ).ljust(64, b"\x00")
+
+    with path.open("wb") as file:
+        file.write(header)
+        for entry in big_streams:
+            file.write(entry.data)
+            file.write(b"\x00" * (-entry.size % _SECTOR_SIZE))
+        file.write(mini_stream)
+        file.write(b"\x00" * (-len(mini_stream) % _SECTOR_SIZE))
+        mini_fat_data = struct.pack(f"<{len(mini_fat)}I", *mini_fat)
+        file.write(mini_fat_data)
+        file.write(b"\xff" * (-len(mini_fat_data) % _SECTOR_SIZE))
+        file.write(directory)
+        file.write(struct.pack(f"<{len(fat)}I", *fat))
+        remaining = fat_ids[_HEADER_DIFAT_ENTRIES:]
+        for index in range(difat_sectors):
+            ids = remaining[: _IDS_PER_SECTOR - 1]
+            remaining = remaining[_IDS_PER_SECTOR - 1 :]
+            ids += [_FREESECT] * (_IDS_PER_SECTOR - 1 - len(ids))
+            next_difat = (
+                difat_start + index + 1 if index + 1 < difat_sectors else _ENDOFCHAIN
+            )
+            file.write(struct.pack(f"<{_IDS_PER_SECTOR}I", *ids, next_difat))
+
+
+def _record(properties: dict[str, str]) -> bytes:
+    data = (
+        "|" + "|".join(f"{key}={value}" for key, value in properties.items())
+    ).encode("utf-8") + b"\x00"
+    return struct.pack("<I", len(data)) + data
+
+
+def write_schlib(path: pathlib.Path, parts: int, pins: int = 40) -> pathlib.Path:
+    """
+    Writes a SchLib with the given number of parts. Each part has the given
+    number of pin records after its properties, like a real symbol.
+    """
+    streams = {
+        "FileHeader": _record(
+            {
+                "HEADER": "Protel for Windows - Schematic Library Editor Binary File Version 5.0",
+                "Weight": str(parts),
+                "CompCount": str(parts),
+            }
+        )
+    }
+    for index in range(parts):
+        name = f"BENCH_SYMBOL_{index:06d}"
+        data = bytearray(
+            _record(
+                {
+                    "RECORD": "1",
+                    "LibReference": name,
+                    "ComponentDescription": f"Benchmark symbol {index} description",
+                    "PartCount": "2",
+                    "DisplayModeCount": "1",
+                    "CurrentPartId": "1",
+                    "LibraryPath": "*",
+                    "SourceLibraryName": "*",
+                    "TargetFileName": "*",
+                    "AreaColor": "11599871",
+                    "Color": "128",
+                }
+            )
+        )
+        for pin in range(pins):
+            data += _record(
+                {
+                    "RECORD": "2",
+                    "OwnerIndex": "0",
+                    "Location.X": str(pin * 10),
+                    "Location.Y": "0",
+                    "Name": f"PIN{pin}",
+                    "Designator": str(pin + 1),
+                }
+            )
+        streams[f"{name}/Data"] = bytes(data)
+    write_compound_file(path, streams)
+    return path
+
+
+def write_pcblib(
+    path: pathlib.Path, footprints: int, primitives_size: int = 8192
+) -> pathlib.Path:
+    """
+    Writes a PcbLib with the given number of footprints. Each footprint gets
+    a primitives stream of the given size, that the parser does not read.
+    """
+    header = "PCB 6.0 Binary Library File".encode("ascii")
+    toc = (
+        "\r\n".join(
+            f"Name=BENCH_FP_{index:06d}|Pad Count=8|Height=1mil|"
+            f"Description=Benchmark footprint {index} description"
+            for index in range(footprints)
+        ).encode("utf-8")
+        + b"\r\n\x00"
+    )
+    streams = {
+        "FileHeader": struct.pack("<I", len(header)) + header,
+        "Library/ComponentParamsTOC/Data": struct.pack("<I", len(toc)) + toc,
+    }
+    for index in range(footprints):
+        streams[f"BENCH_FP_{index:06d}/Data"] = bytes(
+            (index + offset) % 251 for offset in range(primitives_size)
+        )
+    write_compound_file(path, streams)
+    return path
+
+
+def generate(directory: pathlib.Path, symbols: int, footprints: int) -> typing.Tuple:
+    return (
+        write_schlib(directory / f"bench_{symbols}.SchLib", symbols),
+        write_pcblib(directory / f"bench_{footprints}.PcbLib", footprints),
+    )
@@ -0,0 +1,245 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import asyncio
+import contextlib
+import dataclasses
+import itertools
+import statistics
+import time
+import typing
+
+import click
+from sqlalchemy import insert, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import edaparts.models
+from edaparts.app.config import Config
+from edaparts.migrations import migrations
+from edaparts.models import FootprintReference, LibraryReference
+from edaparts.models.components.component_model import CHIP_PACKAGES, ComponentModel
+from edaparts.models.internal.internal_models import CadType, StorageStatus
+from edaparts.models.libraries.join_tables import (
+    component_footprint_asc_table,
+    component_library_asc_table,
+)
+from edaparts.services.database import sessionmanager
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    label: str
+    timings: list[float]
+
+    @property
+    def best(self) -> float:
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.timings)
+
+
+def db_url_option(func):
+    # The benchmarks drop and recreate the whole schema, so the database is
+    # never taken from the application configuration
+    return click.option(
+        "--db-url",
+        envvar="BENCH_DB_CONNECTION_STRING",
+        required=True,
+        help="Scratch database URI. Its content is dropped!",
+    )(func)
+
+
+def repeat_option(func):
+    return click.option(
+        "-r", "--repeat", default=20, show_default=True, help="Runs per case"
+    )(func)
+
+
+async def measure(
+    label: str, repeat: int, func: typing.Callable[[], typing.Awaitable]
+) -> BenchmarkResult:
+    # Warm up caches and connections before timing
+    await func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+    return BenchmarkResult(label=label, timings=timings)
+
+
+def measure_sync(
+    label: str, repeat: int, func: typing.Callable[[], typing.Any]
+) -> BenchmarkResult:
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return BenchmarkResult(label=label, timings=timings)
+
+
+def print_results(title: str, results: typing.Sequence[BenchmarkResult]):
+    click.echo(title)
+    width = max(len(result.label) for result in results)
+    baseline = results[0].median
+    for result in results:
+        click.echo(
+            f"  {result.label:<{width}}  best={result.best * 1000:9.3f}ms  "
+            f"median={result.median * 1000:9.3f}ms  mean={result.mean * 1000:9.3f}ms  "
+            f"x{baseline / result.median:6.2f}"
+        )
+
+
+@contextlib.asynccontextmanager
+async def scratch_database(db_url: str) -> typing.AsyncIterator[None]:
+    sessionmanager.init(db_url)
+    try:
+        async with sessionmanager.connect() as connection:
+            await sessionmanager.drop_all(connection)
+            await sessionmanager.create_all(connection)
+        yield
+    finally:
+        await sessionmanager.close()
+
+
+@contextlib.asynccontextmanager
+async def migrated_database(
+    db_url: str, revision: str = "head"
+) -> typing.AsyncIterator[None]:
+    # Like scratch_database, but the schema is created by the migrations, so
+    # the library views exist too
+    sessionmanager.init(db_url)
+    try:
+        async with sessionmanager.connect() as connection:
+            await connection.execute(text("DROP SCHEMA public CASCADE"))
+            await connection.execute(text("CREATE SCHEMA public"))
+        # The migrations take the database from the configuration
+        Config.DB_CONNECTION_STRING = db_url
+        await asyncio.to_thread(migrations.upgrade, revision)
+        yield
+    finally:
+        await sessionmanager.close()
+
+
+def component_types() -> list[typing.Type[ComponentModel]]:
+    return [
+        mapper.class_
+        for mapper in inspect(ComponentModel).polymorphic_map.values()
+        if mapper.class_ is not ComponentModel
+    ]
+
+
+async def seed_components(
+    db: AsyncSession,
+    count: int,
+    types: typing.Sequence[typing.Type[ComponentModel]] = None,
+    batch_size: int = 2000,
+) -> int:
+    types_cycle = itertools.cycle(types or component_types())
+    for start in range(0, count, batch_size):
+        for index in range(start, min(start + batch_size, count)):
+            model_type = next(types_cycle)
+            db.add(
+                model_type(
+                    type=model_type.__tablename__,
+                    mpn=f"BENCH-{index:08d}",
+                    manufacturer="Benchmark Inc.",
+                    value=f"{index % 1000} n",
+                    package=CHIP_PACKAGES[index % len(CHIP_PACKAGES)],
+                    description=f"Benchmark component {index}",
+                    comment_altium="=Value",
+                    comment_kicad="${VALUE}",
+                    is_through_hole=False,
+                    operating_temperature_min="-40 ºC",
+                    operating_temperature_max="125 ºC",
+                )
+            )
+        await db.commit()
+        # Keep the identity map small between batches
+        db.expunge_all()
+    return count
+
+
+async def link_library_refs(db: AsyncSession, footprints: int = 2):
+    # Every component gets a symbol and the given footprints of each CAD, so
+    # it is shown by both the Altium and the KiCad views
+    symbol_ids = []
+    footprint_ids = []
+    for cad_type in CadType:
+        symbol = LibraryReference(
+            path=f"bench.{cad_type.value}",
+            reference="Bench",
+            alias="BENCH",
+            storage_status=StorageStatus.STORED,
+            cad_type=cad_type,
+        )
+        footprint_refs = [
+            FootprintReference(
+                path=f"bench_{index}.{cad_type.value}",
+                reference=f"Bench {index}",
+                alias="BENCH",
+                storage_status=StorageStatus.STORED,
+                cad_type=cad_type,
+            )
+            for index in range(footprints)
+        ]
+        db.add_all([symbol, *footprint_refs])
+        await db.flush()
+        symbol_ids.append(symbol.id)
+        footprint_ids.extend(footprint_ref.id for footprint_ref in footprint_refs)
+
+    component_ids = (await db.scalars(select(ComponentModel.id))).all()
+    for start in range(0, len(component_ids), 2000):
+        batch = component_ids[start : start + 2000]
+        await db.execute(
+            insert(component_library_asc_table),
+            [
+                {"component_id": component_id, "library_ref_id": symbol_id}
+                for component_id in batch
+                for symbol_id in symbol_ids
+            ],
+        )
+        if footprint_ids:
+            await db.execute(
+                insert(component_footprint_asc_table),
+                [
+                    {"component_id": component_id, "footprint_ref_id": footprint_id}
+                    for component_id in batch
+                    for footprint_id in footprint_ids
+                ],
+            )
+    await db.commit()
+
+
+def run(coro: typing.Coroutine):
+    return asyncio.run(coro)
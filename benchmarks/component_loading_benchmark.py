@@ -0,0 +1,85 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+"""
+Compares the polymorphic (all component tables joined) and the subtype
+targeted component loading modes.
+
+    python -m benchmarks.component_loading_benchmark --db-url postgresql+psycopg://...
+"""
+
+import click
+
+from benchmarks import common
+from edaparts.models.internal.internal_models import ComponentLoadingMode
+from edaparts.services import component_service
+from edaparts.services.database import sessionmanager
+
+
+async def _run_benchmark(db_url: str, components: int, page_size: int, repeat: int):
+    async with common.scratch_database(db_url):
+        async with sessionmanager.session() as db:
+            await common.seed_components(db, components)
+
+        results_list = []
+        results_single = []
+        for mode in ComponentLoadingMode:
+
+            async def list_page(loading_mode=mode):
+                async with sessionmanager.session() as session:
+                    await component_service.get_component_list(
+                        session,
+                        page_number=2,
+                        page_size=page_size,
+                        loading_mode=loading_mode,
+                    )
+
+            async def single(loading_mode=mode):
+                async with sessionmanager.session() as session:
+                    await component_service.get_component(
+                        session, components // 2, loading_mode=loading_mode
+                    )
+
+            results_list.append(await common.measure(mode.value, repeat, list_page))
+            results_single.append(await common.measure(mode.value, repeat, single))
+
+        common.print_results(
+            f"get_component_list [components={components}, page_size={page_size}]",
+            results_list,
+        )
+        common.print_results("get_component", results_single)
+
+
+@click.command()
+@common.db_url_option
+@common.repeat_option
+@click.option("-n", "--components", default=80000, show_default=True)
+@click.option("-p", "--page-size", default=100, show_default=True)
+def main(db_url: str, repeat: int, components: int, page_size: int):
+    common.run(_run_benchmark(db_url, components, page_size, repeat))
+
+
+if __name__ == "__main__":
+    main()
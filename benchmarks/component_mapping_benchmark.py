@@ -0,0 +1,143 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+"""
+Compares the per instance inspection of component models mapped to query
+DTOs with the precomputed mapping plans. It needs no database.
+
+    python -m benchmarks.component_mapping_benchmark --page-size 500
+"""
+
+import datetime
+import itertools
+import typing
+
+import click
+from sqlalchemy import inspect
+
+from benchmarks import common
+from edaparts.dtos import components_dtos
+from edaparts.dtos.components.common_dtos import ComponentCommentToolFields
+
+
+def _validated_map(model):
+    # The mapping used before the plans, kept as reference
+    dto_t = components_dtos._model_to_query_dto[type(model)]
+    dto_data = {
+        c.key: getattr(model, c.key)
+        for c in inspect(model).mapper.column_attrs
+        if c.key in dto_t.model_fields
+    }
+    dto_data["component_type"] = typing.get_args(
+        dto_t.model_fields["component_type"].annotation
+    )[0]
+    mapped_dto = dto_t(**dto_data)
+    mapped_dto.comment = ComponentCommentToolFields.from_model(model)
+    return mapped_dto
+
+
+def _build_page(page_size: int) -> list:
+    now = datetime.datetime.now()
+    # Only the types exposed by the API have a query DTO
+    types_cycle = itertools.cycle(
+        t for t in common.component_types() if t in components_dtos._model_to_query_dto
+    )
+    page = []
+    for index in range(page_size):
+        model_type = next(types_cycle)
+        model = model_type(
+            id=index + 1,
+            type=model_type.__tablename__,
+            created_on=now,
+            updated_on=now,
+            mpn=f"BENCH-{index:08d}",
+            manufacturer="Benchmark Inc.",
+            value=f"{index % 1000} n",
+            package="0603 (1608 Metric)",
+            description=f"Benchmark component {index}",
+            comment_altium="=Value",
+            comment_kicad="${VALUE}",
+            is_through_hole=False,
+            operating_temperature_min="-40 ºC",
+            operating_temperature_max="125 ºC",
+        )
+        # Rows loaded from the DB have all their columns set
+        for attr in inspect(model_type).column_attrs:
+            if attr.key not in model.__dict__:
+                setattr(model, attr.key, None)
+        page.append(model)
+    return page
+
+
+@click.command()
+@common.repeat_option
+@click.option("-p", "--page-size", default=500, show_default=True)
+def main(repeat: int, page_size: int):
+    page = _build_page(page_size)
+    for model in page:
+        if _validated_map(model) != components_dtos.map_component_model_to_query_dto(
+            model
+        ):
+            raise click.ClickException(f"Different DTOs for {type(model).__name__}")
+
+    common.print_results(
+        f"map page [{page_size} components]",
+        [
+            common.measure_sync(
+                "validated", repeat, lambda: [_validated_map(m) for m in page]
+            ),
+            common.measure_sync(
+                "plan",
+                repeat,
+                lambda: [
+                    components_dtos.map_component_model_to_query_dto(m) for m in page
+                ],
+            ),
+        ],
+    )
+    common.print_results(
+        f"map and dump page [{page_size} components]",
+        [
+            common.measure_sync(
+                "validated",
+                repeat,
+                lambda: [_validated_map(m).model_dump_json() for m in page],
+            ),
+            common.measure_sync(
+                "plan",
+                repeat,
+                lambda: [
+                    components_dtos.map_component_model_to_query_dto(
+                        m
+                    ).model_dump_json()
+                    for m in page
+                ],
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
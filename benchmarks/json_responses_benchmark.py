@@ -0,0 +1,169 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+"""
+Compares the FastAPI response model validation and encoding with the direct
+JSON serialization of the read routes (FAST_JSON_RESPONSES).
+
+    python -m benchmarks.json_responses_benchmark --db-url postgresql+psycopg://...
+"""
+
+import click
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import insert, select
+
+import edaparts.routers.routers
+from benchmarks import common
+from edaparts.dtos import components_dtos
+from edaparts.app.config import Config
+from edaparts.app.api import exception_handler_api_error
+from edaparts.models import LibraryReference
+from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.components.resistor_model import ResistorModel
+from edaparts.models.internal.internal_models import CadType, StorageStatus
+from edaparts.models.inventory.inventory_item_model import InventoryItemModel
+from edaparts.models.libraries.join_tables import component_library_asc_table
+from edaparts.services import kicad
+from edaparts.services.database import sessionmanager
+from edaparts.services.exceptions import ApiError
+
+
+async def _seed(components: int):
+    # Every component gets an inventory item and a KiCad symbol, so all the
+    # routes return full pages
+    async with sessionmanager.session() as db:
+        # Only the types exposed by the API have a query DTO
+        await common.seed_components(
+            db,
+            components,
+            types=[
+                t
+                for t in common.component_types()
+                if t in components_dtos._model_to_query_dto
+            ],
+        )
+        symbol = LibraryReference(
+            path="bench.kicad_sym",
+            reference="Bench",
+            storage_status=StorageStatus.STORED,
+            cad_type=CadType.KICAD,
+        )
+        db.add(symbol)
+        await db.flush()
+        rows = (
+            await db.execute(
+                select(
+                    ComponentModel.__table__.c.id,
+                    ComponentModel.__table__.c.mpn,
+                    ComponentModel.__table__.c.manufacturer,
+                )
+            )
+        ).all()
+        for start in range(0, len(rows), 2000):
+            batch = rows[start : start + 2000]
+            await db.execute(
+                insert(InventoryItemModel),
+                [
+                    {
+                        "dici": f"BENCH-{component_id:010d}",
+                        "mpn": mpn,
+                        "manufacturer": manufacturer,
+                        "name": mpn,
+                        "description": f"Benchmark item {component_id}",
+                        "last_buy_price": 0.0,
+                        "component_id": component_id,
+                    }
+                    for component_id, mpn, manufacturer in batch
+                ],
+            )
+            await db.execute(
+                insert(component_library_asc_table),
+                [
+                    {"component_id": component_id, "library_ref_id": symbol.id}
+                    for component_id, _, _ in batch
+                ],
+            )
+        await db.commit()
+
+
+async def _run_benchmark(db_url: str, components: int, page_size: int, repeat: int):
+    async with common.scratch_database(db_url):
+        await _seed(components)
+
+        app = FastAPI()
+        app.include_router(edaparts.routers.routers.router)
+        app.add_exception_handler(ApiError, exception_handler_api_error)
+        resistors_category = next(
+            category.id
+            for category in kicad.get_components_categories().values()
+            if category.component_type is ResistorModel
+        )
+        routes = {
+            "kicad category parts": f"/tools/kicad/api/v1/parts/category/{resistors_category}.json",
+            "components list": f"/components?page_size={page_size}&count_mode=none",
+            "inventory items list": f"/inventory/items?page_size={page_size}"
+            "&include_component=true&count_mode=none",
+        }
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            for name, url in routes.items():
+                results = []
+                bodies = []
+                for fast in (False, True):
+
+                    async def request(url=url):
+                        response = await client.get(url)
+                        response.raise_for_status()
+                        return response
+
+                    Config.FAST_JSON_RESPONSES = fast
+                    bodies.append((await request()).json())
+                    results.append(
+                        await common.measure(
+                            "fast" if fast else "response_model", repeat, request
+                        )
+                    )
+                if bodies[0] != bodies[1]:
+                    raise click.ClickException(f"Different responses for {name}")
+                elements = (
+                    bodies[0] if isinstance(bodies[0], list) else bodies[0]["elements"]
+                )
+                common.print_results(f"{name} [{len(elements)} elements]", results)
+
+
+@click.command()
+@common.db_url_option
+@common.repeat_option
+@click.option("-n", "--components", default=20000, show_default=True)
+@click.option("-p", "--page-size", default=500, show_default=True)
+def main(db_url: str, repeat: int, components: int, page_size: int):
+    common.run(_run_benchmark(db_url, components, page_size, repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+"""
+Generators of synthetic KiCad symbol libraries and footprints, in the KiCad 7
+file format, for the benchmarks.
+
+The generated files include the constructs that trip naive s-expression
+scanners: escaped quotes, brackets inside strings, nested unit symbols and
+repeated description tokens.
+"""
+
+import pathlib
+
+_PIN = """      (pin passive line (at {x} {y} 180) (length 2.54)
+        (name "P{index}" (effects (font (size 1.27 1.27))))
+        (number "{index}" (effects (font (size 1.27 1.27))))
+      )
+"""
+
+_SYMBOL = """  (symbol "{name}" (pin_names (offset 1.016)) (in_bom yes) (on_board yes)
+    (property "Reference" "U" (at 0 1.27 0)
+      (effects (font (size 1.27 1.27)))
+    )
+    (property "Value" "{name}" (at 0 -1.27 0)
+      (effects (font (size 1.27 1.27)))
+    )
+    (property "Footprint" "Benchmark:FP_{index}" (at 0 0 0)
+      (effects (font (size 1.27 1.27)) hide)
+    )
+    (property "Datasheet" "https://example.com/{name}.pdf" (at 0 0 0)
+      (effects (font (size 1.27 1.27)) hide)
+    )
+    (property "Description" "{description}" (at 0 0 0)
+      (effects (font (size 1.27 1.27)) hide)
+    )
+    (property "ki_keywords" "(benchmark) \\"symbol\\"" (at 0 0 0)
+      (effects (font (size 1.27 1.27)) hide)
+    )
+    (symbol "{name}_0_1"
+      (rectangle (start -5.08 5.08) (end 5.08 -5.08)
+        (stroke (width 0.254) (type default))
+        (fill (type background))
+      )
+    )
+    (symbol "{name}_1_1"
+{pins}    )
+  )
+"""
+
+_PAD = """  (pad "{index}" smd roundrect (at {x} 0) (size 0.6 1.2) (layers "F.Cu" "F.Paste" "F.Mask") (roundrect_rratio 0.25))
+"""
+
+_FOOTPRINT = """(footprint "Benchmark:{name}" (version 20221018) (generator pcbnew)
+  (layer "F.Cu")
+  (descr "Legacy description")
+  (tags "benchmark (synthetic)")
+  (attr smd)
+  (fp_text reference "REF**" (at 0 -2) (layer "F.SilkS")
+    (effects (font (size 1 1) (thickness 0.15)))
+  )
+  (fp_text value "{name}" (at 0 2) (layer "F.Fab")
+    (effects (font (size 1 1) (thickness 0.15)))
+  )
+  (fp_line (start -3 -1) (end 3 -1) (stroke (width 0.12) (type solid)) (layer "F.SilkS"))
+  (fp_line (start -3 1) (end 3 1) (stroke (width 0.12) (type solid)) (layer "F.SilkS"))
+{pads}  (descr "{description}")
+)
+"""
+
+
+def _description(index: int) -> str:
+    # Escaped quotes and brackets that must not be taken as structure
+    return f'Benchmark part {index} (\\"{index} pins\\")'
+
+
+def write_symbol_lib(path: pathlib.Path, symbols: int, pins: int = 8):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(
+            "(kicad_symbol_lib (version 20220914) (generator kicad_symbol_editor)\n"
+        )
+        for index in range(symbols):
+            name = f"SYM_{index}"
+            file.write(
+                _SYMBOL.format(
+                    name=name,
+                    index=index,
+                    description=_description(index),
+                    pins="".join(
+                        _PIN.format(index=pin, x=7.62, y=pin * -2.54)
+                        for pin in range(1, pins + 1)
+                    ),
+                )
+            )
+        file.write(")\n")
+
+
+def write_footprint(path: pathlib.Path, name: str, index: int, pads: int = 8):
+    path.write_text(
+        _FOOTPRINT.format(
+            name=name,
+            description=_description(index),
+            pads="".join(
+                _PAD.format(index=pad, x=pad * 0.8) for pad in range(1, pads + 1)
+            ),
+        ),
+        encoding="utf-8",
+    )
+
+
+def generate(
+    directory: pathlib.Path, symbols: int, footprints: int
+) -> tuple[pathlib.Path, pathlib.Path]:
+    """
+    Writes a symbol library and a footprint library directory with the given
+    number of symbols and footprints. Returns the paths of both.
+    """
+    symbol_lib = directory.joinpath("benchmark.kicad_sym")
+    write_symbol_lib(symbol_lib, symbols)
+    footprint_lib = directory.joinpath("benchmark.pretty")
+    footprint_lib.mkdir()
+    for index in range(footprints):
+        name = f"FP_{index}"
+        write_footprint(footprint_lib.joinpath(f"{name}.kicad_mod"), name, index)
+    return symbol_lib, footprint_lib
@@ -0,0 +1,117 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+"""
+Compares the KiCad scanner with the full kiutils parsing.
+
+Besides the timings, it checks that both give the same models. Pass
+--corpus with a directory of real libraries (e.g. a checkout of the KiCad
+symbols and footprints repositories) to check every library found in it.
+"""
+
+import pathlib
+import sys
+import tempfile
+
+import click
+
+from benchmarks import common, kicad_fixtures
+from edaparts.models.internal.internal_models import CadType
+from edaparts.services.exceptions import ApiError
+from edaparts.utils import models_parser
+
+
+def _parse(path: pathlib.Path, deep_validation: bool):
+    try:
+        return models_parser.parse_file(
+            path, CadType.KICAD, deep_validation=deep_validation
+        )
+    except ApiError as err:
+        return err.msg
+
+
+def _check_corpus(corpus: pathlib.Path) -> bool:
+    libraries = sorted(
+        [*corpus.rglob("*.kicad_sym"), *corpus.rglob("*.pretty")], key=str
+    )
+    mismatches = 0
+    for library in libraries:
+        scanned = _parse(library, False)
+        parsed = _parse(library, True)
+        if isinstance(parsed, models_parser.Library) and (
+            not isinstance(scanned, models_parser.Library)
+            or scanned.models != parsed.models
+        ):
+            mismatches += 1
+            click.echo(f"MISMATCH {library}")
+    click.echo(f"{len(libraries)} libraries checked, {mismatches} mismatches")
+    return mismatches == 0
+
+
+@click.command()
+@common.repeat_option
+@click.option("-s", "--symbols", default=2000, show_default=True)
+@click.option("-f", "--footprints", default=500, show_default=True)
+@click.option(
+    "--corpus",
+    type=click.Path(exists=True, file_okay=False, path_type=pathlib.Path),
+    help="Directory of real KiCad libraries to check",
+)
+def main(repeat: int, symbols: int, footprints: int, corpus: pathlib.Path | None):
+    with tempfile.TemporaryDirectory() as directory:
+        symbol_lib, footprint_lib = kicad_fixtures.generate(
+            pathlib.Path(directory), symbols, footprints
+        )
+        for library in (symbol_lib, footprint_lib):
+            scanned = models_parser.parse_file(library, CadType.KICAD)
+            parsed = models_parser.parse_file(
+                library, CadType.KICAD, deep_validation=True
+            )
+            if scanned.models != parsed.models:
+                click.echo(f"MISMATCH {library.name}")
+                sys.exit(1)
+            common.print_results(
+                f"parse_file [{library.name}, {len(scanned.models)} models]",
+                [
+                    common.measure_sync(
+                        "kiutils",
+                        max(1, repeat // 5),
+                        lambda: models_parser.parse_file(
+                            library, CadType.KICAD, deep_validation=True
+                        ),
+                    ),
+                    common.measure_sync(
+                        "scanner",
+                        repeat,
+                        lambda: models_parser.parse_file(library, CadType.KICAD),
+                    ),
+                ],
+            )
+
+    if corpus is not None and not _check_corpus(corpus):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+"""
+Compares the per query latency of the plain Altium and KiCad library views
+with their materialized variants, browsing a whole view and looking a part
+up by its part number, and measures the concurrent refresh of each one.
+
+    python -m benchmarks.library_views_benchmark --db-url postgresql+psycopg://...
+"""
+
+import click
+from sqlalchemy import text
+
+from benchmarks import common
+from edaparts.models.components.capacitor_ceramic_model import CapacitorCeramicModel
+from edaparts.models.components.resistor_model import ResistorModel
+from edaparts.services import library_views
+from edaparts.services.database import sessionmanager
+
+_DEFAULT_VIEWS = (
+    "Altium Resistors",
+    "Altium Resistors 0603",
+    "Altium Capacitors Ceramic",
+    "KiCad Resistors",
+)
+
+
+async def _seed(components: int):
+    async with sessionmanager.session() as db:
+        await common.seed_components(
+            db, components, types=[ResistorModel, CapacitorCeramicModel]
+        )
+        await common.link_library_refs(db)
+
+
+async def _run_benchmark(
+    db_url: str, components: int, views: tuple[str, ...], repeat: int
+):
+    async with common.migrated_database(db_url):
+        await _seed(components)
+        materialized_views = {
+            view: f"{view}{library_views.MATERIALIZED_VIEW_SUFFIX}" for view in views
+        }
+        await library_views.refresh_views(materialized_views.values())
+
+        for view, materialized_view in materialized_views.items():
+            async with sessionmanager.connect() as connection:
+                quoted = connection.dialect.identifier_preparer.quote
+                part_number = await connection.scalar(
+                    text(f'SELECT "Part Number" FROM {quoted(materialized_view)}')
+                )
+                if part_number is None:
+                    raise click.ClickException(f"{view} is empty")
+
+            browse_results = []
+            lookup_results = []
+            for label, name in (("plain", view), ("materialized", materialized_view)):
+
+                async def browse(name=name):
+                    async with sessionmanager.connect() as connection:
+                        return (
+                            await connection.execute(
+                                text(f"SELECT * FROM {quoted(name)}")
+                            )
+                        ).all()
+
+                async def lookup(name=name):
+                    async with sessionmanager.connect() as connection:
+                        return (
+                            await connection.execute(
+                                text(
+                                    f"SELECT * FROM {quoted(name)} "
+                                    'WHERE "Part Number" = :part_number'
+                                ),
+                                {"part_number": part_number},
+                            )
+                        ).all()
+
+                browse_results.append(await common.measure(label, repeat, browse))
+                lookup_results.append(await common.measure(label, repeat, lookup))
+
+            rows = len(await browse())
+            common.print_results(f"{view}: browse [{rows} rows]", browse_results)
+            common.print_results(f"{view}: part number lookup", lookup_results)
+            common.print_results(
+                f"{view}: concurrent refresh",
+                [
+                    await common.measure(
+                        "refresh",
+                        max(1, repeat // 4),
+                        lambda name=materialized_view: library_views.refresh_views(
+                            [name]
+                        ),
+                    )
+                ],
+            )
+
+
+@click.command()
+@common.db_url_option
+@common.repeat_option
+@click.option("-n", "--components", default=20000, show_default=True)
+@click.option(
+    "-v",
+    "--view",
+    "views",
+    multiple=True,
+    default=_DEFAULT_VIEWS,
+    show_default=True,
+    help="Plain view to compare, may be repeated",
+)
+def main(db_url: str, repeat: int, components: int, views: tuple[str, ...]):
+    common.run(_run_benchmark(db_url, components, views, repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import pathlib
+import tempfile
+
+import click
+from olefile import olefile
+
+from benchmarks import altium_fixtures, common
+from edaparts.models.internal.internal_models import CadType
+from edaparts.utils import models_parser
+
+
+def _bytewise_read_stream(ole: olefile.OleFileIO, path: str) -> bytes:
+    # The reading approach used before the bulk reads, kept as reference
+    stream = ole.openstream(path)
+    buffer = bytes()
+    while c := stream.read(1):
+        buffer += c
+    stream.close()
+    return buffer
+
+
+@click.command()
+@common.repeat_option
+@click.option("-s", "--symbols", default=2000, show_default=True)
+@click.option("-f", "--footprints", default=2000, show_default=True)
+def main(repeat: int, symbols: int, footprints: int):
+    with tempfile.TemporaryDirectory() as directory:
+        schlib, pcblib = altium_fixtures.generate(
+            pathlib.Path(directory), symbols, footprints
+        )
+        for library in (schlib, pcblib):
+            common.print_results(
+                f"parse_file [{library.name}, {library.stat().st_size / 2**20:.1f} MiB]",
+                [
+                    common.measure_sync(
+                        "bulk",
+                        repeat,
+                        lambda: models_parser.parse_file(library, CadType.ALTIUM),
+                    )
+                ],
+            )
+
+        # Byte at a time reading is too slow to read every stream of a big
+        # library, so the comparison uses the PcbLib TOC stream only
+        toc_path = "Library/ComponentParamsTOC/Data"
+        with olefile.OleFileIO(pcblib) as ole:
+            common.print_results(
+                f"read stream [{toc_path}, {ole.get_size(toc_path) / 2**10:.1f} KiB]",
+                [
+                    common.measure_sync(
+                        "bytewise", 1, lambda: _bytewise_read_stream(ole, toc_path)
+                    ),
+                    common.measure_sync(
+                        "bulk",
+                        repeat,
+                        lambda: models_parser._read_stream(ole, toc_path),
+                    ),
+                ],
+            )
+
+
+if __name__ == "__main__":
+    main()
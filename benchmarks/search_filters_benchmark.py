@@ -0,0 +1,110 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+"""
+Measures the building of the inventory search filters of the component
+fields, with their keys parsed on each request and with the parsed keys
+taken from the cache. It needs no database.
+
+    python -m benchmarks.search_filters_benchmark --iterations 1000
+"""
+
+import itertools
+
+import click
+
+from benchmarks import common
+from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.metadata.metadata_parser import metadata_parser
+from edaparts.services import search_service
+
+# Operators and a valid value of each field type
+_TYPE_FILTERS = {
+    str: (("eq", "100n"), ("like", "%0603%"), ("noteq", "DNP")),
+    int: (("min", "10"), ("maxeq", "1000"), ("eq", "42")),
+    bool: (("eq", "false"), ("noteq", "true")),
+}
+_NUMERIC_FILTERS = (("mineq", "90n"), ("maxeq", "110n"), ("min", "1"))
+
+
+def _build_filters(count: int) -> dict[str, str]:
+    candidates = []
+    for field in metadata_parser.get_model_metadata_by_model(
+        ComponentModel
+    ).fields.values():
+        operators = (
+            _NUMERIC_FILTERS
+            if field.numeric_field
+            else _TYPE_FILTERS.get(field.data_type, ())
+        )
+        candidates.append(
+            [(f"comp_{field.name}_{operator}", value) for operator, value in operators]
+        )
+    # One filter of each field first, so the filters spread over the fields
+    filters = [
+        f
+        for f in itertools.chain.from_iterable(itertools.zip_longest(*candidates))
+        if f
+    ]
+    if count > len(filters):
+        raise click.ClickException(f"Only {len(filters)} distinct filters available")
+    return dict(filters[:count])
+
+
+def _parsed(filters: dict[str, str], iterations: int):
+    for _ in range(iterations):
+        search_service.__parse_filter_keys.cache_clear()
+        search_service.__parse_filter_for_sqlalquemy_model(
+            ComponentModel, "comp", filters
+        )
+
+
+def _cached(filters: dict[str, str], iterations: int):
+    for _ in range(iterations):
+        search_service.__parse_filter_for_sqlalquemy_model(
+            ComponentModel, "comp", filters
+        )
+
+
+@click.command()
+@common.repeat_option
+@click.option("-i", "--iterations", default=1000, show_default=True)
+def main(repeat: int, iterations: int):
+    metadata_parser.load()
+    for count in (1, 5, 20):
+        filters = _build_filters(count)
+        common.print_results(
+            f"build {count} filters [{iterations} requests]",
+            [
+                common.measure_sync(
+                    "parsed", repeat, lambda: _parsed(filters, iterations)
+                ),
+                common.measure_sync(
+                    "cached", repeat, lambda: _cached(filters, iterations)
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
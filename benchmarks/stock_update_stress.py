@@ -0,0 +1,160 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+"""
+Concurrency stress test of the mass stock updates.
+
+Runs mass updates from many concurrent clients over a small set of shared
+stocks, in random line order, and checks that no update is lost: every
+stock must end at its initial level plus all the applied movements, and
+every line must have its movement. Exits with an error otherwise.
+"""
+
+import asyncio
+import collections
+import random
+import sys
+import time
+
+import click
+from sqlalchemy import func, select
+
+from benchmarks import common
+from edaparts.models.internal.internal_inventory_models import (
+    MassStockMovement,
+    SingleStockMovement,
+)
+from edaparts.models.inventory import (
+    InventoryItemLocationStockModel,
+    InventoryItemLocationStockMovementModel,
+    InventoryItemModel,
+    InventoryLocationModel,
+)
+from edaparts.services import inventory_service
+from edaparts.services.database import sessionmanager
+
+_INITIAL_STOCK = 1_000_000.0
+
+
+async def _seed(stocks: int) -> list[tuple[str, str]]:
+    async with sessionmanager.session() as db:
+        location = InventoryLocationModel(name="Stress", dici="LOC-STRESS")
+        db.add(location)
+        for index in range(stocks):
+            db.add(
+                InventoryItemLocationStockModel(
+                    actual_stock=_INITIAL_STOCK,
+                    stock_min_level=0.0,
+                    location=location,
+                    item=InventoryItemModel(
+                        mpn=f"STRESS-{index:06d}",
+                        manufacturer="Benchmark Inc.",
+                        name=f"Stress item {index}",
+                        dici=f"ITEM-STRESS{index:06d}",
+                    ),
+                )
+            )
+        await db.commit()
+    return [(f"ITEM-STRESS{index:06d}", "LOC-STRESS") for index in range(stocks)]
+
+
+async def _client(
+    seed: int,
+    bins: list[tuple[str, str]],
+    updates: int,
+    lines: int,
+    applied: collections.Counter,
+) -> int:
+    generator = random.Random(seed)
+    for _ in range(updates):
+        movements = [
+            SingleStockMovement(*generator.choice(bins), generator.randint(-5, 5))
+            for _ in range(lines)
+        ]
+        async with sessionmanager.session() as db:
+            await inventory_service.stock_mass_update(
+                db, MassStockMovement(reason="stress", movements=movements)
+            )
+        # Only count the movements once committed
+        for movement in movements:
+            applied[movement.item_identifier] += movement.quantity
+    return updates * lines
+
+
+@click.command()
+@common.db_url_option
+@click.option("-c", "--clients", default=8, show_default=True)
+@click.option("-u", "--updates", default=50, show_default=True, help="Per client")
+@click.option("-l", "--lines", default=50, show_default=True, help="Per update")
+@click.option("-s", "--stocks", default=20, show_default=True)
+def main(db_url: str, clients: int, updates: int, lines: int, stocks: int):
+    async def run():
+        async with common.scratch_database(db_url):
+            bins = await _seed(stocks)
+            applied = collections.Counter()
+            started_at = time.perf_counter()
+            total_lines = sum(
+                await asyncio.gather(
+                    *(
+                        _client(seed, bins, updates, lines, applied)
+                        for seed in range(clients)
+                    )
+                )
+            )
+            elapsed = time.perf_counter() - started_at
+            click.echo(
+                f"{clients} clients, {total_lines} lines in {elapsed:.2f}s "
+                f"({total_lines / elapsed:.0f} lines/s)"
+            )
+
+            async with sessionmanager.session() as db:
+                levels = dict(
+                    (
+                        await db.execute(
+                            select(
+                                InventoryItemModel.dici,
+                                InventoryItemLocationStockModel.actual_stock,
+                            ).join(InventoryItemLocationStockModel.item)
+                        )
+                    ).all()
+                )
+                movements = await db.scalar(
+                    select(func.count(InventoryItemLocationStockMovementModel.id))
+                )
+
+            lost = {
+                dici: level - (_INITIAL_STOCK + applied[dici])
+                for dici, level in levels.items()
+                if level != _INITIAL_STOCK + applied[dici]
+            }
+            if lost or movements != total_lines:
+                click.echo(f"FAILED: lost updates {lost}, {movements} movements")
+                sys.exit(1)
+            click.echo("OK: no lost updates")
+
+    common.run(run())
+
+
+if __name__ == "__main__":
+    main()
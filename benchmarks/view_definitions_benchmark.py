@@ -0,0 +1,162 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+"""
+Compares the legacy crosstab library views with the generated ones, that
+aggregate the footprints of each component in a lateral subquery, on the same
+dataset: latency and query plans of browsing a whole view and of looking a
+part up by its part number.
+
+    python -m benchmarks.view_definitions_benchmark --db-url postgresql+psycopg://...
+"""
+
+import asyncio
+import json
+
+import click
+from sqlalchemy import text
+
+from benchmarks import common
+from edaparts.migrations import migrations
+from edaparts.models.components.capacitor_ceramic_model import CapacitorCeramicModel
+from edaparts.models.components.resistor_model import ResistorModel
+from edaparts.services.database import sessionmanager
+
+# Last revision with the hand-written crosstab views, and the one that
+# replaces them with the generated ones
+_LEGACY_REVISION = "c9e27a4f1d83"
+_GENERATED_REVISION = "d58e3b9a0f26"
+
+_DEFAULT_VIEWS = (
+    "Altium Resistors",
+    "Altium Resistors 0603",
+    "KiCad Resistors",
+    "KiCad Capacitors Ceramic 0805",
+)
+
+
+def _queries(view: str) -> dict[str, str]:
+    return {
+        "browse": f'SELECT * FROM "{view}"',
+        "part number lookup": (
+            f'SELECT * FROM "{view}" WHERE "Part Number" = :part_number'
+        ),
+    }
+
+
+async def _part_number(view: str) -> str:
+    async with sessionmanager.connect() as connection:
+        part_number = await connection.scalar(
+            text(f'SELECT "Part Number" FROM "{view}" LIMIT 1')
+        )
+    if part_number is None:
+        raise click.ClickException(f"{view} is empty")
+    return part_number
+
+
+async def _explain(query: str, params: dict) -> tuple[str, float]:
+    async with sessionmanager.connect() as connection:
+        plan = await connection.scalar(
+            text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}"), params
+        )
+    # Some drivers return the JSON plan as text
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]["Node Type"], plan[0]["Execution Time"]
+
+
+async def _explain_text(query: str, params: dict) -> list[str]:
+    async with sessionmanager.connect() as connection:
+        return (
+            await connection.scalars(
+                text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"), params
+            )
+        ).all()
+
+
+async def _measure_views(
+    views: tuple[str, ...], label: str, repeat: int, plans: bool
+) -> dict[tuple[str, str], common.BenchmarkResult]:
+    async with sessionmanager.connect() as connection:
+        await connection.execute(text("ANALYZE"))
+
+    results = {}
+    for view in views:
+        part_number = await _part_number(view)
+        params = {"part_number": part_number}
+        for case, query in _queries(view).items():
+
+            async def execute(query=query, params=params):
+                async with sessionmanager.connect() as connection:
+                    return (await connection.execute(text(query), params)).all()
+
+            results[(view, case)] = await common.measure(label, repeat, execute)
+            node, execution_time = await _explain(query, params)
+            click.echo(
+                f"{label} {view}: {case} plan: {node}, "
+                f"execution {execution_time:.3f}ms"
+            )
+            if plans:
+                click.echo("\n".join(await _explain_text(query, params)))
+    return results
+
+
+async def _run_benchmark(
+    db_url: str, components: int, views: tuple[str, ...], repeat: int, plans: bool
+):
+    async with common.migrated_database(db_url, revision=_LEGACY_REVISION):
+        async with sessionmanager.session() as db:
+            await common.seed_components(
+                db, components, types=[ResistorModel, CapacitorCeramicModel]
+            )
+            await common.link_library_refs(db)
+        legacy = await _measure_views(views, "crosstab", repeat, plans)
+
+        await asyncio.to_thread(migrations.upgrade, _GENERATED_REVISION)
+        generated = await _measure_views(views, "lateral", repeat, plans)
+
+        for key, legacy_result in legacy.items():
+            view, case = key
+            common.print_results(f"{view}: {case}", [legacy_result, generated[key]])
+
+
+@click.command()
+@common.db_url_option
+@common.repeat_option
+@click.option("-n", "--components", default=100000, show_default=True)
+@click.option(
+    "-v",
+    "--view",
+    "views",
+    multiple=True,
+    default=_DEFAULT_VIEWS,
+    show_default=True,
+    help="View to compare, may be repeated",
+)
+@click.option("--plans", is_flag=True, help="Print the full query plans")
+def main(db_url: str, repeat: int, components: int, views: tuple[str, ...], plans):
+    common.run(_run_benchmark(db_url, components, views, repeat, plans))
+
+
+if __name__ == "__main__":
+    main()
@@ -31,8 +31,14 @@ from starlette.applications import Request
 from starlette.responses import JSONResponse
 
 from edaparts.app.config import config
+from edaparts.models.metadata.metadata_parser import metadata_parser
+from edaparts.services import storable_objects_service
 from edaparts.services.database import sessionmanager
 from edaparts.services.exceptions import ApiError
+from edaparts.services.invalidation_bus import invalidation_bus
+from edaparts.services.library_views import library_views_refresher
+from edaparts.services.parsing_executor import parsing_executor
+from edaparts.services.storage_tasks import storage_task_worker
 
 
 def exception_handler_api_error(_: Request, exc: Exception) -> JSONResponse:
@@ -50,7 +56,35 @@ def init_app():
         if os.path.exists(config.LOCKS_DIR):
             shutil.rmtree(config.LOCKS_DIR)
 
+        parsing_executor.init(
+            config.LIBRARY_PARSER_WORKERS,
+            config.LIBRARY_PARSER_QUEUE_DEPTH,
+            config.LIBRARY_PARSER_TIMEOUT,
+        )
+        storage_task_worker.init(
+            storable_objects_service.run_storable_task,
+            storable_objects_service.fail_storable_task,
+            concurrency=config.STORAGE_TASKS_CONCURRENCY,
+            poll_interval=config.STORAGE_TASKS_POLL_INTERVAL,
+            max_attempts=config.STORAGE_TASKS_MAX_ATTEMPTS,
+            retry_backoff=config.STORAGE_TASKS_RETRY_BACKOFF,
+            retry_backoff_max=config.STORAGE_TASKS_RETRY_BACKOFF_MAX,
+            lease=config.STORAGE_TASKS_LEASE,
+        )
+        invalidation_bus.init(
+            config.DB_CONNECTION_STRING,
+            keepalive=config.INVALIDATION_BUS_KEEPALIVE,
+            reconnect_delay=config.INVALIDATION_BUS_RECONNECT_DELAY,
+            reconnect_delay_max=config.INVALIDATION_BUS_RECONNECT_DELAY_MAX,
+        )
+        library_views_refresher.init(
+            config.DB_CONNECTION_STRING, config.LIBRARY_VIEWS_REFRESH_DELAY
+        )
         yield
+        await library_views_refresher.close()
+        await invalidation_bus.close()
+        await storage_task_worker.close()
+        parsing_executor.close()
         if sessionmanager._engine is not None:
             await sessionmanager.close()
 
@@ -59,5 +93,7 @@ def init_app():
     import edaparts.routers.routers
 
     api.include_router(edaparts.routers.routers.router)
+    # All the models are mapped by now
+    metadata_parser.load()
     api.add_exception_handler(ApiError, exception_handler_api_error)
     return api
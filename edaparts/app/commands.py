@@ -1,5 +1,10 @@
+import asyncio
+
 import click
+
+from edaparts.app.config import config
 from edaparts.migrations import migrations
+from edaparts.services import component_values
 
 
 @click.command()
@@ -18,3 +23,14 @@ def db_upgrade_cmd(revision):
 @click.option("-r", "--revision", required=True, help="Revision target")
 def db_downgrade_cmd(revision):
     migrations.downgrade(revision)
+
+
+@click.command()
+@click.option(
+    "-b", "--batch-size", default=1000, show_default=True, help="Rows per batch"
+)
+def db_backfill_values_cmd(batch_size):
+    count = asyncio.run(
+        component_values.run_backfill(config.DB_CONNECTION_STRING, batch_size)
+    )
+    click.echo(f"Numeric values filled for {count} rows")
@@ -42,6 +42,103 @@ class Config:
     LOCKS_DIR = os.getenv(
         "LOCKS_DIR", str(pathlib.Path(MODELS_BASE_DIR).parent.joinpath("locks"))
     )
+    # Uploaded files waiting to be stored. Must survive restarts, as pending
+    # storage tasks keep pointing to them
+    UPLOADS_DIR = os.getenv(
+        "UPLOADS_DIR", str(pathlib.Path(MODELS_BASE_DIR).parent.joinpath("uploads"))
+    )
+    # Stored library paths are locked while being written. "file" uses lock
+    # files in LOCKS_DIR, "postgres" uses advisory locks, that also work for
+    # workers in different hosts. Locks are polled every
+    # STORAGE_LOCK_POLL_INTERVAL seconds, up to STORAGE_LOCK_TIMEOUT seconds
+    STORAGE_LOCK_BACKEND = os.getenv("STORAGE_LOCK_BACKEND", "file")
+    STORAGE_LOCK_TIMEOUT = float(os.getenv("STORAGE_LOCK_TIMEOUT", "30"))
+    STORAGE_LOCK_POLL_INTERVAL = float(os.getenv("STORAGE_LOCK_POLL_INTERVAL", "0.1"))
+    # Parsed libraries metadata, keyed by the library content hash. Empty disables it
+    LIBRARY_CACHE_DIR = os.getenv(
+        "LIBRARY_CACHE_DIR",
+        str(pathlib.Path(MODELS_BASE_DIR).parent.joinpath("library_cache")),
+    )
+    LIBRARY_CACHE_MAX_ENTRIES = int(os.getenv("LIBRARY_CACHE_MAX_ENTRIES", "1024"))
+
+    # How component subtypes are fetched. "polymorphic" joins all the component
+    # tables in a single query, "subtype" fetches the base rows first and then
+    # queries only the subtype tables present in the result
+    COMPONENTS_LOADING_MODE = os.getenv("COMPONENTS_LOADING_MODE", "polymorphic")
+    # Rows fetched from the server-side cursor and written at once by the
+    # streamed components export
+    COMPONENTS_EXPORT_BATCH_SIZE = int(
+        os.getenv("COMPONENTS_EXPORT_BATCH_SIZE", "1000")
+    )
+
+    # Read heavy routes serialize their DTOs directly to JSON, skipping the
+    # response model validation of FastAPI
+    FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "False").lower() in (
+        "true",
+        "1",
+        "t",
+    )
+
+    # Lifetime in seconds and maximum number of entries of the per-process
+    # caches of the KiCad category listings and parts. 0 disables them
+    KICAD_CACHE_TTL = float(os.getenv("KICAD_CACHE_TTL", "300"))
+    KICAD_CACHE_MAX_ENTRIES = int(os.getenv("KICAD_CACHE_MAX_ENTRIES", "4096"))
+
+    # Writes are notified to the other worker processes through Postgres
+    # LISTEN/NOTIFY, so they evict the changed entities from their caches.
+    # The listener checks its connection every INVALIDATION_BUS_KEEPALIVE
+    # seconds and reconnects with an exponential backoff
+    INVALIDATION_BUS_CHANNEL = os.getenv(
+        "INVALIDATION_BUS_CHANNEL", "edaparts_cache_invalidation"
+    )
+    INVALIDATION_BUS_KEEPALIVE = float(os.getenv("INVALIDATION_BUS_KEEPALIVE", "30"))
+    INVALIDATION_BUS_RECONNECT_DELAY = float(
+        os.getenv("INVALIDATION_BUS_RECONNECT_DELAY", "1")
+    )
+    INVALIDATION_BUS_RECONNECT_DELAY_MAX = float(
+        os.getenv("INVALIDATION_BUS_RECONNECT_DELAY_MAX", "30")
+    )
+
+    # Seconds the changes are collected before refreshing the materialized
+    # Altium and KiCad library views that read the changed tables
+    LIBRARY_VIEWS_REFRESH_DELAY = float(os.getenv("LIBRARY_VIEWS_REFRESH_DELAY", "2"))
+
+    # Lifetime in seconds and maximum number of entries of the per-process
+    # cache used by the "cached" total count mode of paged queries
+    PAGINATION_COUNT_CACHE_TTL = int(os.getenv("PAGINATION_COUNT_CACHE_TTL", "60"))
+    PAGINATION_COUNT_CACHE_SIZE = int(os.getenv("PAGINATION_COUNT_CACHE_SIZE", "1024"))
+
+    # Library files are parsed in a pool of worker processes, so big libraries
+    # do not block the event loop. 0 workers parses them in a thread instead
+    LIBRARY_PARSER_WORKERS = int(os.getenv("LIBRARY_PARSER_WORKERS", "2"))
+    # Maximum number of parses running or waiting for a worker. Requests that
+    # exceed it are rejected
+    LIBRARY_PARSER_QUEUE_DEPTH = int(os.getenv("LIBRARY_PARSER_QUEUE_DEPTH", "16"))
+    # Seconds a request waits for its library to be parsed
+    LIBRARY_PARSER_TIMEOUT = float(os.getenv("LIBRARY_PARSER_TIMEOUT", "60"))
+    # KiCad libraries are scanned for model names and descriptions only. If
+    # enabled they are fully parsed with kiutils instead, validating them
+    KICAD_DEEP_VALIDATION = os.getenv("KICAD_DEEP_VALIDATION", "False").lower() in (
+        "true",
+        "1",
+        "t",
+    )
+
+    # Footprint and symbol files are stored by a task queue persisted in the DB.
+    # Each worker process runs up to STORAGE_TASKS_CONCURRENCY tasks at once and
+    # looks for new tasks every STORAGE_TASKS_POLL_INTERVAL seconds
+    STORAGE_TASKS_CONCURRENCY = int(os.getenv("STORAGE_TASKS_CONCURRENCY", "4"))
+    STORAGE_TASKS_POLL_INTERVAL = float(os.getenv("STORAGE_TASKS_POLL_INTERVAL", "2"))
+    # Failed tasks are retried with an exponential backoff, starting at
+    # STORAGE_TASKS_RETRY_BACKOFF seconds, up to STORAGE_TASKS_MAX_ATTEMPTS runs
+    STORAGE_TASKS_MAX_ATTEMPTS = int(os.getenv("STORAGE_TASKS_MAX_ATTEMPTS", "5"))
+    STORAGE_TASKS_RETRY_BACKOFF = float(os.getenv("STORAGE_TASKS_RETRY_BACKOFF", "5"))
+    STORAGE_TASKS_RETRY_BACKOFF_MAX = float(
+        os.getenv("STORAGE_TASKS_RETRY_BACKOFF_MAX", "300")
+    )
+    # Seconds a running task is owned by its worker without renewing it. Tasks
+    # of dead workers are run again once it expires
+    STORAGE_TASKS_LEASE = float(os.getenv("STORAGE_TASKS_LEASE", "120"))
 
 
 config = Config
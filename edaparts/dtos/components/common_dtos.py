@@ -95,7 +95,3 @@ class ComponentQueryRequestBaseDto(
     BaseModel,
 ):
     comment: ComponentCommentToolFields | None = Field(default=None)
-
-    def _fill_dto[T](self, model: ComponentModel) -> T:
-        self.comment = ComponentCommentToolFields.from_model(model)
-        return self
@@ -21,10 +21,16 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 #
+import csv
+import io
+import json
+import operator
 import typing
+from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import instance_dict
 from typing_extensions import Annotated
 
 
@@ -33,9 +39,17 @@ from edaparts.dtos.components import (
     ComponentUpdateRequestDtoUnionAlias,
     ComponentQueryDtoUnionAlias,
 )
+from edaparts.dtos.pagination_dtos import PageResultBaseDto
 from edaparts.models.components import (
     ComponentModelType,
 )
+from edaparts.models.internal.internal_models import (
+    BulkImportMode,
+    BulkImportRowResult,
+    BulkImportRowStatus,
+    ComponentRelations,
+)
+from edaparts.services.exceptions import InvalidRequestError, ResourceInvalidQuery
 
 
 # Generic DTO aliases
@@ -60,27 +74,255 @@ _model_to_query_dto = {
     for dto_type in typing.get_args(ComponentQueryDtoUnionAlias)
 }
 
+_component_type_to_query_dto = {
+    typing.get_args(dto_type.model_fields["component_type"].annotation)[0]: dto_type
+    for dto_type in typing.get_args(ComponentQueryDtoUnionAlias)
+}
+
+
+class _QueryDtoMappingPlan:
+    """
+    Maps the models of a component type to its query DTO with the columns to
+    read computed once, instead of inspecting each model.
+    """
+
+    def __init__(self, dto_t):
+        self.dto_t = dto_t
+        self.keys = tuple(
+            c.key
+            for c in inspect(dto_t.model_type()).column_attrs
+            if c.key in dto_t.model_fields
+        )
+        columns = self.keys + ("comment_kicad", "comment_altium")
+        self.state_getter = operator.itemgetter(*columns)
+        self.attr_getter = operator.attrgetter(*columns)
+        # Fill the component type based on the pydantic discriminator
+        self.component_type = typing.get_args(
+            dto_t.model_fields["component_type"].annotation
+        )[0]
+
+    def map(self, model: ComponentModelType) -> ComponentSpecificQueryDto:
+        try:
+            # Loaded columns are read from the instance state directly,
+            # skipping the attribute instrumentation
+            *values, kicad, altium = self.state_getter(instance_dict(model))
+        except KeyError:
+            # Expired or deferred columns are loaded through the attributes
+            *values, kicad, altium = self.attr_getter(model)
+        dto_data = dict(zip(self.keys, values))
+        dto_data["component_type"] = self.component_type
+        dto_data["comment"] = {"kicad": kicad, "altium": altium}
+        # Validating a plain dict runs in pydantic-core only, and it is faster
+        # than model_construct
+        return self.dto_t.model_validate(dto_data)
+
+
+_query_dto_plans = {
+    model_type: _QueryDtoMappingPlan(dto_t)
+    for model_type, dto_t in _model_to_query_dto.items()
+}
+
 
 def map_component_model_to_query_dto(
     model: ComponentModelType,
 ) -> ComponentSpecificQueryDto:
-    dto_t = _model_to_query_dto[type(model)]
-    dto_data = {
-        c.key: getattr(model, c.key)
-        for c in inspect(model).mapper.column_attrs
-        if c.key in dto_t.model_fields
-    }
-    # Fill the component type based on the pydantic discriminator
-    dto_data["component_type"] = typing.get_args(
-        dto_t.model_fields["component_type"].annotation
-    )[0]
-    mapped_dto = dto_t(**dto_data)
-    return mapped_dto._fill_dto(model)
+    return _query_dto_plans[type(model)].map(model)
 
 
 # todo: try to use a generic schema for list operations
-class ComponentsListResultDto(BaseModel):
-    page_size: int
-    page_number: int
-    total_elements: int
+class ComponentsListResultDto(PageResultBaseDto):
     elements: list[ComponentSpecificQueryDto]
+
+
+class ComponentBulkImportModeEnum(Enum):
+    PARTIAL = "partial"
+    ATOMIC = "atomic"
+
+    @staticmethod
+    def to_model(data: "ComponentBulkImportModeEnum") -> BulkImportMode:
+        if data == ComponentBulkImportModeEnum.PARTIAL:
+            return BulkImportMode.PARTIAL
+        if data == ComponentBulkImportModeEnum.ATOMIC:
+            return BulkImportMode.ATOMIC
+        raise ValueError(data)
+
+
+class ComponentBulkRowStatusEnum(Enum):
+    CREATED = "created"
+    EXISTS = "exists"
+    DUPLICATED = "duplicated"
+    INVALID = "invalid"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+    @staticmethod
+    def from_model(data: BulkImportRowStatus) -> "ComponentBulkRowStatusEnum":
+        if data == BulkImportRowStatus.CREATED:
+            return ComponentBulkRowStatusEnum.CREATED
+        if data == BulkImportRowStatus.EXISTS:
+            return ComponentBulkRowStatusEnum.EXISTS
+        if data == BulkImportRowStatus.DUPLICATED:
+            return ComponentBulkRowStatusEnum.DUPLICATED
+        if data == BulkImportRowStatus.INVALID:
+            return ComponentBulkRowStatusEnum.INVALID
+        if data == BulkImportRowStatus.FAILED:
+            return ComponentBulkRowStatusEnum.FAILED
+        if data == BulkImportRowStatus.SKIPPED:
+            return ComponentBulkRowStatusEnum.SKIPPED
+        raise ValueError(data)
+
+
+class ComponentBulkRowResultDto(BaseModel):
+    index: int
+    status: ComponentBulkRowStatusEnum
+    component_id: int | None = None
+    dici: str | None = None
+    error: str | None = None
+
+    @staticmethod
+    def from_model(data: BulkImportRowResult) -> "ComponentBulkRowResultDto":
+        return ComponentBulkRowResultDto(
+            index=data.index,
+            status=ComponentBulkRowStatusEnum.from_model(data.status),
+            component_id=data.component_id,
+            dici=data.dici,
+            error=data.error,
+        )
+
+
+class ComponentsBulkCreateResultDto(BaseModel):
+    # False if an atomic import was discarded
+    committed: bool
+    created: int
+    elements: list[ComponentBulkRowResultDto]
+
+
+class ComponentRelationsDto(BaseModel):
+    component_id: int
+    footprint_ids: list[int] = []
+    symbol_ids: list[int] = []
+
+    def to_model(self) -> ComponentRelations:
+        return ComponentRelations(
+            component_id=self.component_id,
+            footprint_ids=self.footprint_ids,
+            symbol_ids=self.symbol_ids,
+        )
+
+    @staticmethod
+    def from_model(data: ComponentRelations) -> "ComponentRelationsDto":
+        return ComponentRelationsDto(
+            component_id=data.component_id,
+            footprint_ids=data.footprint_ids,
+            symbol_ids=data.symbol_ids,
+        )
+
+
+class ComponentsRelationsBulkDto(BaseModel):
+    relations: list[ComponentRelationsDto]
+
+
+def __format_validation_error(err: ValidationError) -> str:
+    return "; ".join(
+        (
+            f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}"
+            if e["loc"]
+            else e["msg"]
+        )
+        for e in err.errors()
+    )
+
+
+def parse_component_create_requests(
+    body: bytes, ndjson: bool
+) -> list[ComponentModelType | InvalidRequestError]:
+    """
+    Maps a JSON array or a NDJSON document of ComponentCreateRequestDto items
+    to models. Items that cannot be parsed are returned as errors in their
+    position so the import can report them.
+    """
+    if ndjson:
+        items = [line for line in body.splitlines() if line.strip()]
+        validate = ComponentCreateRequestDto.model_validate_json
+    else:
+        try:
+            items = json.loads(body)
+        except ValueError as err:
+            raise InvalidRequestError(f"The request body is not valid JSON: {err}")
+        if not isinstance(items, list):
+            raise InvalidRequestError("The request body must be a JSON array")
+        validate = ComponentCreateRequestDto.model_validate
+
+    entries = []
+    for item in items:
+        try:
+            entries.append(validate(item).component.to_model())
+        except ValidationError as err:
+            entries.append(InvalidRequestError(__format_validation_error(err)))
+    return entries
+
+
+class ComponentExportFormatEnum(Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+def get_component_export_models(
+    component_types: list[str] | None,
+) -> list[typing.Type[ComponentModelType]]:
+    if not component_types:
+        return [
+            dto_type.model_type() for dto_type in _component_type_to_query_dto.values()
+        ]
+    invalid_types = [
+        t for t in component_types if t not in _component_type_to_query_dto
+    ]
+    if invalid_types:
+        raise ResourceInvalidQuery(
+            "Unknown component types",
+            details={"type": invalid_types},
+            invalid_fields=["type"],
+        )
+    return [
+        _component_type_to_query_dto[t].model_type()
+        for t in dict.fromkeys(component_types)
+    ]
+
+
+async def stream_components_ndjson(
+    batches: typing.AsyncIterator[typing.Sequence[ComponentModelType]],
+) -> typing.AsyncIterator[bytes]:
+    async for batch in batches:
+        yield b"".join(
+            map_component_model_to_query_dto(model).model_dump_json().encode() + b"\n"
+            for model in batch
+        )
+
+
+async def stream_components_csv(
+    model_types: list[typing.Type[ComponentModelType]],
+    batches: typing.AsyncIterator[typing.Sequence[ComponentModelType]],
+) -> typing.AsyncIterator[bytes]:
+    # The columns of all the exported types, with the comment split by tool
+    fields = {}
+    for model_type in model_types:
+        fields.update(dict.fromkeys(_model_to_query_dto[model_type].model_fields))
+    fields = list(fields)
+    comment_index = fields.index("comment")
+    fields[comment_index : comment_index + 1] = ["comment_kicad", "comment_altium"]
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, restval="")
+    writer.writeheader()
+    async for batch in batches:
+        for model in batch:
+            row = map_component_model_to_query_dto(model).model_dump(mode="json")
+            comment = row.pop("comment") or {}
+            row["comment_kicad"] = comment.get("kicad")
+            row["comment_altium"] = comment.get("altium")
+            writer.writerow(row)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
@@ -25,6 +25,7 @@
 from pydantic import BaseModel
 
 from edaparts.dtos.libraries_dtos import BaseLibraryQueryDto
+from edaparts.dtos.pagination_dtos import PageResultBaseDto
 from edaparts.models import FootprintReference
 
 
@@ -34,10 +35,7 @@ class FootprintQueryDto(BaseLibraryQueryDto):
         return super().from_model(FootprintQueryDto, data)
 
 
-class FootprintListResultDto(BaseModel):
-    page_size: int
-    page_number: int
-    total_elements: int
+class FootprintListResultDto(PageResultBaseDto):
     elements: list[FootprintQueryDto]
 
 
@@ -29,6 +29,7 @@ from typing import Optional, Annotated
 from pydantic import BaseModel, Field
 
 from edaparts.dtos.components_dtos import ComponentSpecificQueryDto
+from edaparts.dtos.pagination_dtos import PageResultBaseDto
 from edaparts.models.internal.internal_inventory_models import (
     MassStockMovement,
     SingleStockMovement,
@@ -80,10 +81,7 @@ class InventoryItemQueryDto(InventoryItemCreateRequestDto):
         )
 
 
-class InventoryItemsQueryDto(BaseModel):
-    page_size: int
-    page_number: int
-    total_elements: int
+class InventoryItemsQueryDto(PageResultBaseDto):
     elements: list[InventoryItemQueryDto]
 
 
@@ -105,10 +103,7 @@ class InventoryLocationQueryDto(BaseModel):
         )
 
 
-class InventoryLocationsQueryDto(BaseModel):
-    page_size: int
-    page_number: int
-    total_elements: int
+class InventoryLocationsQueryDto(PageResultBaseDto):
     elements: list[InventoryLocationQueryDto]
 
 
@@ -244,10 +239,7 @@ class InventoryCategoryQueryDto(InventoryCategoryCreateUpdateRequestDto):
         )
 
 
-class InventoryCategoriesQueryDto(BaseModel):
-    page_size: int
-    page_number: int
-    total_elements: int
+class InventoryCategoriesQueryDto(PageResultBaseDto):
     elements: list[InventoryCategoryQueryDto]
 
 
@@ -2,8 +2,11 @@ import typing
 
 from pydantic import BaseModel
 
-from edaparts.models.components.component_model import ComponentModel
-from edaparts.models.internal.kicad_models import KiCadPart, KiCadPartProperty
+from edaparts.models.internal.kicad_models import (
+    KiCadCategoryPart,
+    KiCadPart,
+    KiCadPartProperty,
+)
 
 
 class EndpointsQueryDto(BaseModel):
@@ -26,10 +29,10 @@ class CategoryPartQueryDto(BaseModel):
     description: typing.Optional[str]
 
     @staticmethod
-    def from_model(data: ComponentModel) -> "CategoryPartQueryDto":
+    def from_model(data: KiCadCategoryPart) -> "CategoryPartQueryDto":
         return CategoryPartQueryDto(
             id=str(data.id),
-            name=data.mpn,
+            name=data.name,
             description=data.description,
         )
 
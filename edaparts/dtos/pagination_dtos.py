@@ -0,0 +1,73 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import typing
+from enum import Enum
+
+from pydantic import BaseModel
+
+from edaparts.models.internal.internal_models import PageCountMode
+
+
+class PageCountModeEnum(Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
+
+    @staticmethod
+    def to_model(data: "PageCountModeEnum") -> PageCountMode:
+        if data == PageCountModeEnum.EXACT:
+            return PageCountMode.EXACT
+        if data == PageCountModeEnum.ESTIMATED:
+            return PageCountMode.ESTIMATED
+        if data == PageCountModeEnum.CACHED:
+            return PageCountMode.CACHED
+        if data == PageCountModeEnum.NONE:
+            return PageCountMode.NONE
+        raise ValueError(data)
+
+    @staticmethod
+    def from_model(data: PageCountMode) -> "PageCountModeEnum":
+        if data == PageCountMode.EXACT:
+            return PageCountModeEnum.EXACT
+        if data == PageCountMode.ESTIMATED:
+            return PageCountModeEnum.ESTIMATED
+        if data == PageCountMode.CACHED:
+            return PageCountModeEnum.CACHED
+        if data == PageCountMode.NONE:
+            return PageCountModeEnum.NONE
+        raise ValueError(data)
+
+
+class PageResultBaseDto(BaseModel):
+    page_size: int
+    page_number: int
+    # None if the count was skipped (count_mode=none)
+    total_elements: typing.Optional[int]
+    # Tells if total_elements is an exact, estimated or cached number
+    total_elements_kind: PageCountModeEnum = PageCountModeEnum.EXACT
+    # Opaque cursor to fetch the next page by keyset, None if it is the last page
+    next_cursor: typing.Optional[str] = None
@@ -25,6 +25,7 @@
 from pydantic import BaseModel
 
 from edaparts.dtos.libraries_dtos import BaseLibraryQueryDto
+from edaparts.dtos.pagination_dtos import PageResultBaseDto
 from edaparts.models import LibraryReference
 
 
@@ -34,10 +35,7 @@ class SymbolQueryDto(BaseLibraryQueryDto):
         return super().from_model(SymbolQueryDto, data)
 
 
-class SymbolListResultDto(BaseModel):
-    page_size: int
-    page_number: int
-    total_elements: int
+class SymbolListResultDto(PageResultBaseDto):
     elements: list[SymbolQueryDto]
 
 
@@ -0,0 +1,57 @@
+"""Storable objects listing indexes
+
+Revision ID: 5f70d7f69176
+Revises: f1ad6c343ede
+Create Date: 2026-10-18 09:12:40.518331
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f70d7f69176"
+down_revision: Union[str, None] = "f1ad6c343ede"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_STORABLE_TABLES = ("footprint_ref", "library_ref")
+
+
+def upgrade() -> None:
+    for table in _STORABLE_TABLES:
+        op.create_index(
+            f"ix_{table}_cad_type_storage_status_id",
+            table,
+            ["cad_type", "storage_status", "id"],
+            unique=False,
+        )
+        op.create_index(
+            f"ix_{table}_storage_status_id",
+            table,
+            ["storage_status", "id"],
+            unique=False,
+        )
+        op.create_index(
+            f"ix_{table}_path_prefix",
+            table,
+            ["path"],
+            unique=False,
+            postgresql_ops={"path": "varchar_pattern_ops"},
+        )
+        op.create_index(
+            f"ix_{table}_reference_prefix",
+            table,
+            ["reference"],
+            unique=False,
+            postgresql_ops={"reference": "varchar_pattern_ops"},
+        )
+
+
+def downgrade() -> None:
+    for table in _STORABLE_TABLES:
+        op.drop_index(f"ix_{table}_reference_prefix", table_name=table)
+        op.drop_index(f"ix_{table}_path_prefix", table_name=table)
+        op.drop_index(f"ix_{table}_storage_status_id", table_name=table)
+        op.drop_index(f"ix_{table}_cad_type_storage_status_id", table_name=table)
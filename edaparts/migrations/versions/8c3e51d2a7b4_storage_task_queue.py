@@ -0,0 +1,82 @@
+"""Storage task queue
+
+Revision ID: 8c3e51d2a7b4
+Revises: 5f70d7f69176
+Create Date: 2026-10-18 11:02:17.406215
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3e51d2a7b4"
+down_revision: Union[str, None] = "5f70d7f69176"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "storage_task",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "task_type",
+            sa.Enum("STORE", "DELETE", name="storagetasktype"),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "RUNNING", name="storagetaskstatus"),
+            nullable=False,
+        ),
+        sa.Column("model_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "file_type",
+            sa.Enum("FOOTPRINT", "SYMBOL", name="storablelibraryresourcetype"),
+            nullable=False,
+        ),
+        sa.Column(
+            "cad_type",
+            postgresql.ENUM("ALTIUM", "KICAD", name="cadtype", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("path", sa.String(length=400), nullable=False),
+        sa.Column("reference", sa.String(length=150), nullable=True),
+        sa.Column("filename", sa.String(length=1024), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("run_after", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("lease_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.String(length=1024), nullable=True),
+        sa.Column(
+            "created_on",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_storage_task_status_run_after",
+        "storage_task",
+        ["status", "run_after"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_storage_task_file_type_model_id_id",
+        "storage_task",
+        ["file_type", "model_id", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_storage_task_file_type_model_id_id", table_name="storage_task")
+    op.drop_index("ix_storage_task_status_run_after", table_name="storage_task")
+    op.drop_table("storage_task")
+    sa.Enum(name="storablelibraryresourcetype").drop(op.get_bind())
+    sa.Enum(name="storagetaskstatus").drop(op.get_bind())
+    sa.Enum(name="storagetasktype").drop(op.get_bind())
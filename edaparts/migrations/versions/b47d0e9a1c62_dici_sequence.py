@@ -0,0 +1,32 @@
+"""DICI sequence
+
+Revision ID: b47d0e9a1c62
+Revises: 8c3e51d2a7b4
+Create Date: 2026-10-18 14:21:08.730912
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b47d0e9a1c62"
+down_revision: Union[str, None] = "8c3e51d2a7b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The increment is the number of DICIs reserved by each value, it must
+    # match DICI_BLOCK_SIZE
+    op.execute(
+        sa.schema.CreateSequence(
+            sa.Sequence("inventory_dici_seq", start=1, increment=50)
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence("inventory_dici_seq")))
@@ -0,0 +1,87 @@
+"""Materialized library views
+
+Revision ID: c9e27a4f1d83
+Revises: b47d0e9a1c62
+Create Date: 2026-10-18 16:41:09.213475
+
+"""
+
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = "c9e27a4f1d83"
+down_revision: Union[str, None] = "b47d0e9a1c62"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_MATERIALIZED_VIEW_SUFFIX = " Materialized"
+
+# Columns the EDA tools look the parts up by, besides the part number
+_LOOKUP_COLUMNS = ("Library Ref", "Symbol")
+
+
+def _index_name(view: str, suffix: str) -> str:
+    # View names are too long to be part of the index names
+    return f"ix_mv_{hashlib.sha1(view.encode('utf-8')).hexdigest()[:12]}_{suffix}"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    views = (
+        bind.execute(
+            text(
+                "SELECT viewname FROM pg_views "
+                "WHERE schemaname = current_schema() "
+                "AND (viewname LIKE 'Altium %' OR viewname LIKE 'KiCad %')"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    for view in views:
+        columns = set(
+            bind.execute(
+                text(
+                    "SELECT column_name FROM information_schema.columns "
+                    "WHERE table_schema = current_schema() AND table_name = :view"
+                ),
+                {"view": view},
+            ).scalars()
+        )
+        materialized_view = f"{view}{_MATERIALIZED_VIEW_SUFFIX}"
+        op.execute(
+            f'CREATE MATERIALIZED VIEW "{materialized_view}" AS SELECT * FROM "{view}"'
+        )
+        # Concurrent refreshes require a unique index. It also serves the
+        # lookups by part number
+        op.execute(
+            f'CREATE UNIQUE INDEX {_index_name(view, "part_number")} '
+            f'ON "{materialized_view}" ("Part Number", "Manufacturer")'
+        )
+        for column in _LOOKUP_COLUMNS:
+            if column in columns:
+                op.execute(
+                    f"CREATE INDEX {_index_name(view, column.lower().replace(' ', '_'))} "
+                    f'ON "{materialized_view}" ("{column}")'
+                )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    materialized_views = (
+        bind.execute(
+            text(
+                "SELECT matviewname FROM pg_matviews "
+                "WHERE schemaname = current_schema() AND matviewname LIKE :pattern"
+            ),
+            {"pattern": f"%{_MATERIALIZED_VIEW_SUFFIX}"},
+        )
+        .scalars()
+        .all()
+    )
+    for materialized_view in materialized_views:
+        op.execute(f'DROP MATERIALIZED VIEW "{materialized_view}"')
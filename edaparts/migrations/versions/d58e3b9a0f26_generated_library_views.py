@@ -0,0 +1,104 @@
+"""Generated library views
+
+Revision ID: d58e3b9a0f26
+Revises: c9e27a4f1d83
+Create Date: 2026-10-18 19:27:52.604118
+
+"""
+
+import pathlib
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = "d58e3b9a0f26"
+down_revision: Union[str, None] = "c9e27a4f1d83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_VIEWS_DIR = pathlib.Path(__file__).parent.parent.joinpath("views")
+
+# Written by edaparts.models.metadata.view_generator
+_CREATE_VIEWS_FILE = _VIEWS_DIR.joinpath(revision, "CreateViews.sql")
+_STATEMENT_TERMINATOR = ";\n\n"
+
+_INDEXES = (
+    ("ix_component_package", "component", ["package"]),
+    (
+        "ix_component_library_asc_component_id_library_ref_id",
+        "component_library_asc",
+        ["component_id", "library_ref_id"],
+    ),
+    (
+        "ix_component_footprint_asc_component_id_footprint_ref_id",
+        "component_footprint_asc",
+        ["component_id", "footprint_ref_id"],
+    ),
+)
+
+
+def _generated_statements() -> list[str]:
+    sql = "\n".join(
+        line
+        for line in _CREATE_VIEWS_FILE.read_text().splitlines()
+        if not line.startswith("--")
+    )
+    return [
+        statement.strip().removesuffix(";")
+        for statement in sql.split(_STATEMENT_TERMINATOR)
+        if statement.strip()
+    ]
+
+
+def _drop_library_views():
+    bind = op.get_bind()
+    # The materialized views select the plain ones, so they go first
+    materialized_views = (
+        bind.execute(
+            text(
+                "SELECT matviewname FROM pg_matviews "
+                "WHERE schemaname = current_schema() "
+                "AND (matviewname LIKE 'Altium %' OR matviewname LIKE 'KiCad %')"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    for materialized_view in materialized_views:
+        op.execute(f'DROP MATERIALIZED VIEW "{materialized_view}"')
+    views = (
+        bind.execute(
+            text(
+                "SELECT viewname FROM pg_views "
+                "WHERE schemaname = current_schema() "
+                "AND (viewname LIKE 'Altium %' OR viewname LIKE 'KiCad %')"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    for view in views:
+        op.execute(f'DROP VIEW "{view}"')
+
+
+def upgrade() -> None:
+    # The column set of the views changes, so they cannot be replaced in place
+    _drop_library_views()
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    for statement in _generated_statements():
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    _drop_library_views()
+    for name, table, _ in _INDEXES:
+        op.drop_index(name, table_name=table)
+    for view_file in sorted(_VIEWS_DIR.joinpath("f1ad6c343ede").glob("Create*.sql")):
+        op.execute(view_file.read_text())
+    # The materialized variants and their indexes did not change
+    for statement in _generated_statements():
+        if not statement.startswith("CREATE VIEW"):
+            op.execute(statement)
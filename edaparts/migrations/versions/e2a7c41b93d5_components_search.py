@@ -0,0 +1,75 @@
+"""Components search
+
+Revision ID: e2a7c41b93d5
+Revises: d58e3b9a0f26
+Create Date: 2026-10-18 21:04:37.851920
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a7c41b93d5"
+down_revision: Union[str, None] = "d58e3b9a0f26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# General component columns of the search document, followed by the string
+# columns of each component type table
+_DOCUMENT_COLUMNS = ("mpn", "manufacturer", "value", "package", "description")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column("component", sa.Column("search_document", sa.Text(), nullable=True))
+
+    # Fill the document of the existing components, one component type at once
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    for table in inspector.get_table_names():
+        if not table.startswith("comp_"):
+            continue
+        columns = [f"c.{column}" for column in _DOCUMENT_COLUMNS] + [
+            f't."{column["name"]}"'
+            for column in inspector.get_columns(table)
+            if isinstance(column["type"], sa.String)
+        ]
+        op.execute(
+            f"UPDATE component c SET search_document = CONCAT_WS(' ', {', '.join(columns)}) "
+            f"FROM {table} t WHERE t.id = c.id"
+        )
+
+    op.create_index(
+        "ix_component_search_document_tsv",
+        "component",
+        [sa.text("to_tsvector('simple', search_document)")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_component_search_document_trgm",
+        "component",
+        ["search_document"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_document": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_component_mpn_trgm",
+        "component",
+        ["mpn"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"mpn": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_component_mpn_trgm", table_name="component")
+    op.drop_index("ix_component_search_document_trgm", table_name="component")
+    op.drop_index("ix_component_search_document_tsv", table_name="component")
+    op.drop_column("component", "search_document")
+    # pg_trgm is left in place, other objects of the database may use it
@@ -0,0 +1,43 @@
+"""Numeric component values
+
+Revision ID: f6b1d8e24a90
+Revises: e2a7c41b93d5
+Create Date: 2026-10-18 23:12:05.447190
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6b1d8e24a90"
+down_revision: Union[str, None] = "e2a7c41b93d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Numeric shadows of the textual values. They are filled by the
+# edaparts-backfill-values command, to be run after this migration
+_COLUMNS = (
+    ("component", "value_numeric"),
+    ("component", "operating_temperature_min_numeric"),
+    ("component", "operating_temperature_max_numeric"),
+    ("comp_resistor", "power_max_numeric"),
+    ("comp_resistor", "tolerance_numeric"),
+    ("comp_capacitor_ceramic", "voltage_numeric"),
+    ("comp_capacitor_electrolytic", "voltage_numeric"),
+    ("comp_capacitor_tantalum", "voltage_numeric"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.add_column(table, sa.Column(column, sa.Float(), nullable=True))
+        op.create_index(f"ix_{table}_{column}", table, [column], unique=False)
+
+
+def downgrade() -> None:
+    for table, column in reversed(_COLUMNS):
+        op.drop_index(f"ix_{table}_{column}", table_name=table)
+        op.drop_column(table, column)
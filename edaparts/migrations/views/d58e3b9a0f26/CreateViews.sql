@@ -0,0 +1,3818 @@
+-- Generated by edaparts.models.metadata.view_generator, do not edit
+
+CREATE VIEW "Altium Capacitors Ceramic" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Capacitors Ceramic 0603" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '0603 (1608 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Capacitors Ceramic 0805" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '0805 (2012 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Capacitors Ceramic 1206" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '1206 (3216 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Capacitors Ceramic 1210" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '1210 (3225 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Capacitors Ceramic 2220" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '2220 (5750 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Capacitors Electrolytic" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.material "Material",
+       t.polarised "Polarised",
+       t.esr "ESR",
+       t.lifetime_temperature "Lifetime Temperature"
+FROM component c
+         INNER JOIN comp_capacitor_electrolytic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Capacitors Tantalum" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.lifetime_temperature "Lifetime Temperature",
+       t.esr "ESR"
+FROM component c
+         INNER JOIN comp_capacitor_tantalum t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Connectors PCB" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.orientation "Orientation",
+       t.pitch "Pitch",
+       t.voltage_rating "Voltage Rating",
+       t.current_rating "Current Rating",
+       t.number_of_rows "Number of Rows",
+       t.number_of_contacts "Number of Contacts"
+FROM component c
+         INNER JOIN comp_connector_pcb t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Crystal Oscillators" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.load_capacitance "Load Capacitance",
+       t.frequency "Frequency",
+       t.frequency_tolerance "Frquency Tolerance"
+FROM component c
+         INNER JOIN comp_crystal_oscillator t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Diodes Rectifier" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.forward_voltage "Forward Voltage",
+       t.reverse_current_leakage "Reverse Leakage Current",
+       t.max_forward_average_current "Maximum Forward Avg. Current",
+       t.max_reverse_vrrm "Maximum Repetitive Reverse Voltage",
+       t.diode_type "Diode Type"
+FROM component c
+         INNER JOIN comp_diode_rectifier t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Diodes TVS" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.voltage_reverse_standoff "Standoff Reverse Voltage",
+       t.voltage_breakdown_min "Minimum Breakdown Voltage",
+       t.voltage_clamping_max "Maximum Clamping Voltage"
+FROM component c
+         INNER JOIN comp_diode_tvs t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Diodes Zener" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.power_max "Maximum Power",
+       t.voltage_forward "Forward Voltage",
+       t.voltage_zener "Zener Voltage"
+FROM component c
+         INNER JOIN comp_diode_zener t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Discrete Logics" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.logic_family "Logic Family",
+       t.logic_type "Logic Type",
+       t.number_of_bits "Number of Bits",
+       t.propagation_delay "Propagation Delay",
+       t.supply_voltage_max "Maximum Supply Voltage",
+       t.supply_voltage_min "Minimum Supply Voltage",
+       t.logic_function "Logic Function"
+FROM component c
+         INNER JOIN comp_discrete_logic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Ferrite Beads" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.number_of_lines "Number of Lines",
+       t.dc_resistance "DC Resistance",
+       t.impedance_freq "Impedance Frequency",
+       t.current_rating "Current Rating"
+FROM component c
+         INNER JOIN comp_ferrite_bead t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Inductors Chokes" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.number_of_lines "Number of Lines",
+       t.dc_resistance "DC Resistance",
+       t.impedance_freq "Impedance Frequency",
+       t.current_rating "Current Rating"
+FROM component c
+         INNER JOIN comp_inductor_choke t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Inductors Power" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.tolerance "Tolerance",
+       t.resistance_dcr "Resistance DCR",
+       t.inductance_freq_test "Test Frequency",
+       t.current_rating "Current Rating",
+       t.current_saturation "Current Saturation",
+       t.core_material "Core Material"
+FROM component c
+         INNER JOIN comp_power_inductor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium LED Indicators" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.forward_voltage "Forward Voltage",
+       t.color "Color",
+       t.lens_style "Lens Type",
+       t.lens_transparency "Lens Transparency",
+       t.dominant_wavelength "Dominant Wavelength",
+       t.test_current "Test Current",
+       t.lens_size "Lens Size"
+FROM component c
+         INNER JOIN comp_led_indicator t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Memories" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.technology "Technology",
+       t.memory_type "Memory Type",
+       t.size "Size",
+       t.interface "Interface",
+       t.clock_frequency "Clock Frequency"
+FROM component c
+         INNER JOIN comp_memory t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Microcontrollers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.core "Core",
+       t.core_size "Core Size",
+       t.speed "Speed",
+       t.flash_size "Flash Size",
+       t.ram_size "RAM Size",
+       t.peripherals "Peripherals",
+       t.connectivity "Connectivity",
+       t.voltage_supply "Voltage Supply"
+FROM component c
+         INNER JOIN comp_microcontroller t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium OpAmps" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.gain_bandwith "Gain Bandwith Product",
+       t.output_type "Output Type",
+       t.input_type "Input Type",
+       t.amplifier_type "Amplifier Type",
+       t.slew_rate "Slew Rate",
+       t.voltage_supplies "Voltage Supplies",
+       t.voltage_input_offset "Input Offset Voltage",
+       t.current_output "Output Current",
+       t.number_of_channels "Number of Channels"
+FROM component c
+         INNER JOIN comp_opamp t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Optocouplers Digital" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.voltage_isolation "Isolation Voltage",
+       t.voltage_saturation_max "Maximum Saturation Voltage",
+       t.current_transfer_ratio_max "Maximum Current Transfer Ratio",
+       t.current_transfer_ratio_min "Minimum Current Transfer Ratio",
+       t.voltage_forward_typical "Typical Forward Voltage",
+       t.voltage_output_max "Maximum Output Voltage",
+       t.number_of_channels "Number of Channels"
+FROM component c
+         INNER JOIN comp_optocoupler_digital t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Optocouplers Linear" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.voltage_isolation "Isolation Voltage",
+       t.transfer_gain "Transfer Gain",
+       t.input_forward_voltage "Input FOrward Voltage",
+       t.servo_gain "Servo Gain",
+       t.forward_gain "Forward Gain",
+       t.non_linearity "Non Linearity"
+FROM component c
+         INNER JOIN comp_optocoupler_linear t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Oscillator Oscillators" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.base_resonator "Base Resonator",
+       t.current_supply_max "Current Supply Maximum",
+       t.frequency "Frequency",
+       t.frequency_stability "Frequency Stability",
+       t.voltage_supply "Voltage Supply",
+       t.output_type "Output Type"
+FROM component c
+         INNER JOIN comp_oscillator_oscillator t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium PPTC Fuses" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.current_hold "Hold Current",
+       t.current_trip "Trip Current",
+       t.voltage_rating "Voltage Rating",
+       t.resistance_maximum "Maximum Resistance",
+       t.resistance_minimum "Minimum Resistance",
+       t.power_rating "Power Rating",
+       t.current_rating "Current Rating"
+FROM component c
+         INNER JOIN comp_fuse_pptc t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Potentiometers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.power_max "Maximum Power",
+       t.tolerance "Tolerance",
+       t.resistance_min "Minimum Resistance",
+       t.resistance_max "Maximum Resistance",
+       t.number_of_turns "Number of Turns"
+FROM component c
+         INNER JOIN comp_potentiometer t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Regulators DCDC" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.voltage_input_min "Minimum Input Voltage",
+       t.voltage_output_min_fixed "Minimum/Fixed Output Voltage",
+       t.voltage_output_max "Maximum Output Voltage",
+       t.current_output "Output Current",
+       t.frequency_switching "Switching Frequency",
+       t.topology "Topology",
+       t.output_type "Output Type",
+       t.number_of_outputs "Number of Outputs"
+FROM component c
+         INNER JOIN comp_voltage_regulator_dcdc t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Regulators Linear" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.gain_bandwith "Gain Bandwith",
+       t.output_type "Output Type",
+       t.voltage_output_min_fixed "Minimum/Fixed Output Voltage",
+       t.voltage_output_max "Maximum Output Voltage",
+       t.voltage_dropout_max "Maximum Dropout Voltage",
+       t.current_supply_max "Maximum Supply Current",
+       t.current_output "Output Current",
+       t.pssr "PSSR"
+FROM component c
+         INNER JOIN comp_voltage_regulator_linear t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Resistors" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Resistors 0603" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '0603 (1608 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Resistors 0805" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '0805 (2012 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Resistors 1206" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '1206 (3216 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Resistors 1210" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '1210 (3225 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Resistors 2220" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+WHERE c.package = '2220 (5750 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Switches Pushbuttons" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.function "Function",
+       t.dc_voltage_rating "Maximum DC Voltage Rating",
+       t.ac_voltage_rating "Maximum RMS Voltage Rating",
+       t.current_rating "Current Rating",
+       t.circuit_type "Circuit Type"
+FROM component c
+         INNER JOIN comp_switch_push_button t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Switches Switch" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.voltage_rating "Maximum Voltage Rating",
+       t.current_rating "Current Rating",
+       t.number_of_positions "Number of Positions",
+       t.circuit_type "Circuit Type"
+FROM component c
+         INNER JOIN comp_switch_switch t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Transceivers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.duplex "Duplex",
+       t.data_rate "Data Rate",
+       t.protocol "Protocol",
+       t.voltage_supply "Supply Voltage"
+FROM component c
+         INNER JOIN comp_transceiver t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Transducers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.input_magnitude "Input Magnitude",
+       t.output_type "Output Type",
+       t.proportional_gain "Proportional Gain",
+       t.supply_voltage "Supply Voltage"
+FROM component c
+         INNER JOIN comp_transducer t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Transformers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.number_of_windings "Number of Windings",
+       t.primary_dc_resistance "Primary DCR",
+       t.secondary_dc_resistance "Secondary DCR",
+       t.tertiary_dc_resistance "Tertiary DCR",
+       t.leakage_inductance "Leakage Inductance",
+       t.primary_inductance "Primary Inductance",
+       t.secondary_current_rating "Secondary Current Rating",
+       t.tertiary_current_rating "Tertiary Current Rating",
+       t.primary_voltage_rating "Primary Voltage Rating",
+       t.secondary_voltage_rating "Secondary Voltage Rating",
+       t.tertiary_voltage_rating "Tertiary Voltage Rating",
+       t.nps_turns_ratio "NPS Turns Ratio",
+       t.npt_turns_ratio "NPT Turns Ratio"
+FROM component c
+         INNER JOIN comp_transformer t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Transistors Arrays Mosfet" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.number_of_channels "Number of Channels",
+       t.rds_on "Drain Source Resistance",
+       t.vgs_max "Gate Source Max Voltage",
+       t.vgs_th "Gate Source Threshold Voltage",
+       t.vds_max "Drain Source Max Voltage",
+       t.ids_max "Drain Source Max Current",
+       t.current_total_max "Total Max Current",
+       t.power_max "Maximum Power",
+       t.channel_type "Channel Type"
+FROM component c
+         INNER JOIN comp_transistor_array_mosfet t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Transistors BJT" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.vce_sat_max "Collector Emiter Saturation Voltage",
+       t.hfe "hfe Gain",
+       t.vce_max "Collector Emiter Max. Votage",
+       t.ic_max "Collector Max. Current",
+       t.power_max "Maximum Power",
+       t.bjt_type "BJT Type"
+FROM component c
+         INNER JOIN comp_transistor_bjt t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Transistors Mosfet" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.rds_on "Drain Source Resistance",
+       t.vgs_max "Gate Source Max Voltage",
+       t.vgs_th "Gate Source Threshold Voltage",
+       t.vds_max "Drain Source Max Voltage",
+       t.ids_max "Drain Source Max Current",
+       t.power_max "Maximum Power",
+       t.channel_type "Channel Type"
+FROM component c
+         INNER JOIN comp_transistor_mosfet t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "Altium Triacs" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_altium "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       l.path "Library Path",
+       l.reference "Library Ref",
+       f.paths[1] "Footprint Path",
+       f.paths[2] "Footprint Path 2",
+       f.paths[3] "Footprint Path 3",
+       f.paths[4] "Footprint Path 4",
+       f.refs[1] "Footprint Ref",
+       f.refs[2] "Footprint Ref 2",
+       f.refs[3] "Footprint Ref 3",
+       f.refs[4] "Footprint Ref 4",
+       t.power_max "Maximum Power",
+       t.vdrm "Vdrm",
+       t.current_rating "Current Rating",
+       t.dl_dt "Rate Rise Off-State Voltage",
+       t.trigger_current "Trigger Current",
+       t.latching_current "Latching Current",
+       t.holding_current "Holding Current",
+       t.gate_trigger_voltage "Gate Trigger Voltage",
+       t.emitter_forward_current "Emitter Forward Current",
+       t.emitter_forward_voltage "Emitter Forward Voltage",
+       t.triac_type "Triac Type"
+FROM component c
+         INNER JOIN comp_triac t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'ALTIUM'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT array_agg(f.path ORDER BY f.id) paths, array_agg(f.reference ORDER BY f.id) refs
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'ALTIUM'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Capacitors Ceramic" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Capacitors Ceramic 0603" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '0603 (1608 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Capacitors Ceramic 0805" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '0805 (2012 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Capacitors Ceramic 1206" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '1206 (3216 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Capacitors Ceramic 1210" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '1210 (3225 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Capacitors Ceramic 2220" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.composition "Composition"
+FROM component c
+         INNER JOIN comp_capacitor_ceramic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '2220 (5750 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Capacitors Electrolytic" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.material "Material",
+       t.polarised "Polarised",
+       t.esr "ESR",
+       t.lifetime_temperature "Lifetime Temperature"
+FROM component c
+         INNER JOIN comp_capacitor_electrolytic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Capacitors Tantalum" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.voltage "Voltage",
+       t.lifetime_temperature "Lifetime Temperature",
+       t.esr "ESR"
+FROM component c
+         INNER JOIN comp_capacitor_tantalum t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Connectors PCB" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.orientation "Orientation",
+       t.pitch "Pitch",
+       t.voltage_rating "Voltage Rating",
+       t.current_rating "Current Rating",
+       t.number_of_rows "Number of Rows",
+       t.number_of_contacts "Number of Contacts"
+FROM component c
+         INNER JOIN comp_connector_pcb t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Crystal Oscillators" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.load_capacitance "Load Capacitance",
+       t.frequency "Frequency",
+       t.frequency_tolerance "Frquency Tolerance"
+FROM component c
+         INNER JOIN comp_crystal_oscillator t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Diodes Rectifier" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.forward_voltage "Forward Voltage",
+       t.reverse_current_leakage "Reverse Leakage Current",
+       t.max_forward_average_current "Maximum Forward Avg. Current",
+       t.max_reverse_vrrm "Maximum Repetitive Reverse Voltage",
+       t.diode_type "Diode Type"
+FROM component c
+         INNER JOIN comp_diode_rectifier t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Diodes TVS" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.voltage_reverse_standoff "Standoff Reverse Voltage",
+       t.voltage_breakdown_min "Minimum Breakdown Voltage",
+       t.voltage_clamping_max "Maximum Clamping Voltage"
+FROM component c
+         INNER JOIN comp_diode_tvs t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Diodes Zener" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.power_max "Maximum Power",
+       t.voltage_forward "Forward Voltage",
+       t.voltage_zener "Zener Voltage"
+FROM component c
+         INNER JOIN comp_diode_zener t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Discrete Logics" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.logic_family "Logic Family",
+       t.logic_type "Logic Type",
+       t.number_of_bits "Number of Bits",
+       t.propagation_delay "Propagation Delay",
+       t.supply_voltage_max "Maximum Supply Voltage",
+       t.supply_voltage_min "Minimum Supply Voltage",
+       t.logic_function "Logic Function"
+FROM component c
+         INNER JOIN comp_discrete_logic t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Ferrite Beads" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.number_of_lines "Number of Lines",
+       t.dc_resistance "DC Resistance",
+       t.impedance_freq "Impedance Frequency",
+       t.current_rating "Current Rating"
+FROM component c
+         INNER JOIN comp_ferrite_bead t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Inductors Chokes" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.number_of_lines "Number of Lines",
+       t.dc_resistance "DC Resistance",
+       t.impedance_freq "Impedance Frequency",
+       t.current_rating "Current Rating"
+FROM component c
+         INNER JOIN comp_inductor_choke t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Inductors Power" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.tolerance "Tolerance",
+       t.resistance_dcr "Resistance DCR",
+       t.inductance_freq_test "Test Frequency",
+       t.current_rating "Current Rating",
+       t.current_saturation "Current Saturation",
+       t.core_material "Core Material"
+FROM component c
+         INNER JOIN comp_power_inductor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad LED Indicators" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.forward_voltage "Forward Voltage",
+       t.color "Color",
+       t.lens_style "Lens Type",
+       t.lens_transparency "Lens Transparency",
+       t.dominant_wavelength "Dominant Wavelength",
+       t.test_current "Test Current",
+       t.lens_size "Lens Size"
+FROM component c
+         INNER JOIN comp_led_indicator t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Memories" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.technology "Technology",
+       t.memory_type "Memory Type",
+       t.size "Size",
+       t.interface "Interface",
+       t.clock_frequency "Clock Frequency"
+FROM component c
+         INNER JOIN comp_memory t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Microcontrollers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.core "Core",
+       t.core_size "Core Size",
+       t.speed "Speed",
+       t.flash_size "Flash Size",
+       t.ram_size "RAM Size",
+       t.peripherals "Peripherals",
+       t.connectivity "Connectivity",
+       t.voltage_supply "Voltage Supply"
+FROM component c
+         INNER JOIN comp_microcontroller t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad OpAmps" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.gain_bandwith "Gain Bandwith Product",
+       t.output_type "Output Type",
+       t.input_type "Input Type",
+       t.amplifier_type "Amplifier Type",
+       t.slew_rate "Slew Rate",
+       t.voltage_supplies "Voltage Supplies",
+       t.voltage_input_offset "Input Offset Voltage",
+       t.current_output "Output Current",
+       t.number_of_channels "Number of Channels"
+FROM component c
+         INNER JOIN comp_opamp t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Optocouplers Digital" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.voltage_isolation "Isolation Voltage",
+       t.voltage_saturation_max "Maximum Saturation Voltage",
+       t.current_transfer_ratio_max "Maximum Current Transfer Ratio",
+       t.current_transfer_ratio_min "Minimum Current Transfer Ratio",
+       t.voltage_forward_typical "Typical Forward Voltage",
+       t.voltage_output_max "Maximum Output Voltage",
+       t.number_of_channels "Number of Channels"
+FROM component c
+         INNER JOIN comp_optocoupler_digital t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Optocouplers Linear" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.voltage_isolation "Isolation Voltage",
+       t.transfer_gain "Transfer Gain",
+       t.input_forward_voltage "Input FOrward Voltage",
+       t.servo_gain "Servo Gain",
+       t.forward_gain "Forward Gain",
+       t.non_linearity "Non Linearity"
+FROM component c
+         INNER JOIN comp_optocoupler_linear t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Oscillator Oscillators" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.base_resonator "Base Resonator",
+       t.current_supply_max "Current Supply Maximum",
+       t.frequency "Frequency",
+       t.frequency_stability "Frequency Stability",
+       t.voltage_supply "Voltage Supply",
+       t.output_type "Output Type"
+FROM component c
+         INNER JOIN comp_oscillator_oscillator t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad PPTC Fuses" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.current_hold "Hold Current",
+       t.current_trip "Trip Current",
+       t.voltage_rating "Voltage Rating",
+       t.resistance_maximum "Maximum Resistance",
+       t.resistance_minimum "Minimum Resistance",
+       t.power_rating "Power Rating",
+       t.current_rating "Current Rating"
+FROM component c
+         INNER JOIN comp_fuse_pptc t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Potentiometers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.power_max "Maximum Power",
+       t.tolerance "Tolerance",
+       t.resistance_min "Minimum Resistance",
+       t.resistance_max "Maximum Resistance",
+       t.number_of_turns "Number of Turns"
+FROM component c
+         INNER JOIN comp_potentiometer t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Regulators DCDC" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.voltage_input_min "Minimum Input Voltage",
+       t.voltage_output_min_fixed "Minimum/Fixed Output Voltage",
+       t.voltage_output_max "Maximum Output Voltage",
+       t.current_output "Output Current",
+       t.frequency_switching "Switching Frequency",
+       t.topology "Topology",
+       t.output_type "Output Type",
+       t.number_of_outputs "Number of Outputs"
+FROM component c
+         INNER JOIN comp_voltage_regulator_dcdc t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Regulators Linear" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.gain_bandwith "Gain Bandwith",
+       t.output_type "Output Type",
+       t.voltage_output_min_fixed "Minimum/Fixed Output Voltage",
+       t.voltage_output_max "Maximum Output Voltage",
+       t.voltage_dropout_max "Maximum Dropout Voltage",
+       t.current_supply_max "Maximum Supply Current",
+       t.current_output "Output Current",
+       t.pssr "PSSR"
+FROM component c
+         INNER JOIN comp_voltage_regulator_linear t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Resistors" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Resistors 0603" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '0603 (1608 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Resistors 0805" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '0805 (2012 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Resistors 1206" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '1206 (3216 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Resistors 1210" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '1210 (3225 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Resistors 2220" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.power_max "Power Max",
+       t.tolerance "Tolerance"
+FROM component c
+         INNER JOIN comp_resistor t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+WHERE c.package = '2220 (5750 Metric)'
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Switches Pushbuttons" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.function "Function",
+       t.dc_voltage_rating "Maximum DC Voltage Rating",
+       t.ac_voltage_rating "Maximum RMS Voltage Rating",
+       t.current_rating "Current Rating",
+       t.circuit_type "Circuit Type"
+FROM component c
+         INNER JOIN comp_switch_push_button t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Switches Switch" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.voltage_rating "Maximum Voltage Rating",
+       t.current_rating "Current Rating",
+       t.number_of_positions "Number of Positions",
+       t.circuit_type "Circuit Type"
+FROM component c
+         INNER JOIN comp_switch_switch t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Transceivers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.duplex "Duplex",
+       t.data_rate "Data Rate",
+       t.protocol "Protocol",
+       t.voltage_supply "Supply Voltage"
+FROM component c
+         INNER JOIN comp_transceiver t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Transducers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.input_magnitude "Input Magnitude",
+       t.output_type "Output Type",
+       t.proportional_gain "Proportional Gain",
+       t.supply_voltage "Supply Voltage"
+FROM component c
+         INNER JOIN comp_transducer t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Transformers" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.number_of_windings "Number of Windings",
+       t.primary_dc_resistance "Primary DCR",
+       t.secondary_dc_resistance "Secondary DCR",
+       t.tertiary_dc_resistance "Tertiary DCR",
+       t.leakage_inductance "Leakage Inductance",
+       t.primary_inductance "Primary Inductance",
+       t.secondary_current_rating "Secondary Current Rating",
+       t.tertiary_current_rating "Tertiary Current Rating",
+       t.primary_voltage_rating "Primary Voltage Rating",
+       t.secondary_voltage_rating "Secondary Voltage Rating",
+       t.tertiary_voltage_rating "Tertiary Voltage Rating",
+       t.nps_turns_ratio "NPS Turns Ratio",
+       t.npt_turns_ratio "NPT Turns Ratio"
+FROM component c
+         INNER JOIN comp_transformer t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Transistors Arrays Mosfet" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.number_of_channels "Number of Channels",
+       t.rds_on "Drain Source Resistance",
+       t.vgs_max "Gate Source Max Voltage",
+       t.vgs_th "Gate Source Threshold Voltage",
+       t.vds_max "Drain Source Max Voltage",
+       t.ids_max "Drain Source Max Current",
+       t.current_total_max "Total Max Current",
+       t.power_max "Maximum Power",
+       t.channel_type "Channel Type"
+FROM component c
+         INNER JOIN comp_transistor_array_mosfet t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Transistors BJT" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.vce_sat_max "Collector Emiter Saturation Voltage",
+       t.hfe "hfe Gain",
+       t.vce_max "Collector Emiter Max. Votage",
+       t.ic_max "Collector Max. Current",
+       t.power_max "Maximum Power",
+       t.bjt_type "BJT Type"
+FROM component c
+         INNER JOIN comp_transistor_bjt t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Transistors Mosfet" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.rds_on "Drain Source Resistance",
+       t.vgs_max "Gate Source Max Voltage",
+       t.vgs_th "Gate Source Threshold Voltage",
+       t.vds_max "Drain Source Max Voltage",
+       t.ids_max "Drain Source Max Current",
+       t.power_max "Maximum Power",
+       t.channel_type "Channel Type"
+FROM component c
+         INNER JOIN comp_transistor_mosfet t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE VIEW "KiCad Triacs" AS
+SELECT c.mpn "Part Number",
+       c.value "Value",
+       c.manufacturer "Manufacturer",
+       c.created_on "Created On",
+       c.updated_on "Updated On",
+       c.package "Package",
+       c.description "Description",
+       c.comment_kicad "Comment",
+       c.operating_temperature_min "Minimum Operating Temperature",
+       c.operating_temperature_max "Maximum Operating Temperature",
+       CONCAT(l.alias, ':', l.reference) "Symbol",
+       COALESCE(f.footprints, '') "Footprints",
+       t.power_max "Maximum Power",
+       t.vdrm "Vdrm",
+       t.current_rating "Current Rating",
+       t.dl_dt "Rate Rise Off-State Voltage",
+       t.trigger_current "Trigger Current",
+       t.latching_current "Latching Current",
+       t.holding_current "Holding Current",
+       t.gate_trigger_voltage "Gate Trigger Voltage",
+       t.emitter_forward_current "Emitter Forward Current",
+       t.emitter_forward_voltage "Emitter Forward Voltage",
+       t.triac_type "Triac Type"
+FROM component c
+         INNER JOIN comp_triac t ON t.id = c.id
+         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias
+                             FROM component_library_asc cl
+                                      INNER JOIN library_ref l ON l.id = cl.library_ref_id
+                             WHERE cl.component_id = c.id
+                               AND l.cad_type = 'KICAD'::cadtype
+                             ORDER BY l.id
+                             LIMIT 1) l ON TRUE
+         LEFT JOIN LATERAL (SELECT string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) footprints
+                            FROM component_footprint_asc cf
+                                     INNER JOIN footprint_ref f ON f.id = cf.footprint_ref_id
+                            WHERE cf.component_id = c.id
+                              AND f.cad_type = 'KICAD'::cadtype) f ON TRUE
+ORDER BY c.id DESC;
+
+CREATE MATERIALIZED VIEW "Altium Capacitors Ceramic Materialized" AS SELECT * FROM "Altium Capacitors Ceramic";
+
+CREATE UNIQUE INDEX ix_mv_c353fd76bff2_part_number ON "Altium Capacitors Ceramic Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_c353fd76bff2_library_ref ON "Altium Capacitors Ceramic Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Capacitors Ceramic 0603 Materialized" AS SELECT * FROM "Altium Capacitors Ceramic 0603";
+
+CREATE UNIQUE INDEX ix_mv_c156f287312b_part_number ON "Altium Capacitors Ceramic 0603 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_c156f287312b_library_ref ON "Altium Capacitors Ceramic 0603 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Capacitors Ceramic 0805 Materialized" AS SELECT * FROM "Altium Capacitors Ceramic 0805";
+
+CREATE UNIQUE INDEX ix_mv_a12141fee684_part_number ON "Altium Capacitors Ceramic 0805 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_a12141fee684_library_ref ON "Altium Capacitors Ceramic 0805 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Capacitors Ceramic 1206 Materialized" AS SELECT * FROM "Altium Capacitors Ceramic 1206";
+
+CREATE UNIQUE INDEX ix_mv_60979e9a48fb_part_number ON "Altium Capacitors Ceramic 1206 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_60979e9a48fb_library_ref ON "Altium Capacitors Ceramic 1206 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Capacitors Ceramic 1210 Materialized" AS SELECT * FROM "Altium Capacitors Ceramic 1210";
+
+CREATE UNIQUE INDEX ix_mv_e4054654227d_part_number ON "Altium Capacitors Ceramic 1210 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_e4054654227d_library_ref ON "Altium Capacitors Ceramic 1210 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Capacitors Ceramic 2220 Materialized" AS SELECT * FROM "Altium Capacitors Ceramic 2220";
+
+CREATE UNIQUE INDEX ix_mv_bbebf29c9e03_part_number ON "Altium Capacitors Ceramic 2220 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_bbebf29c9e03_library_ref ON "Altium Capacitors Ceramic 2220 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Capacitors Electrolytic Materialized" AS SELECT * FROM "Altium Capacitors Electrolytic";
+
+CREATE UNIQUE INDEX ix_mv_dd1f1506091e_part_number ON "Altium Capacitors Electrolytic Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_dd1f1506091e_library_ref ON "Altium Capacitors Electrolytic Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Capacitors Tantalum Materialized" AS SELECT * FROM "Altium Capacitors Tantalum";
+
+CREATE UNIQUE INDEX ix_mv_fabcb1211950_part_number ON "Altium Capacitors Tantalum Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_fabcb1211950_library_ref ON "Altium Capacitors Tantalum Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Connectors PCB Materialized" AS SELECT * FROM "Altium Connectors PCB";
+
+CREATE UNIQUE INDEX ix_mv_8c4c82a8732b_part_number ON "Altium Connectors PCB Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_8c4c82a8732b_library_ref ON "Altium Connectors PCB Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Crystal Oscillators Materialized" AS SELECT * FROM "Altium Crystal Oscillators";
+
+CREATE UNIQUE INDEX ix_mv_f1bbbc37c164_part_number ON "Altium Crystal Oscillators Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_f1bbbc37c164_library_ref ON "Altium Crystal Oscillators Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Diodes Rectifier Materialized" AS SELECT * FROM "Altium Diodes Rectifier";
+
+CREATE UNIQUE INDEX ix_mv_67dc8375927b_part_number ON "Altium Diodes Rectifier Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_67dc8375927b_library_ref ON "Altium Diodes Rectifier Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Diodes TVS Materialized" AS SELECT * FROM "Altium Diodes TVS";
+
+CREATE UNIQUE INDEX ix_mv_f79d68db8a06_part_number ON "Altium Diodes TVS Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_f79d68db8a06_library_ref ON "Altium Diodes TVS Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Diodes Zener Materialized" AS SELECT * FROM "Altium Diodes Zener";
+
+CREATE UNIQUE INDEX ix_mv_0071886c9bb6_part_number ON "Altium Diodes Zener Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_0071886c9bb6_library_ref ON "Altium Diodes Zener Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Discrete Logics Materialized" AS SELECT * FROM "Altium Discrete Logics";
+
+CREATE UNIQUE INDEX ix_mv_d0dbe23867b7_part_number ON "Altium Discrete Logics Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_d0dbe23867b7_library_ref ON "Altium Discrete Logics Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Ferrite Beads Materialized" AS SELECT * FROM "Altium Ferrite Beads";
+
+CREATE UNIQUE INDEX ix_mv_e9a0c40f18e7_part_number ON "Altium Ferrite Beads Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_e9a0c40f18e7_library_ref ON "Altium Ferrite Beads Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Inductors Chokes Materialized" AS SELECT * FROM "Altium Inductors Chokes";
+
+CREATE UNIQUE INDEX ix_mv_8bc4a707a8d7_part_number ON "Altium Inductors Chokes Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_8bc4a707a8d7_library_ref ON "Altium Inductors Chokes Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Inductors Power Materialized" AS SELECT * FROM "Altium Inductors Power";
+
+CREATE UNIQUE INDEX ix_mv_199429257a09_part_number ON "Altium Inductors Power Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_199429257a09_library_ref ON "Altium Inductors Power Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium LED Indicators Materialized" AS SELECT * FROM "Altium LED Indicators";
+
+CREATE UNIQUE INDEX ix_mv_f94092f9f27d_part_number ON "Altium LED Indicators Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_f94092f9f27d_library_ref ON "Altium LED Indicators Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Memories Materialized" AS SELECT * FROM "Altium Memories";
+
+CREATE UNIQUE INDEX ix_mv_c755397a03e8_part_number ON "Altium Memories Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_c755397a03e8_library_ref ON "Altium Memories Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Microcontrollers Materialized" AS SELECT * FROM "Altium Microcontrollers";
+
+CREATE UNIQUE INDEX ix_mv_ab213dc914ee_part_number ON "Altium Microcontrollers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_ab213dc914ee_library_ref ON "Altium Microcontrollers Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium OpAmps Materialized" AS SELECT * FROM "Altium OpAmps";
+
+CREATE UNIQUE INDEX ix_mv_f6d77dafc2c3_part_number ON "Altium OpAmps Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_f6d77dafc2c3_library_ref ON "Altium OpAmps Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Optocouplers Digital Materialized" AS SELECT * FROM "Altium Optocouplers Digital";
+
+CREATE UNIQUE INDEX ix_mv_99fa38f6f05a_part_number ON "Altium Optocouplers Digital Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_99fa38f6f05a_library_ref ON "Altium Optocouplers Digital Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Optocouplers Linear Materialized" AS SELECT * FROM "Altium Optocouplers Linear";
+
+CREATE UNIQUE INDEX ix_mv_63bb9e5b4501_part_number ON "Altium Optocouplers Linear Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_63bb9e5b4501_library_ref ON "Altium Optocouplers Linear Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Oscillator Oscillators Materialized" AS SELECT * FROM "Altium Oscillator Oscillators";
+
+CREATE UNIQUE INDEX ix_mv_5b94f828bfe1_part_number ON "Altium Oscillator Oscillators Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_5b94f828bfe1_library_ref ON "Altium Oscillator Oscillators Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium PPTC Fuses Materialized" AS SELECT * FROM "Altium PPTC Fuses";
+
+CREATE UNIQUE INDEX ix_mv_3801676e8c79_part_number ON "Altium PPTC Fuses Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_3801676e8c79_library_ref ON "Altium PPTC Fuses Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Potentiometers Materialized" AS SELECT * FROM "Altium Potentiometers";
+
+CREATE UNIQUE INDEX ix_mv_6e24b545f83e_part_number ON "Altium Potentiometers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_6e24b545f83e_library_ref ON "Altium Potentiometers Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Regulators DCDC Materialized" AS SELECT * FROM "Altium Regulators DCDC";
+
+CREATE UNIQUE INDEX ix_mv_88205f946b4e_part_number ON "Altium Regulators DCDC Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_88205f946b4e_library_ref ON "Altium Regulators DCDC Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Regulators Linear Materialized" AS SELECT * FROM "Altium Regulators Linear";
+
+CREATE UNIQUE INDEX ix_mv_051692651e37_part_number ON "Altium Regulators Linear Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_051692651e37_library_ref ON "Altium Regulators Linear Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Resistors Materialized" AS SELECT * FROM "Altium Resistors";
+
+CREATE UNIQUE INDEX ix_mv_04d8f3171bac_part_number ON "Altium Resistors Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_04d8f3171bac_library_ref ON "Altium Resistors Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Resistors 0603 Materialized" AS SELECT * FROM "Altium Resistors 0603";
+
+CREATE UNIQUE INDEX ix_mv_d30993649638_part_number ON "Altium Resistors 0603 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_d30993649638_library_ref ON "Altium Resistors 0603 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Resistors 0805 Materialized" AS SELECT * FROM "Altium Resistors 0805";
+
+CREATE UNIQUE INDEX ix_mv_3a2d658a360d_part_number ON "Altium Resistors 0805 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_3a2d658a360d_library_ref ON "Altium Resistors 0805 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Resistors 1206 Materialized" AS SELECT * FROM "Altium Resistors 1206";
+
+CREATE UNIQUE INDEX ix_mv_19ecac6c368b_part_number ON "Altium Resistors 1206 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_19ecac6c368b_library_ref ON "Altium Resistors 1206 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Resistors 1210 Materialized" AS SELECT * FROM "Altium Resistors 1210";
+
+CREATE UNIQUE INDEX ix_mv_fab22725110c_part_number ON "Altium Resistors 1210 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_fab22725110c_library_ref ON "Altium Resistors 1210 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Resistors 2220 Materialized" AS SELECT * FROM "Altium Resistors 2220";
+
+CREATE UNIQUE INDEX ix_mv_15bfc84ca376_part_number ON "Altium Resistors 2220 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_15bfc84ca376_library_ref ON "Altium Resistors 2220 Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Switches Pushbuttons Materialized" AS SELECT * FROM "Altium Switches Pushbuttons";
+
+CREATE UNIQUE INDEX ix_mv_36a2af55f437_part_number ON "Altium Switches Pushbuttons Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_36a2af55f437_library_ref ON "Altium Switches Pushbuttons Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Switches Switch Materialized" AS SELECT * FROM "Altium Switches Switch";
+
+CREATE UNIQUE INDEX ix_mv_e752d28667c3_part_number ON "Altium Switches Switch Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_e752d28667c3_library_ref ON "Altium Switches Switch Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Transceivers Materialized" AS SELECT * FROM "Altium Transceivers";
+
+CREATE UNIQUE INDEX ix_mv_f96b4943e93b_part_number ON "Altium Transceivers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_f96b4943e93b_library_ref ON "Altium Transceivers Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Transducers Materialized" AS SELECT * FROM "Altium Transducers";
+
+CREATE UNIQUE INDEX ix_mv_913e26b64ce5_part_number ON "Altium Transducers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_913e26b64ce5_library_ref ON "Altium Transducers Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Transformers Materialized" AS SELECT * FROM "Altium Transformers";
+
+CREATE UNIQUE INDEX ix_mv_0625f7c8bd67_part_number ON "Altium Transformers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_0625f7c8bd67_library_ref ON "Altium Transformers Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Transistors Arrays Mosfet Materialized" AS SELECT * FROM "Altium Transistors Arrays Mosfet";
+
+CREATE UNIQUE INDEX ix_mv_ec1a770e348c_part_number ON "Altium Transistors Arrays Mosfet Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_ec1a770e348c_library_ref ON "Altium Transistors Arrays Mosfet Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Transistors BJT Materialized" AS SELECT * FROM "Altium Transistors BJT";
+
+CREATE UNIQUE INDEX ix_mv_5abf893dd540_part_number ON "Altium Transistors BJT Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_5abf893dd540_library_ref ON "Altium Transistors BJT Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Transistors Mosfet Materialized" AS SELECT * FROM "Altium Transistors Mosfet";
+
+CREATE UNIQUE INDEX ix_mv_c13149746872_part_number ON "Altium Transistors Mosfet Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_c13149746872_library_ref ON "Altium Transistors Mosfet Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "Altium Triacs Materialized" AS SELECT * FROM "Altium Triacs";
+
+CREATE UNIQUE INDEX ix_mv_c9bfa1c78230_part_number ON "Altium Triacs Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_c9bfa1c78230_library_ref ON "Altium Triacs Materialized" ("Library Ref");
+
+CREATE MATERIALIZED VIEW "KiCad Capacitors Ceramic Materialized" AS SELECT * FROM "KiCad Capacitors Ceramic";
+
+CREATE UNIQUE INDEX ix_mv_1c4cb34ae0ab_part_number ON "KiCad Capacitors Ceramic Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_1c4cb34ae0ab_symbol ON "KiCad Capacitors Ceramic Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Capacitors Ceramic 0603 Materialized" AS SELECT * FROM "KiCad Capacitors Ceramic 0603";
+
+CREATE UNIQUE INDEX ix_mv_794462f61c91_part_number ON "KiCad Capacitors Ceramic 0603 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_794462f61c91_symbol ON "KiCad Capacitors Ceramic 0603 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Capacitors Ceramic 0805 Materialized" AS SELECT * FROM "KiCad Capacitors Ceramic 0805";
+
+CREATE UNIQUE INDEX ix_mv_7a3d76f87cb8_part_number ON "KiCad Capacitors Ceramic 0805 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_7a3d76f87cb8_symbol ON "KiCad Capacitors Ceramic 0805 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Capacitors Ceramic 1206 Materialized" AS SELECT * FROM "KiCad Capacitors Ceramic 1206";
+
+CREATE UNIQUE INDEX ix_mv_58abf50e028c_part_number ON "KiCad Capacitors Ceramic 1206 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_58abf50e028c_symbol ON "KiCad Capacitors Ceramic 1206 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Capacitors Ceramic 1210 Materialized" AS SELECT * FROM "KiCad Capacitors Ceramic 1210";
+
+CREATE UNIQUE INDEX ix_mv_6dcb92fdf176_part_number ON "KiCad Capacitors Ceramic 1210 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_6dcb92fdf176_symbol ON "KiCad Capacitors Ceramic 1210 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Capacitors Ceramic 2220 Materialized" AS SELECT * FROM "KiCad Capacitors Ceramic 2220";
+
+CREATE UNIQUE INDEX ix_mv_c73b810eb7d0_part_number ON "KiCad Capacitors Ceramic 2220 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_c73b810eb7d0_symbol ON "KiCad Capacitors Ceramic 2220 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Capacitors Electrolytic Materialized" AS SELECT * FROM "KiCad Capacitors Electrolytic";
+
+CREATE UNIQUE INDEX ix_mv_e81855fa8a9e_part_number ON "KiCad Capacitors Electrolytic Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_e81855fa8a9e_symbol ON "KiCad Capacitors Electrolytic Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Capacitors Tantalum Materialized" AS SELECT * FROM "KiCad Capacitors Tantalum";
+
+CREATE UNIQUE INDEX ix_mv_04da4ea34728_part_number ON "KiCad Capacitors Tantalum Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_04da4ea34728_symbol ON "KiCad Capacitors Tantalum Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Connectors PCB Materialized" AS SELECT * FROM "KiCad Connectors PCB";
+
+CREATE UNIQUE INDEX ix_mv_12592549f1ab_part_number ON "KiCad Connectors PCB Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_12592549f1ab_symbol ON "KiCad Connectors PCB Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Crystal Oscillators Materialized" AS SELECT * FROM "KiCad Crystal Oscillators";
+
+CREATE UNIQUE INDEX ix_mv_ad514d52a72a_part_number ON "KiCad Crystal Oscillators Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_ad514d52a72a_symbol ON "KiCad Crystal Oscillators Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Diodes Rectifier Materialized" AS SELECT * FROM "KiCad Diodes Rectifier";
+
+CREATE UNIQUE INDEX ix_mv_b5c585b95ee1_part_number ON "KiCad Diodes Rectifier Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_b5c585b95ee1_symbol ON "KiCad Diodes Rectifier Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Diodes TVS Materialized" AS SELECT * FROM "KiCad Diodes TVS";
+
+CREATE UNIQUE INDEX ix_mv_2a6481d95905_part_number ON "KiCad Diodes TVS Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_2a6481d95905_symbol ON "KiCad Diodes TVS Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Diodes Zener Materialized" AS SELECT * FROM "KiCad Diodes Zener";
+
+CREATE UNIQUE INDEX ix_mv_a19be40a07f8_part_number ON "KiCad Diodes Zener Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_a19be40a07f8_symbol ON "KiCad Diodes Zener Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Discrete Logics Materialized" AS SELECT * FROM "KiCad Discrete Logics";
+
+CREATE UNIQUE INDEX ix_mv_09f2db2aca62_part_number ON "KiCad Discrete Logics Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_09f2db2aca62_symbol ON "KiCad Discrete Logics Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Ferrite Beads Materialized" AS SELECT * FROM "KiCad Ferrite Beads";
+
+CREATE UNIQUE INDEX ix_mv_20b9098b8a94_part_number ON "KiCad Ferrite Beads Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_20b9098b8a94_symbol ON "KiCad Ferrite Beads Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Inductors Chokes Materialized" AS SELECT * FROM "KiCad Inductors Chokes";
+
+CREATE UNIQUE INDEX ix_mv_faf9de392a80_part_number ON "KiCad Inductors Chokes Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_faf9de392a80_symbol ON "KiCad Inductors Chokes Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Inductors Power Materialized" AS SELECT * FROM "KiCad Inductors Power";
+
+CREATE UNIQUE INDEX ix_mv_826f99094b63_part_number ON "KiCad Inductors Power Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_826f99094b63_symbol ON "KiCad Inductors Power Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad LED Indicators Materialized" AS SELECT * FROM "KiCad LED Indicators";
+
+CREATE UNIQUE INDEX ix_mv_296e554ee884_part_number ON "KiCad LED Indicators Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_296e554ee884_symbol ON "KiCad LED Indicators Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Memories Materialized" AS SELECT * FROM "KiCad Memories";
+
+CREATE UNIQUE INDEX ix_mv_fff8801ca9bb_part_number ON "KiCad Memories Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_fff8801ca9bb_symbol ON "KiCad Memories Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Microcontrollers Materialized" AS SELECT * FROM "KiCad Microcontrollers";
+
+CREATE UNIQUE INDEX ix_mv_619937728c82_part_number ON "KiCad Microcontrollers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_619937728c82_symbol ON "KiCad Microcontrollers Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad OpAmps Materialized" AS SELECT * FROM "KiCad OpAmps";
+
+CREATE UNIQUE INDEX ix_mv_8d68255a5324_part_number ON "KiCad OpAmps Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_8d68255a5324_symbol ON "KiCad OpAmps Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Optocouplers Digital Materialized" AS SELECT * FROM "KiCad Optocouplers Digital";
+
+CREATE UNIQUE INDEX ix_mv_04e90888cc3d_part_number ON "KiCad Optocouplers Digital Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_04e90888cc3d_symbol ON "KiCad Optocouplers Digital Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Optocouplers Linear Materialized" AS SELECT * FROM "KiCad Optocouplers Linear";
+
+CREATE UNIQUE INDEX ix_mv_e6d6c5963e13_part_number ON "KiCad Optocouplers Linear Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_e6d6c5963e13_symbol ON "KiCad Optocouplers Linear Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Oscillator Oscillators Materialized" AS SELECT * FROM "KiCad Oscillator Oscillators";
+
+CREATE UNIQUE INDEX ix_mv_13611a5c27ae_part_number ON "KiCad Oscillator Oscillators Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_13611a5c27ae_symbol ON "KiCad Oscillator Oscillators Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad PPTC Fuses Materialized" AS SELECT * FROM "KiCad PPTC Fuses";
+
+CREATE UNIQUE INDEX ix_mv_9e38fc50fbb4_part_number ON "KiCad PPTC Fuses Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_9e38fc50fbb4_symbol ON "KiCad PPTC Fuses Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Potentiometers Materialized" AS SELECT * FROM "KiCad Potentiometers";
+
+CREATE UNIQUE INDEX ix_mv_48fa63517663_part_number ON "KiCad Potentiometers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_48fa63517663_symbol ON "KiCad Potentiometers Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Regulators DCDC Materialized" AS SELECT * FROM "KiCad Regulators DCDC";
+
+CREATE UNIQUE INDEX ix_mv_57cbcdbfec6f_part_number ON "KiCad Regulators DCDC Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_57cbcdbfec6f_symbol ON "KiCad Regulators DCDC Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Regulators Linear Materialized" AS SELECT * FROM "KiCad Regulators Linear";
+
+CREATE UNIQUE INDEX ix_mv_38288d211614_part_number ON "KiCad Regulators Linear Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_38288d211614_symbol ON "KiCad Regulators Linear Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Resistors Materialized" AS SELECT * FROM "KiCad Resistors";
+
+CREATE UNIQUE INDEX ix_mv_3090b3122ab9_part_number ON "KiCad Resistors Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_3090b3122ab9_symbol ON "KiCad Resistors Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Resistors 0603 Materialized" AS SELECT * FROM "KiCad Resistors 0603";
+
+CREATE UNIQUE INDEX ix_mv_29849fac9e72_part_number ON "KiCad Resistors 0603 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_29849fac9e72_symbol ON "KiCad Resistors 0603 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Resistors 0805 Materialized" AS SELECT * FROM "KiCad Resistors 0805";
+
+CREATE UNIQUE INDEX ix_mv_d3482c8f2245_part_number ON "KiCad Resistors 0805 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_d3482c8f2245_symbol ON "KiCad Resistors 0805 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Resistors 1206 Materialized" AS SELECT * FROM "KiCad Resistors 1206";
+
+CREATE UNIQUE INDEX ix_mv_3cc466913f6e_part_number ON "KiCad Resistors 1206 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_3cc466913f6e_symbol ON "KiCad Resistors 1206 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Resistors 1210 Materialized" AS SELECT * FROM "KiCad Resistors 1210";
+
+CREATE UNIQUE INDEX ix_mv_d17eaa0af1f3_part_number ON "KiCad Resistors 1210 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_d17eaa0af1f3_symbol ON "KiCad Resistors 1210 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Resistors 2220 Materialized" AS SELECT * FROM "KiCad Resistors 2220";
+
+CREATE UNIQUE INDEX ix_mv_200a7fe09200_part_number ON "KiCad Resistors 2220 Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_200a7fe09200_symbol ON "KiCad Resistors 2220 Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Switches Pushbuttons Materialized" AS SELECT * FROM "KiCad Switches Pushbuttons";
+
+CREATE UNIQUE INDEX ix_mv_dffc7a27fdd0_part_number ON "KiCad Switches Pushbuttons Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_dffc7a27fdd0_symbol ON "KiCad Switches Pushbuttons Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Switches Switch Materialized" AS SELECT * FROM "KiCad Switches Switch";
+
+CREATE UNIQUE INDEX ix_mv_ccdf19069667_part_number ON "KiCad Switches Switch Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_ccdf19069667_symbol ON "KiCad Switches Switch Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Transceivers Materialized" AS SELECT * FROM "KiCad Transceivers";
+
+CREATE UNIQUE INDEX ix_mv_ae49d262236c_part_number ON "KiCad Transceivers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_ae49d262236c_symbol ON "KiCad Transceivers Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Transducers Materialized" AS SELECT * FROM "KiCad Transducers";
+
+CREATE UNIQUE INDEX ix_mv_58a12a4ff2de_part_number ON "KiCad Transducers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_58a12a4ff2de_symbol ON "KiCad Transducers Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Transformers Materialized" AS SELECT * FROM "KiCad Transformers";
+
+CREATE UNIQUE INDEX ix_mv_74c4c7d16880_part_number ON "KiCad Transformers Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_74c4c7d16880_symbol ON "KiCad Transformers Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Transistors Arrays Mosfet Materialized" AS SELECT * FROM "KiCad Transistors Arrays Mosfet";
+
+CREATE UNIQUE INDEX ix_mv_eff267863f9b_part_number ON "KiCad Transistors Arrays Mosfet Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_eff267863f9b_symbol ON "KiCad Transistors Arrays Mosfet Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Transistors BJT Materialized" AS SELECT * FROM "KiCad Transistors BJT";
+
+CREATE UNIQUE INDEX ix_mv_be99df610aaa_part_number ON "KiCad Transistors BJT Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_be99df610aaa_symbol ON "KiCad Transistors BJT Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Transistors Mosfet Materialized" AS SELECT * FROM "KiCad Transistors Mosfet";
+
+CREATE UNIQUE INDEX ix_mv_018b7e504ab6_part_number ON "KiCad Transistors Mosfet Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_018b7e504ab6_symbol ON "KiCad Transistors Mosfet Materialized" ("Symbol");
+
+CREATE MATERIALIZED VIEW "KiCad Triacs Materialized" AS SELECT * FROM "KiCad Triacs";
+
+CREATE UNIQUE INDEX ix_mv_dd5cf85fbb15_part_number ON "KiCad Triacs Materialized" ("Part Number", "Manufacturer");
+
+CREATE INDEX ix_mv_dd5cf85fbb15_symbol ON "KiCad Triacs Materialized" ("Symbol");
+
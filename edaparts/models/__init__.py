@@ -25,6 +25,7 @@
 from edaparts.services.database import Base
 from edaparts.models.libraries.library_reference_model import LibraryReference
 from edaparts.models.libraries.footprint_reference_model import FootprintReference
+from edaparts.models.libraries.storage_task_model import StorageTaskModel
 from edaparts.models.metadata.model_descriptor import (
     ModelDescriptor,
     FieldModelDescriptor,
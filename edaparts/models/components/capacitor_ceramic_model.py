@@ -24,12 +24,18 @@
 
 
 from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.components.component_model import (
+    CHIP_PACKAGES,
+    ComponentModel,
+    numeric_column,
+)
 
 
 class CapacitorCeramicModel(ComponentModel):
     __tablename__ = "comp_capacitor_ceramic"
     __id_prefix__ = "CAPC"
+    __library_view__ = "Capacitors Ceramic"
+    __library_view_packages__ = CHIP_PACKAGES
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -38,6 +44,7 @@ class CapacitorCeramicModel(ComponentModel):
     tolerance = Column(String(30))
     voltage = Column(String(30))
     composition = Column(String(30))
+    voltage_numeric = numeric_column("voltage")
 
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
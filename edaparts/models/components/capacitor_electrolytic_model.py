@@ -24,12 +24,16 @@
 
 
 from sqlalchemy import Column, String, ForeignKey, Boolean
-from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.components.component_model import (
+    ComponentModel,
+    numeric_column,
+)
 
 
 class CapacitorElectrolyticModel(ComponentModel):
     __tablename__ = "comp_capacitor_electrolytic"
     __id_prefix__ = "CAPE"
+    __library_view__ = "Capacitors Electrolytic"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -41,6 +45,12 @@ class CapacitorElectrolyticModel(ComponentModel):
     polarised = Column(Boolean())
     esr = Column(String(30))
     lifetime_temperature = Column(String(30))
+    voltage_numeric = numeric_column("voltage")
+
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "esr": "ESR",
+    }
 
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
@@ -24,12 +24,16 @@
 
 
 from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.components.component_model import (
+    ComponentModel,
+    numeric_column,
+)
 
 
 class CapacitorTantalumModel(ComponentModel):
     __tablename__ = "comp_capacitor_tantalum"
     __id_prefix__ = "CAPT"
+    __library_view__ = "Capacitors Tantalum"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -39,6 +43,12 @@ class CapacitorTantalumModel(ComponentModel):
     voltage = Column(String(30))
     lifetime_temperature = Column(String(30))
     esr = Column(String(30))
+    voltage_numeric = numeric_column("voltage")
+
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "esr": "ESR",
+    }
 
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
@@ -30,10 +30,14 @@ from sqlalchemy import (
     DateTime,
     UniqueConstraint,
     ForeignKey,
+    Index,
     Boolean,
+    Float,
+    Text,
     func,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from edaparts.models.inventory.inventory_identificable_item_model import (
     InventoryIdentificableItemModel,
@@ -43,10 +47,34 @@ from edaparts.models.libraries.join_tables import (
     component_library_asc_table,
 )
 
+# Packages that get their own library views in the components that use them
+CHIP_PACKAGES = (
+    "0603 (1608 Metric)",
+    "0805 (2012 Metric)",
+    "1206 (3216 Metric)",
+    "1210 (3225 Metric)",
+    "2220 (5750 Metric)",
+)
+
+
+def numeric_column(source: str) -> Column:
+    """
+    Column of the value of the given string property as a number in its base
+    unit, e.g. 1e-07 for 100n. Filled by the service on write and used by the
+    range filters of the searches.
+    """
+    return Column(Float, index=True, info={"derived": True, "numeric_of": source})
+
 
 class ComponentModel(InventoryIdentificableItemModel):
     __tablename__ = "component"
     __id_prefix__ = "COMP"
+    # Name of the Altium and KiCad library views of each component type, and
+    # the packages that have their own view. Components without a view name
+    # have no views
+    __library_view__ = None
+    __library_view_packages__ = ()
+    __library_view_headers__ = {}
 
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -60,7 +88,7 @@ class ComponentModel(InventoryIdentificableItemModel):
     created_on = Column(DateTime(), server_default=func.now())
     updated_on = Column(DateTime(), server_default=func.now(), onupdate=func.now())
     value = Column(String(100))
-    package = Column(String(100))
+    package = Column(String(100), index=True)
     description = Column(String(200))
     comment_altium = Column(String(100), nullable=True)
     comment_kicad = Column(String(100), nullable=True)
@@ -68,6 +96,15 @@ class ComponentModel(InventoryIdentificableItemModel):
     operating_temperature_min = Column(String(30))
     operating_temperature_max = Column(String(30))
 
+    # Text of the general and type specific properties matched by the
+    # components search. Filled by the service on write, never loaded
+    search_document = deferred(Column(Text, info={"derived": True}))
+
+    # Numeric values of the general properties
+    value_numeric = numeric_column("value")
+    operating_temperature_min_numeric = numeric_column("operating_temperature_min")
+    operating_temperature_max_numeric = numeric_column("operating_temperature_max")
+
     # Relationships
     library_refs = relationship(
         "LibraryReference",
@@ -94,4 +131,23 @@ class ComponentModel(InventoryIdentificableItemModel):
     # Set a constraint that enforces Part Number - Manufacturer uniqueness
     __table_args__ = (
         UniqueConstraint("mpn", "manufacturer", name="_mpn_manufacturer_uc"),
+        # Text search and trigram indexes of the components search. The mpn one
+        # also serves the LIKE filters with leading wildcards. PostgreSQL only
+        Index(
+            "ix_component_search_document_tsv",
+            text("to_tsvector('simple', search_document)"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_component_search_document_trgm",
+            "search_document",
+            postgresql_using="gin",
+            postgresql_ops={"search_document": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_component_mpn_trgm",
+            "mpn",
+            postgresql_using="gin",
+            postgresql_ops={"mpn": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class ConnectorPcbModel(ComponentModel):
     __tablename__ = "comp_connector_pcb"
     __id_prefix__ = "CONP"
+    __library_view__ = "Connectors PCB"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -42,6 +43,12 @@ class ConnectorPcbModel(ComponentModel):
     number_of_rows = Column(String(30))
     number_of_contacts = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "number_of_rows": "Number of Rows",
+        "number_of_contacts": "Number of Contacts",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
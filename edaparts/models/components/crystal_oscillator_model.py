@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class CrystalOscillatorModel(ComponentModel):
     __tablename__ = "comp_crystal_oscillator"
     __id_prefix__ = "XTAL"
+    __library_view__ = "Crystal Oscillators"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -39,6 +40,11 @@ class CrystalOscillatorModel(ComponentModel):
     frequency = Column(String(30))
     frequency_tolerance = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "frequency_tolerance": "Frquency Tolerance",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
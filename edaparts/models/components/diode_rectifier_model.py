@@ -29,6 +29,7 @@ from edaparts.models.components.component_model import ComponentModel
 class DiodeRectifierModel(ComponentModel):
     __tablename__ = "comp_diode_rectifier"
     __id_prefix__ = "DREC"
+    __library_view__ = "Diodes Rectifier"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -40,6 +41,13 @@ class DiodeRectifierModel(ComponentModel):
     max_reverse_vrrm = Column(String(30))
     diode_type = Column(String(50))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "reverse_current_leakage": "Reverse Leakage Current",
+        "max_forward_average_current": "Maximum Forward Avg. Current",
+        "max_reverse_vrrm": "Maximum Repetitive Reverse Voltage",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
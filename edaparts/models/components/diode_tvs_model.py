@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class DiodeTVSModel(ComponentModel):
     __tablename__ = "comp_diode_tvs"
     __id_prefix__ = "DTVS"
+    __library_view__ = "Diodes TVS"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -39,6 +40,13 @@ class DiodeTVSModel(ComponentModel):
     voltage_breakdown_min = Column(String(30))
     voltage_clamping_max = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "voltage_reverse_standoff": "Standoff Reverse Voltage",
+        "voltage_breakdown_min": "Minimum Breakdown Voltage",
+        "voltage_clamping_max": "Maximum Clamping Voltage",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
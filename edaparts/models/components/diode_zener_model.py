@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class DiodeZenerModel(ComponentModel):
     __tablename__ = "comp_diode_zener"
     __id_prefix__ = "DZEN"
+    __library_view__ = "Diodes Zener"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -40,6 +41,13 @@ class DiodeZenerModel(ComponentModel):
     voltage_forward = Column(String(30))
     voltage_zener = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "power_max": "Maximum Power",
+        "voltage_forward": "Forward Voltage",
+        "voltage_zener": "Zener Voltage",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
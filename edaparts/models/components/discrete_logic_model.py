@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class DiscreteLogicModel(ComponentModel):
     __tablename__ = "comp_discrete_logic"
     __id_prefix__ = "LGIC"
+    __library_view__ = "Discrete Logics"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -43,6 +44,13 @@ class DiscreteLogicModel(ComponentModel):
     supply_voltage_min = Column(String(30))
     logic_function = Column(String(100))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "number_of_bits": "Number of Bits",
+        "supply_voltage_max": "Maximum Supply Voltage",
+        "supply_voltage_min": "Minimum Supply Voltage",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
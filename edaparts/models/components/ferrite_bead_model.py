@@ -29,6 +29,7 @@ from edaparts.models.components.component_model import ComponentModel
 class FerriteBeadModel(ComponentModel):
     __tablename__ = "comp_ferrite_bead"
     __id_prefix__ = "FEAD"
+    __library_view__ = "Ferrite Beads"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -39,6 +40,13 @@ class FerriteBeadModel(ComponentModel):
     impedance_freq = Column(String(30))
     current_rating = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "number_of_lines": "Number of Lines",
+        "dc_resistance": "DC Resistance",
+        "impedance_freq": "Impedance Frequency",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class FusePPTCModel(ComponentModel):
     __tablename__ = "comp_fuse_pptc"
     __id_prefix__ = "PPTC"
+    __library_view__ = "PPTC Fuses"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -43,6 +44,14 @@ class FusePPTCModel(ComponentModel):
     power_rating = Column(String(30))
     current_rating = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "current_hold": "Hold Current",
+        "current_trip": "Trip Current",
+        "resistance_maximum": "Maximum Resistance",
+        "resistance_minimum": "Minimum Resistance",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class LedIndicatorModel(ComponentModel):
     __tablename__ = "comp_led_indicator"
     __id_prefix__ = "LEDI"
+    __library_view__ = "LED Indicators"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -43,6 +44,11 @@ class LedIndicatorModel(ComponentModel):
     test_current = Column(String(30))
     lens_size = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "lens_style": "Lens Type",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -29,6 +29,7 @@ from edaparts.models.components.component_model import ComponentModel
 
 class MemoryModel(ComponentModel):
     __tablename__ = "comp_memory"
+    __library_view__ = "Memories"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
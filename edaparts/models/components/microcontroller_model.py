@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class MicrocontrollerModel(ComponentModel):
     __tablename__ = "comp_microcontroller"
     __id_prefix__ = "MCRO"
+    __library_view__ = "Microcontrollers"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -44,6 +45,11 @@ class MicrocontrollerModel(ComponentModel):
     connectivity = Column(String(250))
     voltage_supply = Column(String(50))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "ram_size": "RAM Size",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
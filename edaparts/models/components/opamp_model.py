@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class OpAmpModel(ComponentModel):
     __tablename__ = "comp_opamp"
     __id_prefix__ = "OAMP"
+    __library_view__ = "OpAmps"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -45,6 +46,14 @@ class OpAmpModel(ComponentModel):
     current_output = Column(String(30))
     number_of_channels = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "gain_bandwith": "Gain Bandwith Product",
+        "voltage_input_offset": "Input Offset Voltage",
+        "current_output": "Output Current",
+        "number_of_channels": "Number of Channels",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
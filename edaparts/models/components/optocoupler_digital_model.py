@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class OptocouplerDigitalModel(ComponentModel):
     __tablename__ = "comp_optocoupler_digital"
     __id_prefix__ = "OPTD"
+    __library_view__ = "Optocouplers Digital"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -43,6 +44,17 @@ class OptocouplerDigitalModel(ComponentModel):
     voltage_output_max = Column(String(30))
     number_of_channels = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "voltage_isolation": "Isolation Voltage",
+        "voltage_saturation_max": "Maximum Saturation Voltage",
+        "current_transfer_ratio_max": "Maximum Current Transfer Ratio",
+        "current_transfer_ratio_min": "Minimum Current Transfer Ratio",
+        "voltage_forward_typical": "Typical Forward Voltage",
+        "voltage_output_max": "Maximum Output Voltage",
+        "number_of_channels": "Number of Channels",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
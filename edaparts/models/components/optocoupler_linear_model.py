@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class OptocouplerLinearModel(ComponentModel):
     __tablename__ = "comp_optocoupler_linear"
     __id_prefix__ = "OPTA"
+    __library_view__ = "Optocouplers Linear"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -42,6 +43,12 @@ class OptocouplerLinearModel(ComponentModel):
     forward_gain = Column(String(30))
     non_linearity = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "voltage_isolation": "Isolation Voltage",
+        "input_forward_voltage": "Input FOrward Voltage",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class OscillatorOscillatorModel(ComponentModel):
     __tablename__ = "comp_oscillator_oscillator"
     __id_prefix__ = "XOSC"
+    __library_view__ = "Oscillator Oscillators"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -42,6 +43,11 @@ class OscillatorOscillatorModel(ComponentModel):
     voltage_supply = Column(String(30))
     output_type = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "current_supply_max": "Current Supply Maximum",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class PotentiometerModel(ComponentModel):
     __tablename__ = "comp_potentiometer"
     __id_prefix__ = "RPOT"
+    __library_view__ = "Potentiometers"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -41,6 +42,14 @@ class PotentiometerModel(ComponentModel):
     resistance_max = Column(String(30))
     number_of_turns = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "power_max": "Maximum Power",
+        "resistance_min": "Minimum Resistance",
+        "resistance_max": "Maximum Resistance",
+        "number_of_turns": "Number of Turns",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class PowerInductorModel(ComponentModel):
     __tablename__ = "comp_power_inductor"
     __id_prefix__ = "PIND"
+    __library_view__ = "Inductors Power"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -42,6 +43,12 @@ class PowerInductorModel(ComponentModel):
     current_saturation = Column(String(30))
     core_material = Column(String(50))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "resistance_dcr": "Resistance DCR",
+        "inductance_freq_test": "Test Frequency",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -24,12 +24,18 @@
 
 
 from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.components.component_model import (
+    CHIP_PACKAGES,
+    ComponentModel,
+    numeric_column,
+)
 
 
 class ResistorModel(ComponentModel):
     __tablename__ = "comp_resistor"
     __id_prefix__ = "RFIX"
+    __library_view__ = "Resistors"
+    __library_view_packages__ = CHIP_PACKAGES
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -37,6 +43,8 @@ class ResistorModel(ComponentModel):
     # Specific properties of a resistor
     power_max = Column(String(30))
     tolerance = Column(String(30))
+    power_max_numeric = numeric_column("power_max")
+    tolerance_numeric = numeric_column("tolerance")
 
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
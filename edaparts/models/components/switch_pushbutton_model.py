@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class SwitchPushButtonModel(ComponentModel):
     __tablename__ = "comp_switch_push_button"
     __id_prefix__ = "SBUT"
+    __library_view__ = "Switches Pushbuttons"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -41,6 +42,12 @@ class SwitchPushButtonModel(ComponentModel):
     current_rating = Column(String(30))
     circuit_type = Column(String(50))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "dc_voltage_rating": "Maximum DC Voltage Rating",
+        "ac_voltage_rating": "Maximum RMS Voltage Rating",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
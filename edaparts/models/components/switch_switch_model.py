@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class SwitchSwitchModel(ComponentModel):
     __tablename__ = "comp_switch_switch"
     __id_prefix__ = "SWIT"
+    __library_view__ = "Switches Switch"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -40,6 +41,12 @@ class SwitchSwitchModel(ComponentModel):
     number_of_positions = Column(String(30))
     circuit_type = Column(String(50))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "voltage_rating": "Maximum Voltage Rating",
+        "number_of_positions": "Number of Positions",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
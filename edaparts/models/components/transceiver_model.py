@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class TransceiverModel(ComponentModel):
     __tablename__ = "comp_transceiver"
     __id_prefix__ = "XCVR"
+    __library_view__ = "Transceivers"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -40,6 +41,11 @@ class TransceiverModel(ComponentModel):
     protocol = Column(String(30))
     voltage_supply = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "voltage_supply": "Supply Voltage",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
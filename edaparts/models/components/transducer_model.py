@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class TransducerModel(ComponentModel):
     __tablename__ = "comp_transducer"
     __id_prefix__ = "XDCR"
+    __library_view__ = "Transducers"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -29,6 +29,7 @@ from edaparts.models.components.component_model import ComponentModel
 class TransformerModel(ComponentModel):
     __tablename__ = "comp_transformer"
     __id_prefix__ = "TFRM"
+    __library_view__ = "Transformers"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -48,6 +49,16 @@ class TransformerModel(ComponentModel):
     nps_turns_ratio = Column(String(30))
     npt_turns_ratio = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "number_of_windings": "Number of Windings",
+        "primary_dc_resistance": "Primary DCR",
+        "secondary_dc_resistance": "Secondary DCR",
+        "tertiary_dc_resistance": "Tertiary DCR",
+        "nps_turns_ratio": "NPS Turns Ratio",
+        "npt_turns_ratio": "NPT Turns Ratio",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class TransistorArrayMosfetModel(ComponentModel):
     __tablename__ = "comp_transistor_array_mosfet"
     __id_prefix__ = "QARR"
+    __library_view__ = "Transistors Arrays Mosfet"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -45,6 +46,18 @@ class TransistorArrayMosfetModel(ComponentModel):
     power_max = Column(String(30))
     channel_type = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "number_of_channels": "Number of Channels",
+        "rds_on": "Drain Source Resistance",
+        "vgs_max": "Gate Source Max Voltage",
+        "vgs_th": "Gate Source Threshold Voltage",
+        "vds_max": "Drain Source Max Voltage",
+        "ids_max": "Drain Source Max Current",
+        "current_total_max": "Total Max Current",
+        "power_max": "Maximum Power",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class TransistorBjtModel(ComponentModel):
     __tablename__ = "comp_transistor_bjt"
     __id_prefix__ = "QBJT"
+    __library_view__ = "Transistors BJT"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -42,6 +43,16 @@ class TransistorBjtModel(ComponentModel):
     power_max = Column(String(50))
     bjt_type = Column(String(10))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "vce_sat_max": "Collector Emiter Saturation Voltage",
+        "hfe": "hfe Gain",
+        "vce_max": "Collector Emiter Max. Votage",
+        "ic_max": "Collector Max. Current",
+        "power_max": "Maximum Power",
+        "bjt_type": "BJT Type",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
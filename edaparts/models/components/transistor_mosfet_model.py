@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class TransistorMosfetModel(ComponentModel):
     __tablename__ = "comp_transistor_mosfet"
     __id_prefix__ = "QFET"
+    __library_view__ = "Transistors Mosfet"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -43,6 +44,16 @@ class TransistorMosfetModel(ComponentModel):
     power_max = Column(String(30))
     channel_type = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "rds_on": "Drain Source Resistance",
+        "vgs_max": "Gate Source Max Voltage",
+        "vgs_th": "Gate Source Threshold Voltage",
+        "vds_max": "Drain Source Max Voltage",
+        "ids_max": "Drain Source Max Current",
+        "power_max": "Maximum Power",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
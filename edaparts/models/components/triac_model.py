@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class TriacModel(ComponentModel):
     __tablename__ = "comp_triac"
     __id_prefix__ = "TRIA"
+    __library_view__ = "Triacs"
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
 
@@ -46,6 +47,12 @@ class TriacModel(ComponentModel):
     emitter_forward_voltage = Column(String(30))
     triac_type = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "power_max": "Maximum Power",
+        "dl_dt": "Rate Rise Off-State Voltage",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
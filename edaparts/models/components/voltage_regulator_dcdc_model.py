@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class VoltageRegulatorDCDCModel(ComponentModel):
     __tablename__ = "comp_voltage_regulator_dcdc"
     __id_prefix__ = "DCDC"
+    __library_view__ = "Regulators DCDC"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -44,6 +45,16 @@ class VoltageRegulatorDCDCModel(ComponentModel):
     output_type = Column(String(50))
     number_of_outputs = Column(String(30))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "voltage_input_min": "Minimum Input Voltage",
+        "voltage_output_min_fixed": "Minimum/Fixed Output Voltage",
+        "voltage_output_max": "Maximum Output Voltage",
+        "current_output": "Output Current",
+        "frequency_switching": "Switching Frequency",
+        "number_of_outputs": "Number of Outputs",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
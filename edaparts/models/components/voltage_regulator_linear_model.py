@@ -30,6 +30,7 @@ from edaparts.models.components.component_model import ComponentModel
 class VoltageRegulatorLinearModel(ComponentModel):
     __tablename__ = "comp_voltage_regulator_linear"
     __id_prefix__ = "REGL"
+    __library_view__ = "Regulators Linear"
 
     # Primary key
     id = Column(ForeignKey("component.id"), primary_key=True)
@@ -44,6 +45,16 @@ class VoltageRegulatorLinearModel(ComponentModel):
     current_output = Column(String(30))
     pssr = Column(String(50))
 
+    # Headers of the library views columns that differ from the column names
+    __library_view_headers__ = {
+        "voltage_output_min_fixed": "Minimum/Fixed Output Voltage",
+        "voltage_output_max": "Maximum Output Voltage",
+        "current_output": "Output Current",
+        "current_supply_max": "Maximum Supply Current",
+        "voltage_dropout_max": "Maximum Dropout Voltage",
+        "pssr": "PSSR",
+    }
+
     # Tells the ORM the type of a specific component by the distinguish column
     __mapper_args__ = {
         "polymorphic_identity": __tablename__,
@@ -45,6 +45,84 @@ class StorageStatus(Enum):
     DELETING = "DELETING"
 
 
+class StorageTaskType(Enum):
+    STORE = "STORE"
+    DELETE = "DELETE"
+
+
+class StorageTaskStatus(Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+
+
+class ComponentLoadingMode(Enum):
+    POLYMORPHIC = "polymorphic"
+    SUBTYPE = "subtype"
+
+
+class PageCountMode(Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
+
+
+class BulkImportMode(Enum):
+    PARTIAL = "partial"
+    ATOMIC = "atomic"
+
+
+class BulkImportRowStatus(Enum):
+    CREATED = "created"
+    EXISTS = "exists"
+    DUPLICATED = "duplicated"
+    INVALID = "invalid"
+    FAILED = "failed"
+    # Not created because the atomic import failed on other rows
+    SKIPPED = "skipped"
+
+
+@dataclass
+class BulkImportRowResult:
+    index: int
+    status: BulkImportRowStatus
+    component_id: typing.Optional[int] = None
+    dici: typing.Optional[str] = None
+    error: typing.Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ComponentRelations:
+    component_id: int
+    footprint_ids: list[int]
+    symbol_ids: list[int]
+
+
+class ChangedEntityType(Enum):
+    COMPONENT = "component"
+    FOOTPRINT = "footprint"
+    SYMBOL = "symbol"
+    INVENTORY_ITEM = "inventory_item"
+    INVENTORY_LOCATION = "inventory_location"
+    INVENTORY_CATEGORY = "inventory_category"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    entity_type: ChangedEntityType
+    # None if any entity of the type may have changed
+    entity_id: typing.Optional[int] = None
+
+
+@dataclass(frozen=True)
+class LibraryViewDefinition:
+    name: str
+    cad_type: CadType
+    model: type
+    # Only the components of this package are shown if given
+    package: typing.Optional[str] = None
+
+
 @dataclass(frozen=True)
 class StorableObjectRequest:
     filename: pathlib.Path
@@ -105,3 +183,19 @@ class CreateUpdateDataStorableTask(BaseStorableTask):
 @dataclass(frozen=True)
 class DeleteStorableTask(BaseStorableTask):
     pass
+
+
+@dataclass(frozen=True)
+class ModelFieldFilter:
+    """
+    Search filter of a model field parsed from its query parameter, e.g.
+    comp_value_mineq. The filter value is applied on each request.
+    """
+
+    key: str
+    field_name: str
+    operator: str
+    data_type: type
+    column: typing.Any
+    # Column of the value as a number, for the fields that have one
+    numeric_column: typing.Any = None
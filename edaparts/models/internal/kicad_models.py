@@ -39,7 +39,15 @@ class KiCadPart:
     id: int
     name: str
     symbolIdStr: str
-    fields: dict[str, KiCadPartProperty]
+    # Read only view, as parts are cached and shared by all the requests
+    fields: typing.Mapping[str, KiCadPartProperty]
+
+
+@dataclass(frozen=True)
+class KiCadCategoryPart:
+    id: int
+    name: str
+    description: typing.Optional[str]
 
 
 @dataclass(frozen=True)
@@ -23,8 +23,17 @@
 #
 
 
+from sqlalchemy import Sequence
+
 from edaparts.services.database import Base
 
+# Each value of the sequence reserves a block of DICI_BLOCK_SIZE numbers for
+# the process that takes it, that hands them out without querying the DB
+DICI_BLOCK_SIZE = 50
+dici_sequence = Sequence(
+    "inventory_dici_seq", start=1, increment=DICI_BLOCK_SIZE, metadata=Base.metadata
+)
+
 
 class InventoryIdentificableItemModel(Base):
     __abstract__ = True
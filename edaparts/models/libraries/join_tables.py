@@ -23,7 +23,7 @@
 #
 
 
-from sqlalchemy import Column, Integer, ForeignKey, Table
+from sqlalchemy import Column, Integer, ForeignKey, Index, Table
 from edaparts.services.database import Base
 
 component_footprint_asc_table = Table(
@@ -31,6 +31,12 @@ component_footprint_asc_table = Table(
     Base.metadata,
     Column("component_id", Integer, ForeignKey("component.id"), nullable=False),
     Column("footprint_ref_id", Integer, ForeignKey("footprint_ref.id"), nullable=False),
+    # The library views look the footprints of each component up
+    Index(
+        "ix_component_footprint_asc_component_id_footprint_ref_id",
+        "component_id",
+        "footprint_ref_id",
+    ),
 )
 
 component_library_asc_table = Table(
@@ -38,4 +44,9 @@ component_library_asc_table = Table(
     Base.metadata,
     Column("component_id", Integer, ForeignKey("component.id"), nullable=False),
     Column("library_ref_id", Integer, ForeignKey("library_ref.id"), nullable=False),
+    Index(
+        "ix_component_library_asc_component_id_library_ref_id",
+        "component_id",
+        "library_ref_id",
+    ),
 )
@@ -23,7 +23,8 @@
 #
 
 
-from sqlalchemy import Column, Enum, String
+from sqlalchemy import Column, Enum, Index, String
+from sqlalchemy.orm import declared_attr
 
 from edaparts.models.internal.internal_models import StorageStatus, CadType
 from edaparts.services.database import Base
@@ -39,3 +40,27 @@ class StorableLibraryModel(Base):
     storage_status = Column(Enum(StorageStatus, validate_strings=True), nullable=False)
     storage_error = Column(String(1024), nullable=True)
     cad_type = Column(Enum(CadType, validate_strings=True), nullable=False)
+
+    @declared_attr.directive
+    def __table_args__(cls):
+        # Listing filters. The id closes the composite indexes, so filtered pages
+        # are read in order. The prefix ones use pattern ops to serve LIKE 'x%'
+        return (
+            Index(
+                f"ix_{cls.__tablename__}_cad_type_storage_status_id",
+                "cad_type",
+                "storage_status",
+                "id",
+            ),
+            Index(f"ix_{cls.__tablename__}_storage_status_id", "storage_status", "id"),
+            Index(
+                f"ix_{cls.__tablename__}_path_prefix",
+                "path",
+                postgresql_ops={"path": "varchar_pattern_ops"},
+            ),
+            Index(
+                f"ix_{cls.__tablename__}_reference_prefix",
+                "reference",
+                postgresql_ops={"reference": "varchar_pattern_ops"},
+            ),
+        )
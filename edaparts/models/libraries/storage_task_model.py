@@ -0,0 +1,70 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+from sqlalchemy import Column, DateTime, Enum, Index, Integer, String, func
+
+from edaparts.models.internal.internal_models import (
+    CadType,
+    StorableLibraryResourceType,
+    StorageTaskStatus,
+    StorageTaskType,
+)
+from edaparts.services.database import Base
+
+
+class StorageTaskModel(Base):
+    """
+    Pending storage of a footprint or symbol file. Rows only live until the
+    task finishes, successfully or not.
+    """
+
+    __tablename__ = "storage_task"
+    id = Column(Integer, primary_key=True)
+    task_type = Column(Enum(StorageTaskType, validate_strings=True), nullable=False)
+    status = Column(Enum(StorageTaskStatus, validate_strings=True), nullable=False)
+
+    # Not a foreign key, the target table depends on the file type and delete
+    # tasks outlive their model
+    model_id = Column(Integer, nullable=False)
+    file_type = Column(
+        Enum(StorableLibraryResourceType, validate_strings=True), nullable=False
+    )
+    cad_type = Column(Enum(CadType, validate_strings=True), nullable=False)
+    path = Column(String(400), nullable=False)
+    reference = Column(String(150))
+    # Uploaded file to store, if any
+    filename = Column(String(1024))
+
+    attempts = Column(Integer, nullable=False, default=0)
+    run_after = Column(DateTime(timezone=True), nullable=False)
+    # Running tasks whose lease expires are taken by any worker again
+    lease_until = Column(DateTime(timezone=True))
+    last_error = Column(String(1024))
+    created_on = Column(DateTime(), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_storage_task_status_run_after", "status", "run_after"),
+        Index("ix_storage_task_file_type_model_id_id", "file_type", "model_id", "id"),
+    )
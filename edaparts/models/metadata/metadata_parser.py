@@ -23,77 +23,80 @@
 #
 
 
+import types
+
 from sqlalchemy import inspect
 from sqlalchemy.orm import ColumnProperty
 
 from edaparts.services.database import Base
-from edaparts.models import ModelDescriptor
+from edaparts.models import FieldModelDescriptor, ModelDescriptor
 from edaparts.services.exceptions import GenericIntenalApiError
 from edaparts.utils.helpers import BraceMessage
 
 
 class MetadataParser:
+    """
+    Descriptors of the SQLAlchemy models, built once for all the mapped models
+    and indexed by model and table name, as they do not change once mapped.
+    """
 
     @staticmethod
-    def __get_all_alquemy_models():
-        return [
-            cls
-            for cls in Base.registry._class_registry.values()
-            if isinstance(cls, type) and issubclass(cls, Base)
-        ]
-
-    @staticmethod
-    def model_exists_by_name(model_name):
-        return any(
-            cls.__tablename__ == model_name
-            for cls in MetadataParser.__get_all_alquemy_models()
-        )
-
-    @staticmethod
-    def __get_model_from_alquemy(name, raise_ex=True):
-        if not name:
-            raise GenericIntenalApiError("SQLAlchemy model name cannot be empty")
-
-        models = [
-            cls
-            for cls in MetadataParser.__get_all_alquemy_models()
-            if cls.__tablename__ == name
-        ]
-        if (not MetadataParser.model_exists_by_name(name)) and raise_ex:
-            raise GenericIntenalApiError(
-                BraceMessage(
-                    "SQLAlquemy model parse has failed cause model {0} cannot be found",
-                    name,
-                )
-            )
-        return models[0]
-
-    @staticmethod
-    def __get_alquemy_model_metadata(model):
+    def __build_model_metadata(model) -> ModelDescriptor:
         mapper = inspect(model)
-        descriptor = ModelDescriptor(model.__name__)
+        numeric_fields = {
+            attr.expression.info["numeric_of"]: attr.key
+            for attr in mapper.column_attrs
+            if "numeric_of" in attr.expression.info
+        }
+        fields = {}
         for attr in mapper.attrs:
-            if type(attr) is ColumnProperty:
-                descriptor.add_field(
+            if type(attr) is ColumnProperty and attr.key not in fields:
+                fields[attr.key] = FieldModelDescriptor(
                     attr.key,
                     attr.expression.unique
                     or attr.expression.primary_key
                     or attr.expression.nullable is False,
                     attr.expression.primary_key,
                     attr.expression.type.python_type,
+                    numeric_fields.get(attr.key),
                 )
-        return descriptor
+        return ModelDescriptor(model.__name__, types.MappingProxyType(fields))
 
     def __init__(self):
-        self.mappers = {}
+        self.__models_by_name = None
+        self.__descriptors = None
+
+    def load(self):
+        # The mappers of the registry are final once all the models are imported
+        models = [mapper.class_ for mapper in Base.registry.mappers]
+        descriptors = {
+            model: MetadataParser.__build_model_metadata(model) for model in models
+        }
+        self.__descriptors = types.MappingProxyType(descriptors)
+        self.__models_by_name = types.MappingProxyType(
+            {model.__tablename__: model for model in models}
+        )
+
+    def __get_models_by_name(self):
+        if self.__models_by_name is None:
+            self.load()
+        return self.__models_by_name
+
+    def model_exists_by_name(self, model_name):
+        return model_name in self.__get_models_by_name()
 
     def get_model_by_name(self, model_name):
-        if model_name in self.mappers:
-            model = self.mappers.get(model_name)
-        else:
-            model = MetadataParser.__get_model_from_alquemy(model_name)
-            self.mappers[model_name] = model
+        if not model_name:
+            raise GenericIntenalApiError("SQLAlchemy model name cannot be empty")
 
+        model = self.__get_models_by_name().get(model_name)
+        if model is None:
+            raise GenericIntenalApiError(
+                BraceMessage(
+                    "SQLAlquemy model parse has failed cause model {0} cannot be found",
+                    model_name,
+                )
+            )
         return model
 
     def get_model_children_by_parent_name(self, parent_name):
@@ -107,16 +110,18 @@ class MetadataParser:
         return [mapper.entity for mapper in children_mappers]
 
     def get_model_metadata_by_name(self, model_name):
-        return MetadataParser.__get_alquemy_model_metadata(
-            self.get_model_by_name(model_name)
-        )
+        return self.get_model_metadata_by_model(self.get_model_by_name(model_name))
 
-    @staticmethod
-    def get_model_metadata_by_model(model):
+    def get_model_metadata_by_model(self, model):
         if not issubclass(model, Base):
             raise GenericIntenalApiError("The given model is not a SQLAlquemy one")
 
-        return MetadataParser.__get_alquemy_model_metadata(model)
+        self.__get_models_by_name()
+        descriptor = self.__descriptors.get(model)
+        if descriptor is None:
+            # Mapped after the descriptors were built
+            descriptor = MetadataParser.__build_model_metadata(model)
+        return descriptor
 
     def get_model_children_by_parent_model(self, model):
         if not issubclass(model, Base):
@@ -1,34 +1,25 @@
-class FieldModelDescriptor:
-    def __init__(self, name, is_mandatory, is_pk, data_type):
-        self.name = name
-        self.is_mandatory = is_mandatory
-        self.is_pk = is_pk
-        self.data_type = data_type
-
-    def __repr__(self):
-        return "%s(%s)" % (
-            type(self).__name__,
-            ", ".join("%s=%s" % item for item in vars(self).items()),
-        )
+import types
+import typing
+from dataclasses import dataclass, field
 
 
-class ModelDescriptor:
+@dataclass(frozen=True)
+class FieldModelDescriptor:
+    name: str
+    is_mandatory: bool
+    is_pk: bool
+    data_type: type
+    # Field that holds the value as a number, for the range filters
+    numeric_field: str | None = None
 
-    def __init__(self, model_name):
-        self.model_name = model_name
-        self.fields = {}
 
-    def add_field(self, name, is_mandatory, is_pk, data_type):
-        if name not in self.fields:
-            self.fields[name] = FieldModelDescriptor(
-                name, is_mandatory, is_pk, data_type
-            )
+@dataclass(frozen=True)
+class ModelDescriptor:
+    model_name: str
+    # Read only view, as descriptors are shared by all the requests
+    fields: typing.Mapping[str, FieldModelDescriptor] = field(
+        default_factory=lambda: types.MappingProxyType({})
+    )
 
     def get_field(self, name):
         return self.fields.get(name, None)
-
-    def __repr__(self):
-        return "%s(%s)" % (
-            type(self).__name__,
-            ", ".join("%s=%s" % item for item in vars(self).items()),
-        )
@@ -0,0 +1,225 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+"""
+Generates the Altium and KiCad library views from the component models.
+
+Each component type with a ``__library_view__`` name gets an Altium and a
+KiCad view, plus one per package listed in ``__library_view_packages__``,
+with the general component columns followed by the ones of its own table.
+Their materialized variants and indexes are generated too. The SQL is meant
+to be frozen in a migration:
+
+    python -m edaparts.models.metadata.view_generator > CreateViews.sql
+"""
+
+import hashlib
+
+from sqlalchemy.dialects import postgresql
+
+from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.internal.internal_models import CadType, LibraryViewDefinition
+from edaparts.models.libraries.library_reference_model import LibraryReference
+from edaparts.models.metadata.metadata_parser import metadata_parser
+
+# Altium reads each footprint from its own numbered column, so the footprints
+# it is given are capped. KiCad ones take all of them in a single column
+ALTIUM_FOOTPRINT_COLUMNS = 4
+
+# Suffix of the materialized variants of the Altium and KiCad views
+MATERIALIZED_VIEW_SUFFIX = " Materialized"
+
+# Statements of the generated scripts are separated by this terminator
+STATEMENT_TERMINATOR = ";\n\n"
+
+_VIEW_PREFIXES = {CadType.ALTIUM: "Altium", CadType.KICAD: "KiCad"}
+
+_COMPONENT_COLUMNS = {
+    cad_type: (
+        ("mpn", "Part Number"),
+        ("value", "Value"),
+        ("manufacturer", "Manufacturer"),
+        ("created_on", "Created On"),
+        ("updated_on", "Updated On"),
+        ("package", "Package"),
+        ("description", "Description"),
+        (comment_column, "Comment"),
+        ("operating_temperature_min", "Minimum Operating Temperature"),
+        ("operating_temperature_max", "Maximum Operating Temperature"),
+    )
+    for cad_type, comment_column in (
+        (CadType.ALTIUM, "comment_altium"),
+        (CadType.KICAD, "comment_kicad"),
+    )
+}
+
+# Columns the EDA tools look the parts up by, besides the part number
+_LOOKUP_COLUMNS = {CadType.ALTIUM: "Library Ref", CadType.KICAD: "Symbol"}
+
+_quote = postgresql.dialect().identifier_preparer.quote
+
+
+def get_library_views() -> list[LibraryViewDefinition]:
+    views = []
+    for model in metadata_parser.get_model_children_by_parent_model(ComponentModel):
+        if not model.__library_view__:
+            continue
+        for cad_type in CadType:
+            name = f"{_VIEW_PREFIXES[cad_type]} {model.__library_view__}"
+            views.append(LibraryViewDefinition(name, cad_type, model))
+            views.extend(
+                # Packages are named by their imperial code, e.g. 0603
+                LibraryViewDefinition(
+                    f"{name} {package.split()[0]}", cad_type, model, package
+                )
+                for package in model.__library_view_packages__
+            )
+    return sorted(views, key=lambda view: view.name)
+
+
+def get_view_columns(view: LibraryViewDefinition) -> list[tuple[str, str]]:
+    """
+    Returns the SQL expression and the header of each column of the view.
+    """
+    columns = [
+        (f"c.{_quote(column)}", header)
+        for column, header in _COMPONENT_COLUMNS[view.cad_type]
+    ]
+    if view.cad_type == CadType.ALTIUM:
+        columns.extend((("l.path", "Library Path"), ("l.reference", "Library Ref")))
+        for field, header in (("paths", "Footprint Path"), ("refs", "Footprint Ref")):
+            columns.extend(
+                (f"f.{field}[{index}]", f"{header} {index}" if index > 1 else header)
+                for index in range(1, ALTIUM_FOOTPRINT_COLUMNS + 1)
+            )
+    else:
+        columns.extend(
+            (
+                ("CONCAT(l.alias, ':', l.reference)", "Symbol"),
+                ("COALESCE(f.footprints, '')", "Footprints"),
+            )
+        )
+
+    component_fields = metadata_parser.get_model_metadata_by_model(
+        ComponentModel
+    ).fields
+    for field in metadata_parser.get_model_metadata_by_model(view.model).fields:
+        column = view.model.__table__.columns.get(field)
+        # Derived columns, computed from the other ones, are not shown
+        if field in component_fields or column.info.get("derived"):
+            continue
+        header = view.model.__library_view_headers__.get(
+            field, field.replace("_", " ").title()
+        )
+        columns.append((f"t.{_quote(column.name)}", header))
+    return columns
+
+
+def __cad_type_literal(cad_type: CadType) -> str:
+    return f"'{cad_type.name}'::{LibraryReference.__table__.c.cad_type.type.name}"
+
+
+def render_view(view: LibraryViewDefinition) -> str:
+    # Components are joined to their first symbol and to all their footprints
+    # by lateral subqueries, so the filters on the view columns reach the
+    # component indexes
+    cad_type = __cad_type_literal(view.cad_type)
+    if view.cad_type == CadType.ALTIUM:
+        footprints = (
+            "array_agg(f.path ORDER BY f.id) paths, "
+            "array_agg(f.reference ORDER BY f.id) refs"
+        )
+    else:
+        footprints = (
+            "string_agg(CONCAT(f.alias, ':', f.reference), ';' ORDER BY f.id) "
+            "footprints"
+        )
+    columns = ",\n       ".join(
+        f"{expression} {_quote(header)}"
+        for expression, header in get_view_columns(view)
+    )
+    sql = (
+        f"CREATE VIEW {_quote(view.name)} AS\n"
+        f"SELECT {columns}\n"
+        f"FROM component c\n"
+        f"         INNER JOIN {_quote(view.model.__tablename__)} t ON t.id = c.id\n"
+        f"         INNER JOIN LATERAL (SELECT l.path, l.reference, l.alias\n"
+        f"                             FROM component_library_asc cl\n"
+        f"                                      INNER JOIN library_ref l "
+        f"ON l.id = cl.library_ref_id\n"
+        f"                             WHERE cl.component_id = c.id\n"
+        f"                               AND l.cad_type = {cad_type}\n"
+        f"                             ORDER BY l.id\n"
+        f"                             LIMIT 1) l ON TRUE\n"
+        f"         LEFT JOIN LATERAL (SELECT {footprints}\n"
+        f"                            FROM component_footprint_asc cf\n"
+        f"                                     INNER JOIN footprint_ref f "
+        f"ON f.id = cf.footprint_ref_id\n"
+        f"                            WHERE cf.component_id = c.id\n"
+        f"                              AND f.cad_type = {cad_type}) f ON TRUE"
+    )
+    if view.package:
+        sql += f"\nWHERE c.package = '{view.package}'"
+    return sql + "\nORDER BY c.id DESC"
+
+
+def materialized_index_name(view: str, suffix: str) -> str:
+    # View names are too long to be part of the index names
+    return f"ix_mv_{hashlib.sha1(view.encode('utf-8')).hexdigest()[:12]}_{suffix}"
+
+
+def render_materialized_view(view: LibraryViewDefinition) -> list[str]:
+    materialized_view = _quote(f"{view.name}{MATERIALIZED_VIEW_SUFFIX}")
+    lookup_column = _LOOKUP_COLUMNS[view.cad_type]
+    return [
+        f"CREATE MATERIALIZED VIEW {materialized_view} AS "
+        f"SELECT * FROM {_quote(view.name)}",
+        # Concurrent refreshes require a unique index. It also serves the
+        # lookups by part number
+        f"CREATE UNIQUE INDEX {materialized_index_name(view.name, 'part_number')} "
+        f'ON {materialized_view} ("Part Number", "Manufacturer")',
+        f"CREATE INDEX "
+        f"{materialized_index_name(view.name, lookup_column.lower().replace(' ', '_'))} "
+        f"ON {materialized_view} ({_quote(lookup_column)})",
+    ]
+
+
+def render_library_views() -> list[str]:
+    """
+    Returns the statements that create all the library views and their
+    materialized variants.
+    """
+    views = get_library_views()
+    statements = [render_view(view) for view in views]
+    for view in views:
+        statements.extend(render_materialized_view(view))
+    return statements
+
+
+if __name__ == "__main__":
+    print(
+        "-- Generated by edaparts.models.metadata.view_generator, do not edit\n\n"
+        + STATEMENT_TERMINATOR.join(render_library_views())
+        + STATEMENT_TERMINATOR,
+        end="",
+    )
@@ -23,22 +23,38 @@
 #
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import edaparts.services.component_search
 import edaparts.services.component_service
+from edaparts.app.config import config
+from edaparts.utils.responses import json_response
 from edaparts.dtos.symbols_dtos import SymbolQueryDto, SymbolsComponentReferenceDto
 from edaparts.dtos.components_dtos import (
+    ComponentBulkImportModeEnum,
+    ComponentBulkRowResultDto,
+    ComponentBulkRowStatusEnum,
     ComponentCreateRequestDto,
+    ComponentExportFormatEnum,
+    ComponentRelationsDto,
+    ComponentsRelationsBulkDto,
+    ComponentsBulkCreateResultDto,
     ComponentSpecificQueryDto,
     ComponentsListResultDto,
     ComponentUpdateRequestDto,
+    get_component_export_models,
     map_component_model_to_query_dto,
+    parse_component_create_requests,
+    stream_components_csv,
+    stream_components_ndjson,
 )
 from edaparts.dtos.footprints_dtos import (
     FootprintsComponentReferenceDto,
     FootprintQueryDto,
 )
+from edaparts.dtos.pagination_dtos import PageCountModeEnum
 from edaparts.services.database import get_db
 
 router = APIRouter(prefix="/components", tags=["components"])
@@ -55,6 +71,65 @@ async def create_component(
     return map_component_model_to_query_dto(component)
 
 
+@router.post(
+    "/bulk",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {
+                            "$ref": "#/components/schemas/ComponentCreateRequestDto"
+                        },
+                    }
+                },
+                "application/x-ndjson": {
+                    "schema": {"$ref": "#/components/schemas/ComponentCreateRequestDto"}
+                },
+            },
+        }
+    },
+)
+async def bulk_create_components(
+    request: Request,
+    response: Response,
+    mode: Annotated[
+        ComponentBulkImportModeEnum, Query()
+    ] = ComponentBulkImportModeEnum.PARTIAL,
+    db: AsyncSession = Depends(get_db),
+) -> ComponentsBulkCreateResultDto:
+    content_type = request.headers.get("content-type", "")
+    entries = parse_component_create_requests(
+        await request.body(),
+        ndjson=content_type.startswith(("application/x-ndjson", "application/jsonl")),
+    )
+    results = await edaparts.services.component_service.bulk_create_components(
+        db, entries, ComponentBulkImportModeEnum.to_model(mode)
+    )
+    elements = [ComponentBulkRowResultDto.from_model(r) for r in results]
+    created = sum(1 for e in elements if e.status == ComponentBulkRowStatusEnum.CREATED)
+    committed = mode == ComponentBulkImportModeEnum.PARTIAL or created == len(results)
+    if not committed:
+        response.status_code = 400
+    return ComponentsBulkCreateResultDto(
+        committed=committed, created=created, elements=elements
+    )
+
+
+@router.post("/bulk/relations")
+async def bulk_create_relations(
+    body: ComponentsRelationsBulkDto, db: AsyncSession = Depends(get_db)
+) -> ComponentsRelationsBulkDto:
+    relations = await edaparts.services.component_service.create_components_relations(
+        db, [r.to_model() for r in body.relations]
+    )
+    return ComponentsRelationsBulkDto(
+        relations=[ComponentRelationsDto.from_model(r) for r in relations]
+    )
+
+
 @router.put("/{component_id}")
 async def update_component(
     component_id: int,
@@ -68,29 +143,97 @@ async def update_component(
     return map_component_model_to_query_dto(component)
 
 
-@router.get("")
+@router.get("", response_model=ComponentsListResultDto)
 async def list_components(
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
+    cursor: Annotated[str | None, Query()] = None,
+    count_mode: Annotated[PageCountModeEnum, Query()] = PageCountModeEnum.EXACT,
     db: AsyncSession = Depends(get_db),
-) -> ComponentsListResultDto:
-    results, total_count = await edaparts.services.component_service.get_component_list(
-        db, page_n, page_size
+) -> Response:
+    page = await edaparts.services.component_service.get_component_list(
+        db,
+        page_n,
+        page_size,
+        cursor=cursor,
+        count_mode=PageCountModeEnum.to_model(count_mode),
     )
-    return ComponentsListResultDto(
-        page_size=page_size,
-        page_number=page_n,
-        total_elements=total_count,
-        elements=[map_component_model_to_query_dto(m) for m in results],
+    return json_response(
+        ComponentsListResultDto(
+            page_size=page_size,
+            page_number=page_n,
+            total_elements=page.total,
+            total_elements_kind=PageCountModeEnum.from_model(page.total_kind),
+            next_cursor=page.next_cursor,
+            elements=[map_component_model_to_query_dto(m) for m in page.items],
+        ),
+        ComponentsListResultDto,
     )
 
 
-@router.get("/{component_id}")
+@router.get("/export", response_class=StreamingResponse)
+async def export_components(
+    export_format: Annotated[
+        ComponentExportFormatEnum, Query(alias="format")
+    ] = ComponentExportFormatEnum.NDJSON,
+    component_types: Annotated[list[str] | None, Query(alias="type")] = None,
+) -> StreamingResponse:
+    model_types = get_component_export_models(component_types)
+    batches = edaparts.services.component_service.stream_components(
+        model_types, config.COMPONENTS_EXPORT_BATCH_SIZE
+    )
+    if export_format == ComponentExportFormatEnum.CSV:
+        return StreamingResponse(
+            stream_components_csv(model_types, batches),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="components.csv"'},
+        )
+    return StreamingResponse(
+        stream_components_ndjson(batches),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="components.ndjson"'},
+    )
+
+
+@router.get("/search", response_model=ComponentsListResultDto)
+async def search_components(
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    component_types: Annotated[list[str] | None, Query(alias="type")] = None,
+    page_n: Annotated[int | None, Query(gt=0)] = 1,
+    page_size: Annotated[int | None, Query(gt=0)] = 20,
+    count_mode: Annotated[PageCountModeEnum, Query()] = PageCountModeEnum.EXACT,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    page = await edaparts.services.component_search.search_components(
+        db,
+        q,
+        page_n,
+        page_size,
+        model_types=(
+            get_component_export_models(component_types) if component_types else None
+        ),
+        count_mode=PageCountModeEnum.to_model(count_mode),
+    )
+    return json_response(
+        ComponentsListResultDto(
+            page_size=page_size,
+            page_number=page_n,
+            total_elements=page.total,
+            total_elements_kind=PageCountModeEnum.from_model(page.total_kind),
+            elements=[map_component_model_to_query_dto(m) for m in page.items],
+        ),
+        ComponentsListResultDto,
+    )
+
+
+@router.get("/{component_id}", response_model=ComponentSpecificQueryDto)
 async def get_component(
     component_id: int, db: AsyncSession = Depends(get_db)
-) -> ComponentSpecificQueryDto:
+) -> Response:
     result = await edaparts.services.component_service.get_component(db, component_id)
-    return map_component_model_to_query_dto(result)
+    return json_response(
+        map_component_model_to_query_dto(result), ComponentSpecificQueryDto
+    )
 
 
 @router.delete("/{component_id}", status_code=204, response_class=Response)
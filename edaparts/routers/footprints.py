@@ -25,7 +25,7 @@
 
 import typing
 
-from fastapi import APIRouter, UploadFile, Form, BackgroundTasks
+from fastapi import APIRouter, UploadFile, Form
 from fastapi.params import Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import FileResponse, Response
@@ -36,7 +36,9 @@ from edaparts.dtos.libraries_dtos import (
     LibraryTypeEnum,
     CommonObjectFromExistingCreateDto,
     CommonObjectUpdateDto,
+    StorageStatusEnum,
 )
+from edaparts.dtos.pagination_dtos import PageCountModeEnum
 from edaparts.models.internal.internal_models import (
     StorableLibraryResourceType,
     StorableObjectRequest,
@@ -50,7 +52,6 @@ router = APIRouter(prefix="/footprints", tags=["footprints"])
 
 @router.post("/uploads/create")
 async def create_upload_file(
-    background_tasks: BackgroundTasks,
     file: UploadFile,
     reference: typing.Optional[str] = Form(None),
     description: typing.Optional[str] = Form(None),
@@ -61,7 +62,6 @@ async def create_upload_file(
     with TempCopiedFile(file.file) as disk_file:
         library_model = await edaparts.services.storable_objects_service.create_storable_library_object(
             db,
-            background_tasks,
             StorableObjectRequest(
                 filename=disk_file.path,
                 path=path,
@@ -76,13 +76,11 @@ async def create_upload_file(
 
 @router.post("")
 async def create_from_existing_path(
-    background_tasks: BackgroundTasks,
     body: CommonObjectFromExistingCreateDto,
     db: AsyncSession = Depends(get_db),
 ) -> FootprintQueryDto:
     library_model = await edaparts.services.storable_objects_service.create_storable_library_object_from_existing_file(
         db,
-        background_tasks,
         body.to_model(StorableLibraryResourceType.FOOTPRINT),
     )
     return FootprintQueryDto.from_model(library_model)
@@ -90,7 +88,6 @@ async def create_from_existing_path(
 
 @router.post("/{model_id}/uploads/update")
 async def update_upload_file(
-    background_tasks: BackgroundTasks,
     model_id: int,
     file: UploadFile,
     reference: typing.Optional[str] = Form(None),
@@ -100,7 +97,6 @@ async def update_upload_file(
         library_model = (
             await edaparts.services.storable_objects_service.update_object_data(
                 db,
-                background_tasks,
                 StorableObjectDataUpdateRequest(
                     model_id=model_id,
                     filename=disk_file.path,
@@ -138,14 +134,12 @@ async def get_footprint(
 
 @router.put("/{model_id}")
 async def update_footprint(
-    background_tasks: BackgroundTasks,
     model_id: int,
     body: CommonObjectUpdateDto,
     db: AsyncSession = Depends(get_db),
 ) -> FootprintQueryDto:
     result = await edaparts.services.storable_objects_service.update_object_metadata(
         db,
-        background_tasks,
         model_id,
         body.to_model(StorableLibraryResourceType.FOOTPRINT),
     )
@@ -154,12 +148,11 @@ async def update_footprint(
 
 @router.delete("/{model_id}", status_code=204, response_class=Response)
 async def delete_footprint(
-    background_tasks: BackgroundTasks,
     model_id: int,
     db: AsyncSession = Depends(get_db),
 ) -> None:
     await edaparts.services.storable_objects_service.delete_object(
-        db, background_tasks, StorableLibraryResourceType.FOOTPRINT, model_id
+        db, StorableLibraryResourceType.FOOTPRINT, model_id
     )
 
 
@@ -168,15 +161,32 @@ async def list_footprints(
     db: AsyncSession = Depends(get_db),
     page_n: typing.Annotated[int | None, Query(gt=0)] = 1,
     page_size: typing.Annotated[int | None, Query(gt=0)] = 20,
+    cursor: typing.Annotated[str | None, Query()] = None,
+    count_mode: typing.Annotated[PageCountModeEnum, Query()] = PageCountModeEnum.EXACT,
+    cad_type: typing.Annotated[LibraryTypeEnum | None, Query()] = None,
+    storage_status: typing.Annotated[StorageStatusEnum | None, Query()] = None,
+    path_prefix: typing.Annotated[str | None, Query()] = None,
+    reference_prefix: typing.Annotated[str | None, Query()] = None,
 ) -> FootprintListResultDto:
-    results, total_count = (
-        await edaparts.services.storable_objects_service.get_storable_objects(
-            db, StorableLibraryResourceType.FOOTPRINT, page_n, page_size
-        )
+    page = await edaparts.services.storable_objects_service.get_storable_objects(
+        db,
+        StorableLibraryResourceType.FOOTPRINT,
+        page_n,
+        page_size,
+        cursor=cursor,
+        count_mode=PageCountModeEnum.to_model(count_mode),
+        cad_type=LibraryTypeEnum.to_model(cad_type) if cad_type else None,
+        storage_status=(
+            StorageStatusEnum.to_model(storage_status) if storage_status else None
+        ),
+        path_prefix=path_prefix,
+        reference_prefix=reference_prefix,
     )
     return FootprintListResultDto(
         page_size=page_size,
         page_number=page_n,
-        total_elements=total_count,
-        elements=[FootprintQueryDto.from_model(m) for m in results],
+        total_elements=page.total,
+        total_elements_kind=PageCountModeEnum.from_model(page.total_kind),
+        next_cursor=page.next_cursor,
+        elements=[FootprintQueryDto.from_model(m) for m in page.items],
     )
@@ -39,7 +39,9 @@ from edaparts.dtos.inventory_dtos import (
     InventoryItemQueryDto,
     InventoryItemsQueryDto,
 )
+from edaparts.dtos.pagination_dtos import PageCountModeEnum
 from edaparts.services.database import get_db
+from edaparts.utils.responses import json_response
 
 router = APIRouter(prefix="/categories", tags=["inventory", "categories"])
 
@@ -101,28 +103,45 @@ async def list_categories(
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
     only_root: bool | None = False,
+    cursor: Annotated[str | None, Query()] = None,
+    count_mode: Annotated[PageCountModeEnum, Query()] = PageCountModeEnum.EXACT,
 ) -> InventoryCategoriesQueryDto:
-    categories, total_count = await edaparts.services.inventory_service.get_categories(
-        db, page_n, page_size, only_root=only_root
+    page = await edaparts.services.inventory_service.get_categories(
+        db,
+        page_n,
+        page_size,
+        only_root=only_root,
+        cursor=cursor,
+        count_mode=PageCountModeEnum.to_model(count_mode),
     )
     return InventoryCategoriesQueryDto(
         page_size=page_size,
         page_number=page_n,
-        total_elements=total_count,
-        elements=[InventoryCategoryQueryDto.from_model(m) for m in categories],
+        total_elements=page.total,
+        total_elements_kind=PageCountModeEnum.from_model(page.total_kind),
+        next_cursor=page.next_cursor,
+        elements=[InventoryCategoryQueryDto.from_model(m) for m in page.items],
     )
 
 
-@router.get("/{category_id}/items")
+@router.get("/{category_id}/items", response_model=InventoryItemsQueryDto)
 async def list_category_items(
     category_id: int,
     db: AsyncSession = Depends(get_db),
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
     include_component: bool | None = False,
-) -> InventoryItemsQueryDto:
-    results, total_count = await edaparts.services.inventory_service.get_category_items(
-        db, category_id, page_n, page_size, load_component=include_component
+    cursor: Annotated[str | None, Query()] = None,
+    count_mode: Annotated[PageCountModeEnum, Query()] = PageCountModeEnum.EXACT,
+) -> Response:
+    page = await edaparts.services.inventory_service.get_category_items(
+        db,
+        category_id,
+        page_n,
+        page_size,
+        load_component=include_component,
+        cursor=cursor,
+        count_mode=PageCountModeEnum.to_model(count_mode),
     )
     dtos = [
         InventoryItemQueryDto.from_model(
@@ -133,12 +152,14 @@ async def list_category_items(
                 else None
             ),
         )
-        for item_model in results
+        for item_model in page.items
     ]
     page_dto = InventoryItemsQueryDto(
         page_size=page_size,
         page_number=page_n,
-        total_elements=total_count,
+        total_elements=page.total,
+        total_elements_kind=PageCountModeEnum.from_model(page.total_kind),
+        next_cursor=page.next_cursor,
         elements=dtos,
     )
-    return page_dto
+    return json_response(page_dto, InventoryItemsQueryDto)
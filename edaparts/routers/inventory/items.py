@@ -44,8 +44,10 @@ from edaparts.dtos.inventory_dtos import (
     InventoryItemLocationReferenceDto,
     InventoryItemLocationStockUpdateResourceDto,
 )
+from edaparts.dtos.pagination_dtos import PageCountModeEnum
 from edaparts.services import search_service
 from edaparts.services.database import get_db
+from edaparts.utils.responses import json_response
 
 router = APIRouter(prefix="/items")
 
@@ -60,22 +62,27 @@ async def create_item(
     return InventoryItemQueryDto.from_model(item_model)
 
 
-@router.get("/{item_id}", tags=["inventory", "items"])
+@router.get(
+    "/{item_id}", tags=["inventory", "items"], response_model=InventoryItemQueryDto
+)
 async def get_item(
     item_id: int,
     db: AsyncSession = Depends(get_db),
     include_component: bool | None = False,
-) -> InventoryItemQueryDto:
+) -> Response:
     result = await edaparts.services.inventory_service.get_item(
         db, item_id, load_component=include_component
     )
-    return InventoryItemQueryDto.from_model(
-        result,
-        (
-            map_component_model_to_query_dto(result.component)
-            if include_component and result.component
-            else None
+    return json_response(
+        InventoryItemQueryDto.from_model(
+            result,
+            (
+                map_component_model_to_query_dto(result.component)
+                if include_component and result.component
+                else None
+            ),
         ),
+        InventoryItemQueryDto,
     )
 
 
@@ -89,20 +96,30 @@ async def delete_item(item_id: int, db: AsyncSession = Depends(get_db)) -> None:
     await edaparts.services.inventory_service.delete_item(db, item_id)
 
 
-@router.get("", tags=["inventory", "items"])
+@router.get("", tags=["inventory", "items"], response_model=InventoryItemsQueryDto)
 async def list_items(
     request: Request,
     db: AsyncSession = Depends(get_db),
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
     include_component: bool | None = False,
-) -> InventoryItemsQueryDto:
+    cursor: Annotated[str | None, Query()] = None,
+    count_mode: Annotated[PageCountModeEnum, Query()] = PageCountModeEnum.EXACT,
+) -> Response:
     filters = copy.deepcopy(dict(request.query_params))
     filters.pop("page_n", None)
     filters.pop("page_size", None)
     filters.pop("include_component", None)
-    results, total_count = await search_service.search_items(
-        db, filters, page_n, page_size, load_component=include_component
+    filters.pop("cursor", None)
+    filters.pop("count_mode", None)
+    page = await search_service.search_items(
+        db,
+        filters,
+        page_n,
+        page_size,
+        load_component=include_component,
+        cursor=cursor,
+        count_mode=PageCountModeEnum.to_model(count_mode),
     )
     dtos = [
         InventoryItemQueryDto.from_model(
@@ -113,15 +130,17 @@ async def list_items(
                 else None
             ),
         )
-        for item_model in results
+        for item_model in page.items
     ]
     page_dto = InventoryItemsQueryDto(
         page_size=page_size,
         page_number=page_n,
-        total_elements=total_count,
+        total_elements=page.total,
+        total_elements_kind=PageCountModeEnum.from_model(page.total_kind),
+        next_cursor=page.next_cursor,
         elements=dtos,
     )
-    return page_dto
+    return json_response(page_dto, InventoryItemsQueryDto)
 
 
 @router.post("/{item_id}/properties", tags=["inventory", "items", "properties"])
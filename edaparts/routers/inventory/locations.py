@@ -34,7 +34,9 @@ from edaparts.dtos.inventory_dtos import (
     InventoryLocationQueryDto,
     InventoryLocationCreateDto,
 )
+from edaparts.dtos.pagination_dtos import PageCountModeEnum
 from edaparts.services.database import get_db
+from edaparts.utils.responses import json_response
 
 router = APIRouter()
 
@@ -49,20 +51,35 @@ async def create_location(
     return InventoryLocationQueryDto.from_model(location)
 
 
-@router.get("/locations", tags=["inventory", "locations"])
+@router.get(
+    "/locations",
+    tags=["inventory", "locations"],
+    response_model=InventoryLocationsQueryDto,
+)
 async def list_locations(
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
+    cursor: Annotated[str | None, Query()] = None,
+    count_mode: Annotated[PageCountModeEnum, Query()] = PageCountModeEnum.EXACT,
     db: AsyncSession = Depends(get_db),
-) -> InventoryLocationsQueryDto:
-    results, total_count = await edaparts.services.inventory_service.get_locations(
-        db, page_n, page_size
+) -> Response:
+    page = await edaparts.services.inventory_service.get_locations(
+        db,
+        page_n,
+        page_size,
+        cursor=cursor,
+        count_mode=PageCountModeEnum.to_model(count_mode),
     )
-    return InventoryLocationsQueryDto(
-        page_size=page_size,
-        page_number=page_n,
-        total_elements=total_count,
-        elements=[InventoryLocationQueryDto.from_model(m) for m in results],
+    return json_response(
+        InventoryLocationsQueryDto(
+            page_size=page_size,
+            page_number=page_n,
+            total_elements=page.total,
+            total_elements_kind=PageCountModeEnum.from_model(page.total_kind),
+            next_cursor=page.next_cursor,
+            elements=[InventoryLocationQueryDto.from_model(m) for m in page.items],
+        ),
+        InventoryLocationsQueryDto,
     )
 
 
@@ -29,6 +29,7 @@ import edaparts.routers.components
 import edaparts.routers.symbols
 import edaparts.routers.footprints
 import edaparts.routers.tools.kicad
+import edaparts.routers.metrics
 
 router = APIRouter()
 router.include_router(edaparts.routers.inventory.inventory.router)
@@ -36,3 +37,4 @@ router.include_router(edaparts.routers.components.router)
 router.include_router(edaparts.routers.symbols.router)
 router.include_router(edaparts.routers.footprints.router)
 router.include_router(edaparts.routers.tools.kicad.router)
+router.include_router(edaparts.routers.metrics.router)
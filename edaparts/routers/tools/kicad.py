@@ -23,7 +23,7 @@
 #
 
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
@@ -37,16 +37,20 @@ from edaparts.dtos.kicad_dtos import (
 )
 from edaparts.services.database import get_db
 import edaparts.services.kicad
+from edaparts.utils.responses import json_response
 
 router = APIRouter(prefix="/tools/kicad", tags=["kicad"])
 
 
-@router.get("/api/v1/categories.json")
-async def list_categories() -> CategoriesQueryDto:
-    return [
-        CategoryQueryDto(id=str(elem.id), name=elem.name)
-        for elem in edaparts.services.kicad.get_components_categories().values()
-    ]
+@router.get("/api/v1/categories.json", response_model=CategoriesQueryDto)
+async def list_categories() -> Response:
+    return json_response(
+        [
+            CategoryQueryDto(id=str(elem.id), name=elem.name)
+            for elem in edaparts.services.kicad.get_components_categories().values()
+        ],
+        CategoriesQueryDto,
+    )
 
 
 @router.get("/api/v1/")
@@ -57,15 +61,20 @@ async def endpoint_check(request: Request) -> EndpointsQueryDto:
     )
 
 
-@router.get("/api/v1/parts/category/{category_id}.json")
+@router.get(
+    "/api/v1/parts/category/{category_id}.json", response_model=CategoryPartsQueryDto
+)
 async def list_category_parts(
     category_id: int, db: AsyncSession = Depends(get_db)
-) -> CategoryPartsQueryDto:
+) -> Response:
     results = await edaparts.services.kicad.get_components_for_category(db, category_id)
-    return [CategoryPartQueryDto.from_model(result) for result in results]
+    return json_response(
+        [CategoryPartQueryDto.from_model(result) for result in results],
+        CategoryPartsQueryDto,
+    )
 
 
-@router.get("/api/v1/parts/{part_id}.json")
-async def get_part(part_id: int, db: AsyncSession = Depends(get_db)) -> PartQueryDto:
+@router.get("/api/v1/parts/{part_id}.json", response_model=PartQueryDto)
+async def get_part(part_id: int, db: AsyncSession = Depends(get_db)) -> Response:
     result = await edaparts.services.kicad.get_component(db, part_id)
-    return PartQueryDto.from_model(result)
+    return json_response(PartQueryDto.from_model(result), PartQueryDto)
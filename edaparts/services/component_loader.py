@@ -0,0 +1,142 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import collections
+import logging
+import typing
+
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.orm.attributes import set_committed_value
+
+from edaparts.app.config import Config
+from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.internal.internal_models import ComponentLoadingMode
+from edaparts.models.inventory.inventory_item_model import InventoryItemModel
+from edaparts.utils.helpers import BraceMessage as __l
+
+__logger = logging.getLogger(__name__)
+
+# Plain table used to query the base component rows. Selecting from the table
+# instead of the mapped class skips the mapper level with_polymorphic="*"
+component_table = ComponentModel.__table__
+
+
+def get_loading_mode(
+    loading_mode: ComponentLoadingMode | None = None,
+) -> ComponentLoadingMode:
+    if loading_mode is not None:
+        return loading_mode
+    return ComponentLoadingMode(Config.COMPONENTS_LOADING_MODE.lower())
+
+
+def is_subtype_loading(loading_mode: ComponentLoadingMode | None = None) -> bool:
+    return get_loading_mode(loading_mode) == ComponentLoadingMode.SUBTYPE
+
+
+def get_model_for_identity(identity: str) -> typing.Type[ComponentModel]:
+    mapper = inspect(ComponentModel).polymorphic_map.get(identity)
+    return mapper.class_ if mapper else ComponentModel
+
+
+async def load_components_by_type(
+    db: AsyncSession,
+    id_types: typing.Iterable[typing.Tuple[int, str]],
+    *options: ORMOption,
+) -> dict[int, ComponentModel]:
+    ids_per_type: dict[str, list[int]] = collections.defaultdict(list)
+    for component_id, identity in id_types:
+        ids_per_type[identity].append(component_id)
+
+    components = {}
+    for identity, ids in ids_per_type.items():
+        model = get_model_for_identity(identity)
+        __logger.debug(
+            __l("Loading components [type={0}, count={1}]", identity, len(ids))
+        )
+        query = select(model).where(model.id.in_(ids))
+        if options:
+            query = query.options(*options)
+        for component in (await db.scalars(query)).all():
+            components[component.id] = component
+    return components
+
+
+async def load_components_by_ids(
+    db: AsyncSession, component_ids: typing.Iterable[int], *options: ORMOption
+) -> dict[int, ComponentModel]:
+    component_ids = list(component_ids)
+    if not component_ids:
+        return {}
+    id_types = (
+        await db.execute(
+            select(component_table.c.id, component_table.c.type).where(
+                component_table.c.id.in_(component_ids)
+            )
+        )
+    ).all()
+    return await load_components_by_type(db, id_types, *options)
+
+
+async def load_ordered_components(
+    db: AsyncSession,
+    id_types: typing.Sequence[typing.Tuple[int, str]],
+    *options: ORMOption,
+) -> list[ComponentModel]:
+    components = await load_components_by_type(db, id_types, *options)
+    return [components[row[0]] for row in id_types if row[0] in components]
+
+
+async def fetch_components(
+    db: AsyncSession, id_type_query: Select, *options: ORMOption
+) -> list[ComponentModel]:
+    """
+    Runs a query that returns (id, type) component rows and loads each
+    row as its specific subtype, preserving the order of the query.
+    """
+    id_types = (await db.execute(id_type_query)).all()
+    return await load_ordered_components(db, id_types, *options)
+
+
+async def fetch_component(
+    db: AsyncSession, component_id: int, *options: ORMOption
+) -> ComponentModel | None:
+    components = await load_components_by_ids(db, [component_id], *options)
+    return components.get(component_id, None)
+
+
+async def attach_item_components(
+    db: AsyncSession, items: typing.Sequence[InventoryItemModel]
+):
+    """
+    Populates the component relationship of the given items without
+    emitting the polymorphic join of all the component tables.
+    """
+    components = await load_components_by_ids(
+        db, {item.component_id for item in items if item.component_id is not None}
+    )
+    for item in items:
+        set_committed_value(item, "component", components.get(item.component_id))
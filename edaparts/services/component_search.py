@@ -0,0 +1,152 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import logging
+import re
+import typing
+
+from sqlalchemy import String, and_, func, literal, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.internal.internal_models import PageCountMode
+from edaparts.services import component_loader, pagination
+from edaparts.services.exceptions import InvalidRequestError
+from edaparts.services.pagination import Page
+from edaparts.utils.helpers import BraceMessage as __l
+
+__logger = logging.getLogger(__name__)
+
+# General properties of the search document, followed by the type specific ones
+__DOCUMENT_COLUMNS = ("mpn", "manufacturer", "value", "package", "description")
+
+# Words of the search query. Part numbers and values keep their separators,
+# e.g. 1.5k, 10%, LM317T/NOPB
+__TERM_PATTERN = re.compile(r"[\w.+\-/%]*\w[\w.+\-/%]*")
+
+# Part numbers and values are not words of a language, so they are not stemmed.
+# The same configuration is used by the text search index
+__TEXT_SEARCH_CONFIG = literal_column("'simple'")
+
+__document_columns: dict[type, tuple[str, ...]] = {}
+
+
+def __get_document_columns(model_type: typing.Type[ComponentModel]) -> tuple[str, ...]:
+    columns = __document_columns.get(model_type)
+    if columns is None:
+        columns = __DOCUMENT_COLUMNS
+        if model_type is not ComponentModel:
+            columns += tuple(
+                column.key
+                for column in model_type.__table__.columns
+                if isinstance(column.type, String)
+            )
+        __document_columns[model_type] = columns
+    return columns
+
+
+def build_search_document(model: ComponentModel) -> str:
+    values = (getattr(model, key) for key in __get_document_columns(type(model)))
+    return " ".join(str(value) for value in values if value not in (None, ""))
+
+
+def parse_search_terms(query: str) -> list[str]:
+    return list(dict.fromkeys(__TERM_PATTERN.findall(query.lower())))
+
+
+def build_tsquery(terms: typing.Sequence[str]) -> str:
+    # All the terms must be present, as a prefix of a word, so partial part
+    # numbers match too. Terms never contain quotes
+    return " & ".join(f"'{term}':*" for term in terms)
+
+
+async def search_components(
+    db: AsyncSession,
+    query: str,
+    page_number: int,
+    page_size: int,
+    model_types: typing.Sequence[typing.Type[ComponentModel]] | None = None,
+    count_mode: PageCountMode = PageCountMode.EXACT,
+) -> Page[ComponentModel]:
+    """
+    Searches the components whose properties contain the words of the given
+    query, best matches first.
+
+    On PostgreSQL components match if their search document contains all
+    the words, as prefixes, or is similar enough to the query, and are ranked
+    by both. Other databases only match documents that contain all the words.
+    """
+    __logger.debug(
+        __l(
+            "Searching components [query={0}, page_number={1}, page_size={2}]",
+            query,
+            page_number,
+            page_size,
+        )
+    )
+    terms = parse_search_terms(query)
+    if not terms:
+        raise InvalidRequestError("The search query has no words to search")
+
+    table = component_loader.component_table
+    document = table.c.search_document
+    connection = await db.connection()
+    if connection.dialect.name == "postgresql":
+        vector = func.to_tsvector(__TEXT_SEARCH_CONFIG, document)
+        ts_query = func.to_tsquery(__TEXT_SEARCH_CONFIG, build_tsquery(terms))
+        # Both operators are served by the GIN indexes of the document
+        condition = or_(vector.op("@@")(ts_query), document.op("%>")(query))
+        rank = func.ts_rank(vector, ts_query) + func.word_similarity(query, document)
+    else:
+        condition = and_(
+            *(func.lower(document).contains(term, autoescape=True) for term in terms)
+        )
+        rank = literal(0)
+
+    search_query = select(table.c.id, table.c.type).where(condition)
+    if model_types:
+        search_query = search_query.where(
+            table.c.type.in_(
+                [
+                    model_type.__mapper__.polymorphic_identity
+                    for model_type in model_types
+                ]
+            )
+        )
+    total, total_kind = await pagination.count_total(
+        db, search_query, table.c.id, count_mode=count_mode
+    )
+    id_types = (
+        await db.execute(
+            search_query.order_by(rank.desc(), table.c.id.desc())
+            .offset((page_number - 1) * page_size)
+            .limit(page_size)
+        )
+    ).all()
+    return Page(
+        items=await component_loader.load_ordered_components(db, id_types),
+        total=total,
+        total_kind=total_kind,
+    )
@@ -23,29 +23,67 @@
 #
 
 
+import collections
+import contextlib
+import dataclasses
 import logging
 import typing
 
-from sqlalchemy import select, func, inspect, insert, delete
+from sqlalchemy import (
+    select,
+    func,
+    inspect,
+    insert,
+    delete,
+    literal,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from edaparts.models.components import ComponentModelType
 from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.internal.internal_models import (
+    BulkImportMode,
+    BulkImportRowResult,
+    BulkImportRowStatus,
+    ChangedEntityType,
+    ChangeEvent,
+    ComponentLoadingMode,
+    ComponentRelations,
+    PageCountMode,
+)
+from edaparts.models.inventory.inventory_item_model import InventoryItemModel
 from edaparts.models.libraries.footprint_reference_model import FootprintReference
 from edaparts.models.libraries.join_tables import component_footprint_asc_table,component_library_asc_table
 from edaparts.models.libraries.library_reference_model import LibraryReference
-from edaparts.services import inventory_service
+from edaparts.services import (
+    component_loader,
+    component_search,
+    component_values,
+    inventory_service,
+    kicad,
+    pagination,
+)
 from edaparts.services.exceptions import (
+    ApiError,
     ResourceAlreadyExistsApiError,
     ResourceNotFoundApiError,
     InvalidComponentFieldsError,
     RelationExistsError,
 )
+from edaparts.services.database import sessionmanager
+from edaparts.services.invalidation_bus import invalidation_bus
+from edaparts.services.library_views import library_views_refresher
+from edaparts.services.pagination import Page
 from edaparts.utils.helpers import BraceMessage as __l
 
 __logger = logging.getLogger(__name__)
 
+__BULK_BATCH_SIZE = 1000
+
 
 def __validate_update_component_model(
     model: ComponentModelType, candidate_model: ComponentModelType
@@ -84,6 +122,30 @@ def __validate_update_component_model(
         setattr(model, name, getattr(candidate_model, name))
 
 
+def __fill_derived_columns(model: ComponentModelType):
+    # Columns computed from the component properties, never given by clients
+    model.search_document = component_search.build_search_document(model)
+    component_values.fill_numeric_columns(model)
+
+
+async def __publish_component_changes(db: AsyncSession, component_ids):
+    await invalidation_bus.publish(
+        db,
+        (
+            ChangeEvent(ChangedEntityType.COMPONENT, component_id)
+            for component_id in component_ids
+        ),
+    )
+
+
+def __refresh_library_views(component_types: typing.Iterable[str | None]):
+    # Unknown types map to the base table, read by all the views
+    library_views_refresher.schedule(
+        component_loader.get_model_for_identity(identity).__tablename__
+        for identity in component_types
+    )
+
+
 async def create_component[T: ComponentModelType](db: AsyncSession, model: T) -> T:
     __logger.debug(
         __l(
@@ -105,29 +167,250 @@ async def create_component[T: ComponentModelType](db: AsyncSession, model: T) ->
             conflicting_id=exists_id,
         )
     try:
+        __fill_derived_columns(model)
         db.add(model)
 
         # Create inventory item automatically
         await inventory_service.create_item_for_component(db, model)
+        # The id is needed by the event
+        await db.flush()
+        await __publish_component_changes(db, [model.id])
         await db.commit()
 
     except:
         await db.rollback()
         raise
+    kicad.invalidate_component(model.id, model.type)
+    __refresh_library_views([model.type])
     __logger.debug(__l("Component created [id={0}]", model.id))
     return model
 
 
+def __component_insert_row(model: ComponentModelType) -> dict:
+    # All rows of a type carry the same keys so they are sent as one
+    # multi-row INSERT. Generated columns are left to the database.
+    __fill_derived_columns(model)
+    return {
+        attr.key: getattr(model, attr.key)
+        for attr in inspect(type(model)).column_attrs
+        if attr.key not in ("id", "created_on", "updated_on")
+    }
+
+
+async def __search_existing_components(
+    db: AsyncSession, keys: list[tuple[str, str]]
+) -> dict[tuple[str, str], tuple[str, int]]:
+    # A standalone inventory item with the same mpn and manufacturer also
+    # prevents the creation of the component, as in create_item_for_component
+    existing = {}
+    for batch_start in range(0, len(keys), __BULK_BATCH_SIZE):
+        batch = keys[batch_start : batch_start + __BULK_BATCH_SIZE]
+        query = union_all(
+            select(
+                literal("component"),
+                ComponentModel.id,
+                ComponentModel.mpn,
+                ComponentModel.manufacturer,
+            ).filter(
+                tuple_(ComponentModel.mpn, ComponentModel.manufacturer).in_(batch)
+            ),
+            select(
+                literal("item"),
+                InventoryItemModel.id,
+                InventoryItemModel.mpn,
+                InventoryItemModel.manufacturer,
+            ).filter(
+                tuple_(InventoryItemModel.mpn, InventoryItemModel.manufacturer).in_(
+                    batch
+                )
+            ),
+        )
+        for kind, conflicting_id, mpn, manufacturer in await db.execute(query):
+            # Report the component over the item if both exist
+            if kind == "component" or (mpn, manufacturer) not in existing:
+                existing[(mpn, manufacturer)] = (kind, conflicting_id)
+    return existing
+
+
+async def __insert_component_batch(
+    db: AsyncSession, models: list[ComponentModelType]
+) -> list[tuple[int, str]]:
+    model_type = type(models[0])
+    # ORM bulk insert fills the base and the subtype tables, returning the
+    # ids in the same order as the given rows
+    component_ids = (
+        await db.scalars(
+            insert(model_type).returning(model_type.id, sort_by_parameter_order=True),
+            [__component_insert_row(model) for model in models],
+        )
+    ).all()
+    dicis = await inventory_service.generate_item_ids(
+        db, len(models), obj_model=models[0]
+    )
+    await db.execute(
+        insert(InventoryItemModel),
+        [
+            {
+                "dici": dici,
+                "mpn": model.mpn,
+                "manufacturer": model.manufacturer,
+                "name": model.mpn,
+                "description": model.description,
+                "last_buy_price": 0.0,
+                "component_id": component_id,
+            }
+            for model, component_id, dici in zip(models, component_ids, dicis)
+        ],
+    )
+    return list(zip(component_ids, dicis))
+
+
+async def bulk_create_components(
+    db: AsyncSession,
+    entries: typing.Sequence[ComponentModelType | ApiError],
+    mode: BulkImportMode = BulkImportMode.PARTIAL,
+) -> list[BulkImportRowResult]:
+    """
+    Creates the given components and their inventory items. Entries that are
+    errors are the rows that could not be parsed and are reported as invalid.
+    In atomic mode nothing is created if any row cannot be created.
+    """
+    __logger.debug(
+        __l("Bulk creating components [rows={0}, mode={1}]", len(entries), mode)
+    )
+    results: list[BulkImportRowResult | None] = [None] * len(entries)
+    pending: dict[tuple[str, str], int] = {}
+    for index, entry in enumerate(entries):
+        if isinstance(entry, ApiError):
+            results[index] = BulkImportRowResult(
+                index, BulkImportRowStatus.INVALID, error=entry.msg
+            )
+            continue
+        key = (entry.mpn, entry.manufacturer)
+        if key in pending:
+            results[index] = BulkImportRowResult(
+                index,
+                BulkImportRowStatus.DUPLICATED,
+                error=f"The component is already present in row {pending[key]}",
+            )
+            continue
+        pending[key] = index
+
+    for key, (kind, conflicting_id) in (
+        await __search_existing_components(db, list(pending))
+    ).items():
+        index = pending.pop(key)
+        results[index] = BulkImportRowResult(
+            index,
+            BulkImportRowStatus.EXISTS,
+            component_id=conflicting_id if kind == "component" else None,
+            error=(
+                "The component already exists"
+                if kind == "component"
+                else f"An inventory item already exists for the component [id={conflicting_id}]"
+            ),
+        )
+
+    atomic = mode == BulkImportMode.ATOMIC
+    if atomic and len(pending) != len(entries):
+        await db.rollback()
+        return __skip_pending_rows(results)
+
+    by_type: dict[type, list[int]] = collections.defaultdict(list)
+    for index in pending.values():
+        by_type[type(entries[index])].append(index)
+
+    try:
+        for indexes in by_type.values():
+            for batch_start in range(0, len(indexes), __BULK_BATCH_SIZE):
+                batch = indexes[batch_start : batch_start + __BULK_BATCH_SIZE]
+                try:
+                    # Partial imports only discard the failed batch
+                    async with (
+                        contextlib.nullcontext() if atomic else db.begin_nested()
+                    ):
+                        created = await __insert_component_batch(
+                            db, [entries[index] for index in batch]
+                        )
+                except (SQLAlchemyError, ApiError) as err:
+                    __logger.warning(
+                        __l("Bulk component batch failed [rows={0}]", len(batch)),
+                        exc_info=True,
+                    )
+                    error = (
+                        err.msg
+                        if isinstance(err, ApiError)
+                        else str(getattr(err, "orig", None) or err)
+                    )
+                    for index in batch:
+                        results[index] = BulkImportRowResult(
+                            index, BulkImportRowStatus.FAILED, error=error
+                        )
+                    if atomic:
+                        await db.rollback()
+                        return __skip_pending_rows(results)
+                    continue
+                for index, (component_id, dici) in zip(batch, created):
+                    results[index] = BulkImportRowResult(
+                        index,
+                        BulkImportRowStatus.CREATED,
+                        component_id=component_id,
+                        dici=dici,
+                    )
+        await __publish_component_changes(
+            db,
+            [
+                result.component_id
+                for result in results
+                if result and result.status == BulkImportRowStatus.CREATED
+            ],
+        )
+        await db.commit()
+    except:
+        await db.rollback()
+        raise
+    for model_type in by_type:
+        kicad.invalidate_category_parts(model_type.__mapper__.polymorphic_identity)
+    __refresh_library_views(
+        model_type.__mapper__.polymorphic_identity for model_type in by_type
+    )
+
+    __logger.debug(
+        __l(
+            "Components bulk created [created={0}]",
+            sum(r.status == BulkImportRowStatus.CREATED for r in results),
+        )
+    )
+    return results
+
+
+def __skip_pending_rows(
+    results: list[BulkImportRowResult | None],
+) -> list[BulkImportRowResult]:
+    return [
+        (
+            BulkImportRowResult(index, BulkImportRowStatus.SKIPPED)
+            if result is None or result.status == BulkImportRowStatus.CREATED
+            else result
+        )
+        for index, result in enumerate(results)
+    ]
+
+
 async def update_component(
     db: AsyncSession, component_id: int, model: ComponentModelType
 ) -> ComponentModelType:
     __logger.debug(__l("Updating component [component_id={0}]", component_id))
 
-    current_model = await db.get(ComponentModel, component_id)
+    current_model = await get_component(db, component_id)
 
     # Validate and update the model
     __validate_update_component_model(current_model, model)
+    __fill_derived_columns(current_model)
+    await __publish_component_changes(db, [component_id])
     await db.commit()
+    kicad.invalidate_component(component_id, current_model.type)
+    __refresh_library_views([current_model.type])
     __logger.debug(
         __l(
             "Component updated [id={0}, mpn={1}, manufacturer={2}]",
@@ -188,7 +471,10 @@ async def create_symbol_relation(
         )
 
     await db.execute(insert(component_library_asc_table), symbol_refs)
+    await __publish_component_changes(db, [component_id])
     await db.commit()
+    kicad.invalidate_component(component_id, component.type)
+    __refresh_library_views([component.type])
     __logger.debug(
         __l(
             "Component symbols updated [component_id={0}, symbol_ids={1}",
@@ -245,7 +531,11 @@ async def create_footprints_relation(
         )
 
     await db.execute(insert(component_footprint_asc_table), footprint_refs)
+    await __publish_component_changes(db, [component_id])
     await db.commit()
+    # Footprints are not part of the category listings
+    kicad.invalidate_part(component_id)
+    __refresh_library_views([component.type])
     __logger.debug(
         __l(
             "Component footprints updated [component_id={0}, footprint_ids={1}",
@@ -256,6 +546,166 @@ async def create_footprints_relation(
     return list(sorted(dict.fromkeys(existing_footprints_ids + footprints_to_add)))
 
 
+async def __search_existing_ids(
+    db: AsyncSession, id_column, ids: list[int], value_column=None
+) -> dict[int, typing.Any]:
+    # Maps each existing id to the value of value_column, if given
+    existing = {}
+    value_column = id_column if value_column is None else value_column
+    for batch_start in range(0, len(ids), __BULK_BATCH_SIZE):
+        batch = ids[batch_start : batch_start + __BULK_BATCH_SIZE]
+        existing.update(
+            (
+                await db.execute(
+                    select(id_column, value_column.label("value")).filter(
+                        id_column.in_(batch)
+                    )
+                )
+            )
+            .tuples()
+            .all()
+        )
+    return existing
+
+
+def __raise_missing_ids(name: str, ids: list[int], existing: dict[int, typing.Any]):
+    missing_ids = [i for i in ids if i not in existing]
+    if missing_ids:
+        raise ResourceNotFoundApiError(
+            f"{name} not found",
+            details={"missing_ids": missing_ids},
+            missing_id=missing_ids[0],
+        )
+
+
+async def __search_relations(
+    db: AsyncSession, table, ref_column, component_ids: list[int]
+) -> dict[int, list[int]]:
+    relations = collections.defaultdict(list)
+    for batch_start in range(0, len(component_ids), __BULK_BATCH_SIZE):
+        batch = component_ids[batch_start : batch_start + __BULK_BATCH_SIZE]
+        for component_id, ref_id in await db.execute(
+            select(table.c.component_id, ref_column).filter(
+                table.c.component_id.in_(batch)
+            )
+        ):
+            relations[component_id].append(ref_id)
+    return relations
+
+
+async def create_components_relations(
+    db: AsyncSession, relations: typing.Sequence[ComponentRelations]
+) -> list[ComponentRelations]:
+    """
+    Links the given footprints and symbols to each component. All the ids are
+    validated before linking anything, and the relations that already exist
+    are skipped. Returns all the footprints and symbols of each component.
+    """
+    __logger.debug(
+        __l("Creating components relations [components={0}]", len(relations))
+    )
+    # Merge the entries of the same component keeping the requested order
+    requested: dict[int, tuple[dict[int, None], dict[int, None]]] = {}
+    for relation in relations:
+        footprint_ids, symbol_ids = requested.setdefault(
+            relation.component_id, ({}, {})
+        )
+        footprint_ids.update(dict.fromkeys(relation.footprint_ids))
+        symbol_ids.update(dict.fromkeys(relation.symbol_ids))
+    component_ids = list(requested)
+
+    # The component types are kept to invalidate the KiCad caches
+    component_types = await __search_existing_ids(
+        db, ComponentModel.id, component_ids, ComponentModel.type
+    )
+    __raise_missing_ids("Component", component_ids, component_types)
+    requested_footprints = list(
+        dict.fromkeys(i for f, _ in requested.values() for i in f)
+    )
+    __raise_missing_ids(
+        "Footprint",
+        requested_footprints,
+        await __search_existing_ids(db, FootprintReference.id, requested_footprints),
+    )
+    requested_symbols = list(dict.fromkeys(i for _, s in requested.values() for i in s))
+    __raise_missing_ids(
+        "Symbol",
+        requested_symbols,
+        await __search_existing_ids(db, LibraryReference.id, requested_symbols),
+    )
+
+    # Use the many-to-many tables directly instead of ORM relations to avoid
+    # the slow load of the SQL query that joins all component tables
+    footprint_relations = await __search_relations(
+        db,
+        component_footprint_asc_table,
+        component_footprint_asc_table.c.footprint_ref_id,
+        component_ids,
+    )
+    symbol_relations = await __search_relations(
+        db,
+        component_library_asc_table,
+        component_library_asc_table.c.library_ref_id,
+        component_ids,
+    )
+    footprint_refs = []
+    symbol_refs = []
+    for component_id, (footprint_ids, symbol_ids) in requested.items():
+        current_footprints = footprint_relations[component_id]
+        current_symbols = symbol_relations[component_id]
+        footprint_refs.extend(
+            {"footprint_ref_id": footprint_id, "component_id": component_id}
+            for footprint_id in footprint_ids
+            if footprint_id not in current_footprints
+        )
+        symbol_refs.extend(
+            {"library_ref_id": symbol_id, "component_id": component_id}
+            for symbol_id in symbol_ids
+            if symbol_id not in current_symbols
+        )
+
+    try:
+        if footprint_refs:
+            await db.execute(insert(component_footprint_asc_table), footprint_refs)
+        if symbol_refs:
+            await db.execute(insert(component_library_asc_table), symbol_refs)
+        await __publish_component_changes(
+            db,
+            {r["component_id"] for r in footprint_refs}
+            | {r["component_id"] for r in symbol_refs},
+        )
+        await db.commit()
+    except:
+        await db.rollback()
+        raise
+    for component_id in {r["component_id"] for r in footprint_refs}:
+        kicad.invalidate_part(component_id)
+    for component_id in {r["component_id"] for r in symbol_refs}:
+        kicad.invalidate_component(component_id, component_types[component_id])
+    __refresh_library_views(
+        component_types[r["component_id"]] for r in footprint_refs + symbol_refs
+    )
+    __logger.debug(
+        __l(
+            "Components relations created [footprints={0}, symbols={1}]",
+            len(footprint_refs),
+            len(symbol_refs),
+        )
+    )
+    return [
+        ComponentRelations(
+            component_id=component_id,
+            footprint_ids=sorted(
+                dict.fromkeys(footprint_relations[component_id] + list(footprint_ids))
+            ),
+            symbol_ids=sorted(
+                dict.fromkeys(symbol_relations[component_id] + list(symbol_ids))
+            ),
+        )
+        for component_id, (footprint_ids, symbol_ids) in requested.items()
+    ]
+
+
 async def get_component_symbol_relations(
     db: AsyncSession, component_id
 ) -> typing.Sequence[LibraryReference]:
@@ -297,34 +747,90 @@ async def get_component_footprint_relations(
     ).all()
 
 
-async def get_component(db: AsyncSession, component_id: int) -> ComponentModel:
+async def get_component(
+    db: AsyncSession,
+    component_id: int,
+    loading_mode: ComponentLoadingMode | None = None,
+) -> ComponentModel:
     __logger.debug(__l("Querying component data [component_id={0}]", component_id))
-    component = await db.get(ComponentModel, component_id)
+    if component_loader.is_subtype_loading(loading_mode):
+        component = await component_loader.fetch_component(db, component_id)
+    else:
+        component = await db.get(ComponentModel, component_id)
     if not component:
         raise ResourceNotFoundApiError("Component not found", missing_id=component_id)
     return component
 
 
+async def stream_components(
+    model_types: typing.Sequence[typing.Type[ComponentModel]], batch_size: int
+) -> typing.AsyncIterator[typing.Sequence[ComponentModel]]:
+    """
+    Yields batches of all the components of the given types, read with one
+    server-side cursor query per type. It uses its own session as the rows
+    are consumed while the response is being sent.
+    """
+    async with sessionmanager.session() as db:
+        for model_type in model_types:
+            __logger.debug(__l("Streaming components [type={0}]", model_type))
+            result = await db.stream_scalars(
+                select(model_type)
+                .order_by(model_type.id)
+                .execution_options(yield_per=batch_size)
+            )
+            # The session only keeps weak references to the loaded rows, so
+            # each batch is released once written
+            async for partition in result.partitions():
+                yield partition
+
+
 async def get_component_list(
-    db: AsyncSession, page_number: int, page_size: int
-) -> typing.Tuple[typing.Sequence[ComponentModel], int]:
+    db: AsyncSession,
+    page_number: int,
+    page_size: int,
+    cursor: str | None = None,
+    loading_mode: ComponentLoadingMode | None = None,
+    count_mode: PageCountMode = PageCountMode.EXACT,
+) -> Page[ComponentModel]:
     __logger.debug(
         __l(
-            "Listing components for [page_number={0}, page_size={1}]",
+            "Listing components for [page_number={0}, page_size={1}, cursor={2}]",
             page_number,
             page_size,
+            cursor,
         )
     )
 
-    query = (
-        select(ComponentModel)
-        .limit(page_size)
-        .offset((page_number - 1) * page_size)
-        .order_by(ComponentModel.id.desc())
+    table = component_loader.component_table
+    # The count only needs the base table. Counting over the mapped class
+    # would join all the component tables for nothing
+    total_query = select(func.count()).select_from(table)
+    if component_loader.is_subtype_loading(loading_mode):
+        page = await pagination.fetch_page(
+            db,
+            select(table.c.id, table.c.type),
+            table.c.id,
+            page_number,
+            page_size,
+            cursor=cursor,
+            total_query=total_query,
+            count_mode=count_mode,
+        )
+        return dataclasses.replace(
+            page,
+            items=await component_loader.load_ordered_components(db, page.items),
+        )
+
+    return await pagination.fetch_page(
+        db,
+        select(ComponentModel),
+        table.c.id,
+        page_number,
+        page_size,
+        cursor=cursor,
+        total_query=total_query,
+        count_mode=count_mode,
     )
-    result_page = await db.execute(query)
-    total_count = await db.scalar(select(func.count()).select_from(ComponentModel))
-    return result_page.scalars().all(), total_count
 
 
 async def delete_component(db: AsyncSession, component_id: int):
@@ -343,10 +849,21 @@ async def delete_component(db: AsyncSession, component_id: int):
             raise RelationExistsError("an inventory item exists for the component")
 
         await db.delete(component)
+        await __publish_component_changes(db, [component_id])
         await db.commit()
+        kicad.invalidate_component(component_id, component.type)
+        __refresh_library_views([component.type])
         __logger.debug(__l("Deleted component [component_id={0}]", component_id))
 
 
+async def __get_component_type(db: AsyncSession, component_id: int) -> str | None:
+    return await db.scalar(
+        select(component_loader.component_table.c.type).where(
+            component_loader.component_table.c.id == component_id
+        )
+    )
+
+
 async def delete_component_symbol_relation(
     db: AsyncSession, component_id: int, symbol_id: int
 ):
@@ -358,13 +875,21 @@ async def delete_component_symbol_relation(
         )
     )
 
-    await db.execute(
+    component_type = await __get_component_type(db, component_id)
+    result = await db.execute(
         delete(component_library_asc_table).where(
             component_library_asc_table.c.component_id == component_id,
             component_library_asc_table.c.library_ref_id == symbol_id,
         )
     )
+    if not result.rowcount:
+        # Nothing changed, so nothing to tell or refresh
+        await db.rollback()
+        return
+    await __publish_component_changes(db, [component_id])
     await db.commit()
+    kicad.invalidate_component(component_id, component_type)
+    __refresh_library_views([component_type])
     __logger.debug(
         __l(
             "Deleted component symbol relation [component_id={0}, symbol_id={1}]",
@@ -385,13 +910,20 @@ async def delete_component_footprint_relation(
         )
     )
 
-    await db.execute(
+    component_type = await __get_component_type(db, component_id)
+    result = await db.execute(
         delete(component_footprint_asc_table).where(
             component_footprint_asc_table.c.component_id == component_id,
             component_footprint_asc_table.c.footprint_ref_id == footprint_id,
         )
     )
+    if not result.rowcount:
+        await db.rollback()
+        return
+    await __publish_component_changes(db, [component_id])
     await db.commit()
+    kicad.invalidate_part(component_id)
+    __refresh_library_views([component_type])
     __logger.debug(
         __l(
             "Deleted component footprint relation [component_id={0}, footprint_id={1}]",
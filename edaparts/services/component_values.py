@@ -0,0 +1,131 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import logging
+import typing
+
+from sqlalchemy import Table, bindparam, select, update
+
+from edaparts.models.components.component_model import ComponentModel
+from edaparts.services import database
+from edaparts.utils import si_values
+from edaparts.utils.helpers import BraceMessage as __l
+
+__logger = logging.getLogger(__name__)
+
+__numeric_columns: dict[type, tuple[tuple[str, str], ...]] = {}
+
+
+def __get_table_numeric_columns(table: Table) -> tuple[tuple[str, str], ...]:
+    return tuple(
+        (column.info["numeric_of"], column.key)
+        for column in table.columns
+        if "numeric_of" in column.info
+    )
+
+
+def get_numeric_columns(
+    model_type: typing.Type[ComponentModel],
+) -> tuple[tuple[str, str], ...]:
+    # (source, shadow) pairs of the textual columns stored as numbers too
+    columns = __numeric_columns.get(model_type)
+    if columns is None:
+        columns = tuple(
+            pair
+            for table in model_type.__mapper__.tables
+            for pair in __get_table_numeric_columns(table)
+        )
+        __numeric_columns[model_type] = columns
+    return columns
+
+
+def fill_numeric_columns(model: ComponentModel):
+    for source, shadow in get_numeric_columns(type(model)):
+        setattr(model, shadow, si_values.parse_si_value(getattr(model, source)))
+
+
+async def __backfill_table(table: Table, batch_size: int) -> int:
+    columns = __get_table_numeric_columns(table)
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("_id"))
+        .values({shadow: bindparam(shadow) for _, shadow in columns})
+    )
+    updated = 0
+    last_id = 0
+    while True:
+        # Each batch is committed on its own, so the table is not locked for
+        # the whole job and an interrupted job keeps its progress
+        async with database.sessionmanager.connect() as connection:
+            rows = (
+                await connection.execute(
+                    select(table.c.id, *(table.c[source] for source, _ in columns))
+                    .where(table.c.id > last_id)
+                    .order_by(table.c.id)
+                    .limit(batch_size)
+                )
+            ).all()
+            if not rows:
+                break
+            await connection.execute(
+                statement,
+                [
+                    {
+                        "_id": row[0],
+                        **{
+                            shadow: si_values.parse_si_value(value)
+                            for (_, shadow), value in zip(columns, row[1:])
+                        },
+                    }
+                    for row in rows
+                ],
+            )
+        updated += len(rows)
+        last_id = rows[-1][0]
+        __logger.info(
+            __l("Numeric values filled [table={0}, rows={1}]", table.name, updated)
+        )
+    return updated
+
+
+async def backfill_numeric_columns(batch_size: int = 1000) -> int:
+    tables = {
+        table
+        for mapper in ComponentModel.__mapper__.self_and_descendants
+        for table in mapper.tables
+        if __get_table_numeric_columns(table)
+    }
+    updated = 0
+    for table in sorted(tables, key=lambda t: t.name):
+        updated += await __backfill_table(table, batch_size)
+    return updated
+
+
+async def run_backfill(db_url: str, batch_size: int = 1000) -> int:
+    database.sessionmanager.init(db_url)
+    try:
+        return await backfill_numeric_columns(batch_size)
+    finally:
+        await database.sessionmanager.close()
@@ -214,3 +214,13 @@ class CyclicCategoryDependecy(ApiError):
 class InvalidCategoryRelationError(ApiError):
     def __init__(self, msg=None, details=None):
         super(InvalidCategoryRelationError, self).__init__(msg, details, 400)
+
+
+class LibraryParserBusyError(ApiError):
+    def __init__(self, msg=None, details=None):
+        super(LibraryParserBusyError, self).__init__(msg, details, 503)
+
+
+class LibraryParserTimeoutError(ApiError):
+    def __init__(self, msg=None, details=None):
+        super(LibraryParserTimeoutError, self).__init__(msg, details, 503)
@@ -0,0 +1,228 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import asyncio
+import json
+import logging
+import typing
+import uuid
+
+import psycopg
+from psycopg import sql
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from edaparts.app.config import config
+from edaparts.models.internal.internal_models import ChangedEntityType, ChangeEvent
+from edaparts.services.local_cache import clear_local_caches
+from edaparts.services.metrics import metrics
+from edaparts.utils import helpers
+
+# NOTIFY payloads must be shorter than 8000 bytes
+_MAX_PAYLOAD_BYTES = 7900
+_CONNECT_TIMEOUT = 10
+
+ChangeHandler = typing.Callable[[int | None], None]
+
+
+def _encode_events(origin: str, events: typing.Iterable[ChangeEvent]) -> str:
+    entries = list(
+        dict.fromkeys((event.entity_type.value, event.entity_id) for event in events)
+    )
+    payload = json.dumps({"origin": origin, "events": entries}, separators=(",", ":"))
+    if len(payload.encode("utf-8")) > _MAX_PAYLOAD_BYTES:
+        # Too many to be sent one by one, all the entities of the types are evicted
+        entries = [
+            (entity_type, None)
+            for entity_type in dict.fromkeys(entity_type for entity_type, _ in entries)
+        ]
+        payload = json.dumps(
+            {"origin": origin, "events": entries}, separators=(",", ":")
+        )
+    return payload
+
+
+def _decode_events(payload: str) -> tuple[str, list[ChangeEvent]]:
+    data = json.loads(payload)
+    return data["origin"], [
+        ChangeEvent(ChangedEntityType(entity_type), entity_id)
+        for entity_type, entity_id in data["events"]
+    ]
+
+
+class InvalidationBus:
+    """
+    Tells the other worker processes which entities were changed, so they
+    evict them from their local caches. Events are sent with Postgres NOTIFY
+    in the transaction of the change, so they are only delivered if it is
+    committed. Every worker keeps a LISTEN connection, and flushes all its
+    caches each time it is (re)connected, as the events sent while it was
+    down are lost.
+
+    The writer evicts its own caches after the commit, its events are
+    ignored when they come back. Other databases run a single worker, so
+    nothing is sent.
+    """
+
+    # Module level dunder names would be mangled inside the class
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self):
+        self._origin = uuid.uuid4().hex
+        self._handlers: dict[ChangedEntityType, list[ChangeHandler]] = {}
+        self._listener: asyncio.Task | None = None
+        self._dsn: str | None = None
+        self._channel = config.INVALIDATION_BUS_CHANNEL
+        self._keepalive = 0.0
+        self._reconnect_delay = 0.0
+        self._reconnect_delay_max = 0.0
+
+    def subscribe(self, entity_type: ChangedEntityType, handler: ChangeHandler):
+        """
+        Calls handler with the id of each changed entity of the given type
+        received from other workers, or None if all of them may have changed.
+        """
+        self._handlers.setdefault(entity_type, []).append(handler)
+
+    def init(
+        self,
+        db_url: str,
+        keepalive: float,
+        reconnect_delay: float,
+        reconnect_delay_max: float,
+    ):
+        if self._listener is not None:
+            raise Exception("InvalidationBus is already initialized")
+        url = make_url(db_url)
+        if url.get_backend_name() != "postgresql":
+            self._logger.info(
+                helpers.BraceMessage(
+                    "Invalidation bus disabled, it requires Postgres [backend={0}]",
+                    url.get_backend_name(),
+                )
+            )
+            return
+        # The listener connects with psycopg directly, whatever the driver is
+        self._dsn = url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        self._keepalive = keepalive
+        self._reconnect_delay = reconnect_delay
+        self._reconnect_delay_max = reconnect_delay_max
+        self._listener = asyncio.create_task(self.__listen())
+
+    async def close(self):
+        if self._listener is None:
+            return
+        listener, self._listener = self._listener, None
+        listener.cancel()
+        await asyncio.gather(listener, return_exceptions=True)
+
+    async def publish(self, db: AsyncSession, events: typing.Iterable[ChangeEvent]):
+        """
+        Adds the given events to the transaction of db. They are delivered to
+        the other workers once it is committed. Events of types nobody
+        subscribed to are not sent.
+        """
+        events = [event for event in events if event.entity_type in self._handlers]
+        if not events or db.bind.dialect.name != "postgresql":
+            return
+        await db.execute(
+            select(func.pg_notify(self._channel, _encode_events(self._origin, events)))
+        )
+        metrics.counter("invalidation_bus.published").inc(len(events))
+
+    def dispatch(self, events: typing.Iterable[ChangeEvent]):
+        for event in events:
+            for handler in self._handlers.get(event.entity_type, ()):
+                try:
+                    handler(event.entity_id)
+                except Exception:
+                    self._logger.error(
+                        helpers.BraceMessage(
+                            "Cannot handle change event [event={0}]", event
+                        ),
+                        exc_info=True,
+                    )
+
+    def _handle_payload(self, payload: str):
+        try:
+            origin, events = _decode_events(payload)
+        except (ValueError, KeyError, TypeError):
+            # Sent by a different version of the app, the change is unknown
+            self._logger.warning(
+                helpers.BraceMessage(
+                    "Unreadable change event, flushing the caches [payload={0}]",
+                    payload,
+                )
+            )
+            clear_local_caches()
+            return
+        if origin == self._origin:
+            return
+        metrics.counter("invalidation_bus.received").inc(len(events))
+        self.dispatch(events)
+
+    async def __listen(self):
+        delay = self._reconnect_delay
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self._dsn, autocommit=True, connect_timeout=_CONNECT_TIMEOUT
+                ) as connection:
+                    await connection.execute(
+                        sql.SQL("LISTEN {}").format(sql.Identifier(self._channel))
+                    )
+                    # Entries cached while not listening may have missed events
+                    clear_local_caches()
+                    metrics.counter("invalidation_bus.flushes").inc()
+                    self._logger.info(
+                        helpers.BraceMessage(
+                            "Invalidation bus listening [channel={0}]", self._channel
+                        )
+                    )
+                    delay = self._reconnect_delay
+                    while True:
+                        async for notify in connection.notifies(
+                            timeout=self._keepalive
+                        ):
+                            self._handle_payload(notify.payload)
+                        # Waiting for notifies does not detect a dead server
+                        await asyncio.wait_for(
+                            connection.execute("SELECT 1"), self._keepalive
+                        )
+            except Exception:
+                metrics.counter("invalidation_bus.disconnections").inc()
+                self._logger.error(
+                    helpers.BraceMessage(
+                        "Invalidation bus listener disconnected, reconnecting [delay={0}]",
+                        delay,
+                    ),
+                    exc_info=True,
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._reconnect_delay_max)
+
+
+invalidation_bus = InvalidationBus()
@@ -23,25 +23,45 @@
 #
 
 
+import asyncio
+import collections
 import logging
 import random
 import string
 import typing
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Float,
+    Integer,
+    Row,
+    column,
+    insert,
+    or_,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
-from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
 from sqlalchemy.sql.functions import func
 
 from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.internal.internal_models import (
+    ChangedEntityType,
+    ChangeEvent,
+    ComponentLoadingMode,
+    PageCountMode,
+)
 from edaparts.models.internal.internal_inventory_models import (
     InventoryItemStockStatus,
     MassStockMovement,
+    SingleStockMovement,
 )
 from edaparts.models.inventory.inventory_category_model import InventoryCategoryModel
 from edaparts.models.inventory.inventory_identificable_item_model import (
+    DICI_BLOCK_SIZE,
     InventoryIdentificableItemModel,
+    dici_sequence,
 )
 from edaparts.models.inventory.inventory_item_location_stock import (
     InventoryItemLocationStockModel,
@@ -52,6 +72,7 @@ from edaparts.models.inventory.inventory_item_stock_movement import (
     InventoryItemLocationStockMovementModel,
 )
 from edaparts.models.inventory.inventory_location import InventoryLocationModel
+from edaparts.services import component_loader, pagination
 from edaparts.services.exceptions import (
     ResourceAlreadyExistsApiError,
     UniqueIdentifierCreationError,
@@ -61,83 +82,139 @@ from edaparts.services.exceptions import (
     CyclicCategoryDependecy,
     InvalidCategoryRelationError,
 )
+from edaparts.services.invalidation_bus import invalidation_bus
+from edaparts.services.pagination import Page
 from edaparts.utils.helpers import BraceMessage as __l
 
 __logger = logging.getLogger(__name__)
 
+# Rows per statement of the mass stock updates, keeps the statement
+# parameters under the driver limits
+__MASS_UPDATE_BATCH_SIZE = 1000
 
-async def __search_item_location_stock_by_ids_dicis(
-    db: AsyncSession, item_id: int | str, location_id: str | int
-) -> InventoryItemLocationStockModel:
-    item_filters = []
-    location_filters = []
-    if isinstance(location_id, int):
-        location_filters.append(InventoryLocationModel.id == location_id)
-    else:
-        location_filters.append(InventoryLocationModel.dici == location_id)
 
-    if isinstance(item_id, int):
-        item_filters.append(InventoryItemModel.id == item_id)
-    else:
-        item_filters.append(InventoryItemModel.dici == item_id)
+async def __publish_changes(
+    db: AsyncSession, entity_type: ChangedEntityType, entity_ids
+):
+    await invalidation_bus.publish(
+        db, (ChangeEvent(entity_type, entity_id) for entity_id in entity_ids)
+    )
 
-    try:
-        return (
-            await db.scalars(
-                select(InventoryItemLocationStockModel)
-                .join(InventoryItemModel)
-                .join(InventoryLocationModel)
-                .filter(*(item_filters + location_filters))
-                .options(joinedload(InventoryItemLocationStockModel.item))
-                .options(joinedload(InventoryItemLocationStockModel.location))
-            )
-        ).one()
 
-    except NoResultFound:
-        if not (
-            await db.scalars(select(InventoryItemModel).filter(*item_filters))
-        ).first():
-            # Item not exist
-            raise ResourceNotFoundApiError(
-                "Item doesn't exist",
-                missing_dici=(item_id if isinstance(item_id, str) else None),
-                missing_id=(item_id if isinstance(item_id, int) else None),
-            )
+def __split_ids_dicis(identifiers: typing.Iterable[int | str]):
+    identifiers = list(identifiers)
+    ids = {identifier for identifier in identifiers if isinstance(identifier, int)}
+    dicis = {identifier for identifier in identifiers if isinstance(identifier, str)}
+    return ids, dicis
 
-        if not (
-            await db.scalars(select(InventoryLocationModel).filter(*location_filters))
-        ).first():
-            # Location not exist
-            raise ResourceNotFoundApiError(
-                "Location doesn't exist",
-                missing_dici=(location_id if isinstance(location_id, str) else None),
-                missing_id=(location_id if isinstance(location_id, int) else None),
-            )
 
-        raise ResourceNotFoundApiError(
-            "The given location and item has no item location stock relation"
+async def __search_item_location_stocks_by_ids_dicis(
+    db: AsyncSession, movements: list[SingleStockMovement]
+) -> dict[tuple[int | str, int | str], list[Row]]:
+    # Fetch the stocks of all the movements at once. Items and locations are
+    # filtered separately, so some unrequested pairs may be fetched too
+    item_ids, item_dicis = __split_ids_dicis(m.item_identifier for m in movements)
+    location_ids, location_dicis = __split_ids_dicis(
+        m.location_identifier for m in movements
+    )
+    rows = (
+        await db.execute(
+            select(
+                InventoryItemLocationStockModel.id,
+                InventoryItemModel.id.label("item_id"),
+                InventoryItemModel.dici.label("item_dici"),
+                InventoryLocationModel.id.label("location_id"),
+                InventoryLocationModel.dici.label("location_dici"),
+            )
+            .join(InventoryItemModel)
+            .join(InventoryLocationModel)
+            .filter(
+                or_(
+                    InventoryItemModel.id.in_(item_ids),
+                    InventoryItemModel.dici.in_(item_dicis),
+                ),
+                or_(
+                    InventoryLocationModel.id.in_(location_ids),
+                    InventoryLocationModel.dici.in_(location_dicis),
+                ),
+            )
         )
-
-    except MultipleResultsFound:
-        raise InvalidMassStockUpdateError("Internal integrity error")
+    ).all()
+
+    # Index them by every id/dici combination a movement may use
+    stocks = {}
+    for row in rows:
+        for item_identifier in (row.item_id, row.item_dici):
+            for location_identifier in (row.location_id, row.location_dici):
+                stocks.setdefault((item_identifier, location_identifier), []).append(
+                    row
+                )
+    return stocks
 
 
-def __update_item_location_stock(
-    stock_item: InventoryItemLocationStockModel, quantity: float, reason: str
-) -> InventoryItemLocationStockMovementModel:
-    if stock_item.stock_min_level <= (stock_item.actual_stock + quantity):
-        stock_item.actual_stock = stock_item.actual_stock + quantity
-        stock_item_movement = InventoryItemLocationStockMovementModel(
-            stock_change=quantity, reason=reason, stock_item_id=stock_item.id
+async def __raise_missing_item_location_stock(
+    db: AsyncSession, movements: list[SingleStockMovement], missing: SingleStockMovement
+):
+    # Fetch all the requested items and locations to raise a fine grade
+    # exception, as the first missing movement did in the sequential updates
+    item_ids, item_dicis = __split_ids_dicis(m.item_identifier for m in movements)
+    location_ids, location_dicis = __split_ids_dicis(
+        m.location_identifier for m in movements
+    )
+    items = set()
+    for item_id, item_dici in await db.execute(
+        select(InventoryItemModel.id, InventoryItemModel.dici).filter(
+            or_(
+                InventoryItemModel.id.in_(item_ids),
+                InventoryItemModel.dici.in_(item_dicis),
+            )
+        )
+    ):
+        items.update((item_id, item_dici))
+    if missing.item_identifier not in items:
+        # Item not exist
+        raise ResourceNotFoundApiError(
+            "Item doesn't exist",
+            missing_dici=(
+                missing.item_identifier
+                if isinstance(missing.item_identifier, str)
+                else None
+            ),
+            missing_id=(
+                missing.item_identifier
+                if isinstance(missing.item_identifier, int)
+                else None
+            ),
         )
-        return stock_item_movement
 
-    raise InvalidMassStockUpdateError(
-        __l(
-            "Item has reached its minimum stock level [item_dici={0}, location_dici={1}]",
-            stock_item.item.dici,
-            stock_item.location.dici,
+    locations = set()
+    for location_id, location_dici in await db.execute(
+        select(InventoryLocationModel.id, InventoryLocationModel.dici).filter(
+            or_(
+                InventoryLocationModel.id.in_(location_ids),
+                InventoryLocationModel.dici.in_(location_dicis),
+            )
         )
+    ):
+        locations.update((location_id, location_dici))
+    if missing.location_identifier not in locations:
+        # Location not exist
+        raise ResourceNotFoundApiError(
+            "Location doesn't exist",
+            missing_dici=(
+                missing.location_identifier
+                if isinstance(missing.location_identifier, str)
+                else None
+            ),
+            missing_id=(
+                missing.location_identifier
+                if isinstance(missing.location_identifier, int)
+                else None
+            ),
+        )
+
+    raise ResourceNotFoundApiError(
+        "The given location and item has no item location stock relation"
     )
 
 
@@ -261,17 +338,23 @@ async def create_standalone_item(
 
 
 async def get_item(
-    db: AsyncSession, item_id: int, load_component: bool = False
+    db: AsyncSession,
+    item_id: int,
+    load_component: bool = False,
+    loading_mode: ComponentLoadingMode | None = None,
 ) -> InventoryItemModel:
     __logger.debug(__l("Querying item data [item_id={0}]", item_id))
 
+    subtype_loading = component_loader.is_subtype_loading(loading_mode)
     query = select(InventoryItemModel).filter_by(id=item_id).limit(1)
-    if load_component:
+    if load_component and not subtype_loading:
         query = query.options(selectinload(InventoryItemModel.component))
     result = (await db.scalars(query)).first()
 
     if not result:
         raise ResourceNotFoundApiError("Item not found", missing_id=item_id)
+    if load_component and subtype_loading:
+        await component_loader.attach_item_components(db, [result])
     return result
 
 
@@ -310,23 +393,30 @@ async def get_location(db: AsyncSession, location_id: int) -> InventoryLocationM
 
 
 async def get_locations(
-    db: AsyncSession, page_number: int, page_size: int
-) -> typing.Tuple[typing.Sequence[InventoryLocationModel], int]:
+    db: AsyncSession,
+    page_number: int,
+    page_size: int,
+    cursor: str | None = None,
+    count_mode: PageCountMode = PageCountMode.EXACT,
+) -> Page[InventoryLocationModel]:
     __logger.debug(
-        __l("Retrieving locations [page_n={0}, page_size={1}]", page_number, page_size)
-    )
-    query = (
-        select(InventoryLocationModel)
-        .limit(page_size)
-        .offset((page_number - 1) * page_size)
-        .order_by(InventoryLocationModel.id.desc())
+        __l(
+            "Retrieving locations [page_n={0}, page_size={1}, cursor={2}]",
+            page_number,
+            page_size,
+            cursor,
+        )
     )
-    result_page = await db.execute(query)
-    # todo: use one single query
-    total_count = await db.scalar(
-        select(func.count()).select_from(InventoryLocationModel)
+    return await pagination.fetch_page(
+        db,
+        select(InventoryLocationModel),
+        InventoryLocationModel.id,
+        page_number,
+        page_size,
+        cursor=cursor,
+        total_query=select(func.count()).select_from(InventoryLocationModel),
+        count_mode=count_mode,
     )
-    return result_page.scalars().all(), total_count
 
 
 async def get_category_items(
@@ -335,13 +425,17 @@ async def get_category_items(
     page_number: int,
     page_size: int,
     load_component: bool = False,
-) -> typing.Tuple[typing.Sequence[InventoryItemModel], int]:
+    cursor: str | None = None,
+    loading_mode: ComponentLoadingMode | None = None,
+    count_mode: PageCountMode = PageCountMode.EXACT,
+) -> Page[InventoryItemModel]:
     __logger.debug(
         __l(
-            "Retrieving category items [category_id={0}, page_n={1}, page_size={2}]",
+            "Retrieving category items [category_id={0}, page_n={1}, page_size={2}, cursor={3}]",
             category_id,
             page_number,
             page_size,
+            cursor,
         )
     )
     db_category_id = (
@@ -352,30 +446,26 @@ async def get_category_items(
     if not db_category_id:
         raise ResourceNotFoundApiError("Category not found", missing_id=category_id)
 
+    subtype_loading = component_loader.is_subtype_loading(loading_mode)
     query = select(InventoryItemModel).filter_by(category_id=category_id)
     query = (
         query.options(joinedload(InventoryItemModel.component))
-        if load_component
+        if load_component and not subtype_loading
         else query
     )
-    query = (
-        query.order_by(InventoryItemModel.id.desc())
-        .limit(page_size)
-        .offset((page_number - 1) * page_size)
-    )
 
-    # todo: extract to common place
-    _count_column_name = "__private_edaparts_get_category_items_row_count"
-    new_query = query.add_columns(func.count().over().label(_count_column_name))
-    rows_result = (await db.execute(new_query)).fetchall()
-    results = []
-    total = 0
-    for index in range(len(rows_result)):
-        row_data = rows_result[index]
-        if index == 0:
-            total = row_data[1]
-        results.append(row_data[0])
-    return results, total
+    page = await pagination.fetch_page(
+        db,
+        query,
+        InventoryItemModel.id,
+        page_number,
+        page_size,
+        cursor=cursor,
+        count_mode=count_mode,
+    )
+    if load_component and subtype_loading:
+        await component_loader.attach_item_components(db, page.items)
+    return page
 
 
 async def create_item_stocks_for_locations(
@@ -440,6 +530,8 @@ async def create_item_stocks_for_locations(
             item_stock_per_location[db_location_id] = item_stock
             db.add(item_stock)
 
+        if item_stocks:
+            await __publish_changes(db, ChangedEntityType.INVENTORY_ITEM, [item.id])
         await db.commit()
     except:
         await db.rollback()
@@ -465,6 +557,9 @@ async def delete_stock_location(db: AsyncSession, location_id: int):
                 await db.delete(stock_item)
 
             await db.delete(location)
+            await __publish_changes(
+                db, ChangedEntityType.INVENTORY_LOCATION, [location_id]
+            )
             await db.commit()
         # todo: Add a more specific exception
         except:
@@ -490,6 +585,7 @@ async def delete_item(db: AsyncSession, item_id: int):
                 await db.delete(stock_item)
 
             await db.delete(item)
+            await __publish_changes(db, ChangedEntityType.INVENTORY_ITEM, [item_id])
             await db.commit()
 
         except:
@@ -534,6 +630,7 @@ async def update_item_location_stock_levels(
         item_stock.stock_notify_min_level = min_notify_level
 
     db.add(item_stock)
+    await __publish_changes(db, ChangedEntityType.INVENTORY_ITEM, [item_id])
     await db.commit()
     return item_stock
 
@@ -543,33 +640,109 @@ async def stock_mass_update(
 ) -> list[InventoryItemStockStatus]:
     stock_status_lines = []
     try:
-        for itm in mass_stock_update.movements:
-            # Search the stock item location model by item/location id or dici
-            stock_item = await __search_item_location_stock_by_ids_dicis(
-                db,
-                item_id=itm.item_identifier,
-                location_id=itm.location_identifier,
+        # Search the stock item location models by item/location id or dici
+        stocks = await __search_item_location_stocks_by_ids_dicis(
+            db, mass_stock_update.movements
+        )
+
+        stock_items = [
+            stocks.get((itm.item_identifier, itm.location_identifier))
+            for itm in mass_stock_update.movements
+        ]
+
+        # Lock the stocks before reading their levels, so concurrent updates
+        # are not lost. Locks are always taken in id order to avoid deadlocks
+        locked_stocks = {
+            stock.id: stock
+            for stock in await db.execute(
+                select(
+                    InventoryItemLocationStockModel.id,
+                    InventoryItemLocationStockModel.actual_stock,
+                    InventoryItemLocationStockModel.stock_min_level,
+                )
+                .filter(
+                    InventoryItemLocationStockModel.id.in_(
+                        {
+                            matches[0].id
+                            for matches in stock_items
+                            if matches and len(matches) == 1
+                        }
+                    )
+                )
+                .order_by(InventoryItemLocationStockModel.id)
+                .with_for_update()
             )
+        }
+
+        # Apply the movements in order, as a movement may depend on the stock
+        # left by the previous ones
+        stock_levels: dict[int, float] = {}
+        movement_entries = []
+        for itm, matches in zip(mass_stock_update.movements, stock_items):
+            if matches and len(matches) > 1:
+                raise InvalidMassStockUpdateError("Internal integrity error")
+            if not matches or matches[0].id not in locked_stocks:
+                await __raise_missing_item_location_stock(
+                    db, mass_stock_update.movements, itm
+                )
+            stock_item = matches[0]
+            locked_stock = locked_stocks[stock_item.id]
 
             # Annotate the stock movement
-            movement_entry = __update_item_location_stock(
-                stock_item, itm.quantity, mass_stock_update.reason
+            actual_stock = stock_levels.get(stock_item.id, locked_stock.actual_stock)
+            if not locked_stock.stock_min_level <= (actual_stock + itm.quantity):
+                raise InvalidMassStockUpdateError(
+                    __l(
+                        "Item has reached its minimum stock level [item_dici={0}, location_dici={1}]",
+                        stock_item.item_dici,
+                        stock_item.location_dici,
+                    )
+                )
+            stock_levels[stock_item.id] = actual_stock + itm.quantity
+            movement_entries.append(
+                dict(
+                    stock_change=itm.quantity,
+                    reason=mass_stock_update.reason,
+                    stock_item_id=stock_item.id,
+                )
             )
 
-            # Add DB changes to be persisted
-            db.add(movement_entry)
-            db.add(stock_item)
-
             # Append the change to a list to return the actual stock level to caller
             stock_status_lines.append(
                 InventoryItemStockStatus(
-                    stock_level=stock_item.actual_stock,
-                    item_dici=stock_item.item.dici,
-                    location_dici=stock_item.location.dici,
+                    stock_level=stock_levels[stock_item.id],
+                    item_dici=stock_item.item_dici,
+                    location_dici=stock_item.location_dici,
                 )
             )
 
-        # Persist all the changes
+        # Persist all the changes with one statement per table and batch
+        stock_level_rows = list(stock_levels.items())
+        for batch_start in range(0, len(stock_level_rows), __MASS_UPDATE_BATCH_SIZE):
+            new_levels = values(
+                column("id", Integer), column("actual_stock", Float), name="new_levels"
+            ).data(
+                stock_level_rows[batch_start : batch_start + __MASS_UPDATE_BATCH_SIZE]
+            )
+            await db.execute(
+                update(InventoryItemLocationStockModel)
+                .where(InventoryItemLocationStockModel.id == new_levels.c.id)
+                .values(actual_stock=new_levels.c.actual_stock)
+                .execution_options(synchronize_session=False)
+            )
+        for batch_start in range(0, len(movement_entries), __MASS_UPDATE_BATCH_SIZE):
+            await db.execute(
+                insert(InventoryItemLocationStockMovementModel).values(
+                    movement_entries[
+                        batch_start : batch_start + __MASS_UPDATE_BATCH_SIZE
+                    ]
+                )
+            )
+        await __publish_changes(
+            db,
+            ChangedEntityType.INVENTORY_ITEM,
+            {matches[0].item_id for matches in stock_items},
+        )
         await db.commit()
 
         __logger.debug(
@@ -616,6 +789,7 @@ async def add_property_to_item(
 
     property_model.item_id = item_id
     db.add(property_model)
+    await __publish_changes(db, ChangedEntityType.INVENTORY_ITEM, [item_id])
     await db.commit()
 
     return property_model
@@ -644,6 +818,7 @@ async def update_item_property(
 
     # Persist to DB
     db.add(prop)
+    await __publish_changes(db, ChangedEntityType.INVENTORY_ITEM, [prop.item_id])
     await db.commit()
 
     return prop
@@ -679,6 +854,7 @@ async def delete_item_property(db: AsyncSession, item_id: int, property_id: int)
     prop = await db.get(InventoryItemPropertyModel, property_id)
     if prop:
         await db.delete(prop)
+        await __publish_changes(db, ChangedEntityType.INVENTORY_ITEM, [item_id])
         await db.commit()
 
 
@@ -715,31 +891,27 @@ async def get_category(db: AsyncSession, category_id: int) -> InventoryCategoryM
 
 
 async def get_categories(
-    db: AsyncSession, page_number: int, page_size: int, only_root: bool = False
-) -> typing.Tuple[list[InventoryCategoryModel], int]:
+    db: AsyncSession,
+    page_number: int,
+    page_size: int,
+    only_root: bool = False,
+    cursor: str | None = None,
+    count_mode: PageCountMode = PageCountMode.EXACT,
+) -> Page[InventoryCategoryModel]:
     __logger.debug("Retrieving categories")
 
     query = select(InventoryCategoryModel)
     query = query.filter_by(parent_id=None) if only_root else query
-    query = (
-        query.order_by(InventoryCategoryModel.id.desc())
-        .limit(page_size)
-        .offset((page_number - 1) * page_size)
+    return await pagination.fetch_page(
+        db,
+        query,
+        InventoryCategoryModel.id,
+        page_number,
+        page_size,
+        cursor=cursor,
+        count_mode=count_mode,
     )
 
-    # todo: extract to common place
-    _count_column_name = "__private_edaparts_search_items_row_count"
-    new_query = query.add_columns(func.count().over().label(_count_column_name))
-    rows_result = (await db.execute(new_query)).fetchall()
-    results = []
-    total = 0
-    for index in range(len(rows_result)):
-        row_data = rows_result[index]
-        if index == 0:
-            total = row_data[1]
-        results.append(row_data[0])
-    return results, total
-
 
 async def set_category_parent(
     db: AsyncSession, category_id: int, parent_id: int
@@ -775,6 +947,7 @@ async def set_category_parent(
     category.parent_id = parent_id
 
     db.add(category)
+    await __publish_changes(db, ChangedEntityType.INVENTORY_CATEGORY, [category_id])
     await db.commit()
     return category
 
@@ -788,6 +961,7 @@ async def remove_category_parent(db: AsyncSession, category_id: int):
     if category.parent_id:
         category.parent_id = None
         db.add(category)
+        await __publish_changes(db, ChangedEntityType.INVENTORY_CATEGORY, [category_id])
         await db.commit()
 
 
@@ -820,6 +994,7 @@ async def update_category(
     category.description = description
 
     db.add(category)
+    await __publish_changes(db, ChangedEntityType.INVENTORY_CATEGORY, [category_id])
     await db.commit()
 
     return category
@@ -847,6 +1022,7 @@ async def set_item_category(db: AsyncSession, item_id: int, category_id: int):
     item.category_id = category_id
 
     db.add(item)
+    await __publish_changes(db, ChangedEntityType.INVENTORY_ITEM, [item_id])
     await db.commit()
 
 
@@ -860,9 +1036,14 @@ async def delete_item_category(db: AsyncSession, item_id: int):
     item.category_id = None
 
     db.add(item)
+    await __publish_changes(db, ChangedEntityType.INVENTORY_ITEM, [item_id])
     await db.commit()
 
 
+__DICI_CHARS = string.digits + string.ascii_uppercase
+__DICI_NUMBER_LIMIT = len(__DICI_CHARS) ** 8
+
+
 def __id_generator(size=10, chars=None) -> str:
     return "".join(
         random.choice(chars or (string.ascii_uppercase + string.digits))
@@ -870,29 +1051,101 @@ def __id_generator(size=10, chars=None) -> str:
     )
 
 
-async def generate_item_id(db: AsyncSession, obj_model=None):
-    if isinstance(obj_model, InventoryIdentificableItemModel):
-        query_obj = None
-        if isinstance(obj_model, InventoryItemModel) or isinstance(
-            obj_model, ComponentModel
-        ):
-            query_obj = InventoryItemModel
-        elif isinstance(obj_model, InventoryLocationModel):
-            query_obj = InventoryLocationModel
-
-        if query_obj:
-            model_prefix = obj_model.get_id_prefix()
-            for x in range(3):
-                gen_dici = model_prefix + "-" + __id_generator()
-                existing_dici_result = await db.scalars(
-                    select(query_obj.dici).filter_by(dici=gen_dici).limit(1)
-                )
-                current_id = existing_dici_result.first()
-                if not current_id:
-                    return gen_dici
-    else:
-        return "ITEM-" + __id_generator()
+class _DiciNumbers:
+    """
+    Numbers of the sequence backed DICIs. Blocks of numbers are reserved with
+    a single sequence call, and handed out by this process.
+    """
+
+    def __init__(self):
+        self._numbers: collections.deque[int] = collections.deque()
+        self._lock = asyncio.Lock()
+
+    async def take(self, db: AsyncSession, count: int) -> list[int]:
+        async with self._lock:
+            missing = count - len(self._numbers)
+            if missing > 0:
+                # Reserve all the needed blocks in one round trip
+                block_starts = (
+                    await db.scalars(
+                        select(dici_sequence.next_value()).select_from(
+                            func.generate_series(1, -(-missing // DICI_BLOCK_SIZE))
+                        )
+                    )
+                ).all()
+                for block_start in block_starts:
+                    self._numbers.extend(
+                        range(block_start, block_start + DICI_BLOCK_SIZE)
+                    )
+            return [self._numbers.popleft() for _ in range(count)]
+
+
+__dici_numbers = _DiciNumbers()
 
-    raise UniqueIdentifierCreationError(
-        "Cannot create a unique identifier for an inventory item"
+
+def __encode_dici_number(number: int) -> str:
+    # Base-36 padded to 8 characters. The random DICIs have 10, so both kinds
+    # never collide
+    if number >= __DICI_NUMBER_LIMIT:
+        raise UniqueIdentifierCreationError(
+            "The inventory identifiers sequence is exhausted"
+        )
+    digits = []
+    while number:
+        number, digit = divmod(number, 36)
+        digits.append(__DICI_CHARS[digit])
+    return "".join(reversed(digits)).rjust(8, "0")
+
+
+async def __generate_random_item_ids(
+    db: AsyncSession, count: int, prefix: str, query_obj
+) -> list[str]:
+    # Other databases look for collisions instead
+    dicis = []
+    while len(dicis) < count:
+        for x in range(3):
+            gen_dici = prefix + "-" + __id_generator()
+            if gen_dici in dicis:
+                continue
+            existing_dici_result = await db.scalars(
+                select(query_obj.dici).filter_by(dici=gen_dici).limit(1)
+            )
+            current_id = existing_dici_result.first()
+            if not current_id:
+                dicis.append(gen_dici)
+                break
+        else:
+            raise UniqueIdentifierCreationError(
+                "Cannot create a unique identifier for an inventory item"
+            )
+    return dicis
+
+
+async def generate_item_id(db: AsyncSession, obj_model=None) -> str:
+    return (await generate_item_ids(db, 1, obj_model=obj_model))[0]
+
+
+async def generate_item_ids(db: AsyncSession, count: int, obj_model=None) -> list[str]:
+    """
+    Generates count unique DICIs for the given kind of model, made of the
+    model prefix and a base-36 number of the inventory_dici_seq sequence.
+    """
+    if isinstance(obj_model, InventoryLocationModel):
+        query_obj = InventoryLocationModel
+    else:
+        query_obj = InventoryItemModel
+    prefix = (
+        obj_model.get_id_prefix()
+        if isinstance(obj_model, InventoryIdentificableItemModel)
+        else InventoryIdentificableItemModel.__id_prefix__
     )
+    if count <= 0:
+        return []
+    # Blocks are reserved with generate_series, only available in PostgreSQL
+    if db.get_bind().dialect.name != "postgresql":
+        return await __generate_random_item_ids(db, count, prefix, query_obj)
+
+    return [
+        f"{prefix}-{__encode_dici_number(number)}"
+        for number in await __dici_numbers.take(db, count)
+    ]
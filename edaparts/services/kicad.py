@@ -26,6 +26,7 @@
 import logging
 import operator
 import re
+import types
 import typing
 
 from sqlalchemy import inspect, select
@@ -33,15 +34,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from edaparts.models.components.component_model import ComponentModel
+from edaparts.app.config import config
 from edaparts.models.internal.kicad_models import (
     KiCadCategoryEntry,
+    KiCadCategoryPart,
     KiCadPart,
     KiCadPartProperty,
 )
 from edaparts.services.exceptions import ApiError, ResourceNotFoundApiError
 from edaparts.utils.helpers import BraceMessage as __l
 from edaparts.models import LibraryReference
-from edaparts.models.internal.internal_models import CadType
+from edaparts.models.internal.internal_models import (
+    CadType,
+    ChangedEntityType,
+    ComponentLoadingMode,
+)
+from edaparts.services import component_loader
+from edaparts.services.invalidation_bus import invalidation_bus
+from edaparts.services.local_cache import LocalCache
 
 __logger = logging.getLogger(__name__)
 
@@ -72,37 +82,117 @@ def get_components_categories() -> typing.Dict[int, KiCadCategoryEntry]:
     return __components_types_dict
 
 
+def invalidate_part(component_id: int):
+    __parts_cache.invalidate(component_id)
+
+
+def invalidate_category_parts(identity: str | None = None):
+    """
+    Evicts the cached listing of the category of the given component
+    polymorphic identity, or all of them if it is not known.
+    """
+    category_id = __identity_categories.get(identity)
+    if category_id is not None:
+        __category_parts_cache.invalidate(category_id)
+    else:
+        __category_parts_cache.clear()
+
+
+def invalidate_component(component_id: int, identity: str | None = None):
+    invalidate_part(component_id)
+    invalidate_category_parts(identity)
+
+
+def invalidate_parts():
+    """
+    Evicts all the cached parts. Used when a footprint or symbol changes,
+    as the parts that show it are not tracked.
+    """
+    __parts_cache.clear()
+
+
+def invalidate_all():
+    __parts_cache.clear()
+    __category_parts_cache.clear()
+
+
+def __on_component_changed(component_id: int | None):
+    # Other workers do not send the component type, all the listings go
+    if component_id is None:
+        invalidate_all()
+    else:
+        invalidate_component(component_id)
+
+
 async def get_components_for_category(
     db: AsyncSession, category_id: int
-) -> typing.Sequence[ComponentModel]:
+) -> typing.Sequence[KiCadCategoryPart]:
     if category_id not in __components_types_dict:
         raise ResourceNotFoundApiError(
             f"Category {category_id} does not exist", missing_id=category_id
         )
+    return await __category_parts_cache.get_or_load(
+        category_id, lambda: __query_components_for_category(db, category_id)
+    )
+
+
+async def __query_components_for_category(
+    db: AsyncSession, category_id: int
+) -> tuple[KiCadCategoryPart, ...]:
     __logger.debug(__l("Listing components for [category_id={0}]", category_id))
 
+    component_type = __components_types_dict[category_id].component_type
     query = (
-        select(__components_types_dict[category_id].component_type)
-        .join(ComponentModel.library_refs)
+        select(component_type.id, component_type.mpn, component_type.description)
+        .join(component_type.library_refs)
         .where(LibraryReference.cad_type == CadType.KICAD)
-        .order_by(ComponentModel.id.desc())
+        .order_by(component_type.id.desc())
     )
-    result_page = await db.scalars(query)
+    return tuple(
+        KiCadCategoryPart(id=component_id, name=mpn, description=description)
+        for component_id, mpn, description in await db.execute(query)
+    )
+
 
-    return result_page.fetchall()
+async def get_component(
+    db: AsyncSession,
+    component_id: int,
+    loading_mode: ComponentLoadingMode | None = None,
+) -> KiCadPart:
+    return await __parts_cache.get_or_load(
+        component_id, lambda: __query_component(db, component_id, loading_mode)
+    )
 
 
-async def get_component(db: AsyncSession, component_id: int) -> KiCadPart:
+async def __query_component(
+    db: AsyncSession,
+    component_id: int,
+    loading_mode: ComponentLoadingMode | None = None,
+) -> KiCadPart:
+    component_type = ComponentModel
+    if component_loader.is_subtype_loading(loading_mode):
+        # Resolve the specific type first to query only its own table
+        identity = await db.scalar(
+            select(component_loader.component_table.c.type).where(
+                component_loader.component_table.c.id == component_id
+            )
+        )
+        if not identity:
+            raise ResourceNotFoundApiError(
+                "Component not found", missing_id=component_id
+            )
+        component_type = component_loader.get_model_for_identity(identity)
+
     component = (
         await db.scalars(
-            select(ComponentModel)
-            .join(ComponentModel.library_refs)
+            select(component_type)
+            .join(component_type.library_refs)
             .filter(
-                ComponentModel.id == component_id,
+                component_type.id == component_id,
                 LibraryReference.cad_type == CadType.KICAD,
             )
-            .options(selectinload(ComponentModel.footprint_refs))
-            .options(selectinload(ComponentModel.library_refs))
+            .options(selectinload(component_type.footprint_refs))
+            .options(selectinload(component_type.library_refs))
             .limit(1)
         )
     ).first()
@@ -119,7 +209,7 @@ async def get_component(db: AsyncSession, component_id: int) -> KiCadPart:
         id=component.id,
         name=component.mpn,
         symbolIdStr=f"{library_ref.alias}:{library_ref.reference}",
-        fields=__compute_component_properties(component),
+        fields=types.MappingProxyType(__compute_component_properties(component)),
     )
     return part
 
@@ -134,7 +224,8 @@ def __compute_component_properties(
         to_discard_cols.append(key)
         to_discard_cols.extend([rel_col.key for rel_col in relation.local_columns])
     for key, column_prop in inspect_data.mapper.column_attrs.items():
-        if key in to_discard_cols:
+        # Derived columns are computed from the other ones
+        if key in to_discard_cols or column_prop.columns[0].info.get("derived"):
             continue
         value = getattr(component, column_prop.key)
         if value is None:
@@ -159,3 +250,19 @@ def __compute_component_properties(
 
 
 __components_types_dict = __generate_components_types_dict()
+__identity_categories = {
+    entry.component_type.__mapper__.polymorphic_identity: category_id
+    for category_id, entry in __components_types_dict.items()
+}
+__category_parts_cache = LocalCache(
+    "kicad.category_parts_cache",
+    config.KICAD_CACHE_TTL,
+    config.KICAD_CACHE_MAX_ENTRIES,
+)
+__parts_cache = LocalCache(
+    "kicad.parts_cache", config.KICAD_CACHE_TTL, config.KICAD_CACHE_MAX_ENTRIES
+)
+invalidation_bus.subscribe(ChangedEntityType.COMPONENT, __on_component_changed)
+invalidation_bus.subscribe(ChangedEntityType.FOOTPRINT, lambda _: invalidate_parts())
+# Symbols also decide which components are listed in the categories
+invalidation_bus.subscribe(ChangedEntityType.SYMBOL, lambda _: invalidate_all())
@@ -0,0 +1,155 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import asyncio
+import json
+import logging
+import os
+import pathlib
+import tempfile
+
+from edaparts.app.config import config
+from edaparts.models.internal.internal_models import (
+    CadType,
+    StorableLibraryResourceType,
+)
+from edaparts.services.metrics import metrics
+from edaparts.services.parsing_executor import parsing_executor
+from edaparts.utils.files import hash_sha256
+from edaparts.utils.helpers import BraceMessage as __l
+from edaparts.utils.models_parser import FootprintModel, Library, SymbolModel
+
+__logger = logging.getLogger(__name__)
+
+# Bump it when the parser output changes, so old entries are not used
+_CACHE_FORMAT_VERSION = 1
+
+
+async def get_library(
+    path: pathlib.Path, cad_type: CadType, wait_for_slot: bool = False
+) -> Library:
+    """
+    Returns the parsed library of the given file. Parsed libraries are kept
+    in LIBRARY_CACHE_DIR keyed by the file SHA-256, so a library file is only
+    parsed once whatever its name or location.
+    """
+    cache_dir = __get_cache_dir()
+    # KiCad footprint libraries may be directories, those are not cached
+    if cache_dir is None or pathlib.Path(path).is_dir():
+        return await parsing_executor.parse(path, cad_type, wait_for_slot=wait_for_slot)
+
+    # Deep validated KiCad libraries are kept apart, a scanned one may not be valid
+    deep_suffix = (
+        ".deep" if cad_type == CadType.KICAD and config.KICAD_DEEP_VALIDATION else ""
+    )
+    entry_path = cache_dir.joinpath(
+        f"{await asyncio.to_thread(hash_sha256, path)}.{cad_type.value}{deep_suffix}.json"
+    )
+    library = await asyncio.to_thread(__load_entry, entry_path)
+    if library is not None:
+        metrics.counter("library_cache.hits").inc()
+        return library
+
+    metrics.counter("library_cache.misses").inc()
+    library = await parsing_executor.parse(path, cad_type, wait_for_slot=wait_for_slot)
+    await asyncio.to_thread(__store_entry, cache_dir, entry_path, library)
+    return library
+
+
+def __get_cache_dir() -> pathlib.Path | None:
+    return pathlib.Path(config.LIBRARY_CACHE_DIR) if config.LIBRARY_CACHE_DIR else None
+
+
+def __load_entry(entry_path: pathlib.Path) -> Library | None:
+    try:
+        data = json.loads(entry_path.read_text(encoding="utf-8"))
+        if data["version"] != _CACHE_FORMAT_VERSION:
+            return None
+        library_type = StorableLibraryResourceType(data["library_type"])
+        model_type = (
+            FootprintModel
+            if library_type == StorableLibraryResourceType.FOOTPRINT
+            else SymbolModel
+        )
+        library = Library(
+            cad_type=CadType(data["cad_type"]),
+            library_type=library_type,
+            models={
+                name: model_type(name=name, description=description)
+                for name, description in data["models"]
+            },
+        )
+        # Entries are pruned by modification time, refresh it on use
+        os.utime(entry_path)
+        return library
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError):
+        __logger.warning(
+            __l("Discarding unreadable library cache entry [path={0}]", entry_path),
+            exc_info=True,
+        )
+        entry_path.unlink(missing_ok=True)
+        return None
+
+
+def __store_entry(cache_dir: pathlib.Path, entry_path: pathlib.Path, library: Library):
+    data = {
+        "version": _CACHE_FORMAT_VERSION,
+        "cad_type": library.cad_type.value,
+        "library_type": library.library_type.value,
+        "models": [
+            [model.name, model.description] for model in library.models.values()
+        ],
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write and rename, so readers in other workers never see partial entries
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False
+        ) as temp_file:
+            json.dump(data, temp_file)
+        os.replace(temp_file.name, entry_path)
+        __prune_entries(cache_dir)
+    except OSError:
+        # The cache is an optimization, failing to write it is not an error
+        __logger.warning(
+            __l("Cannot write library cache entry [path={0}]", entry_path),
+            exc_info=True,
+        )
+
+
+def __prune_entries(cache_dir: pathlib.Path):
+    entries = [
+        entry
+        for entry in os.scandir(cache_dir)
+        if entry.is_file() and entry.name.endswith(".json")
+    ]
+    excess = len(entries) - config.LIBRARY_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[:excess]:
+        pathlib.Path(entry.path).unlink(missing_ok=True)
@@ -0,0 +1,181 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import asyncio
+import logging
+import time
+import typing
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from edaparts.models.metadata.view_generator import MATERIALIZED_VIEW_SUFFIX
+from edaparts.services import database
+from edaparts.services.metrics import metrics
+from edaparts.utils import helpers
+
+# Tables read by each materialized view, following the plain views it selects
+_VIEW_TABLES_QUERY = text("""
+    WITH RECURSIVE dependencies(view_id, object_id) AS (
+        SELECT c.oid, c.oid
+        FROM pg_class c
+        WHERE c.relkind = 'm'
+          AND c.relnamespace = current_schema()::regnamespace
+          AND c.relname LIKE :pattern
+        UNION
+        SELECT dependencies.view_id, d.refobjid
+        FROM dependencies
+                 JOIN pg_rewrite r ON r.ev_class = dependencies.object_id
+                 JOIN pg_depend d ON d.classid = 'pg_rewrite'::regclass
+            AND d.objid = r.oid
+            AND d.refclassid = 'pg_class'::regclass
+            AND d.refobjid <> dependencies.object_id
+    )
+    SELECT v.relname, t.relname
+    FROM dependencies
+             JOIN pg_class v ON v.oid = dependencies.view_id
+             JOIN pg_class t ON t.oid = dependencies.object_id
+    WHERE t.relkind = 'r'
+    """)
+
+
+async def get_views_reading(
+    connection: AsyncConnection, tables: typing.Iterable[str]
+) -> list[str]:
+    """
+    Returns the materialized library views that read any of the given tables.
+    """
+    tables = set(tables)
+    return sorted(
+        {
+            view
+            for view, table in await connection.execute(
+                _VIEW_TABLES_QUERY, {"pattern": f"%{MATERIALIZED_VIEW_SUFFIX}"}
+            )
+            if table in tables
+        }
+    )
+
+
+async def refresh_views(views: typing.Iterable[str]):
+    for view in views:
+        started_at = time.monotonic()
+        # One transaction per view, so each lock is held only by its refresh
+        async with database.sessionmanager.connect() as connection:
+            quoted_view = connection.dialect.identifier_preparer.quote(view)
+            # Concurrent refreshes do not block the readers of the view
+            await connection.execute(
+                text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {quoted_view}")
+            )
+        metrics.counter("library_views.refreshes").inc()
+        metrics.summary("library_views.refresh_seconds").observe(
+            time.monotonic() - started_at
+        )
+
+
+class LibraryViewsRefresher:
+    """
+    Refreshes the materialized Altium and KiCad library views after the
+    tables they read change. Changes are collected for refresh_delay
+    seconds, so a burst of writes refreshes each view once, and only the
+    views that read a changed table are refreshed.
+
+    The database is shared, so only the worker that made the change
+    refreshes the views. Only Postgres has the library views.
+    """
+
+    # Module level dunder names would be mangled inside the class
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self):
+        self._runner: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._pending: set[str] = set()
+        self._refresh_delay = 0.0
+
+    def init(self, db_url: str, refresh_delay: float):
+        if self._runner is not None:
+            raise Exception("LibraryViewsRefresher is already initialized")
+        if make_url(db_url).get_backend_name() != "postgresql":
+            return
+        self._refresh_delay = refresh_delay
+        self._wakeup = asyncio.Event()
+        self._runner = asyncio.create_task(self.__run())
+
+    async def close(self):
+        if self._runner is None:
+            return
+        runner, self._runner = self._runner, None
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+
+        # Do not leave the last changes out of the views until the next write
+        if self._pending:
+            try:
+                await self.__refresh(self._pending)
+            except Exception:
+                self._logger.warning(
+                    "Cannot refresh the pending library views", exc_info=True
+                )
+        self._pending.clear()
+
+    def schedule(self, tables: typing.Iterable[str]):
+        """
+        Refreshes the views that read the given tables after the refresh
+        delay. Must be called once the changes are committed.
+        """
+        if self._runner is None:
+            return
+        self._pending.update(tables)
+        self._wakeup.set()
+
+    async def __run(self):
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self._refresh_delay)
+            self._wakeup.clear()
+            tables, self._pending = self._pending, set()
+            try:
+                await self.__refresh(tables)
+            except Exception:
+                # Retried after the delay, along with any new change
+                self._logger.error(
+                    helpers.BraceMessage(
+                        "Cannot refresh the library views [tables={0}]", tables
+                    ),
+                    exc_info=True,
+                )
+                self._pending.update(tables)
+                self._wakeup.set()
+
+    async def __refresh(self, tables: typing.Iterable[str]):
+        async with database.sessionmanager.connect() as connection:
+            views = await get_views_reading(connection, tables)
+        await refresh_views(views)
+        self._logger.debug(
+            helpers.BraceMessage("Library views refreshed [views={0}]", views)
+        )
+
+
+library_views_refresher = LibraryViewsRefresher()
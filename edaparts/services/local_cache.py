@@ -0,0 +1,102 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import collections
+import time
+import typing
+
+from edaparts.services.metrics import metrics
+
+_MISSING = object()
+
+
+class LocalCache:
+    """
+    Bounded LRU cache of a worker process whose entries expire after ttl
+    seconds. Values must be immutable, as they are shared by all the readers.
+    Hits, misses and evictions are counted in the <name>.* metrics.
+    """
+
+    def __init__(self, name: str, ttl: float, max_entries: int):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[
+            typing.Hashable, tuple[float, typing.Any]
+        ] = collections.OrderedDict()
+        # Bumped on each invalidation, so values loaded before it are not stored
+        self._generation = 0
+        local_caches.append(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    async def get_or_load(
+        self,
+        key: typing.Hashable,
+        loader: typing.Callable[[], typing.Awaitable[typing.Any]],
+    ) -> typing.Any:
+        if not self.enabled:
+            return await loader()
+        now = time.monotonic()
+        entry = self._entries.get(key, _MISSING)
+        if entry is not _MISSING and entry[0] > now:
+            self._entries.move_to_end(key)
+            metrics.counter(f"{self.name}.hits").inc()
+            return entry[1]
+
+        metrics.counter(f"{self.name}.misses").inc()
+        generation = self._generation
+        value = await loader()
+        # Skip values that may have been invalidated while they were loaded
+        if generation == self._generation:
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                metrics.counter(f"{self.name}.evictions").inc()
+        return value
+
+    def invalidate(self, key: typing.Hashable):
+        self._generation += 1
+        if self._entries.pop(key, _MISSING) is not _MISSING:
+            metrics.counter(f"{self.name}.invalidations").inc()
+
+    def clear(self):
+        self._generation += 1
+        if self._entries:
+            metrics.counter(f"{self.name}.invalidations").inc(len(self._entries))
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# All the caches of the process, to flush them at once
+local_caches: list[LocalCache] = []
+
+
+def clear_local_caches():
+    for cache in local_caches:
+        cache.clear()
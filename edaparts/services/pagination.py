@@ -0,0 +1,246 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import base64
+import binascii
+import collections
+import dataclasses
+import hashlib
+import json
+import logging
+import time
+import typing
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from edaparts.app.config import config
+from edaparts.models.internal.internal_models import PageCountMode
+from edaparts.services.exceptions import InvalidRequestError
+from edaparts.utils.helpers import BraceMessage as __l
+
+__logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
+_PAGE_ID_COLUMN_NAME = "__private_edaparts_page_row_id"
+_COUNT_COLUMN_NAME = "__private_edaparts_page_row_count"
+
+
+@dataclasses.dataclass(frozen=True)
+class Page(typing.Generic[T]):
+    items: list[T]
+    total: int | None
+    next_cursor: str | None = None
+    # The kind of number total is. It may differ from the requested mode
+    # (e.g. a cache miss or an estimation unsupported by the database)
+    total_kind: PageCountMode = PageCountMode.EXACT
+
+
+@dataclasses.dataclass(frozen=True)
+class _CachedCount:
+    total: int
+    expires_at: float
+
+
+__count_cache: collections.OrderedDict[str, _CachedCount] = collections.OrderedDict()
+
+
+def encode_cursor(last_id: int) -> str:
+    data = json.dumps({"after_id": last_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))[
+            "after_id"
+        ]
+    except (ValueError, TypeError, KeyError, binascii.Error) as err:
+        raise InvalidRequestError("Invalid pagination cursor") from err
+    if not isinstance(after_id, int):
+        raise InvalidRequestError("Invalid pagination cursor")
+    return after_id
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    id_column,
+    page_number: int,
+    page_size: int,
+    cursor: str | None = None,
+    total_query: Select | None = None,
+    count_mode: PageCountMode = PageCountMode.EXACT,
+) -> Page:
+    """
+    Fetches a page of the given query ordered by id_column descending.
+
+    If a cursor is given (an empty one means the first page) the page
+    seeks on id_column instead of using OFFSET, so all the pages cost the
+    same. Items are the selected entity, or a tuple of the selected columns
+    if the query selects more than one.
+
+    The total is computed as count_mode says. Exact totals use a window
+    count unless a total_query is given or a cursor is used.
+    """
+    columns_count = len(query.column_descriptions)
+    page_query = query.add_columns(id_column.label(_PAGE_ID_COLUMN_NAME)).order_by(
+        id_column.desc()
+    )
+    if cursor is not None:
+        if cursor:
+            page_query = page_query.where(id_column < decode_cursor(cursor))
+    else:
+        page_query = page_query.offset((page_number - 1) * page_size)
+
+    window_count = (
+        count_mode == PageCountMode.EXACT and cursor is None and total_query is None
+    )
+    total, total_kind = None, count_mode
+    if window_count:
+        page_query = page_query.add_columns(
+            func.count().over().label(_COUNT_COLUMN_NAME)
+        )
+    else:
+        # The window count would only see the rows after the cursor
+        total, total_kind = await count_total(
+            db,
+            query,
+            id_column,
+            total_query=total_query,
+            count_mode=count_mode,
+        )
+
+    # Fetch an additional row to know if there is a next page
+    rows = (await db.execute(page_query.limit(page_size + 1))).all()
+    if window_count:
+        total = rows[0][-1] if rows else 0
+        if not rows and page_number > 1:
+            # The window count is empty past the last page
+            total = await db.scalar(count_query(query, id_column))
+    next_cursor = (
+        encode_cursor(rows[page_size - 1][columns_count])
+        if len(rows) > page_size
+        else None
+    )
+    return Page(
+        items=[
+            row[0] if columns_count == 1 else tuple(row[:columns_count])
+            for row in rows[:page_size]
+        ],
+        total=total,
+        next_cursor=next_cursor,
+        total_kind=total_kind,
+    )
+
+
+async def count_total(
+    db: AsyncSession,
+    query: Select,
+    id_column,
+    total_query: Select | None = None,
+    count_mode: PageCountMode = PageCountMode.EXACT,
+) -> tuple[int | None, PageCountMode]:
+    """
+    Counts the rows of the given query and returns the count along with
+    the kind of number it is.
+    """
+    if count_mode == PageCountMode.NONE:
+        return None, PageCountMode.NONE
+
+    total_query = (
+        total_query if total_query is not None else count_query(query, id_column)
+    )
+    if count_mode == PageCountMode.ESTIMATED:
+        estimation = await _estimate_count(db, _count_target(query, id_column))
+        if estimation is not None:
+            return estimation, PageCountMode.ESTIMATED
+    elif count_mode == PageCountMode.CACHED:
+        return await _cached_count(db, total_query)
+    return await db.scalar(total_query), PageCountMode.EXACT
+
+
+def count_query(query: Select, id_column) -> Select:
+    return select(func.count()).select_from(_count_target(query, id_column).subquery())
+
+
+def clear_count_cache():
+    __count_cache.clear()
+
+
+def _count_target(query: Select, id_column) -> Select:
+    # Reduce the query to the id column. That removes any eager load
+    # and polymorphic join that the count does not need
+    return query.with_only_columns(id_column).order_by(None).limit(None).offset(None)
+
+
+async def _estimate_count(db: AsyncSession, query: Select) -> int | None:
+    connection = await db.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+
+    # The planner estimation comes from the table statistics (pg_class.reltuples
+    # and the column histograms), so it costs the same for any table size
+    compiled = query.compile(
+        dialect=connection.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    plan = (
+        await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        )
+    ).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _cached_count(
+    db: AsyncSession, total_query: Select
+) -> tuple[int, PageCountMode]:
+    connection = await db.connection()
+    compiled = total_query.compile(
+        dialect=connection.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    signature = hashlib.sha256(
+        f"{compiled}|{sorted(compiled.params.items())!r}".encode("utf-8")
+    ).hexdigest()
+
+    now = time.monotonic()
+    cached = __count_cache.get(signature)
+    if cached is not None and cached.expires_at > now:
+        __count_cache.move_to_end(signature)
+        return cached.total, PageCountMode.CACHED
+
+    total = await db.scalar(total_query)
+    __count_cache[signature] = _CachedCount(
+        total=total, expires_at=now + config.PAGINATION_COUNT_CACHE_TTL
+    )
+    __count_cache.move_to_end(signature)
+    while len(__count_cache) > config.PAGINATION_COUNT_CACHE_SIZE:
+        __count_cache.popitem(last=False)
+    __logger.debug(__l("Cached paged query total [signature={0}]", signature))
+    return total, PageCountMode.EXACT
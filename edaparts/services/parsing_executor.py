@@ -0,0 +1,185 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import asyncio
+import concurrent.futures
+import logging
+import multiprocessing
+import pathlib
+import time
+
+from edaparts.app.config import config
+from edaparts.models.internal.internal_models import CadType
+from edaparts.services.exceptions import (
+    GenericIntenalApiError,
+    LibraryParserBusyError,
+    LibraryParserTimeoutError,
+)
+from edaparts.services.metrics import metrics
+from edaparts.utils import helpers, models_parser
+
+
+def _parse_library(
+    path: pathlib.Path, cad_type: CadType, deep_validation: bool
+) -> tuple[models_parser.Library, float, float]:
+    # Runs in the worker. time.monotonic() is system wide, so the start time
+    # can be compared with the submission one to get the queue wait
+    started_at = time.monotonic()
+    library = models_parser.parse_file(path, cad_type, deep_validation=deep_validation)
+    return library, started_at, time.monotonic() - started_at
+
+
+class LibraryParsingExecutor:
+    """
+    Runs the library parsing out of the event loop, in a pool of worker
+    processes. Parses beyond the queue depth are rejected, and callers stop
+    waiting for a parse after the timeout. A timed out parse keeps its queue
+    slot until the worker finishes it.
+
+    If not initialized libraries are parsed in the default thread executor
+    with no limits.
+    """
+
+    # Module level dunder names would be mangled inside the class
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self):
+        self._pool: concurrent.futures.ProcessPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._workers = 0
+        self._timeout: float | None = None
+
+    def init(self, workers: int, queue_depth: int, timeout: float):
+        if self._slots is not None:
+            raise Exception("LibraryParsingExecutor is already initialized")
+        self._workers = workers
+        self._pool = self.__create_pool()
+        self._slots = asyncio.Semaphore(queue_depth)
+        self._timeout = timeout
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._slots = None
+        self._timeout = None
+
+    async def parse(
+        self, path: pathlib.Path, cad_type: CadType, wait_for_slot: bool = False
+    ) -> models_parser.Library:
+        """
+        Parses the given library. If the queue is full the call fails, unless
+        wait_for_slot is set, that waits for a free slot instead.
+        """
+        if self._slots is not None:
+            if self._slots.locked() and not wait_for_slot:
+                metrics.counter("library_parser.rejected").inc()
+                raise LibraryParserBusyError(
+                    "Too many libraries are being parsed, retry later"
+                )
+            await self._slots.acquire()
+
+        pool = self._pool
+        submitted_at = time.monotonic()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                pool,
+                _parse_library,
+                path,
+                cad_type,
+                config.KICAD_DEEP_VALIDATION,
+            )
+        except concurrent.futures.process.BrokenProcessPool as err:
+            self.__release_slot()
+            self.__replace_broken_pool(pool)
+            raise GenericIntenalApiError("The library parser failed") from err
+        except BaseException:
+            self.__release_slot()
+            raise
+        future.add_done_callback(self.__on_parse_done)
+
+        # Unlike wait_for, wait does not cancel the parse on timeout
+        done, _ = await asyncio.wait((future,), timeout=self._timeout)
+        if not done:
+            metrics.counter("library_parser.timeouts").inc()
+            self._logger.warning(
+                helpers.BraceMessage(
+                    "Library parsing timed out [path={0}, cad_type={1}, timeout={2}]",
+                    path,
+                    cad_type.value,
+                    self._timeout,
+                )
+            )
+            raise LibraryParserTimeoutError(
+                "The library took too long to be parsed, retry later"
+            )
+
+        try:
+            library, started_at, parse_time = future.result()
+        except concurrent.futures.process.BrokenProcessPool as err:
+            # A worker died (e.g. killed by the OOM killer). The pool cannot be
+            # used anymore, so replace it
+            self._logger.error(
+                helpers.BraceMessage("Library parser worker died [path={0}]", path),
+                exc_info=True,
+            )
+            self.__replace_broken_pool(pool)
+            raise GenericIntenalApiError("The library parser failed") from err
+
+        metrics.summary("library_parser.queue_wait_seconds").observe(
+            max(0.0, started_at - submitted_at)
+        )
+        metrics.summary("library_parser.parse_seconds").observe(parse_time)
+        return library
+
+    def __create_pool(self) -> concurrent.futures.ProcessPoolExecutor | None:
+        if self._workers <= 0:
+            return None
+        # Workers are spawned, forking a process that runs an event loop
+        # and a DB pool is not safe
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def __replace_broken_pool(self, pool: concurrent.futures.ProcessPoolExecutor):
+        # Concurrent parses on the same pool break too, replace it once
+        if pool is not None and self._pool is pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = self.__create_pool()
+
+    def __release_slot(self):
+        if self._slots is not None:
+            self._slots.release()
+
+    def __on_parse_done(self, future: asyncio.Future):
+        self.__release_slot()
+        # Retrieve the result of abandoned parses to avoid "exception was never
+        # retrieved" warnings
+        if not future.cancelled():
+            future.exception()
+
+
+parsing_executor = LibraryParsingExecutor()
@@ -0,0 +1,191 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import logging
+import pathlib
+import time
+import typing
+
+import filelock
+from sqlalchemy import func, select
+
+from edaparts.app.config import config
+from edaparts.models.internal.internal_models import (
+    CadType,
+    StorableLibraryResourceType,
+)
+from edaparts.services import database
+from edaparts.services.metrics import metrics
+from edaparts.utils import helpers
+
+_LockKey = tuple[CadType, StorableLibraryResourceType, str]
+
+
+@dataclasses.dataclass
+class _LocalLock:
+    lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class PathLockManager:
+    """
+    Exclusive locks of the stored library paths that never block the event
+    loop. Coroutines of the same process wait on an asyncio lock, and only
+    the owner of it takes the lock shared with the other processes. That one
+    is a lock file or a Postgres advisory lock, depending on
+    STORAGE_LOCK_BACKEND, polled without blocking until taken.
+    """
+
+    # Module level dunder names would be mangled inside the class
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self):
+        self._local_locks: dict[_LockKey, _LocalLock] = {}
+
+    @contextlib.asynccontextmanager
+    async def lock(
+        self,
+        cad_type: CadType,
+        file_type: StorableLibraryResourceType,
+        path: str,
+        timeout: float | None = None,
+    ) -> typing.AsyncIterator[None]:
+        """
+        Holds the lock of the given path. Raises TimeoutError if it cannot be
+        taken in timeout seconds (STORAGE_LOCK_TIMEOUT if not given).
+        """
+        key = (cad_type, file_type, path)
+        started_at = time.monotonic()
+        deadline = started_at + (
+            config.STORAGE_LOCK_TIMEOUT if timeout is None else timeout
+        )
+
+        local_lock = self._local_locks.setdefault(key, _LocalLock())
+        local_lock.users += 1
+        try:
+            if local_lock.lock.locked():
+                metrics.counter("path_locks.contended").inc()
+            try:
+                await asyncio.wait_for(
+                    local_lock.lock.acquire(), max(0.0, deadline - time.monotonic())
+                )
+            except TimeoutError:
+                raise self.__timeout_error(key, started_at) from None
+            try:
+                async with self.__process_lock(key, started_at, deadline):
+                    metrics.summary("path_locks.wait_seconds").observe(
+                        time.monotonic() - started_at
+                    )
+                    yield
+            finally:
+                local_lock.lock.release()
+        finally:
+            local_lock.users -= 1
+            if local_lock.users == 0:
+                del self._local_locks[key]
+
+    def __process_lock(
+        self, key: _LockKey, started_at: float, deadline: float
+    ) -> typing.AsyncContextManager[None]:
+        if config.STORAGE_LOCK_BACKEND == "postgres":
+            return self.__advisory_lock(key, started_at, deadline)
+        return self.__file_lock(key, started_at, deadline)
+
+    @contextlib.asynccontextmanager
+    async def __file_lock(
+        self, key: _LockKey, started_at: float, deadline: float
+    ) -> typing.AsyncIterator[None]:
+        cad_type, file_type, path = key
+        lock_path = pathlib.Path(config.LOCKS_DIR).joinpath(
+            cad_type.value, file_type.value, path + ".lock"
+        )
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock = filelock.FileLock(lock_path)
+        while not self.__try_file_lock(lock):
+            await self.__wait_retry(key, started_at, deadline)
+        try:
+            yield
+        finally:
+            lock.release()
+
+    @staticmethod
+    def __try_file_lock(lock: filelock.BaseFileLock) -> bool:
+        try:
+            lock.acquire(blocking=False)
+            return True
+        except filelock.Timeout:
+            return False
+
+    @contextlib.asynccontextmanager
+    async def __advisory_lock(
+        self, key: _LockKey, started_at: float, deadline: float
+    ) -> typing.AsyncIterator[None]:
+        # Transaction level lock, released when the connection transaction ends
+        lock_id = _advisory_lock_id(key)
+        async with database.sessionmanager.connect() as connection:
+            while not await connection.scalar(
+                select(func.pg_try_advisory_xact_lock(lock_id))
+            ):
+                await self.__wait_retry(key, started_at, deadline)
+            yield
+
+    async def __wait_retry(self, key: _LockKey, started_at: float, deadline: float):
+        if time.monotonic() >= deadline:
+            raise self.__timeout_error(key, started_at)
+        metrics.counter("path_locks.polls").inc()
+        await asyncio.sleep(
+            min(config.STORAGE_LOCK_POLL_INTERVAL, deadline - time.monotonic())
+        )
+
+    def __timeout_error(self, key: _LockKey, started_at: float) -> TimeoutError:
+        cad_type, file_type, path = key
+        metrics.counter("path_locks.timeouts").inc()
+        self._logger.warning(
+            helpers.BraceMessage(
+                "Path lock timed out [cad_type={0}, file_type={1}, path={2}, waited={3}]",
+                cad_type.value,
+                file_type.value,
+                path,
+                time.monotonic() - started_at,
+            )
+        )
+        return TimeoutError(
+            f"The lock of {path} could not be taken, it is being stored by another task"
+        )
+
+
+def _advisory_lock_id(key: _LockKey) -> int:
+    # Advisory locks take a signed 64-bit key
+    cad_type, file_type, path = key
+    digest = hashlib.sha256(
+        f"{cad_type.value}:{file_type.value}:{path}".encode("utf-8")
+    ).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+path_lock_manager = PathLockManager()
@@ -21,20 +21,34 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 #
+import functools
 import typing
 
-from sqlalchemy import and_, select, func
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.internal.internal_models import (
+    ComponentLoadingMode,
+    ModelFieldFilter,
+    PageCountMode,
+)
 from edaparts.models.inventory.inventory_item_model import InventoryItemModel
 from edaparts.models.inventory.inventory_item_property import InventoryItemPropertyModel
 from edaparts.models.metadata.metadata_parser import metadata_parser
+from edaparts.services import component_loader, pagination
 from edaparts.services.exceptions import MalformedSearchQueryError
-from edaparts.utils import helpers
+from edaparts.services.pagination import Page
+from edaparts.utils import helpers, si_values
 from edaparts.utils.helpers import BraceMessage as __l
 
+__RANGE_OPERATORS = ("min", "max", "mineq", "maxeq")
+__NUMERIC_OPERATORS = __RANGE_OPERATORS + ("eq",)
+
+# Number of distinct sets of filters whose parsing is kept
+__FILTER_PLANS_CACHE_SIZE = 1024
+
 
 def __generate_aggregate_filter_expression(value_col_condition, key_col_condition=None):
     return (
@@ -161,15 +175,17 @@ def __parse_item_property_filters(search_filters):
     return filters
 
 
-def __parse_filter_for_sqlalquemy_model(model, filter_model_prefix, search_filters):
-    filters = []
+@functools.lru_cache(maxsize=__FILTER_PLANS_CACHE_SIZE)
+def __parse_filter_keys(
+    model, filter_model_prefix, filter_keys: tuple[str, ...]
+) -> tuple[ModelFieldFilter, ...]:
+    # Only the keys are parsed, so the result is shared by all the requests
+    # with the same filters, whatever their values
+    field_filters = []
     item_model_metadata = metadata_parser.get_model_metadata_by_model(model)
     prefix_size = len(filter_model_prefix) + 1
-    for filter_key, filter_value in {
-        k[prefix_size:]: v
-        for k, v in search_filters.items()
-        if k.startswith(filter_model_prefix + "_")
-    }.items():
+    for key in filter_keys:
+        filter_key = key[prefix_size:]
         filter_key_split = filter_key.split("_")
         if len(filter_key_split) < 2:
             raise MalformedSearchQueryError(
@@ -194,60 +210,104 @@ def __parse_filter_for_sqlalquemy_model(model, filter_model_prefix, search_filte
                 )
             )
 
-        field_column = getattr(model, field_name)
-
-        if (
-            (field_metadata.data_type is int)
-            and helpers.is_int(filter_value)
-            and "." not in filter_value
-        ):
-            filter_condition = __create_numerical_field_filter_expression(
-                field_name, operator, int(filter_value), field_column, field_column
-            )
-        elif field_metadata.data_type is int:
-            # Field is an int but the passed value is not...
-            raise MalformedSearchQueryError(
-                __l(
-                    "Filter value for field {0} is not of the proper type {1}",
-                    field_name,
-                    field_metadata.data_type.__name__,
-                )
+        field_filters.append(
+            ModelFieldFilter(
+                key,
+                field_name,
+                operator,
+                field_metadata.data_type,
+                getattr(model, field_name),
+                (
+                    getattr(model, field_metadata.numeric_field)
+                    if field_metadata.numeric_field
+                    else None
+                ),
             )
+        )
+    return tuple(field_filters)
 
-        elif (field_metadata.data_type is float) and helpers.is_float(filter_value):
-            filter_condition = __create_numerical_field_filter_expression(
-                field_name, operator, float(filter_value), field_column, field_column
-            )
-        elif field_metadata.data_type is float:
-            # Field is a float but the passed value is not...
-            raise MalformedSearchQueryError(
-                __l(
-                    "Filter value for field {0} is not of the proper type {1}",
-                    field_name,
-                    field_metadata.data_type.__name__,
-                )
-            )
-        elif field_metadata.data_type is bool:
-            bool_value = (
-                True if filter_value and filter_value.lower() == "true" else False
-            )
-            filter_condition = __create_boolean_field_filter_expression(
-                field_name, operator, bool_value, field_column, field_column
-            )
 
-        elif field_metadata.data_type is str:
-            value = filter_value if type(filter_value) is str else str(filter_value)
-            filter_condition = __create_string_field_filter_expression(
-                field_name, operator, value, field_column, field_column
+def __create_field_filter_expression(field_filter: ModelFieldFilter, filter_value):
+    field_name = field_filter.field_name
+    operator = field_filter.operator
+    field_column = field_filter.column
+    numeric_value = (
+        si_values.parse_si_value(filter_value)
+        if field_filter.numeric_column is not None and operator in __NUMERIC_OPERATORS
+        else None
+    )
+
+    if numeric_value is not None:
+        # Textual values with a numeric shadow, e.g. 100n or 50V, are
+        # compared by their magnitude
+        return __create_numerical_field_filter_expression(
+            field_filter.numeric_column.key,
+            operator,
+            numeric_value,
+            field_filter.numeric_column,
+            field_filter.numeric_column,
+        )
+    if field_filter.numeric_column is not None and operator in __RANGE_OPERATORS:
+        raise MalformedSearchQueryError(
+            __l(
+                "Filter value for field {0} cannot be read as a number",
+                field_name,
             )
-        else:
-            raise MalformedSearchQueryError(
-                __l("Filter for field {0} is not supported", field_name)
+        )
+    if (
+        (field_filter.data_type is int)
+        and helpers.is_int(filter_value)
+        and "." not in filter_value
+    ):
+        return __create_numerical_field_filter_expression(
+            field_name, operator, int(filter_value), field_column, field_column
+        )
+    if field_filter.data_type is int:
+        # Field is an int but the passed value is not...
+        raise MalformedSearchQueryError(
+            __l(
+                "Filter value for field {0} is not of the proper type {1}",
+                field_name,
+                field_filter.data_type.__name__,
             )
+        )
+    if (field_filter.data_type is float) and helpers.is_float(filter_value):
+        return __create_numerical_field_filter_expression(
+            field_name, operator, float(filter_value), field_column, field_column
+        )
+    if field_filter.data_type is float:
+        # Field is a float but the passed value is not...
+        raise MalformedSearchQueryError(
+            __l(
+                "Filter value for field {0} is not of the proper type {1}",
+                field_name,
+                field_filter.data_type.__name__,
+            )
+        )
+    if field_filter.data_type is bool:
+        bool_value = True if filter_value and filter_value.lower() == "true" else False
+        return __create_boolean_field_filter_expression(
+            field_name, operator, bool_value, field_column, field_column
+        )
+    if field_filter.data_type is str:
+        value = filter_value if type(filter_value) is str else str(filter_value)
+        return __create_string_field_filter_expression(
+            field_name, operator, value, field_column, field_column
+        )
+    raise MalformedSearchQueryError(
+        __l("Filter for field {0} is not supported", field_name)
+    )
 
-        filters.append(filter_condition)
 
-    return filters
+def __parse_filter_for_sqlalquemy_model(model, filter_model_prefix, search_filters):
+    # Sorted, so the same filters given in other order share their parsing
+    filter_keys = tuple(
+        sorted(k for k in search_filters if k.startswith(filter_model_prefix + "_"))
+    )
+    return [
+        __create_field_filter_expression(field_filter, search_filters[field_filter.key])
+        for field_filter in __parse_filter_keys(model, filter_model_prefix, filter_keys)
+    ]
 
 
 async def search_items(
@@ -256,9 +316,13 @@ async def search_items(
     page_number: int,
     page_size: int,
     load_component: bool = False,
-):
+    cursor: str | None = None,
+    loading_mode: ComponentLoadingMode | None = None,
+    count_mode: PageCountMode = PageCountMode.EXACT,
+) -> Page[InventoryItemModel]:
     # Allow passing empty filters
     search_filters = {} if not search_filters else search_filters
+    subtype_loading = component_loader.is_subtype_loading(loading_mode)
 
     query_build = select(InventoryItemModel)
     filters = __parse_filter_for_sqlalquemy_model(
@@ -283,27 +347,38 @@ async def search_items(
         else:
             # Generic component search
             component_model = ComponentModel
-        query_build = query_build.join(InventoryItemModel.component)
+        if not subtype_loading:
+            query_build = query_build.join(InventoryItemModel.component)
+        elif component_model is ComponentModel:
+            # Join only the base table, not the polymorphic selectable
+            query_build = query_build.join(
+                component_loader.component_table,
+                InventoryItemModel.component_id
+                == component_loader.component_table.c.id,
+            )
+        else:
+            query_build = query_build.join(
+                component_model, InventoryItemModel.component_id == component_model.id
+            )
         filters = filters + __parse_filter_for_sqlalquemy_model(
             component_model, "comp", search_filters
         )
 
-    if load_component:
+    if load_component and not subtype_loading:
         # joinedload instead of selectin to avoid performance issues
         query_build = query_build.options(joinedload(InventoryItemModel.component))
 
     # todo: apply the same search strategy to other services
-    query_build = query_build.filter(*filters).order_by(InventoryItemModel.id.desc())
-    query_build = query_build.limit(page_size).offset((page_number - 1) * page_size)
-    _count_column_name = "__private_edaparts_search_items_row_count"
-    new_query = query_build.add_columns(func.count().over().label(_count_column_name))
-    rows_result = (await db.execute(new_query)).fetchall()
-    results = []
-    total = 0
-    for index in range(len(rows_result)):
-        row_data = rows_result[index]
-        if index == 0:
-            total = row_data[1]
-        results.append(row_data[0])
-
-    return results, total
+    page = await pagination.fetch_page(
+        db,
+        query_build.filter(*filters),
+        InventoryItemModel.id,
+        page_number,
+        page_size,
+        cursor=cursor,
+        count_mode=count_mode,
+    )
+
+    if load_component and subtype_loading:
+        await component_loader.attach_item_components(db, page.items)
+    return page
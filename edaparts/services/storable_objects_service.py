@@ -31,17 +31,16 @@ import re
 import shutil
 import typing
 
-import filelock
-from fastapi import BackgroundTasks
-from sqlalchemy import select, update, func, delete
+from sqlalchemy import select, update, delete
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-import edaparts.utils.models_parser
 from edaparts.app.config import Config
 from edaparts.models import FootprintReference, LibraryReference
 from edaparts.models.internal.internal_models import (
     CadType,
+    ChangedEntityType,
+    ChangeEvent,
     CreateUpdateDataStorableTask,
     BaseStorableTask,
     DeleteStorableTask,
@@ -53,9 +52,12 @@ from edaparts.models.internal.internal_models import (
     StorageStatus,
     StorableObjectRequest,
     StorableObjectDataUpdateRequest,
+    PageCountMode,
 )
-from edaparts.services import database
+from edaparts.services import database, library_cache, pagination, storage_tasks
 from edaparts.services.exceptions import ApiError
+from edaparts.services.invalidation_bus import invalidation_bus
+from edaparts.services.library_views import library_views_refresher
 from edaparts.services.exceptions import (
     ResourceAlreadyExistsApiError,
     ResourceNotFoundApiError,
@@ -63,6 +65,8 @@ from edaparts.services.exceptions import (
     InvalidSymbolApiError,
     InvalidStorableTypeError,
 )
+from edaparts.services.pagination import Page
+from edaparts.services.path_locks import path_lock_manager
 from edaparts.utils.files import hash_sha256
 from edaparts.utils.helpers import BraceMessage as __l
 
@@ -184,12 +188,18 @@ def __get_model_for_storable_type(
     )
 
 
-def __get_library(
-    file: pathlib.Path, cad_type: CadType, expected_type: StorableLibraryResourceType
+async def __get_library(
+    file: pathlib.Path,
+    cad_type: CadType,
+    expected_type: StorableLibraryResourceType,
+    wait_for_slot: bool = False,
 ):
     try:
-        # Parse the given data
-        lib = edaparts.utils.models_parser.parse_file(file, cad_type)
+        # Parse the given data out of the event loop, or reuse the result of a
+        # previous parse of the same content
+        lib = await library_cache.get_library(
+            file, cad_type, wait_for_slot=wait_for_slot
+        )
         # Be sure that the encoded data is of the expected type
         if expected_type != lib.library_type:
             raise __get_error_for_type(expected_type)(
@@ -209,7 +219,6 @@ def __get_library(
 
 async def update_object_data(
     db: AsyncSession,
-    background_tasks: BackgroundTasks,
     storable_request: StorableObjectDataUpdateRequest,
 ):
     # For the shake of simplicity do not allow to change the path
@@ -243,7 +252,7 @@ async def update_object_data(
         )
         return model
 
-    lib = __get_library(
+    lib = await __get_library(
         storable_request.filename, model.cad_type, storable_request.file_type
     )
 
@@ -273,11 +282,10 @@ async def update_object_data(
     # Reset storage status
     model.storage_status = StorageStatus.NOT_STORED
     db.add(model)
-    await db.commit()
 
-    # Signal background process to store the storable object
-    background_tasks.add_task(
-        _object_store_task,
+    # Queue the storage of the object along with the status change
+    storage_tasks.enqueue(
+        db,
         CreateUpdateDataStorableTask(
             model_id=model.id,
             filename=storable_request.filename,
@@ -288,12 +296,13 @@ async def update_object_data(
             reference=storable_request.reference or model.reference,
         ),
     )
+    await db.commit()
+    storage_tasks.storage_task_worker.notify()
     return model
 
 
 async def update_object_metadata(
     db: AsyncSession,
-    background_tasks: BackgroundTasks,
     model_id: int,
     storable_request: StorableObjectUpdateRequest,
 ):
@@ -331,7 +340,7 @@ async def update_object_metadata(
         local_path = __get_target_object_path(
             storable_request.cad_type, storable_request.file_type, model.path
         )
-        lib = __get_library(
+        lib = await __get_library(
             local_path,
             storable_request.cad_type,
             storable_request.file_type,
@@ -352,12 +361,11 @@ async def update_object_metadata(
         model.description = storable_request.description
 
     db.add(model)
-    await db.commit()
 
-    # Signal background process to store the storable object
-    if storable_request.reference != model.reference:
-        background_tasks.add_task(
-            _object_store_task,
+    # Queue the storage of the object along with the status change
+    if storable_request.reference and storable_request.reference != model.reference:
+        storage_tasks.enqueue(
+            db,
             CreateUpdateDataStorableTask(
                 model_id=model.id,
                 path=model.path,
@@ -367,6 +375,8 @@ async def update_object_metadata(
                 reference=storable_request.reference,
             ),
         )
+    await db.commit()
+    storage_tasks.storage_task_worker.notify()
     return model
 
 
@@ -382,7 +392,6 @@ def __validate_kicad_reference_change(
 
 async def create_storable_library_object(
     db: AsyncSession,
-    background_tasks: BackgroundTasks,
     storable_request: StorableObjectRequest,
 ) -> FootprintReference | LibraryReference:
     __validate_storable_type(storable_request.file_type)
@@ -391,7 +400,7 @@ async def create_storable_library_object(
     )
 
     # Parse storable object from encoded data and check its content
-    lib = __get_library(
+    lib = await __get_library(
         storable_request.filename,
         storable_request.cad_type,
         storable_request.file_type,
@@ -452,12 +461,10 @@ async def create_storable_library_object(
     )
 
     db.add(model)
-    await db.commit()
-    __logger.debug(__l("Storable object created [id={0}]", model.id))
-
-    # Signal background process to store the object
-    background_tasks.add_task(
-        _object_store_task,
+    # The id is needed by the storage task, committed along with the model
+    await db.flush()
+    storage_tasks.enqueue(
+        db,
         CreateUpdateDataStorableTask(
             model_id=model.id,
             filename=storable_request.filename,
@@ -467,13 +474,15 @@ async def create_storable_library_object(
             reference=model.reference,
         ),
     )
+    await db.commit()
+    storage_tasks.storage_task_worker.notify()
+    __logger.debug(__l("Storable object created [id={0}]", model.id))
 
     return model
 
 
 async def create_storable_library_object_from_existing_file(
     db: AsyncSession,
-    background_tasks: BackgroundTasks,
     storable_request: StorableObjectCreateReuseRequest,
 ) -> FootprintReference | LibraryReference:
     __validate_storable_type(storable_request.file_type)
@@ -516,7 +525,7 @@ async def create_storable_library_object_from_existing_file(
     local_path = __get_target_object_path(
         storable_request.cad_type, storable_request.file_type, storable_request.path
     )
-    lib = __get_library(
+    lib = await __get_library(
         local_path,
         storable_request.cad_type,
         storable_request.file_type,
@@ -564,12 +573,10 @@ async def create_storable_library_object_from_existing_file(
     )
 
     db.add(model)
-    await db.commit()
-    __logger.debug(__l("Storable object created [id={0}]", model.id))
-
-    # Signal background process to store the object
-    background_tasks.add_task(
-        _object_store_task,
+    # The id is needed by the storage task, committed along with the model
+    await db.flush()
+    storage_tasks.enqueue(
+        db,
         CreateUpdateDataStorableTask(
             model_id=model.id,
             path=model.path,
@@ -578,13 +585,15 @@ async def create_storable_library_object_from_existing_file(
             reference=model.reference,
         ),
     )
+    await db.commit()
+    storage_tasks.storage_task_worker.notify()
+    __logger.debug(__l("Storable object created [id={0}]", model.id))
 
     return model
 
 
 async def delete_object(
     db: AsyncSession,
-    background_tasks: BackgroundTasks,
     storable_type: StorableLibraryResourceType,
     model_id: int,
 ):
@@ -593,8 +602,8 @@ async def delete_object(
         model_id,
     )
     if model:
-        background_tasks.add_task(
-            _object_store_task,
+        storage_tasks.enqueue(
+            db,
             DeleteStorableTask(
                 model_id=model.id,
                 path=model.path,
@@ -602,6 +611,8 @@ async def delete_object(
                 cad_type=model.cad_type,
             ),
         )
+        await db.commit()
+        storage_tasks.storage_task_worker.notify()
 
 
 def __get_model_alias(storable_request: StorableObjectRequest) -> typing.Optional[str]:
@@ -621,46 +632,41 @@ def __get_model_alias(storable_request: StorableObjectRequest) -> typing.Optiona
     return f"EDAPARTS_{sanitized_name}"
 
 
-async def _object_store_task(storable_task: BaseStorableTask):
+async def run_storable_task(storable_task: BaseStorableTask):
+    """
+    Runs a queued storage task. Errors are raised, the task queue decides if
+    the task is retried or failed.
+    """
     async with database.sessionmanager.session() as session:
-        error = None
-        try:
-            if isinstance(storable_task, CreateUpdateDataStorableTask):
-                await __task_store_file(session, storable_task)
-            elif isinstance(storable_task, DeleteStorableTask):
-                await __task_delete_model(session, storable_task)
-        except SQLAlchemyError as err:
-            error = err
-            __logger.critical(
-                __l(
-                    "SQLAlchemyError error [model_id={0}, storable_task={1}]",
-                    storable_task.model_id,
-                    storable_task,
-                ),
-                exc_info=True,
-            )
-        except ApiError as err:
-            # Internal error that doesn't mean the task is failing, the payload may be wrong,
-            # and we should pass the message to the user
-            error = err
-            __logger.debug(err.msg)
-        finally:
-            # Remove the temporal file
-            if (
-                isinstance(storable_task, CreateUpdateDataStorableTask)
-                and storable_task.filename
-            ):
-                os.remove(storable_task.filename)
-
-        if error:
-            # Update the state to signal something failed
-            await __store_file_set_state(
-                session,
-                storable_task.model_id,
-                storable_task.file_type,
-                StorageStatus.STORAGE_FAILED,
-                error_description=str(error),
-            )
+        if isinstance(storable_task, CreateUpdateDataStorableTask):
+            if storable_task.filename and not storable_task.filename.exists():
+                raise ApiError("The uploaded file is not available anymore")
+            await __task_store_file(session, storable_task)
+        elif isinstance(storable_task, DeleteStorableTask):
+            await __task_delete_model(session, storable_task)
+    __remove_task_upload(storable_task)
+
+
+async def fail_storable_task(storable_task: BaseStorableTask, error: Exception):
+    async with database.sessionmanager.session() as session:
+        # Update the state to signal something failed
+        await __store_file_set_state(
+            session,
+            storable_task.model_id,
+            storable_task.file_type,
+            StorageStatus.STORAGE_FAILED,
+            error_description=str(error),
+        )
+    __remove_task_upload(storable_task)
+
+
+def __remove_task_upload(storable_task: BaseStorableTask):
+    # Remove the temporal file
+    if (
+        isinstance(storable_task, CreateUpdateDataStorableTask)
+        and storable_task.filename
+    ):
+        storable_task.filename.unlink(missing_ok=True)
 
 
 def __get_target_object_path(
@@ -681,7 +687,9 @@ async def __task_delete_model(
         storable_task.file_type,
         StorageStatus.DELETING,
     )
-    with __get_file_lock(storable_task):
+    async with path_lock_manager.lock(
+        storable_task.cad_type, storable_task.file_type, storable_task.path
+    ):
         target_file = __get_target_object_path(
             storable_task.cad_type, storable_task.file_type, storable_task.path
         )
@@ -695,7 +703,11 @@ async def __task_delete_model(
         await session.execute(
             delete(model_type).where(model_type.id == storable_task.model_id)
         )
+        change_events = __get_change_events(storable_task)
+        await invalidation_bus.publish(session, change_events)
         await session.commit()
+        invalidation_bus.dispatch(change_events)
+        library_views_refresher.schedule([model_type.__tablename__])
 
 
 async def __task_store_file(
@@ -714,10 +726,13 @@ async def __task_store_file(
         storable_task.file_type,
         StorageStatus.STORING,
     )
-    with __get_file_lock(storable_task):
+    async with path_lock_manager.lock(
+        storable_task.cad_type, storable_task.file_type, storable_task.path
+    ):
         await __store_file_validate(session, storable_task)
 
         model_type = __get_model_for_storable_type(storable_task.file_type)
+        change_events = []
         current_reference = (
             await session.scalars(
                 select(model_type.reference).filter(
@@ -739,6 +754,9 @@ async def __task_store_file(
                 .where(model_type.id == storable_task.model_id)
                 .values(reference=storable_task.reference)
             )
+            # Committed along with the state
+            change_events = __get_change_events(storable_task)
+            await invalidation_bus.publish(session, change_events)
 
         # Checks done, copy the content if available
         if storable_task.filename:
@@ -751,19 +769,19 @@ async def __task_store_file(
             storable_task.file_type,
             StorageStatus.STORED,
         )
+        invalidation_bus.dispatch(change_events)
+        if change_events:
+            library_views_refresher.schedule([model_type.__tablename__])
 
 
-def __get_file_lock(
-    storable_task: BaseStorableTask,
-) -> filelock.BaseFileLock:
-    lock_path = pathlib.Path(Config.LOCKS_DIR).joinpath(
-        __storable_base_dirs[storable_task.cad_type][storable_task.file_type],
-        storable_task.path + ".lock",
+def __get_change_events(storable_task: BaseStorableTask) -> list[ChangeEvent]:
+    # The components that use the object show its reference
+    entity_type = (
+        ChangedEntityType.FOOTPRINT
+        if storable_task.file_type == StorableLibraryResourceType.FOOTPRINT
+        else ChangedEntityType.SYMBOL
     )
-    lock_path_dir = lock_path.parent
-    if not lock_path_dir.exists():
-        lock_path_dir.mkdir(parents=True)
-    return filelock.FileLock(lock_path, timeout=30)
+    return [ChangeEvent(entity_type, storable_task.model_id)]
 
 
 async def __store_file_validate(
@@ -784,8 +802,12 @@ async def __store_file_validate(
         return
 
     # Parse the library again with the lock to avoid race conditions
-    library = __get_library(
-        storable_task.filename, storable_task.cad_type, storable_task.file_type
+    # Background tasks wait for a parser slot instead of failing the storage
+    library = await __get_library(
+        storable_task.filename,
+        storable_task.cad_type,
+        storable_task.file_type,
+        wait_for_slot=True,
     )
     references_list = (await __get_stored_references_for_id(session, storable_task)) + [
         storable_task.reference
@@ -909,29 +931,50 @@ async def get_storable_model_data_path(
 
 
 async def get_storable_objects(
-    db: AsyncSession, storable_type: StorableLibraryResourceType, page_number, page_size
-) -> typing.Tuple[list[FootprintReference | LibraryReference], int]:
+    db: AsyncSession,
+    storable_type: StorableLibraryResourceType,
+    page_number,
+    page_size,
+    cursor: str | None = None,
+    count_mode: PageCountMode = PageCountMode.EXACT,
+    cad_type: CadType | None = None,
+    storage_status: StorageStatus | None = None,
+    path_prefix: str | None = None,
+    reference_prefix: str | None = None,
+) -> Page[FootprintReference | LibraryReference]:
     __logger.debug(
         __l(
-            "Querying all storable objects [storable_type={0}, page_number={1}, page_size={2}]",
+            "Querying storable objects [storable_type={0}, page_number={1}, page_size={2}, cursor={3}, cad_type={4}, "
+            "storage_status={5}, path_prefix={6}, reference_prefix={7}]",
             storable_type.value,
             page_number,
             page_size,
+            cursor,
+            cad_type.value if cad_type else None,
+            storage_status.value if storage_status else None,
+            path_prefix,
+            reference_prefix,
         )
     )
 
     model_type = __get_model_for_storable_type(storable_type)
-    # todo: extract to common place
-    _count_column_name = "__private_edaparts_get_category_items_row_count"
-    new_query = select(model_type).add_columns(
-        func.count().over().label(_count_column_name)
-    )
-    rows_result = (await db.execute(new_query)).fetchall()
-    results = []
-    total = 0
-    for index in range(len(rows_result)):
-        row_data = rows_result[index]
-        if index == 0:
-            total = row_data[1]
-        results.append(row_data[0])
-    return results, total
+    query = select(model_type)
+    if cad_type is not None:
+        query = query.where(model_type.cad_type == cad_type)
+    if storage_status is not None:
+        query = query.where(model_type.storage_status == storage_status)
+    if path_prefix:
+        query = query.where(model_type.path.startswith(path_prefix, autoescape=True))
+    if reference_prefix:
+        query = query.where(
+            model_type.reference.startswith(reference_prefix, autoescape=True)
+        )
+    return await pagination.fetch_page(
+        db,
+        query,
+        model_type.id,
+        page_number,
+        page_size,
+        cursor=cursor,
+        count_mode=count_mode,
+    )
@@ -0,0 +1,464 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+import asyncio
+import datetime
+import logging
+import pathlib
+import time
+import typing
+
+from sqlalchemy import and_, delete, exists, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from edaparts.models import FootprintReference, LibraryReference, StorageTaskModel
+from edaparts.models.internal.internal_models import (
+    BaseStorableTask,
+    CreateUpdateDataStorableTask,
+    DeleteStorableTask,
+    StorableLibraryResourceType,
+    StorageStatus,
+    StorageTaskStatus,
+    StorageTaskType,
+)
+from edaparts.services import database
+from edaparts.services.exceptions import (
+    ApiError,
+    GenericIntenalApiError,
+    LibraryParserBusyError,
+    LibraryParserTimeoutError,
+)
+from edaparts.services.metrics import metrics
+from edaparts.utils import helpers
+
+# API errors that do not depend on the task payload, so retrying may succeed
+_RETRYABLE_API_ERRORS = (
+    GenericIntenalApiError,
+    LibraryParserBusyError,
+    LibraryParserTimeoutError,
+)
+
+_STORABLE_MODELS = {
+    StorableLibraryResourceType.FOOTPRINT: FootprintReference,
+    StorableLibraryResourceType.SYMBOL: LibraryReference,
+}
+
+TaskHandler = typing.Callable[[BaseStorableTask], typing.Awaitable[None]]
+TaskFailureHandler = typing.Callable[
+    [BaseStorableTask, Exception], typing.Awaitable[None]
+]
+
+
+def enqueue(db: AsyncSession, storable_task: BaseStorableTask):
+    """
+    Adds the given task to the session. It is only visible to the workers
+    once the session is committed, so the task is stored or lost along with
+    the model changes that need it.
+    """
+    is_store = isinstance(storable_task, CreateUpdateDataStorableTask)
+    db.add(
+        StorageTaskModel(
+            task_type=StorageTaskType.STORE if is_store else StorageTaskType.DELETE,
+            status=StorageTaskStatus.PENDING,
+            model_id=storable_task.model_id,
+            file_type=storable_task.file_type,
+            cad_type=storable_task.cad_type,
+            path=storable_task.path,
+            reference=storable_task.reference if is_store else None,
+            filename=(
+                str(storable_task.filename)
+                if is_store and storable_task.filename
+                else None
+            ),
+            attempts=0,
+            run_after=_now(),
+        )
+    )
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _to_storable_task(task: StorageTaskModel) -> BaseStorableTask:
+    if task.task_type == StorageTaskType.DELETE:
+        return DeleteStorableTask(
+            model_id=task.model_id,
+            path=task.path,
+            file_type=task.file_type,
+            cad_type=task.cad_type,
+        )
+    return CreateUpdateDataStorableTask(
+        model_id=task.model_id,
+        path=task.path,
+        file_type=task.file_type,
+        cad_type=task.cad_type,
+        reference=task.reference,
+        filename=pathlib.Path(task.filename) if task.filename else None,
+    )
+
+
+def _is_retryable(error: Exception) -> bool:
+    # Other API errors are caused by the payload, running it again fails again
+    return not isinstance(error, ApiError) or isinstance(error, _RETRYABLE_API_ERRORS)
+
+
+class StorageTaskWorker:
+    """
+    Runs the storage tasks persisted in the DB. Every worker process runs
+    one, and they share the queue claiming tasks with SKIP LOCKED, so a task
+    is only run by one of them. Tasks of the same model run one after the
+    other, in creation order.
+
+    Running tasks are leased and the lease is renewed while they run. The
+    tasks of a worker that dies are run again by any worker once their lease
+    expires.
+    """
+
+    # Module level dunder names would be mangled inside the class
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self):
+        self._runner: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._running: dict[int, asyncio.Task] = {}
+        self._handler: TaskHandler | None = None
+        self._failure_handler: TaskFailureHandler | None = None
+        self._concurrency = 0
+        self._poll_interval = 0.0
+        self._max_attempts = 0
+        self._retry_backoff = 0.0
+        self._retry_backoff_max = 0.0
+        self._lease = 0.0
+
+    def init(
+        self,
+        handler: TaskHandler,
+        failure_handler: TaskFailureHandler,
+        concurrency: int,
+        poll_interval: float,
+        max_attempts: int,
+        retry_backoff: float,
+        retry_backoff_max: float,
+        lease: float,
+    ):
+        """
+        Starts the worker. handler runs a task and raises if it fails.
+        failure_handler is called once a task fails for good.
+        """
+        if self._runner is not None:
+            raise Exception("StorageTaskWorker is already initialized")
+        self._handler = handler
+        self._failure_handler = failure_handler
+        self._concurrency = concurrency
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._retry_backoff = retry_backoff
+        self._retry_backoff_max = retry_backoff_max
+        self._lease = lease
+        self._wakeup = asyncio.Event()
+        self._runner = asyncio.create_task(self.__run())
+
+    async def close(self):
+        if self._runner is None:
+            return
+        runner, self._runner = self._runner, None
+        running = dict(self._running)
+        for task in (runner, *running.values()):
+            task.cancel()
+        await asyncio.gather(runner, *running.values(), return_exceptions=True)
+
+        # Give the interrupted tasks back, instead of waiting for their lease
+        if running:
+            try:
+                await self.__release(list(running.keys()))
+            except Exception:
+                self._logger.warning(
+                    "Cannot release the running storage tasks", exc_info=True
+                )
+        self._running.clear()
+
+    def notify(self):
+        """
+        Wakes the worker up, so new tasks of this process run right away
+        instead of on the next poll.
+        """
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def __run(self):
+        try:
+            await self.__recover_orphan_objects()
+        except Exception:
+            self._logger.error(
+                "Cannot recover the interrupted storable objects", exc_info=True
+            )
+
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.__renew_leases()
+                await self.__start_tasks()
+            except Exception:
+                # The DB may be temporarily unavailable, retry on the next poll
+                self._logger.error("Cannot poll the storage tasks", exc_info=True)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except TimeoutError:
+                pass
+
+    async def __start_tasks(self):
+        free_slots = self._concurrency - len(self._running)
+        if free_slots <= 0:
+            return
+        async with database.sessionmanager.session() as session:
+            now = _now()
+            earlier_task = aliased(StorageTaskModel)
+            tasks = (
+                await session.scalars(
+                    select(StorageTaskModel)
+                    .where(
+                        or_(
+                            and_(
+                                StorageTaskModel.status == StorageTaskStatus.PENDING,
+                                StorageTaskModel.run_after <= now,
+                            ),
+                            and_(
+                                StorageTaskModel.status == StorageTaskStatus.RUNNING,
+                                StorageTaskModel.lease_until < now,
+                            ),
+                        ),
+                        # Tasks of the same model wait for the previous ones
+                        ~exists().where(
+                            earlier_task.file_type == StorageTaskModel.file_type,
+                            earlier_task.model_id == StorageTaskModel.model_id,
+                            earlier_task.id < StorageTaskModel.id,
+                        ),
+                    )
+                    .order_by(StorageTaskModel.id)
+                    .limit(free_slots)
+                    .with_for_update(skip_locked=True, of=StorageTaskModel)
+                )
+            ).all()
+            for task in tasks:
+                if task.status == StorageTaskStatus.RUNNING:
+                    metrics.counter("storage_tasks.lease_expired").inc()
+                    self._logger.warning(
+                        helpers.BraceMessage(
+                            "Storage task lease expired, running it again [task_id={0}]",
+                            task.id,
+                        )
+                    )
+                else:
+                    metrics.summary("storage_tasks.queue_wait_seconds").observe(
+                        max(0.0, (now - _as_utc(task.run_after)).total_seconds())
+                    )
+                task.status = StorageTaskStatus.RUNNING
+                task.attempts += 1
+                task.lease_until = now + datetime.timedelta(seconds=self._lease)
+            await session.commit()
+
+        for task in tasks:
+            self._running[task.id] = asyncio.create_task(
+                self.__execute(task.id, task.attempts, _to_storable_task(task))
+            )
+
+    async def __execute(
+        self, task_id: int, attempts: int, storable_task: BaseStorableTask
+    ):
+        started_at = time.monotonic()
+        try:
+            await self._handler(storable_task)
+        except Exception as err:
+            # Shielded, so closing the worker does not run the task again
+            await asyncio.shield(
+                self.__on_task_error(task_id, attempts, storable_task, err)
+            )
+        else:
+            metrics.counter("storage_tasks.completed").inc()
+            await asyncio.shield(self.__delete(task_id))
+        finally:
+            metrics.summary("storage_tasks.run_seconds").observe(
+                time.monotonic() - started_at
+            )
+            self._running.pop(task_id, None)
+            # A slot is free, look for more tasks
+            self.notify()
+
+    async def __on_task_error(
+        self,
+        task_id: int,
+        attempts: int,
+        storable_task: BaseStorableTask,
+        error: Exception,
+    ):
+        try:
+            if attempts < self._max_attempts and _is_retryable(error):
+                delay = min(
+                    self._retry_backoff * 2 ** (attempts - 1), self._retry_backoff_max
+                )
+                self._logger.warning(
+                    helpers.BraceMessage(
+                        "Storage task failed, retrying [task_id={0}, attempts={1}, delay={2}, storable_task={3}]",
+                        task_id,
+                        attempts,
+                        delay,
+                        storable_task,
+                    ),
+                    exc_info=error,
+                )
+                metrics.counter("storage_tasks.retried").inc()
+                async with database.sessionmanager.session() as session:
+                    await session.execute(
+                        update(StorageTaskModel)
+                        .where(StorageTaskModel.id == task_id)
+                        .values(
+                            status=StorageTaskStatus.PENDING,
+                            run_after=_now() + datetime.timedelta(seconds=delay),
+                            lease_until=None,
+                            last_error=str(error)[:1024],
+                        )
+                    )
+                    await session.commit()
+                return
+
+            if isinstance(error, ApiError):
+                # The payload is wrong, the message is passed to the user
+                self._logger.debug(
+                    helpers.BraceMessage(
+                        "Storage task rejected [task_id={0}, error={1}]",
+                        task_id,
+                        error.msg,
+                    )
+                )
+            else:
+                self._logger.critical(
+                    helpers.BraceMessage(
+                        "Storage task failed [task_id={0}, attempts={1}, storable_task={2}]",
+                        task_id,
+                        attempts,
+                        storable_task,
+                    ),
+                    exc_info=error,
+                )
+            metrics.counter("storage_tasks.failed").inc()
+            await self._failure_handler(storable_task, error)
+            await self.__delete(task_id)
+        except Exception:
+            # The task keeps its lease, and it is run again once expired
+            self._logger.error(
+                helpers.BraceMessage(
+                    "Cannot record the storage task failure [task_id={0}]", task_id
+                ),
+                exc_info=True,
+            )
+
+    async def __delete(self, task_id: int):
+        async with database.sessionmanager.session() as session:
+            await session.execute(
+                delete(StorageTaskModel).where(StorageTaskModel.id == task_id)
+            )
+            await session.commit()
+
+    async def __renew_leases(self):
+        if not self._running:
+            return
+        async with database.sessionmanager.session() as session:
+            await session.execute(
+                update(StorageTaskModel)
+                .where(StorageTaskModel.id.in_(list(self._running.keys())))
+                .values(lease_until=_now() + datetime.timedelta(seconds=self._lease))
+            )
+            await session.commit()
+
+    async def __release(self, task_ids: list[int]):
+        async with database.sessionmanager.session() as session:
+            await session.execute(
+                update(StorageTaskModel)
+                .where(StorageTaskModel.id.in_(task_ids))
+                .values(status=StorageTaskStatus.PENDING, lease_until=None)
+            )
+            await session.commit()
+
+    async def __recover_orphan_objects(self):
+        # Objects that wait for a task that does not exist, e.g. the ones
+        # whose storage was interrupted before the task queue existed
+        async with database.sessionmanager.session() as session:
+            for file_type, model_type in _STORABLE_MODELS.items():
+                has_task = exists().where(
+                    StorageTaskModel.file_type == file_type,
+                    StorageTaskModel.model_id == model_type.id,
+                )
+                orphans = (
+                    await session.scalars(
+                        select(model_type)
+                        .where(
+                            model_type.storage_status.in_(
+                                (
+                                    StorageStatus.NOT_STORED,
+                                    StorageStatus.STORING,
+                                    StorageStatus.DELETING,
+                                )
+                            ),
+                            ~has_task,
+                        )
+                        .with_for_update(skip_locked=True)
+                    )
+                ).all()
+                for model in orphans:
+                    self._logger.warning(
+                        helpers.BraceMessage(
+                            "Recovering interrupted storable object [file_type={0}, model_id={1}, storage_status={2}]",
+                            file_type.value,
+                            model.id,
+                            model.storage_status.value,
+                        )
+                    )
+                    if model.storage_status == StorageStatus.DELETING:
+                        # The file is not needed, just finish the deletion
+                        enqueue(
+                            session,
+                            DeleteStorableTask(
+                                model_id=model.id,
+                                path=model.path,
+                                file_type=file_type,
+                                cad_type=model.cad_type,
+                            ),
+                        )
+                    else:
+                        # The uploaded file is gone
+                        model.storage_status = StorageStatus.STORAGE_FAILED
+                        model.storage_error = (
+                            "The storage was interrupted, upload the file again"
+                        )
+                await session.commit()
+
+
+def _as_utc(value: datetime.datetime) -> datetime.datetime:
+    # Drivers without time zone support return naive datetimes
+    return value if value.tzinfo else value.replace(tzinfo=datetime.timezone.utc)
+
+
+storage_task_worker = StorageTaskWorker()
@@ -31,11 +31,16 @@ import tempfile
 import uuid
 from typing import BinaryIO
 
+from edaparts.app.config import config
+
 
 class TempCopiedFile:
 
     def __init__(self, binary_io: BinaryIO):
-        temp_dir = tempfile.gettempdir()
+        # Uploads are kept until their storage task ends, that may be after a
+        # restart, so they are not written to the system temporal directory
+        temp_dir = config.UPLOADS_DIR or tempfile.gettempdir()
+        os.makedirs(temp_dir, exist_ok=True)
         self.path = pathlib.Path(os.path.join(temp_dir, uuid.uuid4().hex))
         with open(self.path, "wb") as f_dest:
             shutil.copyfileobj(binary_io, f_dest)
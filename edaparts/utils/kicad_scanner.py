@@ -0,0 +1,159 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+"""
+Lightweight scanner of KiCad symbol libraries and footprints.
+
+It only extracts the names and descriptions of the top level symbols and
+footprints, skipping everything else, instead of building the whole kiutils
+object graph. Tokens follow the kiutils s-expression rules, so the results
+are the same ones kiutils gives.
+"""
+
+import dataclasses
+import mmap
+import pathlib
+import re
+
+# Same string rules as kiutils: a quote preceded by a backslash does not end
+# the string, and strings end before a closing bracket or a whitespace
+_STRING_RE = re.compile(rb'"(?:[^"]|(?<=\\)")*"(?:(?=\))|(?=\s))')
+# An opening bracket (capturing the expression head), a closing one or a quote
+_TOKEN_RE = re.compile(rb'\(\s*([^()\s"]*)|(\))|"')
+_ARG_RE = re.compile(
+    rb'\s*(?:(?P<string>"(?:[^"]|(?<=\\)")*"(?:(?=\))|(?=\s)))|(?P<atom>[^()\s]+))'
+)
+_NUMBER_RE = re.compile(r"[+-]?\d+\.\d+|-?\d+")
+
+_SYMBOL_LIB = b"kicad_symbol_lib"
+_FOOTPRINT = b"footprint"
+
+
+class KiCadScanError(Exception):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class KiCadScanResult:
+    lib_type: str
+    # (name, description) of each top level symbol or footprint, in file order
+    entries: list[tuple[str, str | None]]
+
+
+def scan_file(path: pathlib.Path) -> KiCadScanResult:
+    with open(path, "rb") as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            raise KiCadScanError("The file is empty")
+        with data:
+            return scan(data)
+
+
+def scan(data: bytes | mmap.mmap) -> KiCadScanResult:
+    entries: list[list] = []
+    current: list | None = None
+    lib_type: bytes | None = None
+    depth = 0
+    pos = 0
+    while (match := _TOKEN_RE.search(data, pos)) is not None:
+        head = match.group(1)
+        pos = match.end()
+        if head is None:
+            if match.group(2) is None:
+                string_match = _STRING_RE.match(data, match.start())
+                if string_match is not None:
+                    pos = string_match.end()
+                continue
+
+            depth -= 1
+            if depth == 0:
+                # kiutils only takes the first expression of the file
+                break
+            if depth < 0:
+                raise KiCadScanError("Unbalanced brackets")
+            continue
+
+        depth += 1
+        if depth == 1:
+            lib_type = head
+            if head == _FOOTPRINT:
+                name, pos = _read_arg(data, pos)
+                current = [_entry_name(name, nickname_only=True), None, False]
+                entries.append(current)
+            elif head != _SYMBOL_LIB:
+                break
+        elif lib_type == _SYMBOL_LIB:
+            if depth == 2 and head == b"symbol":
+                name, pos = _read_arg(data, pos)
+                current = [_entry_name(name), None, False]
+                entries.append(current)
+            elif depth == 3 and head == b"property" and current and not current[2]:
+                key, pos = _read_arg(data, pos)
+                if key == "Description":
+                    # Only the first description property counts
+                    current[1], pos = _read_arg(data, pos)
+                    current[2] = True
+        elif depth == 2 and head == b"descr" and current:
+            # The last descr token counts
+            current[1], pos = _read_arg(data, pos)
+    else:
+        if lib_type is None:
+            raise KiCadScanError("No expression found")
+        if depth != 0:
+            raise KiCadScanError("Unbalanced brackets")
+
+    return KiCadScanResult(
+        lib_type=lib_type.decode("utf-8"),
+        entries=[(name, description) for name, description, _ in entries],
+    )
+
+
+def _read_arg(data: bytes | mmap.mmap, pos: int) -> tuple[str | int | float, int]:
+    arg_match = _ARG_RE.match(data, pos)
+    if arg_match is None:
+        raise KiCadScanError("Missing expression argument")
+    string = arg_match.group("string")
+    if string is not None:
+        return string[1:-1].decode("utf-8").replace('\\"', '"'), arg_match.end()
+    atom = arg_match.group("atom").decode("utf-8")
+    if _NUMBER_RE.fullmatch(atom):
+        number = float(atom)
+        return int(number) if number.is_integer() else number, arg_match.end()
+    return atom, arg_match.end()
+
+
+def _entry_name(lib_id, nickname_only: bool = False):
+    # Same lib_id split as kiutils: "<nickname>:<entry>" for both symbols and
+    # footprints, and "<entry>_<unit>_<style>" for symbols
+    nickname_match = re.match(r"^(.+?):(.+?)$", str(lib_id))
+    if nickname_match:
+        return nickname_match.group(2)
+    if not nickname_only:
+        unit_match = re.match(r"^(.+?)_(\d+?)_(\d+?)$", str(lib_id))
+        if unit_match:
+            return unit_match.group(1)
+    return lib_id
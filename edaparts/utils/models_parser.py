@@ -35,6 +35,7 @@ from olefile import olefile
 
 from edaparts.models.internal.internal_models import CadType
 from edaparts.services.exceptions import ApiError
+from edaparts.utils import kicad_scanner
 from edaparts.models.internal.internal_models import StorableLibraryResourceType
 
 __logger = logging.getLogger(__name__)
@@ -66,46 +67,17 @@ class Library:
         return len(self.models)
 
 
-def _parse_kicad_lib(path: pathlib.Path) -> dict[str, FootprintModel | SymbolModel]:
+def _parse_kicad_lib(
+    path: pathlib.Path, deep_validation: bool = False
+) -> dict[str, FootprintModel | SymbolModel]:
     models: dict[str, FootprintModel | SymbolModel] = {}
     parse_paths = path.glob("*.kicad_mod") if path.is_dir() else [path]
     try:
         for model_path in parse_paths:
-            parsed_expression = sexpr.parse_sexp(model_path.read_text(encoding="utf-8"))
-            if (
-                parsed_expression is None
-                or (not isinstance(parsed_expression, list))
-                or len(parsed_expression) == 0
-            ):
-                raise ApiError(f"Cannot fetch the library type for {model_path}")
-            lib_type = parsed_expression[0]
-            if lib_type == "kicad_symbol_lib":
-                for parsed_symbol in SymbolLib().from_sexpr(parsed_expression).symbols:
-                    description_property = next(
-                        (
-                            prop
-                            for prop in parsed_symbol.properties
-                            if prop.key == "Description"
-                        ),
-                        None,
-                    )
-                    lib_model = SymbolModel(
-                        name=parsed_symbol.entryName,
-                        description=(
-                            description_property.value if description_property else None
-                        ),
-                    )
-                    models[lib_model.name] = lib_model
-
-            elif lib_type == "footprint":
-                footprint_model = Footprint().from_sexpr(parsed_expression)
-                lib_model = FootprintModel(
-                    name=footprint_model.entryName,
-                    description=footprint_model.description,
-                )
-                models[lib_model.name] = lib_model
+            if deep_validation:
+                _parse_kicad_model(model_path, models)
             else:
-                raise ApiError(f"Unrecognized/unsupported KiCAD model type {lib_type}")
+                _scan_kicad_model(model_path, models)
     except (IOError, UnicodeDecodeError) as err:
         raise ApiError(
             f"Cannot read KiCad lib {path}", http_code=400, details=str(err)
@@ -114,71 +86,128 @@ def _parse_kicad_lib(path: pathlib.Path) -> dict[str, FootprintModel | SymbolMod
     return models
 
 
-def _parse_key_value_string(s):
-    properties = s.decode("utf-8").strip("|").split("|")
+def _scan_kicad_model(
+    model_path: pathlib.Path, models: dict[str, FootprintModel | SymbolModel]
+):
+    # Only pulls names and descriptions, the rest of the file is skipped
+    try:
+        scan_result = kicad_scanner.scan_file(model_path)
+    except kicad_scanner.KiCadScanError as err:
+        raise ApiError(
+            f"Cannot parse KiCad lib {model_path}", http_code=400, details=str(err)
+        ) from err
+    if scan_result.lib_type == "kicad_symbol_lib":
+        model_type = SymbolModel
+    elif scan_result.lib_type == "footprint":
+        model_type = FootprintModel
+    else:
+        raise ApiError(
+            f"Unrecognized/unsupported KiCAD model type {scan_result.lib_type}"
+        )
+    for name, description in scan_result.entries:
+        models[name] = model_type(name=name, description=description)
+
+
+def _parse_kicad_model(
+    model_path: pathlib.Path, models: dict[str, FootprintModel | SymbolModel]
+):
+    # Full kiutils parsing, that validates the whole file structure
+    parsed_expression = sexpr.parse_sexp(model_path.read_text(encoding="utf-8"))
+    if (
+        parsed_expression is None
+        or (not isinstance(parsed_expression, list))
+        or len(parsed_expression) == 0
+    ):
+        raise ApiError(f"Cannot fetch the library type for {model_path}")
+    lib_type = parsed_expression[0]
+    if lib_type == "kicad_symbol_lib":
+        for parsed_symbol in SymbolLib().from_sexpr(parsed_expression).symbols:
+            description_property = next(
+                (
+                    prop
+                    for prop in parsed_symbol.properties
+                    if prop.key == "Description"
+                ),
+                None,
+            )
+            lib_model = SymbolModel(
+                name=parsed_symbol.entryName,
+                description=(
+                    description_property.value if description_property else None
+                ),
+            )
+            models[lib_model.name] = lib_model
+
+    elif lib_type == "footprint":
+        footprint_model = Footprint().from_sexpr(parsed_expression)
+        lib_model = FootprintModel(
+            name=footprint_model.entryName,
+            description=footprint_model.description,
+        )
+        models[lib_model.name] = lib_model
+    else:
+        raise ApiError(f"Unrecognized/unsupported KiCAD model type {lib_type}")
+
+
+# Storages of a SchLib that are not symbols
+_SCHLIB_NON_PART_STORAGES = frozenset(
+    ["FileHeader", "Storage", "SectionKeys", "FileVersionInfo"]
+)
+_SYMBOL_PROPERTIES = frozenset(["componentdescription"])
+_FOOTPRINT_PROPERTIES = frozenset(["name", "description"])
+
+
+def _parse_key_value_string(s, keys: frozenset[str] = None) -> dict[str, str]:
+    # Accepts bytes-like objects (memoryview slices are decoded without
+    # copying them first) or already decoded text
+    properties = (s if isinstance(s, str) else str(s, "utf-8")).strip("|").split("|")
     result = {}
     for prop in properties:
-        x = prop.split("=")
-        key = x[0]
-        if len(x) > 1:
-            value = x[1]
-        else:
-            value = ""
-        result[key.lower() if isinstance(key, str) else key] = value
+        key, _, value = prop.partition("=")
+        key = key.lower()
+        if keys is None or key in keys:
+            # Only the text up to the next '=' is the value
+            result[key] = value.partition("=")[0]
 
     return result
 
 
 def _get_u32(buffer):
-    (word,) = struct.unpack("<I", buffer[:4])
+    (word,) = struct.unpack_from("<I", buffer)
     return word
 
 
-def _read_stream(oleobj, path):
-    f = oleobj.openstream(path)
-    c = True
-    buffer = bytes()
-    while c:
-        c = f.read(1)
-        if c:
-            buffer += c
-    f.close()
-    return buffer
+def _read_stream(oleobj, path) -> memoryview:
+    # OleStream already holds the whole stream in memory. getvalue() hands its
+    # bytes without copying them, and the view allows slicing them for free
+    with oleobj.openstream(path) as stream:
+        return memoryview(stream.getvalue())
 
 
-def _get_symbols_data(olebj):
+def _get_symbols_data(olebj, keys: frozenset[str] = None):
     parts = {}
     for part in olebj.listdir(streams=True, storages=False):
         if (
-            part[0]
-            not in ["FileHeader", "Storage", "SectionKeys", "FileVersionInfo"]
-            + list(parts.keys())
-            and len(part) == 2
+            len(part) == 2
+            and part[0] not in _SCHLIB_NON_PART_STORAGES
+            and part[0] not in parts
         ):
-            # Part streams not used
-            data_path = f"{part[0]}/Data"
-            buffer = _read_stream(olebj, data_path)
-
-            # Properties
-            length = _get_u32(buffer[:4])
-            props = _parse_key_value_string(buffer[4 : 4 + length])
-            parts[part[0]] = props
+            # Only the first record (the part properties) is decoded, the
+            # remaining ones (pins, graphics...) are not used
+            buffer = _read_stream(olebj, f"{part[0]}/Data")
+            length = _get_u32(buffer)
+            parts[part[0]] = _parse_key_value_string(buffer[4 : 4 + length], keys)
     return parts
 
 
-def _get_toc_data(buffer):
+def _get_toc_data(buffer, keys: frozenset[str] = None):
     # first four bytes are total string length
     # last byte is 0x00
     footprints = []
     if _get_u32(buffer) + 4 == len(buffer):
-        buffer = buffer[4:-1]
-        entries = (
-            buffer.replace(b"\x0D\x0A", str.encode("\n"))
-            .strip()
-            .split(str.encode("\n"))
-        )
+        entries = str(buffer[4:-1], "utf-8").replace("\r\n", "\n").strip().split("\n")
         for entry in entries:
-            footprints.append(_parse_key_value_string(entry))
+            footprints.append(_parse_key_value_string(entry, keys))
     else:
         __logger.warning("Cannot read TOC data from lib. Buffer length mismatch")
     return footprints
@@ -189,13 +218,11 @@ def _parse_olefile_library(byte_data) -> dict[str, FootprintModel | SymbolModel]
     with olefile.OleFileIO(byte_data) as ole:
         # Figure out what kind of file it is
         if ole.exists("FileHeader"):
-            fh = ole.openstream("FileHeader")
-            contents = fh.read()
-            fh.close()
+            contents = _read_stream(ole, "FileHeader").tobytes()
 
             if b"PCB" in contents and b"Binary Library" in contents:
                 buffer = _read_stream(ole, "Library/ComponentParamsTOC/Data")
-                parts = _get_toc_data(buffer)
+                parts = _get_toc_data(buffer, _FOOTPRINT_PROPERTIES)
                 for part in parts:
                     name = part.get("name", None)
                     lib_parts[name] = FootprintModel(
@@ -203,7 +230,9 @@ def _parse_olefile_library(byte_data) -> dict[str, FootprintModel | SymbolModel]
                         description=part.get("description", None),
                     )
             elif b"Schematic Library" in contents:
-                for part_k, part_v in _get_symbols_data(ole).items():
+                for part_k, part_v in _get_symbols_data(
+                    ole, _SYMBOL_PROPERTIES
+                ).items():
                     lib_parts[part_k] = SymbolModel(
                         name=part_k,
                         description=part_v.get("componentdescription", None),
@@ -214,9 +243,16 @@ def _parse_olefile_library(byte_data) -> dict[str, FootprintModel | SymbolModel]
     return lib_parts
 
 
-def parse_file(path: pathlib.Path, cad_type: CadType) -> Library:
+def parse_file(
+    path: pathlib.Path, cad_type: CadType, deep_validation: bool = False
+) -> Library:
+    """
+    Parses the given library. KiCad libraries are scanned for the model names
+    and descriptions only, unless deep_validation is set, that parses (and
+    validates) the whole file with kiutils.
+    """
     if cad_type == CadType.KICAD:
-        models = _parse_kicad_lib(path)
+        models = _parse_kicad_lib(path, deep_validation=deep_validation)
     elif cad_type == CadType.ALTIUM:
         models = _parse_olefile_library(path)
     else:
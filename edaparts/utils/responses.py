@@ -0,0 +1,51 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import functools
+import typing
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from edaparts.app.config import config
+
+
+@functools.cache
+def __get_type_adapter(response_type) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def json_response(content: typing.Any, response_type) -> typing.Any:
+    """
+    Serializes the DTOs returned by a read route straight to JSON bytes.
+    Returning a Response skips the validation of the content against the
+    response model and the FastAPI JSON encoding, both redundant for DTOs
+    just built by the route. Routes that use it declare their response_model
+    in the decorator, so the API schema is kept.
+    """
+    if not config.FAST_JSON_RESPONSES:
+        return content
+    return Response(
+        __get_type_adapter(response_type).dump_json(content, by_alias=True),
+        media_type="application/json",
+    )
@@ -0,0 +1,127 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import re
+
+# Multipliers of the SI prefixes. Femto is left out, as an "f" is more likely
+# a Farad than a prefix in component values
+_SI_PREFIXES = {
+    "p": 1e-12,
+    "n": 1e-9,
+    "u": 1e-6,
+    "µ": 1e-6,
+    "μ": 1e-6,
+    "m": 1e-3,
+    "k": 1e3,
+    "K": 1e3,
+    "M": 1e6,
+    "G": 1e9,
+}
+
+# Units found in the component values, lowercase. The value is returned in
+# the unit itself, e.g. Farads or %
+_UNITS = {
+    "",
+    "f",
+    "v",
+    "vdc",
+    "vac",
+    "a",
+    "w",
+    "h",
+    "hz",
+    "s",
+    "ω",
+    "r",
+    "ohm",
+    "ohms",
+    "%",
+    "ppm",
+    "c",
+    "°c",
+    "ºc",
+    "°",
+    "º",
+}
+
+_NUMBER_PATTERN = re.compile(r"([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)\s*(.*)")
+_FRACTION_PATTERN = re.compile(r"(\d+)\s*/\s*(\d+)\s*(.*)")
+# Prefix, R or unit in place of the decimal point, e.g. 4k7, 4R7 or 3V3
+_INFIX_UNITS = {"R", "V", "A", "W"}
+_INFIX_PATTERN = re.compile(r"(\d+)([pnuµμmkKMGRVAW])(\d+)(.*)")
+
+# Values are rounded to this number of significant digits, so the same value
+# written in different ways (100n, 0.1u) gives the same number
+_SIGNIFICANT_DIGITS = 12
+
+
+def __unit_multiplier(unit: str) -> float | None:
+    unit = unit.replace(" ", "")
+    if unit.lower() in _UNITS:
+        return 1.0
+    if unit.lower().startswith("meg") and unit.lower()[3:] in _UNITS:
+        return 1e6
+    if unit[0] in _SI_PREFIXES and unit[1:].lower() in _UNITS:
+        return _SI_PREFIXES[unit[0]]
+    return None
+
+
+def parse_si_value(value: str | None) -> float | None:
+    """
+    Parses a component value as written by people, e.g. 100n, 4.7 kΩ, 4k7, 3V3,
+    1/4 W, ±1% or -40 ºC, into a number in its base unit. Returns None if the
+    value is not a single number, like ranges or text.
+    """
+    if not value:
+        return None
+    text = value.strip().replace("−", "-")
+    text = text.removeprefix("±").removeprefix("+/-").lstrip()
+
+    match = _INFIX_PATTERN.fullmatch(text)
+    if match:
+        integer, infix, decimals, unit = match.groups()
+        number = float(f"{integer}.{decimals}")
+        multiplier = __unit_multiplier(unit)
+        if multiplier is None or (infix != "R" and multiplier != 1.0):
+            return None
+        # A unit can only be followed by itself, e.g. 3V3 or 3V3V
+        if infix in _INFIX_UNITS - {"R"} and unit.strip() not in ("", infix):
+            return None
+        multiplier = 1.0 if infix in _INFIX_UNITS else _SI_PREFIXES[infix]
+    else:
+        match = _FRACTION_PATTERN.fullmatch(text) or _NUMBER_PATTERN.fullmatch(text)
+        if not match:
+            return None
+        if match.re is _FRACTION_PATTERN:
+            numerator, denominator, unit = match.groups()
+            if int(denominator) == 0:
+                return None
+            number = int(numerator) / int(denominator)
+        else:
+            number, unit = float(match.group(1)), match.group(2)
+        multiplier = __unit_multiplier(unit)
+        if multiplier is None:
+            return None
+    return float(f"{number * multiplier:.{_SIGNIFICANT_DIGITS}g}")
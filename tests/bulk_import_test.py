@@ -0,0 +1,212 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+"""
+Bulk component imports on a PostgreSQL database, given by the
+TEST_DB_CONNECTION_STRING variable. Its content is dropped!
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import func, select
+
+from edaparts.models.components.capacitor_ceramic_model import CapacitorCeramicModel
+from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.components.resistor_model import ResistorModel
+from edaparts.models.internal.internal_models import (
+    BulkImportMode,
+    BulkImportRowStatus,
+)
+from edaparts.models.inventory import InventoryItemModel
+from edaparts.services import component_service, inventory_service
+from edaparts.services.database import sessionmanager
+from edaparts.services.exceptions import ApiError
+
+_DB_URL = os.getenv("TEST_DB_CONNECTION_STRING")
+
+# Savepoints and the sequence backed DICIs behave as in production only in
+# PostgreSQL
+pytestmark = pytest.mark.skipif(
+    not (_DB_URL or "").startswith("postgresql"),
+    reason="TEST_DB_CONNECTION_STRING is not a PostgreSQL database",
+)
+
+
+@pytest.fixture(autouse=True)
+def dici_numbers(monkeypatch):
+    # The schema, and so the DICI sequence, is created again by each test
+    monkeypatch.setattr(
+        inventory_service, "__dici_numbers", inventory_service._DiciNumbers()
+    )
+
+
+def _resistor(mpn: str, manufacturer: str | None = "Test Inc.") -> ResistorModel:
+    return ResistorModel(
+        mpn=mpn,
+        manufacturer=manufacturer,
+        value="10k",
+        package="0603",
+        description=f"Resistor {mpn}",
+        power_max="0.1W",
+    )
+
+
+def _capacitor(mpn: str) -> CapacitorCeramicModel:
+    return CapacitorCeramicModel(
+        mpn=mpn,
+        manufacturer="Test Inc.",
+        value="100n",
+        package="0603",
+        description=f"Capacitor {mpn}",
+        voltage="50V",
+    )
+
+
+def _import(entries, mode, setup=None):
+    async def run():
+        sessionmanager.init(_DB_URL)
+        try:
+            async with sessionmanager.connect() as connection:
+                await sessionmanager.drop_all(connection)
+                await sessionmanager.create_all(connection)
+            if setup:
+                async with sessionmanager.session() as db:
+                    await setup(db)
+            async with sessionmanager.session() as db:
+                results = await component_service.bulk_create_components(
+                    db, entries, mode
+                )
+            async with sessionmanager.session() as db:
+                mpns = set(await db.scalars(select(ComponentModel.mpn)))
+                items = await db.scalar(select(func.count(InventoryItemModel.id)))
+            return results, mpns, items
+        finally:
+            await sessionmanager.close()
+
+    return asyncio.run(run())
+
+
+async def _create_existing(db):
+    await component_service.create_component(db, _resistor("R-EXISTING"))
+    db.add(
+        InventoryItemModel(
+            mpn="R-ITEM",
+            manufacturer="Test Inc.",
+            name="R-ITEM",
+            dici="ITEM-STANDALONE",
+        )
+    )
+    await db.commit()
+
+
+def test_bulk_row_statuses():
+    results, mpns, items = _import(
+        [
+            _resistor("R-1"),
+            _resistor("R-1"),
+            _resistor("R-EXISTING"),
+            _resistor("R-ITEM"),
+            ApiError("Unknown component type", http_code=400),
+        ],
+        BulkImportMode.PARTIAL,
+        setup=_create_existing,
+    )
+    assert [r.status for r in results] == [
+        BulkImportRowStatus.CREATED,
+        BulkImportRowStatus.DUPLICATED,
+        BulkImportRowStatus.EXISTS,
+        BulkImportRowStatus.EXISTS,
+        BulkImportRowStatus.INVALID,
+    ]
+    assert results[0].component_id and results[0].dici
+    # Existing components are given, standalone items are not
+    assert results[2].component_id is not None
+    assert results[3].component_id is None
+    assert mpns == {"R-EXISTING", "R-1"}
+    # The existing component and standalone items, and the created one
+    assert items == 3
+
+
+def test_bulk_atomic_conflict_creates_nothing():
+    results, mpns, items = _import(
+        [_resistor("R-1"), _capacitor("C-1"), _resistor("R-EXISTING")],
+        BulkImportMode.ATOMIC,
+        setup=_create_existing,
+    )
+    assert [r.status for r in results] == [
+        BulkImportRowStatus.SKIPPED,
+        BulkImportRowStatus.SKIPPED,
+        BulkImportRowStatus.EXISTS,
+    ]
+    assert mpns == {"R-EXISTING"}
+    assert items == 2
+
+
+def test_bulk_partial_keeps_good_batches(monkeypatch):
+    monkeypatch.setattr(component_service, "__BULK_BATCH_SIZE", 2)
+    results, mpns, items = _import(
+        [
+            _resistor("R-1"),
+            _resistor("R-2"),
+            # Components need a manufacturer, so this batch fails on insert
+            _resistor("R-3", manufacturer=None),
+            _resistor("R-4"),
+            _capacitor("C-1"),
+        ],
+        BulkImportMode.PARTIAL,
+    )
+    assert [r.status for r in results] == [
+        BulkImportRowStatus.CREATED,
+        BulkImportRowStatus.CREATED,
+        BulkImportRowStatus.FAILED,
+        BulkImportRowStatus.FAILED,
+        BulkImportRowStatus.CREATED,
+    ]
+    assert results[2].error
+    assert mpns == {"R-1", "R-2", "C-1"}
+    assert items == 3
+
+
+def test_bulk_atomic_failed_batch_rolls_back(monkeypatch):
+    monkeypatch.setattr(component_service, "__BULK_BATCH_SIZE", 2)
+    results, mpns, items = _import(
+        [
+            _resistor("R-1"),
+            _resistor("R-2"),
+            # Components need a manufacturer, so this batch fails on insert
+            _resistor("R-3", manufacturer=None),
+            _capacitor("C-1"),
+        ],
+        BulkImportMode.ATOMIC,
+    )
+    # The batch created before the failure is rolled back too
+    assert [r.status for r in results] == [
+        BulkImportRowStatus.SKIPPED,
+        BulkImportRowStatus.SKIPPED,
+        BulkImportRowStatus.FAILED,
+        BulkImportRowStatus.SKIPPED,
+    ]
+    assert mpns == set()
+    assert items == 0
@@ -0,0 +1,61 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+from edaparts.models.components.capacitor_ceramic_model import CapacitorCeramicModel
+from edaparts.services import component_search
+
+
+def test_parse_search_terms():
+    assert component_search.parse_search_terms("100n 0603 X7R 50V") == [
+        "100n",
+        "0603",
+        "x7r",
+        "50v",
+    ]
+    # Separators inside the words are kept, lone symbols and repeats are not
+    assert component_search.parse_search_terms("LM317T/NOPB  1.5k - 10% 1.5k") == [
+        "lm317t/nopb",
+        "1.5k",
+        "10%",
+    ]
+    assert component_search.parse_search_terms("' & :*") == []
+
+
+def test_build_tsquery():
+    assert component_search.build_tsquery(["100n", "x7r"]) == "'100n':* & 'x7r':*"
+
+
+def test_build_search_document():
+    model = CapacitorCeramicModel(
+        mpn="GRM188R71H104KA93D",
+        manufacturer="Murata",
+        value="100n",
+        package="0603 (1608 Metric)",
+        description="",
+        voltage="50V",
+        composition="X7R",
+    )
+    assert (
+        component_search.build_search_document(model)
+        == "GRM188R71H104KA93D Murata 100n 0603 (1608 Metric) 50V X7R"
+    )
@@ -0,0 +1,80 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import datetime
+import typing
+
+import pytest
+from sqlalchemy import inspect
+
+from edaparts.dtos import components_dtos
+from edaparts.dtos.components.common_dtos import ComponentCommentToolFields
+
+
+def _build_model(model_type, loaded: bool):
+    now = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    model = model_type(
+        id=7,
+        type=model_type.__tablename__,
+        created_on=now,
+        updated_on=now,
+        mpn="CRCW0603392RFKEAC",
+        manufacturer="Vishay / Dale",
+        value="392 Ohms",
+        description="Thin Film Resistor 392 Ohms 1%",
+        comment_kicad="${VALUE}",
+        is_through_hole=False,
+    )
+    if loaded:
+        # Rows loaded from the DB have all their columns set
+        for attr in inspect(model_type).column_attrs:
+            if attr.key not in model.__dict__:
+                setattr(model, attr.key, None)
+    return model
+
+
+def _validated_dto(model):
+    dto_t = components_dtos._model_to_query_dto[type(model)]
+    dto_data = {
+        c.key: getattr(model, c.key)
+        for c in inspect(model).mapper.column_attrs
+        if c.key in dto_t.model_fields
+    }
+    dto_data["component_type"] = typing.get_args(
+        dto_t.model_fields["component_type"].annotation
+    )[0]
+    dto = dto_t(**dto_data)
+    dto.comment = ComponentCommentToolFields.from_model(model)
+    return dto
+
+
+@pytest.mark.parametrize("loaded", [True, False])
+@pytest.mark.parametrize("model_type", list(components_dtos._model_to_query_dto))
+def test_map_component_model_to_query_dto(model_type, loaded):
+    model = _build_model(model_type, loaded)
+
+    mapped = components_dtos.map_component_model_to_query_dto(model)
+
+    assert type(mapped) is components_dtos._model_to_query_dto[model_type]
+    assert mapped == _validated_dto(model)
+    assert mapped.comment == ComponentCommentToolFields(kicad="${VALUE}")
@@ -0,0 +1,94 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import asyncio
+import json
+
+from edaparts.models.internal.internal_models import ChangedEntityType, ChangeEvent
+from edaparts.services.invalidation_bus import (
+    InvalidationBus,
+    _decode_events,
+    _encode_events,
+)
+from edaparts.services.local_cache import LocalCache, local_caches
+
+
+def test_events_round_trip():
+    events = [
+        ChangeEvent(ChangedEntityType.COMPONENT, 1),
+        ChangeEvent(ChangedEntityType.COMPONENT, 1),
+        ChangeEvent(ChangedEntityType.SYMBOL),
+    ]
+    origin, decoded = _decode_events(_encode_events("origin", events))
+    assert origin == "origin"
+    assert decoded == [
+        ChangeEvent(ChangedEntityType.COMPONENT, 1),
+        ChangeEvent(ChangedEntityType.SYMBOL),
+    ]
+
+
+def test_events_collapsed_if_too_long():
+    events = [ChangeEvent(ChangedEntityType.COMPONENT, i) for i in range(5000)]
+    events.append(ChangeEvent(ChangedEntityType.FOOTPRINT, 1))
+    payload = _encode_events("origin", events)
+    assert len(payload) < 8000
+    assert _decode_events(payload)[1] == [
+        ChangeEvent(ChangedEntityType.COMPONENT),
+        ChangeEvent(ChangedEntityType.FOOTPRINT),
+    ]
+
+
+def test_dispatch_other_workers_events():
+    bus = InvalidationBus()
+    received = []
+    bus.subscribe(ChangedEntityType.COMPONENT, received.append)
+    bus.subscribe(ChangedEntityType.SYMBOL, lambda _: 1 / 0)
+    bus.subscribe(ChangedEntityType.SYMBOL, received.append)
+
+    events = [
+        ChangeEvent(ChangedEntityType.COMPONENT, 1),
+        ChangeEvent(ChangedEntityType.SYMBOL, 2),
+        ChangeEvent(ChangedEntityType.FOOTPRINT, 3),
+    ]
+    bus._handle_payload(_encode_events("other", events))
+    # A failing handler does not stop the others
+    assert received == [1, 2]
+
+    # Own events were already handled after the commit
+    bus._handle_payload(_encode_events(bus._origin, events))
+    assert received == [1, 2]
+
+
+def test_unreadable_payload_flushes_caches():
+    bus = InvalidationBus()
+    cache = LocalCache("test.bus_flush", 60, 10)
+
+    async def load():
+        return 1
+
+    try:
+        asyncio.run(cache.get_or_load("k", load))
+        bus._handle_payload(json.dumps({"origin": "other", "events": [["unknown", 1]]}))
+        assert len(cache) == 0
+    finally:
+        local_caches.remove(cache)
@@ -0,0 +1,141 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import asyncio
+import types
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from edaparts.models.inventory.inventory_identificable_item_model import (
+    DICI_BLOCK_SIZE,
+)
+from edaparts.services import inventory_service
+from edaparts.services.exceptions import UniqueIdentifierCreationError
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+
+class _SequenceDb:
+    """
+    Session of a database with sequences that hands out the block starts of
+    inventory_dici_seq as the real sequence would.
+    """
+
+    def __init__(self):
+        self.next_value = 1
+        self.requested_blocks = []
+
+    def get_bind(self):
+        return types.SimpleNamespace(
+            dialect=types.SimpleNamespace(name="postgresql", supports_sequences=True)
+        )
+
+    async def scalars(self, statement):
+        params = statement.compile(dialect=postgresql.dialect()).params
+        blocks = params["generate_series_2"] - params["generate_series_1"] + 1
+        self.requested_blocks.append(blocks)
+        starts = []
+        for _ in range(blocks):
+            starts.append(self.next_value)
+            self.next_value += DICI_BLOCK_SIZE
+        return _Result(starts)
+
+
+class _CollidingDb:
+    # Session of a non PostgreSQL database where every DICI already exists
+    def __init__(self, dialect="sqlite", supports_sequences=False):
+        self.queries = 0
+        self.dialect = types.SimpleNamespace(
+            name=dialect, supports_sequences=supports_sequences
+        )
+
+    def get_bind(self):
+        return types.SimpleNamespace(dialect=self.dialect)
+
+    async def scalars(self, _):
+        self.queries += 1
+        return _Result(["existing"])
+
+
+@pytest.fixture
+def dici_numbers(monkeypatch):
+    numbers = inventory_service._DiciNumbers()
+    monkeypatch.setattr(inventory_service, "__dici_numbers", numbers)
+    return numbers
+
+
+def test_encode_dici_number():
+    encode = inventory_service.__encode_dici_number
+    assert encode(0) == "00000000"
+    assert encode(35) == "0000000Z"
+    assert encode(36) == "00000010"
+    assert encode(36**8 - 1) == "ZZZZZZZZ"
+    # Legacy random DICIs have 10 characters, the numbers cannot reach them
+    with pytest.raises(UniqueIdentifierCreationError):
+        encode(36**8)
+
+
+def test_generate_item_ids_spanning_blocks(dici_numbers):
+    db = _SequenceDb()
+    count = DICI_BLOCK_SIZE * 2 + 10
+    dicis = asyncio.run(inventory_service.generate_item_ids(db, count))
+    # All the blocks are reserved in a single query
+    assert db.requested_blocks == [3]
+    assert len(set(dicis)) == count
+    assert dicis[0] == "ITEM-00000001"
+    assert all(len(dici) == len("ITEM-") + 8 for dici in dicis)
+
+    # The rest of the last block is used before reserving a new one
+    more = asyncio.run(
+        inventory_service.generate_item_ids(db, DICI_BLOCK_SIZE - 10 + 1)
+    )
+    assert db.requested_blocks == [3, 1]
+    assert not set(more) & set(dicis)
+    assert len(dici_numbers._numbers) == DICI_BLOCK_SIZE - 1
+
+
+@pytest.mark.parametrize("count", [0, -1])
+def test_generate_item_ids_none_requested(count):
+    # The DB is not used
+    assert asyncio.run(inventory_service.generate_item_ids(None, count)) == []
+
+
+@pytest.mark.parametrize(
+    "dialect,supports_sequences", [("sqlite", False), ("mssql", True)]
+)
+def test_generate_random_item_ids_collisions(dialect, supports_sequences):
+    # Only PostgreSQL reserves blocks of the sequence, even if others have them
+    db = _CollidingDb(dialect, supports_sequences)
+    with pytest.raises(UniqueIdentifierCreationError):
+        asyncio.run(inventory_service.generate_item_ids(db, 1))
+    assert db.queries == 3
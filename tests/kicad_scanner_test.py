@@ -0,0 +1,107 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import pytest
+from kiutils.footprint import Footprint
+from kiutils.symbol import SymbolLib
+from kiutils.utils import sexpr
+
+from edaparts.utils import kicad_scanner
+
+_SYMBOL_LIB = b"""(kicad_symbol_lib (version 20220914) (generator kicad_symbol_editor)
+  (symbol "Lib:R" (in_bom yes) (on_board yes)
+    (property "Reference" "R (\\"ohm\\")" (at 0 0 0))
+    (property "Description" "Resistor ) with (brackets" (at 0 0 0))
+    (property "Description" "Ignored" (at 0 0 0))
+    (symbol "R_0_1" (property "Description" "Nested" (at 0 0 0)))
+    (symbol "R_1_1" (pin passive line (at 0 0 0) (length 2.54)))
+  )
+  (symbol "C_1_2" (property "Value" "C" (at 0 0 0)))
+  (symbol "12" (property "Description" 10 (at 0 0 0)))
+)
+(kicad_symbol_lib (symbol "Ignored"))
+"""
+
+_FOOTPRINT = b"""(footprint "Lib:R_0603_1_1" (version 20221018) (layer "F.Cu")
+  (descr "First")
+  (fp_text value "(descr \\"x\\")" (at 0 0) (layer "F.Fab"))
+  (pad "1" smd rect (at 0 0) (size 1 1) (layers "F.Cu") (descr "Nested"))
+  (descr "Last")
+)
+"""
+
+
+def _kiutils_entries(data: bytes) -> list[tuple]:
+    expression = sexpr.parse_sexp(data.decode("utf-8"))
+    if expression[0] == "footprint":
+        footprint = Footprint().from_sexpr(expression)
+        return [(footprint.entryName, footprint.description)]
+    return [
+        (
+            symbol.entryName,
+            next(
+                (prop.value for prop in symbol.properties if prop.key == "Description"),
+                None,
+            ),
+        )
+        for symbol in SymbolLib().from_sexpr(expression).symbols
+    ]
+
+
+@pytest.mark.parametrize("data", [_SYMBOL_LIB, _FOOTPRINT])
+def test_scan_matches_kiutils(data):
+    result = kicad_scanner.scan(data)
+    assert result.entries == _kiutils_entries(data)
+
+
+def test_scan_symbol_lib():
+    result = kicad_scanner.scan(_SYMBOL_LIB)
+    assert result.lib_type == "kicad_symbol_lib"
+    assert result.entries == [
+        ("R", "Resistor ) with (brackets"),
+        ("C", None),
+        ("12", 10),
+    ]
+
+
+def test_scan_footprint():
+    result = kicad_scanner.scan(_FOOTPRINT)
+    assert result.lib_type == "footprint"
+    assert result.entries == [("R_0603_1_1", "Last")]
+
+
+def test_scan_file(tmp_path):
+    path = tmp_path.joinpath("empty.kicad_sym")
+    path.write_bytes(b"")
+    with pytest.raises(kicad_scanner.KiCadScanError):
+        kicad_scanner.scan_file(path)
+    path.write_bytes(_FOOTPRINT)
+    assert kicad_scanner.scan_file(path).entries == [("R_0603_1_1", "Last")]
+
+
+@pytest.mark.parametrize("data", [b"", b"  \n", b"(footprint (descr"])
+def test_scan_invalid(data):
+    with pytest.raises(kicad_scanner.KiCadScanError):
+        kicad_scanner.scan(data)
@@ -0,0 +1,118 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import asyncio
+
+from edaparts.services.local_cache import LocalCache, local_caches
+from edaparts.services.metrics import metrics
+
+
+class _Loader:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+def _cache(name, ttl=60, max_entries=10) -> LocalCache:
+    cache = LocalCache(name, ttl, max_entries)
+    local_caches.remove(cache)
+    return cache
+
+
+def test_cache_hit_miss():
+    cache = _cache("test.hit_miss")
+    loader = _Loader()
+
+    async def run():
+        return [await cache.get_or_load("k", loader) for _ in range(3)]
+
+    assert asyncio.run(run()) == [1, 1, 1]
+    assert loader.calls == 1
+    assert metrics.counter("test.hit_miss.misses").value == 1
+    assert metrics.counter("test.hit_miss.hits").value == 2
+
+
+def test_cache_expired():
+    cache = _cache("test.expired", ttl=0.01)
+    loader = _Loader()
+
+    async def run():
+        await cache.get_or_load("k", loader)
+        await asyncio.sleep(0.02)
+        return await cache.get_or_load("k", loader)
+
+    assert asyncio.run(run()) == 2
+
+
+def test_cache_lru_bound():
+    cache = _cache("test.lru", max_entries=2)
+    loader = _Loader()
+
+    async def run():
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("b", loader)
+        # Refresh a, so b is the least recently used
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("c", loader)
+        return await cache.get_or_load("a", loader), await cache.get_or_load(
+            "b", loader
+        )
+
+    assert asyncio.run(run()) == (1, 4)
+    assert len(cache) == 2
+
+
+def test_cache_invalidated_while_loading():
+    cache = _cache("test.invalidated")
+    loading = asyncio.Event()
+    invalidated = asyncio.Event()
+
+    async def slow_loader():
+        loading.set()
+        await invalidated.wait()
+        return "stale"
+
+    async def run():
+        task = asyncio.create_task(cache.get_or_load("k", slow_loader))
+        await loading.wait()
+        cache.invalidate("k")
+        invalidated.set()
+        assert await task == "stale"
+        return await cache.get_or_load("k", _Loader())
+
+    # The value loaded before the invalidation is returned but not kept
+    assert asyncio.run(run()) == 1
+
+
+def test_cache_disabled():
+    cache = _cache("test.disabled", ttl=0)
+    loader = _Loader()
+
+    async def run():
+        return [await cache.get_or_load("k", loader) for _ in range(2)]
+
+    assert asyncio.run(run()) == [1, 2]
+    assert len(cache) == 0
@@ -0,0 +1,56 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import dataclasses
+
+import pytest
+
+from edaparts.models.components.component_model import ComponentModel
+from edaparts.models.components.resistor_model import ResistorModel
+from edaparts.models.metadata.metadata_parser import metadata_parser
+from edaparts.services.exceptions import GenericIntenalApiError
+
+
+def test_get_model_by_name():
+    assert metadata_parser.model_exists_by_name("comp_resistor")
+    assert metadata_parser.get_model_by_name("comp_resistor") is ResistorModel
+    assert not metadata_parser.model_exists_by_name("comp_unknown")
+    with pytest.raises(GenericIntenalApiError):
+        metadata_parser.get_model_by_name("comp_unknown")
+
+
+def test_get_model_metadata_by_model():
+    descriptor = metadata_parser.get_model_metadata_by_model(ResistorModel)
+    # Built once and shared
+    assert descriptor is metadata_parser.get_model_metadata_by_name("comp_resistor")
+    assert descriptor.fields["power_max"].numeric_field == "power_max_numeric"
+    assert descriptor.fields["value"].numeric_field == "value_numeric"
+    assert descriptor.fields["mpn"].numeric_field is None
+    assert (
+        "power_max"
+        not in metadata_parser.get_model_metadata_by_model(ComponentModel).fields
+    )
+    with pytest.raises(TypeError):
+        descriptor.fields["mpn"] = None
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        descriptor.fields["mpn"].is_mandatory = False
@@ -0,0 +1,42 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import pytest
+
+from edaparts.services import pagination
+from edaparts.services.exceptions import InvalidRequestError
+
+
+def test_cursor_round_trip():
+    for last_id in (1, 20, 123456789):
+        cursor = pagination.encode_cursor(last_id)
+        assert "=" not in cursor
+        assert pagination.decode_cursor(cursor) == last_id
+
+
+@pytest.mark.parametrize("cursor", ["garbage!", "e30", "eyJhZnRlcl9pZCI6ImEifQ"])
+def test_cursor_invalid(cursor):
+    with pytest.raises(InvalidRequestError):
+        pagination.decode_cursor(cursor)
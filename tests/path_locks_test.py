@@ -0,0 +1,96 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import asyncio
+
+import pytest
+
+from edaparts.app.config import config
+from edaparts.models.internal.internal_models import (
+    CadType,
+    StorableLibraryResourceType,
+)
+from edaparts.services.path_locks import PathLockManager
+
+
+@pytest.fixture
+def lock_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "LOCKS_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "STORAGE_LOCK_BACKEND", "file")
+    monkeypatch.setattr(config, "STORAGE_LOCK_POLL_INTERVAL", 0.01)
+    return PathLockManager()
+
+
+def _lock(lock_manager, path, timeout=None):
+    return lock_manager.lock(
+        CadType.KICAD, StorableLibraryResourceType.SYMBOL, path, timeout=timeout
+    )
+
+
+def test_lock_exclusive(lock_manager):
+    events = []
+
+    async def user(index):
+        async with _lock(lock_manager, "lib.kicad_sym"):
+            events.append(("in", index))
+            await asyncio.sleep(0.01)
+            events.append(("out", index))
+
+    async def run():
+        await asyncio.gather(*(user(index) for index in range(3)))
+
+    asyncio.run(run())
+    assert events == [(kind, index) for index in range(3) for kind in ("in", "out")]
+    assert not lock_manager._local_locks
+
+
+def test_lock_timeout(lock_manager):
+    async def run():
+        async with _lock(lock_manager, "lib.kicad_sym"):
+            # Other paths are not affected
+            async with _lock(lock_manager, "other.kicad_sym", timeout=0.05):
+                pass
+            with pytest.raises(TimeoutError):
+                async with _lock(lock_manager, "lib.kicad_sym", timeout=0.05):
+                    pass
+
+    asyncio.run(run())
+    assert not lock_manager._local_locks
+
+
+def test_lock_held_by_other_process(lock_manager):
+    # A lock manager of another process is modeled by a second instance, that
+    # only shares the lock files
+    other_manager = PathLockManager()
+
+    async def run():
+        async with _lock(other_manager, "lib.kicad_sym"):
+            with pytest.raises(TimeoutError):
+                async with _lock(lock_manager, "lib.kicad_sym", timeout=0.05):
+                    pass
+        async with _lock(lock_manager, "lib.kicad_sym", timeout=0.05):
+            pass
+
+    asyncio.run(run())
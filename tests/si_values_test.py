@@ -0,0 +1,60 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import pytest
+
+from edaparts.utils.si_values import parse_si_value
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("100n", 1e-7),
+        ("0.1u", 1e-7),
+        ("100nF", 1e-7),
+        ("100 nF", 1e-7),
+        ("4.7k", 4700.0),
+        ("4k7", 4700.0),
+        ("4.7 kΩ", 4700.0),
+        ("4R7", 4.7),
+        ("3V3", 3.3),
+        ("1V8", 1.8),
+        ("2A5", 2.5),
+        ("1Meg", 1e6),
+        ("2.2µH", 2.2e-6),
+        ("50V", 50.0),
+        ("1/4 W", 0.25),
+        ("±1%", 1.0),
+        ("-40 ºC", -40.0),
+        ("125°C", 125.0),
+    ],
+)
+def test_parse_si_value(value, expected):
+    assert parse_si_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value", [None, "", "DNP", "X7R", "10-20V", "100n 50V", "1/0 W", "4k7M", "3V3F"]
+)
+def test_parse_si_value_not_a_number(value):
+    assert parse_si_value(value) is None
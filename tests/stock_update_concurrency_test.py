@@ -0,0 +1,135 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+"""
+Concurrent mass stock updates on a PostgreSQL database, given by the
+TEST_DB_CONNECTION_STRING variable. Its content is dropped!
+"""
+
+import asyncio
+import collections
+import os
+import random
+
+import pytest
+from sqlalchemy import func, select
+
+from edaparts.models.internal.internal_inventory_models import (
+    MassStockMovement,
+    SingleStockMovement,
+)
+from edaparts.models.inventory import (
+    InventoryItemLocationStockModel,
+    InventoryItemLocationStockMovementModel,
+    InventoryItemModel,
+    InventoryLocationModel,
+)
+from edaparts.services import inventory_service
+from edaparts.services.database import sessionmanager
+
+_DB_URL = os.getenv("TEST_DB_CONNECTION_STRING")
+_INITIAL_STOCK = 1000.0
+_CLIENTS = 8
+_UPDATES = 20
+_LINES = 20
+_STOCKS = 5
+
+# Row locks are what is tested, so other databases are not supported
+pytestmark = pytest.mark.skipif(
+    not (_DB_URL or "").startswith("postgresql"),
+    reason="TEST_DB_CONNECTION_STRING is not a PostgreSQL database",
+)
+
+
+async def _seed() -> list[tuple[str, str]]:
+    async with sessionmanager.connect() as connection:
+        await sessionmanager.drop_all(connection)
+        await sessionmanager.create_all(connection)
+    async with sessionmanager.session() as db:
+        location = InventoryLocationModel(name="Concurrency", dici="LOC-CONC")
+        for index in range(_STOCKS):
+            db.add(
+                InventoryItemLocationStockModel(
+                    actual_stock=_INITIAL_STOCK,
+                    stock_min_level=0.0,
+                    location=location,
+                    item=InventoryItemModel(
+                        mpn=f"CONC-{index}",
+                        manufacturer="Test Inc.",
+                        name=f"Concurrency item {index}",
+                        dici=f"ITEM-CONC{index}",
+                    ),
+                )
+            )
+        await db.commit()
+    return [(f"ITEM-CONC{index}", "LOC-CONC") for index in range(_STOCKS)]
+
+
+async def _client(seed: int, bins, applied: collections.Counter):
+    generator = random.Random(seed)
+    for _ in range(_UPDATES):
+        # Lines in random order over a few stocks, so the clients contend
+        movements = [
+            SingleStockMovement(*generator.choice(bins), generator.randint(-5, 5))
+            for _ in range(_LINES)
+        ]
+        async with sessionmanager.session() as db:
+            await inventory_service.stock_mass_update(
+                db, MassStockMovement(reason="concurrency", movements=movements)
+            )
+        for movement in movements:
+            applied[movement.item_identifier] += movement.quantity
+
+
+def test_concurrent_mass_updates_lose_nothing():
+    async def run():
+        sessionmanager.init(_DB_URL)
+        try:
+            bins = await _seed()
+            applied = collections.Counter()
+            await asyncio.gather(
+                *(_client(seed, bins, applied) for seed in range(_CLIENTS))
+            )
+            async with sessionmanager.session() as db:
+                levels = dict(
+                    (
+                        await db.execute(
+                            select(
+                                InventoryItemModel.dici,
+                                InventoryItemLocationStockModel.actual_stock,
+                            ).join(InventoryItemLocationStockModel.item)
+                        )
+                    ).all()
+                )
+                movements = await db.scalar(
+                    select(func.count(InventoryItemLocationStockMovementModel.id))
+                )
+            return applied, levels, movements
+        finally:
+            await sessionmanager.close()
+
+    applied, levels, movements = asyncio.run(run())
+    assert levels == {
+        dici: _INITIAL_STOCK + applied[dici] for dici, _ in levels.items()
+    }
+    assert movements == _CLIENTS * _UPDATES * _LINES
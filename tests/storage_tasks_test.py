@@ -0,0 +1,271 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+"""
+Storage task queue on a PostgreSQL database, given by the
+TEST_DB_CONNECTION_STRING variable. Its content is dropped!
+"""
+
+import asyncio
+import datetime
+import os
+import time
+
+import pytest
+from sqlalchemy import select
+
+from edaparts.models import FootprintReference, StorageTaskModel
+from edaparts.models.internal.internal_models import (
+    CadType,
+    DeleteStorableTask,
+    StorableLibraryResourceType,
+    StorageStatus,
+    StorageTaskStatus,
+    StorageTaskType,
+)
+from edaparts.services import storable_objects_service
+from edaparts.services.database import sessionmanager
+from edaparts.services.storage_tasks import StorageTaskWorker
+
+_DB_URL = os.getenv("TEST_DB_CONNECTION_STRING")
+_TIMEOUT = 10.0
+
+# Tasks are claimed with FOR UPDATE SKIP LOCKED
+pytestmark = pytest.mark.skipif(
+    not (_DB_URL or "").startswith("postgresql"),
+    reason="TEST_DB_CONNECTION_STRING is not a PostgreSQL database",
+)
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _footprint(status: StorageStatus) -> FootprintReference:
+    return FootprintReference(
+        path="test.PcbLib",
+        reference="R0603",
+        storage_status=status,
+        cad_type=CadType.ALTIUM,
+    )
+
+
+def _task(model_id: int, **values) -> StorageTaskModel:
+    return StorageTaskModel(
+        task_type=values.pop("task_type", StorageTaskType.STORE),
+        status=values.pop("status", StorageTaskStatus.PENDING),
+        model_id=model_id,
+        file_type=StorableLibraryResourceType.FOOTPRINT,
+        cad_type=CadType.ALTIUM,
+        path="test.PcbLib",
+        reference="R0603",
+        attempts=values.pop("attempts", 0),
+        run_after=values.pop("run_after", _now()),
+        **values,
+    )
+
+
+async def _wait_for(condition):
+    deadline = time.monotonic() + _TIMEOUT
+    while not await condition():
+        assert time.monotonic() < deadline, "Timed out waiting for the worker"
+        await asyncio.sleep(0.02)
+
+
+async def _tasks() -> list[StorageTaskModel]:
+    async with sessionmanager.session() as db:
+        return list(await db.scalars(select(StorageTaskModel)))
+
+
+def _run(scenario):
+    async def run():
+        sessionmanager.init(_DB_URL)
+        try:
+            async with sessionmanager.connect() as connection:
+                await sessionmanager.drop_all(connection)
+                await sessionmanager.create_all(connection)
+            await scenario()
+        finally:
+            await sessionmanager.close()
+
+    asyncio.run(run())
+
+
+def _start_worker(handler, failure_handler=None, **options) -> StorageTaskWorker:
+    async def ignore_failure(*_):
+        pass
+
+    worker = StorageTaskWorker()
+    worker.init(
+        handler,
+        failure_handler or ignore_failure,
+        concurrency=options.get("concurrency", 4),
+        poll_interval=0.05,
+        max_attempts=options.get("max_attempts", 5),
+        retry_backoff=options.get("retry_backoff", 0.1),
+        retry_backoff_max=options.get("retry_backoff_max", 10),
+        lease=options.get("lease", 30),
+    )
+    return worker
+
+
+def test_expired_lease_is_claimed_again():
+    async def scenario():
+        async with sessionmanager.session() as db:
+            # A dead worker left the first one, the second one is still alive
+            db.add(
+                _task(
+                    1,
+                    status=StorageTaskStatus.RUNNING,
+                    attempts=1,
+                    lease_until=_now() - datetime.timedelta(seconds=1),
+                )
+            )
+            db.add(
+                _task(
+                    2,
+                    status=StorageTaskStatus.RUNNING,
+                    attempts=1,
+                    lease_until=_now() + datetime.timedelta(hours=1),
+                )
+            )
+            await db.commit()
+
+        runs = []
+
+        async def handler(storable_task):
+            runs.append(storable_task.model_id)
+
+        worker = _start_worker(handler)
+        try:
+            await _wait_for(lambda: _finished(1))
+            # Give the worker a few polls to take the leased one by mistake
+            await asyncio.sleep(0.3)
+        finally:
+            await worker.close()
+        assert runs == [1]
+        (leased,) = await _tasks()
+        assert leased.model_id == 2
+        assert leased.status == StorageTaskStatus.RUNNING
+
+    async def _finished(model_id):
+        return all(task.model_id != model_id for task in await _tasks())
+
+    _run(scenario)
+
+
+def test_failed_task_retried_with_backoff_then_failed():
+    async def scenario():
+        async with sessionmanager.session() as db:
+            footprint = _footprint(StorageStatus.STORING)
+            db.add(footprint)
+            await db.flush()
+            db.add(_task(footprint.id))
+            await db.commit()
+
+        runs = []
+
+        async def handler(_):
+            runs.append(time.monotonic())
+            raise OSError("Disk unavailable")
+
+        worker = _start_worker(
+            handler,
+            storable_objects_service.fail_storable_task,
+            max_attempts=3,
+            retry_backoff=0.2,
+        )
+        try:
+
+            async def failed():
+                async with sessionmanager.session() as db:
+                    model = await db.get(FootprintReference, footprint.id)
+                    return model.storage_status == StorageStatus.STORAGE_FAILED
+
+            await _wait_for(failed)
+        finally:
+            await worker.close()
+
+        assert len(runs) == 3
+        # The delay doubles on each retry
+        assert runs[1] - runs[0] >= 0.2
+        assert runs[2] - runs[1] >= 0.4
+        assert await _tasks() == []
+        async with sessionmanager.session() as db:
+            model = await db.get(FootprintReference, footprint.id)
+            assert "Disk unavailable" in model.storage_error
+
+    _run(scenario)
+
+
+def test_orphan_objects_recovered():
+    async def scenario():
+        async with sessionmanager.session() as db:
+            not_stored = _footprint(StorageStatus.NOT_STORED)
+            storing = _footprint(StorageStatus.STORING)
+            deleting = _footprint(StorageStatus.DELETING)
+            # Waits for its task, it is not an orphan
+            queued = _footprint(StorageStatus.STORING)
+            stored = _footprint(StorageStatus.STORED)
+            db.add_all([not_stored, storing, deleting, queued, stored])
+            await db.flush()
+            db.add(_task(queued.id, run_after=_now() + datetime.timedelta(hours=1)))
+            await db.commit()
+
+        runs = []
+
+        async def handler(storable_task):
+            runs.append(storable_task)
+
+        worker = _start_worker(handler)
+        try:
+            await _wait_for(lambda: _has_run(runs))
+        finally:
+            await worker.close()
+
+        # The deletion is finished by a new task
+        assert runs == [
+            DeleteStorableTask(
+                model_id=deleting.id,
+                path="test.PcbLib",
+                file_type=StorableLibraryResourceType.FOOTPRINT,
+                cad_type=CadType.ALTIUM,
+            )
+        ]
+        async with sessionmanager.session() as db:
+            statuses = {
+                model.id: model.storage_status
+                for model in await db.scalars(select(FootprintReference))
+            }
+        assert statuses == {
+            not_stored.id: StorageStatus.STORAGE_FAILED,
+            storing.id: StorageStatus.STORAGE_FAILED,
+            deleting.id: StorageStatus.DELETING,
+            queued.id: StorageStatus.STORING,
+            stored.id: StorageStatus.STORED,
+        }
+
+    async def _has_run(runs):
+        return bool(runs)
+
+    _run(scenario)
@@ -0,0 +1,68 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+import pathlib
+import re
+
+from edaparts import migrations
+from edaparts.models.components.opamp_model import OpAmpModel
+from edaparts.models.internal.internal_models import CadType
+from edaparts.models.metadata import view_generator
+
+_LEGACY_VIEWS_DIR = pathlib.Path(migrations.__file__).parent / "views" / "f1ad6c343ede"
+
+
+def _legacy_views() -> dict[str, set[str]]:
+    views = {}
+    for view_file in _LEGACY_VIEWS_DIR.glob("Create*.sql"):
+        sql = view_file.read_text()
+        name = re.search(r'create or replace view "([^"]+)"', sql).group(1)
+        columns = sql[sql.index(" as\nselect") : sql.index("\nfrom crosstab")]
+        views[name] = set(re.findall(r'"([^"]+)",?$', columns, re.M))
+    return views
+
+
+def test_generated_views_keep_legacy_columns():
+    legacy_views = _legacy_views()
+    views = {
+        view.name: {header for _, header in view_generator.get_view_columns(view)}
+        for view in view_generator.get_library_views()
+    }
+    assert views.keys() == legacy_views.keys()
+    for name, headers in legacy_views.items():
+        # The legacy KiCad opamps view missed the gain bandwidth
+        extra = {"Gain Bandwith Product"} if name == "KiCad OpAmps" else set()
+        assert views[name] == headers | extra, name
+
+
+def test_render_view():
+    view = next(
+        view
+        for view in view_generator.get_library_views()
+        if view.model is OpAmpModel and view.cad_type == CadType.KICAD
+    )
+    sql = view_generator.render_view(view)
+    assert sql.startswith('CREATE VIEW "KiCad OpAmps" AS')
+    assert "crosstab" not in sql
+    assert "'KICAD'::cadtype" in sql
+    assert 't.gain_bandwith "Gain Bandwith Product"' in sql